@@ -0,0 +1,68 @@
+#!/bin/bash 
+# shellcheck disable=SC1091
+
+set -o errexit
+set -o pipefail
+set -o nounset
+set +o xtrace
+
+############################################################################
+# The script bakes the datacenter instances into golden images on AWS:
+# it makes the datacenter with the instances launched from their parent
+# image, provisions them with Ansible, creates an image of each instance and
+# deletes the datacenter.
+# The next runs of make.sh launch the instances from the golden images, as
+# long as the playbooks and the variables in the provision directory don't
+# change.
+# You must have both AWS IAM user credentials and an AWS Region set in order to make requests.
+#
+# run:
+#
+# export AWS_ACCESS_KEY_ID=xxxxxx
+# export AWS_SECRET_ACCESS_KEY=yyyyyy
+# export AWS_DEFAULT_REGION=zzzzzz
+#
+# ./bake.sh
+#
+############################################################################
+
+if [[ ! -v AWS_ACCESS_KEY_ID ]]
+then
+  echo "ERROR: environment variable AWS_ACCESS_KEY_ID not set!"
+  exit 1
+fi
+
+if [[ ! -v AWS_SECRET_ACCESS_KEY ]]
+then
+  echo "ERROR: environment variable AWS_SECRET_ACCESS_KEY not set!"
+  exit 1
+fi
+
+if [[ ! -v AWS_DEFAULT_REGION ]]
+then
+  echo "ERROR: environment variable AWS_DEFAULT_REGION not set!"
+  exit 1
+fi
+ 
+# directory where the datacenter project is downloaded from github
+export DATACENTER_DIR
+DATACENTER_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && cd .. && pwd)"
+
+# make vpc, instance, security groups, ...
+"${DATACENTER_DIR}"/bin/make.sh
+
+# install the programs in the instances
+"${DATACENTER_DIR}"/bin/provision.sh
+
+export PYTHONPATH
+PYTHONPATH="${DATACENTER_DIR}"/project/src
+
+source "${DATACENTER_DIR}"/.venv/bin/activate
+
+# create the images of the provisioned instances
+python "${DATACENTER_DIR}/project/src/com/maxmin/aws/bake.py" "${DATACENTER_DIR}/config/datacenter.json"
+
+deactivate
+
+# delete vpc, instance, security groups, ...
+"${DATACENTER_DIR}"/bin/delete.sh
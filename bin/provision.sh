@@ -10,7 +10,9 @@ set +o xtrace
 ## The script provisions an AWS datacenter using Ansible.
 ## Ansible connects to the instances with an SSH connection plugin.
 ## Ansible is configured to use the Dynamic inventory plugin aws_ec2 to create a dynamic 
-## inventory of the AWS instances.
+## inventory of the AWS instances, cached with the facts for the whole run.
+## The playbooks run in a single pass: the upgrade, OpenSSL and Python first,
+## then the independent stacks at the same time.
 ## see: ansible.cfg file
 ##
 ## run:
@@ -59,87 +61,10 @@ echo "Creating local datacenter virtual environment ..."
 
 echo "Local datacenter virtual environment created."
 
-ANSIBLE_PLAYBOOK_CMD="${DATACENTER_DIR}"/.venv/bin/ansible-playbook
-
-cd "${DATACENTER_DIR}"/provision || exit
-
-########################
-##### UPDATE SYSTEM ####
-########################
-
-echo "Upgrading instances ..."
- 
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/upgrade.yml 
-
-##################
-##### OPENSSL ####
-##################
-
-echo "Openssl ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/openssl.yml 
-
-#################
-##### PYTHON ####
-#################
-
-echo "Python ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/python.yml 
-
-##################
-##### DOCKER #####
-##################
-
-echo "Docker ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/docker.yml 
-
-##################
-### PHPMYADMIN ###
-##################
-
-echo "phpMyadmin ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/phpmyadmin.yml 
-
-#####################
-##### POSTGRESQL ####
-#####################
-
-echo "Postgresql ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/postgresql.yml 
-
-################
-##### NGINX ####
-################
-
-echo "Nginx ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/nginx.yml 
-
-#################
-##### JAVA ######
-#################
-
-echo "Java ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/java.yml 
-
-###################
-##### TOMCAT ######
-###################
-
-echo "Tomcat ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/tomcat.yml 
-
-###################
-##### MARIADB ######
-###################
-
-echo "MariaDB ..."
-
-"${ANSIBLE_PLAYBOOK_CMD}" playbooks/mariadb.yml 
+export PYTHONPATH
+PYTHONPATH="${DATACENTER_DIR}"/project/src
 
+# the playbooks in a single run, the independent stacks at the same time, one
+# log file for each playbook in the provision/logs directory
+# see: PROVISION section of datacenter.ini, playbook.py file
+"${DATACENTER_DIR}"/.venv/bin/python "${DATACENTER_DIR}/project/src/com/maxmin/aws/provision.py" "${DATACENTER_DIR}"/.venv/bin
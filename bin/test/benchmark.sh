@@ -0,0 +1,62 @@
+#!/bin/bash 
+# shellcheck disable=SC1091
+
+set -o errexit
+set -o pipefail
+set -o nounset
+set +o xtrace
+
+############################################################################
+# The script runs a benchmark against moto, in a temporary datacenter
+# directory, so that no key file is written in the project access directory.
+#
+# run:
+#
+# export AWS_ACCESS_KEY_ID=xxxxxx
+# export AWS_SECRET_ACCESS_KEY=yyyyyy
+# export AWS_DEFAULT_REGION=zzzzzz
+#
+# ./benchmark.sh comtest.maxmin.aws.benchmark.client
+#
+############################################################################
+
+if [[ ! -v AWS_ACCESS_KEY_ID ]]
+then
+  echo "ERROR: environment variable AWS_ACCESS_KEY_ID not set!"
+  exit 1
+fi
+
+if [[ ! -v AWS_SECRET_ACCESS_KEY ]]
+then
+  echo "ERROR: environment variable AWS_SECRET_ACCESS_KEY not set!"
+  exit 1
+fi
+
+if [[ ! -v AWS_DEFAULT_REGION ]]
+then
+  echo "ERROR: environment variable AWS_DEFAULT_REGION not set!"
+  exit 1
+fi
+
+if [[ $# -ne 1 ]]
+then
+  echo "ERROR: benchmark module not passed!"
+  exit 1
+fi
+
+PROJECT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && cd ../.. && pwd)"
+
+export DATACENTER_DIR
+DATACENTER_DIR="$(mktemp -d)"
+trap 'rm -rf "${DATACENTER_DIR}"' EXIT
+
+mkdir "${DATACENTER_DIR}"/access
+ln -s "${PROJECT_DIR}"/project "${DATACENTER_DIR}"/project
+ln -s "${PROJECT_DIR}"/config "${DATACENTER_DIR}"/config
+
+export PYTHONPATH
+PYTHONPATH="${PROJECT_DIR}"/project/src:"${PROJECT_DIR}"/project/tests/src
+
+source "${PROJECT_DIR}"/.venv/bin/activate
+
+python -m "${1}"
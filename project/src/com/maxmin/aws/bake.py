@@ -0,0 +1,76 @@
+import os
+import sys
+
+from com.maxmin.aws.configuration.dao.datacenter import DatacenterConfigDao
+from com.maxmin.aws.constants import Ec2Constants, ProjectDirectories
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.golden import GoldenImageBaker, ProvisionDigest
+from com.maxmin.aws.logs import Logger
+
+"""
+Bakes the instances of a datacenter, created by startup.py and provisioned
+by provision.sh, into golden images, the next startup runs launch the
+instances from them as long as the playbooks and the variables don't change.
+The program uses AWS boto3 library to make AWS requests.
+See:
+https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html
+
+export AWS_ACCESS_KEY_ID=xxxxxx
+export AWS_SECRET_ACCESS_KEY=yyyyyy
+export AWS_DEFAULT_REGION=zzzzzz
+
+python bake.py datacenter.json
+"""
+
+if __name__ == "__main__":
+    # AWS IAM user credentials
+
+    if not os.getenv("AWS_ACCESS_KEY_ID"):
+        raise AwsException("environment variable AWS_ACCESS_KEY_ID not set!")
+
+    if not os.getenv("AWS_SECRET_ACCESS_KEY"):
+        raise AwsException(
+            "environment variable AWS_SECRET_ACCESS_KEY not set!"
+        )
+
+    if not os.getenv("AWS_DEFAULT_REGION"):
+        raise AwsException("environment variable AWS_DEFAULT_REGION not set!")
+
+    # directory where the datacenter project is downloaded from github
+    datacenter_dir = os.getenv("DATACENTER_DIR")
+
+    if not datacenter_dir:
+        """
+        see: constants.ProjectDirectories class
+        """
+        raise AwsException("environment variable DATACENTER_DIR not set!")
+
+    datacenter_config_file = sys.argv[1]
+
+    if not datacenter_config_file:
+        raise AwsException("Datacenter configuration file not passed!")
+
+    Logger.info(f"Datacenter directory {datacenter_dir}")
+    Logger.info(f"Provisioning directory {ProjectDirectories.PROVISION_DIR}")
+    Logger.info(f"Datacenter configuration file {datacenter_config_file}")
+
+    # load datacenter configuration file
+
+    datacenter_config_dao = DatacenterConfigDao()
+    datacenter_config = datacenter_config_dao.load(datacenter_config_file)
+
+    # run-scoped snapshot of the EC2 resources, see ec2.ini
+
+    ec2_constants = Ec2Constants()
+
+    if ec2_constants.inventory_enabled:
+        InventoryDao.enable(ec2_constants.inventory_ttl)
+
+    digest = ProvisionDigest.compute(ProjectDirectories.PROVISION_DIR)
+
+    Logger.info(f"Baking golden images, provisioning {digest} ...")
+
+    image_nms = GoldenImageBaker(datacenter_config, digest).bake()
+
+    Logger.info(f"{len(image_nms)} golden images baked!")
@@ -0,0 +1,120 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import asyncio
+
+from com.maxmin.aws.base.dao.client import ClientRegistry, Ec2Dao, Route53Dao
+from com.maxmin.aws.base.dao.executor import AsyncExecutor
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.dao.waiter import AsyncAdaptiveWaiter
+from com.maxmin.aws.base.trace import Tracer
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.exception import AwsDaoException
+from com.maxmin.aws.logs import Logger
+
+
+class AsyncDao(object):
+    """
+    Dao for an event loop, on the shared client of a service.
+    The boto3 calls run in the pool of AsyncExecutor, the waits poll from the
+    event loop and sleep without holding a thread.
+    """
+
+    def __init__(self, service_nm: str, dao_class):
+        self.service_nm = service_nm
+        self.dao_class = dao_class
+        self.client = ClientRegistry.get_client(service_nm)
+
+    async def call(self, operation: str, **kwargs) -> dict:
+        """
+        Calls an operation of the client, eg: describe_vpcs.
+        Returns the response.
+        """
+        return await AsyncExecutor.run(
+            getattr(self.client, operation), **kwargs
+        )
+
+    async def wait(self, waiter_nm: str, **kwargs) -> None:
+        """
+        Waits with a waiter of the service, polling with the schedule of the
+        waiter set in the ini file of the service.
+        """
+        await self.__wait(
+            self.client,
+            self.service_nm,
+            waiter_nm,
+            self.dao_class.get_schedule(waiter_nm),
+            kwargs,
+        )
+
+    async def run(self, method, *args, **kwargs):
+        """
+        Runs a method of a dao or a service in the pool of AsyncExecutor,
+        then waits from the event loop for the resources the method would
+        have waited for.
+        Returns the result of the method.
+        """
+        result, waits = await AsyncExecutor.run_deferring(
+            method, *args, **kwargs
+        )
+
+        if waits:
+            try:
+                await asyncio.gather(*[self.__wait(*wait) for wait in waits])
+            except Exception as e:
+                Logger.error(str(e))
+                raise AwsDaoException("Error waiting for the resources!")
+            finally:
+                self.after_waits(waits)
+
+        return result
+
+    def after_waits(self, waits: list) -> None:
+        """
+        Called when the waits deferred by run are done.
+        """
+        pass
+
+    async def __wait(
+        self, client, service_nm: str, waiter_nm: str, schedule, kwargs
+    ) -> None:
+        with Tracer.span(
+            f"{service_nm}.{waiter_nm}", Tracer.WAITER
+        ), ApiMetrics.waiter(service_nm, waiter_nm):
+            await AsyncAdaptiveWaiter(
+                client, waiter_nm, schedule, AsyncExecutor.get_executor()
+            ).wait(**kwargs)
+
+
+class AsyncEc2Dao(AsyncDao):
+    def __init__(self):
+        super().__init__("ec2", Ec2Dao)
+        self.ec2 = self.client
+
+    async def paginate(
+        self, operation: str, result_key: str, **kwargs
+    ) -> list:
+        """
+        Returns the resources returned by a describe operation, following all
+        the pages.
+        Keyword arguments:
+            operation -- the name of the describe method of the client.
+            result_key -- the key of the list of resources in a page.
+        """
+        return await AsyncExecutor.run(
+            lambda: list(Ec2Dao().paginate(operation, result_key, **kwargs))
+        )
+
+    def after_waits(self, waits: list) -> None:
+        # the state of the resources has changed while the inventory was
+        # readable
+        InventoryDao.invalidate()
+
+
+class AsyncRoute53Dao(AsyncDao):
+    def __init__(self):
+        super().__init__("route53", Route53Dao)
+        self.route53 = self.client
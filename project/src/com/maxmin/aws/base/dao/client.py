@@ -4,14 +4,245 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
 import boto3
+from botocore.config import Config
+
+from com.maxmin.aws.base.dao.executor import AsyncExecutor
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.dao.waiter import AdaptiveWaiter, WaiterSchedule
+from com.maxmin.aws.base.trace import Tracer
+from com.maxmin.aws.constants import (
+    ClientConstants,
+    Ec2Constants,
+    Route53Constants,
+)
+
+
+class ClientRegistry(object):
+    """
+    Process-wide registry of the boto3 clients shared by all the daos.
+    Building a client loads the botocore service model and the endpoint
+    ruleset, so a client is built once for each service, region, profile and
+    configuration and reused for the life of the process.
+    boto3 clients are thread-safe, sessions are not, clients are built while
+    holding the registry lock.
+    The API metrics and the tracer handlers are registered on every client
+    built.
+    The clients requested without a region are built for the region set by
+    the region context manager, if any, so the daos built in the block work
+    on that region.
+    """
+
+    __lock = threading.Lock()
+    __sessions = {}
+    __clients = {}
+    __constants = None
+    __region = contextvars.ContextVar("region", default=None)
+
+    @staticmethod
+    @contextmanager
+    def region(region_nm: str):
+        """
+        Sets the default region of the clients requested in the block.
+        """
+        token = ClientRegistry.__region.set(region_nm)
+
+        try:
+            yield
+        finally:
+            ClientRegistry.__region.reset(token)
+
+    @staticmethod
+    def get_client(
+        service_nm: str,
+        region_nm: str = None,
+        profile_nm: str = None,
+        max_pool_connections: int = None,
+        tcp_keepalive: bool = None,
+    ):
+        """
+        Returns the shared client for the service.
+        Keyword arguments:
+            region_nm -- the AWS region, if not set the region of the region context manager or the region configured in the environment.
+            profile_nm -- the AWS credentials profile, if not set the default credentials.
+            max_pool_connections -- the size of the HTTP connection pool, if not set the value in client.ini.
+            tcp_keepalive -- TCP keep-alive on the pooled connections, if not set the value in client.ini.
+        """
+        with ClientRegistry.__lock:
+            if not ClientRegistry.__constants:
+                ClientRegistry.__constants = ClientConstants()
+
+            constants = ClientRegistry.__constants
+
+            if max_pool_connections is None:
+                max_pool_connections = constants.max_pool_connections
+
+            if tcp_keepalive is None:
+                tcp_keepalive = constants.tcp_keepalive
+
+            session = ClientRegistry.__sessions.get(profile_nm)
+
+            if not session:
+                session = boto3.session.Session(profile_name=profile_nm)
+                ClientRegistry.__sessions[profile_nm] = session
+
+            if not region_nm:
+                region_nm = (
+                    ClientRegistry.__region.get() or session.region_name
+                )
+
+            key = (
+                service_nm,
+                region_nm,
+                profile_nm,
+                max_pool_connections,
+                tcp_keepalive,
+            )
+
+            client = ClientRegistry.__clients.get(key)
+
+            if not client:
+                config = Config(
+                    max_pool_connections=max_pool_connections,
+                    tcp_keepalive=tcp_keepalive,
+                    connect_timeout=constants.connect_timeout,
+                    read_timeout=constants.read_timeout,
+                )
+
+                client = session.client(
+                    service_nm, region_name=region_nm, config=config
+                )
+                ApiMetrics.attach(client)
+                Tracer.attach(client)
+                ClientRegistry.__clients[key] = client
+
+            return client
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Discards all the clients and sessions, the next request builds new ones.
+        """
+        with ClientRegistry.__lock:
+            ClientRegistry.__clients.clear()
+            ClientRegistry.__sessions.clear()
+            ClientRegistry.__constants = None
 
 
 class Ec2Dao(object):
+    # describe operations with a lower limit on the page size
+    __PAGE_LIMITS = {"describe_route_tables": 100}
+
+    __max_results = None
+    # waiter: WaiterSchedule
+    __schedules = {}
+
     def __init__(self):
-        self.ec2 = boto3.client("ec2")
+        self.ec2 = ClientRegistry.get_client("ec2")
+
+    def paginate(self, operation: str, result_key: str, **kwargs) -> Iterator:
+        """
+        Yields the resources returned by a describe operation, following all
+        the pages. A page is requested only when the iteration reaches it.
+        The size of the pages is set by max_results in ec2.ini.
+        Keyword arguments:
+            operation -- the name of the describe method of the client.
+            result_key -- the key of the list of resources in a page.
+        """
+        if not self.ec2.can_paginate(operation):
+            yield from getattr(self.ec2, operation)(**kwargs).get(result_key)
+            return
+
+        if Ec2Dao.__max_results is None:
+            Ec2Dao.__max_results = Ec2Constants().max_results
+
+        page_size = min(
+            Ec2Dao.__max_results, Ec2Dao.__PAGE_LIMITS.get(operation, 1000)
+        )
+
+        pages = self.ec2.get_paginator(operation).paginate(
+            PaginationConfig={"PageSize": page_size}, **kwargs
+        )
+
+        for page in pages:
+            yield from page.get(result_key)
+
+    def wait(self, waiter_nm: str, **kwargs) -> None:
+        """
+        Waits with an EC2 waiter, polling with the schedule set in ec2.ini.
+        The time spent is recorded in the API metrics and in the trace.
+        If the dao runs for an async dao, the wait is deferred to the event
+        loop.
+        """
+        schedule = Ec2Dao.get_schedule(waiter_nm)
+
+        if AsyncExecutor.defer(self.ec2, "ec2", waiter_nm, schedule, kwargs):
+            return
+
+        with Tracer.waiter(f"ec2.{waiter_nm}"), ApiMetrics.waiter(
+            "ec2", waiter_nm
+        ):
+            AdaptiveWaiter(self.ec2, waiter_nm, schedule).wait(**kwargs)
+
+    @staticmethod
+    def get_schedule(waiter_nm: str) -> WaiterSchedule:
+        """
+        Returns the schedule of an EC2 waiter set in ec2.ini.
+        """
+        schedule = Ec2Dao.__schedules.get(waiter_nm)
+
+        if not schedule:
+            schedule = WaiterSchedule(
+                **Ec2Constants().get_waiter_config(waiter_nm)
+            )
+            Ec2Dao.__schedules[waiter_nm] = schedule
+
+        return schedule
 
 
 class Route53Dao(object):
+    # waiter: WaiterSchedule
+    __schedules = {}
+
     def __init__(self):
-        self.route53 = boto3.client("route53")
+        self.route53 = ClientRegistry.get_client("route53")
+
+    def wait(self, waiter_nm: str, **kwargs) -> None:
+        """
+        Waits with a Route53 waiter, polling with the schedule set in
+        route53.ini.
+        The time spent is recorded in the API metrics and in the trace.
+        If the dao runs for an async dao, the wait is deferred to the event
+        loop.
+        """
+        schedule = Route53Dao.get_schedule(waiter_nm)
+
+        if AsyncExecutor.defer(
+            self.route53, "route53", waiter_nm, schedule, kwargs
+        ):
+            return
+
+        with Tracer.waiter(f"route53.{waiter_nm}"), ApiMetrics.waiter(
+            "route53", waiter_nm
+        ):
+            AdaptiveWaiter(self.route53, waiter_nm, schedule).wait(**kwargs)
+
+    @staticmethod
+    def get_schedule(waiter_nm: str) -> WaiterSchedule:
+        """
+        Returns the schedule of a Route53 waiter set in route53.ini.
+        """
+        schedule = Route53Dao.__schedules.get(waiter_nm)
+
+        if not schedule:
+            schedule = WaiterSchedule(
+                **Route53Constants().get_waiter_config(waiter_nm)
+            )
+            Route53Dao.__schedules[waiter_nm] = schedule
+
+        return schedule
@@ -0,0 +1,103 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from com.maxmin.aws.constants import ClientConstants
+
+
+class AsyncExecutor(object):
+    """
+    Process-wide pool of the threads that run the blocking boto3 calls of
+    the async daos, sized by max_workers in the ASYNC section of client.ini,
+    so that an event loop can issue hundreds of calls without a thread for
+    each one.
+    While a method runs with run_deferring, the waits of the daos in the
+    thread are not made: the daos record them and return at once, the async
+    dao polls them from the event loop when the method is done.
+    """
+
+    __lock = threading.Lock()
+    __local = threading.local()
+    __executor = None
+
+    @staticmethod
+    def get_executor() -> ThreadPoolExecutor:
+        with AsyncExecutor.__lock:
+            if not AsyncExecutor.__executor:
+                AsyncExecutor.__executor = ThreadPoolExecutor(
+                    max_workers=ClientConstants().async_max_workers,
+                    thread_name_prefix="async",
+                )
+
+            return AsyncExecutor.__executor
+
+    @staticmethod
+    def shutdown() -> None:
+        """
+        Stops the threads of the pool, the next call builds a new one.
+        """
+        with AsyncExecutor.__lock:
+            executor = AsyncExecutor.__executor
+            AsyncExecutor.__executor = None
+
+        if executor:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    async def run(function, *args, **kwargs):
+        """
+        Runs a blocking function in the pool, in the context of the caller,
+        eg: the region of the clients.
+        Returns the result of the function.
+        """
+        context = contextvars.copy_context()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            AsyncExecutor.get_executor(),
+            functools.partial(context.run, function, *args, **kwargs),
+        )
+
+    @staticmethod
+    async def run_deferring(function, *args, **kwargs) -> tuple:
+        """
+        Runs a blocking function in the pool, deferring the waits of the
+        daos it calls.
+        Returns the result of the function and the list of the waits
+        deferred, as (client, service name, waiter name, WaiterSchedule,
+        waiter arguments) tuples.
+        """
+
+        def deferring() -> tuple:
+            AsyncExecutor.__local.waits = []
+
+            try:
+                return function(*args, **kwargs), AsyncExecutor.__local.waits
+            finally:
+                AsyncExecutor.__local.waits = None
+
+        return await AsyncExecutor.run(deferring)
+
+    @staticmethod
+    def defer(
+        client, service_nm: str, waiter_nm: str, schedule, kwargs: dict
+    ) -> bool:
+        """
+        Records a wait if the current thread runs with run_deferring.
+        Returns True if the wait is deferred, False if it has to be made.
+        """
+        waits = getattr(AsyncExecutor.__local, "waits", None)
+
+        if waits is None:
+            return False
+
+        waits.append((client, service_nm, waiter_nm, schedule, kwargs))
+
+        return True
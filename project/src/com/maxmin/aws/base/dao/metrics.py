@@ -0,0 +1,352 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from com.maxmin.aws.logs import Logger
+
+
+class LatencyHistogram(object):
+    """
+    Counts the latencies in buckets with fixed upper bounds, in milliseconds,
+    the last bucket has no upper bound.
+    """
+
+    BOUNDS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+    def __init__(self):
+        self.counts = [0] * (len(LatencyHistogram.BOUNDS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        millis = seconds * 1000
+        index = len(LatencyHistogram.BOUNDS)
+
+        for i, bound in enumerate(LatencyHistogram.BOUNDS):
+            if millis <= bound:
+                index = i
+                break
+
+        self.counts[index] += 1
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def percentile(self, percent: int) -> float:
+        """
+        Returns the upper bound in milliseconds of the bucket that holds the
+        percentile, the maximum latency if the bucket has no upper bound.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = self.count * percent / 100
+        total = 0
+
+        for i, count in enumerate(self.counts):
+            total += count
+
+            if total >= rank and i < len(LatencyHistogram.BOUNDS):
+                return min(
+                    float(LatencyHistogram.BOUNDS[i]), self.max_seconds * 1000
+                )
+
+        return self.max_seconds * 1000
+
+    def to_dictionary(self) -> dict:
+        buckets = {}
+
+        for i, bound in enumerate(LatencyHistogram.BOUNDS):
+            buckets[str(bound)] = self.counts[i]
+
+        buckets["inf"] = self.counts[-1]
+
+        return {
+            "seconds": round(self.seconds, 6),
+            "max_seconds": round(self.max_seconds, 6),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "buckets_ms": buckets,
+        }
+
+
+class ApiMetrics(object):
+    """
+    Process-wide counters of the AWS calls, fed by the botocore events of the
+    clients built by the ClientRegistry.
+    For each service and operation it records the calls, the errors, the
+    retries, the throttles and the latency histogram, and for each waiter
+    the time spent waiting.
+    The handlers are registered on every client and do nothing until the
+    metrics are enabled.
+    """
+
+    # error codes returned by AWS when the request rate is exceeded
+    THROTTLING_CODES = {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+        "PriorRequestNotComplete",
+        "SlowDown",
+    }
+
+    __START_KEY = "api_metrics_start"
+
+    __enabled = False
+    __lock = threading.Lock()
+    # (service, operation): [calls, errors, retries, throttles, histogram]
+    __operations = {}
+    # (service, waiter): histogram
+    __waiters = {}
+
+    @staticmethod
+    def enable() -> None:
+        """
+        Turns the metrics on and discards the counters.
+        """
+        with ApiMetrics.__lock:
+            ApiMetrics.__enabled = True
+            ApiMetrics.__operations.clear()
+            ApiMetrics.__waiters.clear()
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the metrics off and discards the counters.
+        """
+        with ApiMetrics.__lock:
+            ApiMetrics.__enabled = False
+            ApiMetrics.__operations.clear()
+            ApiMetrics.__waiters.clear()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return ApiMetrics.__enabled
+
+    @staticmethod
+    def attach(client) -> None:
+        """
+        Registers the metrics handlers on the events of a client.
+        """
+        events = client.meta.events
+
+        events.register(
+            "before-call",
+            ApiMetrics.__before_call,
+            unique_id="api-metrics-before-call",
+        )
+        events.register(
+            "after-call",
+            ApiMetrics.__after_call,
+            unique_id="api-metrics-after-call",
+        )
+        events.register(
+            "after-call-error",
+            ApiMetrics.__after_call_error,
+            unique_id="api-metrics-after-call-error",
+        )
+        events.register(
+            "needs-retry",
+            ApiMetrics.__needs_retry,
+            unique_id="api-metrics-needs-retry",
+        )
+
+    @staticmethod
+    @contextmanager
+    def waiter(service_nm: str, waiter_nm: str):
+        """
+        Records the time spent in the block as a wait of a waiter.
+        The requests made by the waiter are counted with the others.
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            if ApiMetrics.__enabled:
+                key = (service_nm, waiter_nm)
+
+                with ApiMetrics.__lock:
+                    histogram = ApiMetrics.__waiters.setdefault(
+                        key, LatencyHistogram()
+                    )
+                    histogram.add(time.perf_counter() - start)
+
+    @staticmethod
+    def to_dictionary() -> dict:
+        """
+        Returns the counters as a dictionary that can be dumped to JSON.
+        """
+        with ApiMetrics.__lock:
+            operations = []
+            total_calls = 0
+
+            for key in sorted(ApiMetrics.__operations):
+                (
+                    calls,
+                    errors,
+                    retries,
+                    throttles,
+                    histogram,
+                ) = ApiMetrics.__operations[key]
+                total_calls += calls
+
+                operations.append(
+                    {
+                        "service": key[0],
+                        "operation": key[1],
+                        "calls": calls,
+                        "errors": errors,
+                        "retries": retries,
+                        "throttles": throttles,
+                        "latency": histogram.to_dictionary(),
+                    }
+                )
+
+            waiters = []
+
+            for key in sorted(ApiMetrics.__waiters):
+                histogram = ApiMetrics.__waiters[key]
+
+                waiters.append(
+                    {
+                        "service": key[0],
+                        "waiter": key[1],
+                        "waits": histogram.count,
+                        "latency": histogram.to_dictionary(),
+                    }
+                )
+
+            return {
+                "total_calls": total_calls,
+                "operations": operations,
+                "waiters": waiters,
+            }
+
+    @staticmethod
+    def export(file_nm: str) -> None:
+        """
+        Writes the counters to a JSON file.
+        """
+        with open(file_nm, "w") as file:
+            json.dump(ApiMetrics.to_dictionary(), file, indent=2)
+
+    @staticmethod
+    def report(file_nm: str = None) -> None:
+        """
+        Logs a summary table of the counters and, if file_nm is set, writes
+        them to a JSON file. Does nothing if the metrics are disabled.
+        """
+        if not ApiMetrics.__enabled:
+            return
+
+        metrics = ApiMetrics.to_dictionary()
+
+        Logger.info(
+            f"{'service':10}{'operation':36}{'calls':>7}{'errors':>7}"
+            f"{'retries':>8}{'throttles':>10}{'avg ms':>9}{'p50 ms':>9}"
+            f"{'p95 ms':>9}{'max ms':>9}"
+        )
+
+        for operation in metrics.get("operations"):
+            latency = operation.get("latency")
+            avg = latency.get("seconds") * 1000 / operation.get("calls")
+
+            Logger.info(
+                f"{operation.get('service'):10}"
+                f"{operation.get('operation'):36}"
+                f"{operation.get('calls'):>7}"
+                f"{operation.get('errors'):>7}"
+                f"{operation.get('retries'):>8}"
+                f"{operation.get('throttles'):>10}"
+                f"{avg:>9.0f}"
+                f"{latency.get('p50_ms'):>9.0f}"
+                f"{latency.get('p95_ms'):>9.0f}"
+                f"{latency.get('max_seconds') * 1000:>9.0f}"
+            )
+
+        Logger.info(f"{'total':46}{metrics.get('total_calls'):>7}")
+
+        for waiter in metrics.get("waiters"):
+            latency = waiter.get("latency")
+
+            Logger.info(
+                f"{waiter.get('service'):10}"
+                f"{waiter.get('waiter'):36}"
+                f"{waiter.get('waits'):>7} waits"
+                f"{latency.get('seconds'):>10.1f}s"
+            )
+
+        if file_nm:
+            ApiMetrics.export(file_nm)
+
+    @staticmethod
+    def __before_call(model, context, **kwargs) -> None:
+        if ApiMetrics.__enabled:
+            context[ApiMetrics.__START_KEY] = time.perf_counter()
+
+    @staticmethod
+    def __after_call(model, parsed, context, **kwargs) -> None:
+        start = context.pop(ApiMetrics.__START_KEY, None)
+
+        if start is None:
+            return
+
+        metadata = parsed.get("ResponseMetadata") or {}
+
+        ApiMetrics.__record(
+            model,
+            time.perf_counter() - start,
+            "Error" in parsed,
+            metadata.get("RetryAttempts", 0),
+        )
+
+    @staticmethod
+    def __after_call_error(model, context, **kwargs) -> None:
+        start = context.pop(ApiMetrics.__START_KEY, None)
+
+        if start is not None:
+            ApiMetrics.__record(model, time.perf_counter() - start, True, 0)
+
+    @staticmethod
+    def __needs_retry(response, operation, **kwargs) -> None:
+        if not ApiMetrics.__enabled or not response:
+            return
+
+        code = (response[1].get("Error") or {}).get("Code")
+
+        if code in ApiMetrics.THROTTLING_CODES:
+            with ApiMetrics.__lock:
+                ApiMetrics.__get_operation(operation)[3] += 1
+
+    @staticmethod
+    def __record(model, seconds: float, error: bool, retries: int) -> None:
+        with ApiMetrics.__lock:
+            if not ApiMetrics.__enabled:
+                return
+
+            counters = ApiMetrics.__get_operation(model)
+            counters[0] += 1
+            counters[1] += 1 if error else 0
+            counters[2] += retries
+            counters[4].add(seconds)
+
+    @staticmethod
+    def __get_operation(model) -> list:
+        key = (model.service_model.service_name, model.name)
+
+        return ApiMetrics.__operations.setdefault(
+            key, [0, 0, 0, 0, LatencyHistogram()]
+        )
@@ -0,0 +1,431 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from typing import Iterator
+
+from botocore import xform_name
+from botocore.exceptions import WaiterError
+from botocore.waiter import NormalizedOperationMethod
+
+
+class WaiterSchedule(object):
+    """
+    Delays between the polls of a waiter: a first quick poll, then delays
+    growing exponentially up to max_delay, each one shortened by a random
+    jitter so that the waiters started together don't poll together.
+    Keyword arguments:
+        first_delay -- seconds before the second poll, the first is immediate.
+        max_delay -- upper bound of the delays.
+        multiplier -- growth factor of the delays.
+        jitter -- fraction of each delay that is randomly cut, 0 no jitter.
+        timeout -- seconds after which the waiter gives up.
+        multiplexed -- if True, the waits on single resources of the same
+        type share their describe calls.
+        window -- seconds a multiplexed describe response is reused.
+    """
+
+    def __init__(
+        self,
+        first_delay: float = 1,
+        max_delay: float = 15,
+        multiplier: float = 2,
+        jitter: float = 0.2,
+        timeout: float = 600,
+        multiplexed: bool = True,
+        window: float = 1,
+    ):
+        self.first_delay = first_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+        self.multiplexed = multiplexed
+        self.window = window
+
+    def delays(self) -> Iterator:
+        """
+        Yields the delays between the polls.
+        """
+        delay = self.first_delay
+
+        while True:
+            yield min(delay, self.max_delay) * (
+                1 - self.jitter * random.random()
+            )
+
+            delay *= self.multiplier
+
+
+class WaitGroup(object):
+    """
+    Resources of the same type waited for at the same time, with the last
+    describe response that covered them.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.resource_ids = {}
+        self.response = None
+        self.polled_ids = set()
+        self.polled_at = 0.0
+
+    def join(self, resource_id: str) -> None:
+        with self.lock:
+            self.resource_ids[resource_id] = (
+                self.resource_ids.get(resource_id, 0) + 1
+            )
+
+    def leave(self, resource_id: str) -> None:
+        with self.lock:
+            self.resource_ids[resource_id] -= 1
+
+            if not self.resource_ids[resource_id]:
+                del self.resource_ids[resource_id]
+
+    def get_pending_ids(self) -> list:
+        with self.lock:
+            return sorted(self.resource_ids)
+
+    def covers(self, resource_id: str, since: float, window: float) -> bool:
+        """
+        Returns True if the last response covered the resource, after since
+        and within the window.
+        """
+        return (
+            resource_id in self.polled_ids
+            and self.polled_at > since
+            and time.monotonic() - self.polled_at <= window
+        )
+
+    def update(self, response: dict, resource_ids: list) -> None:
+        self.response = response
+        self.polled_ids = set(resource_ids)
+        self.polled_at = time.monotonic()
+
+
+class AsyncWaitGroup(WaitGroup):
+    """
+    WaitGroup of the waits of an event loop, the describe call is made
+    holding an asyncio lock so that the waits that join meanwhile reuse its
+    response.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.poll_lock = asyncio.Lock()
+
+
+class AdaptiveWaiter(object):
+    """
+    Polls a resource until it reaches the state checked by a botocore
+    waiter, with the acceptors of the botocore waiter model and the delays of
+    a WaiterSchedule instead of the fixed delay of the model.
+    The waits on a single resource of the types below are multiplexed: each
+    poll describes all the resources of the same type being waited for, the
+    response is shared by the threads waiting for them.
+    """
+
+    # waiter: (identifiers parameter, response key, identifier key)
+    MULTIPLEXED = {
+        "vpc_available": ("VpcIds", "Vpcs", "VpcId"),
+        "subnet_available": ("SubnetIds", "Subnets", "SubnetId"),
+        "security_group_exists": ("GroupIds", "SecurityGroups", "GroupId"),
+        "internet_gateway_exists": (
+            "InternetGatewayIds",
+            "InternetGateways",
+            "InternetGatewayId",
+        ),
+        "image_available": ("ImageIds", "Images", "ImageId"),
+        "instance_running": ("InstanceIds", "Reservations", "InstanceId"),
+        "instance_terminated": ("InstanceIds", "Reservations", "InstanceId"),
+        "instance_status_ok": (
+            "InstanceIds",
+            "InstanceStatuses",
+            "InstanceId",
+        ),
+    }
+
+    __lock = threading.Lock()
+    # client: {waiter: WaitGroup}, dropped with the client
+    __groups = weakref.WeakKeyDictionary()
+
+    def __init__(self, client, waiter_nm: str, schedule: WaiterSchedule):
+        self.client = client
+        self.waiter_nm = waiter_nm
+        self.schedule = schedule
+
+        config = client.get_waiter(waiter_nm).config
+        self.acceptors = config.acceptors
+        self.operation = NormalizedOperationMethod(
+            getattr(client, xform_name(config.operation))
+        )
+
+    def wait(self, **kwargs) -> None:
+        """
+        Polls until an acceptor matches.
+        Raises a WaiterError if the resource reaches a failure state, if AWS
+        returns an unexpected error or if the schedule times out.
+        """
+        deadline = time.monotonic() + self.schedule.timeout
+        delays = self.schedule.delays()
+        resource_id = self.get_multiplexed_id(kwargs)
+        polled_at = 0.0
+
+        if resource_id:
+            with AdaptiveWaiter.__lock:
+                group = AdaptiveWaiter.__groups.setdefault(
+                    self.client, {}
+                ).setdefault(self.waiter_nm, WaitGroup())
+
+            group.join(resource_id)
+
+        try:
+            while True:
+                if resource_id:
+                    response, polled_at = self.__poll_group(
+                        group, resource_id, polled_at
+                    )
+                else:
+                    response = self.operation(**kwargs)
+
+                if self.check(response):
+                    return
+
+                delay = next(delays)
+                self.check_deadline(deadline, delay, response)
+
+                time.sleep(delay)
+        finally:
+            if resource_id:
+                group.leave(resource_id)
+
+    def check(self, response: dict) -> bool:
+        """
+        Returns True if the response matches a success acceptor, False if
+        the waiter has to poll again.
+        Raises a WaiterError if the response matches a failure acceptor or
+        is an error not matched by any acceptor.
+        """
+        state = None
+
+        for acceptor in self.acceptors:
+            if acceptor.matcher_func(response):
+                state = acceptor.state
+                break
+
+        if state == "failure":
+            raise WaiterError(
+                name=self.waiter_nm,
+                reason="Waiter encountered a terminal failure state",
+                last_response=response,
+            )
+
+        if state is None and "Error" in response:
+            raise WaiterError(
+                name=self.waiter_nm,
+                reason="An error occurred ("
+                + response["Error"].get("Code", "Unknown")
+                + ")",
+                last_response=response,
+            )
+
+        return state == "success"
+
+    def check_deadline(
+        self, deadline: float, delay: float, response: dict
+    ) -> None:
+        """
+        Raises a WaiterError if the next poll would be after the deadline.
+        """
+        if time.monotonic() + delay > deadline:
+            raise WaiterError(
+                name=self.waiter_nm,
+                reason=f"Timed out after {self.schedule.timeout} seconds",
+                last_response=response,
+            )
+
+    def get_multiplexed_id(self, kwargs: dict) -> str:
+        """
+        Returns the identifier of the resource if the wait can be
+        multiplexed, None otherwise.
+        """
+        multiplexed = AdaptiveWaiter.MULTIPLEXED.get(self.waiter_nm)
+
+        if not self.schedule.multiplexed or not multiplexed:
+            return None
+
+        resource_ids = kwargs.get(multiplexed[0])
+
+        if list(kwargs) != [multiplexed[0]] or len(resource_ids) != 1:
+            return None
+
+        return resource_ids[0]
+
+    def select(self, response: dict, resource_id: str) -> dict:
+        """
+        Returns the part of a multiplexed describe response that concerns the
+        resource.
+        """
+        if "Error" in response:
+            return response
+
+        _, response_key, id_key = AdaptiveWaiter.MULTIPLEXED[self.waiter_nm]
+        items = response.get(response_key) or []
+
+        if response_key == "Reservations":
+            selected = []
+
+            for reservation in items:
+                instances = [
+                    instance
+                    for instance in reservation.get("Instances") or []
+                    if instance.get(id_key) == resource_id
+                ]
+
+                if instances:
+                    selected.append(dict(reservation, Instances=instances))
+        else:
+            selected = [
+                item for item in items if item.get(id_key) == resource_id
+            ]
+
+        return {response_key: selected}
+
+    def __poll_group(
+        self, group: WaitGroup, resource_id: str, since: float
+    ) -> tuple:
+        """
+        Returns the describe response of the resource and the time of the
+        call, from the last call of the group if it covered the resource
+        after the previous poll of the waiter and within the window, from a
+        new call that describes all the resources of the group otherwise.
+        """
+        parameter = AdaptiveWaiter.MULTIPLEXED[self.waiter_nm][0]
+
+        with group.lock:
+            if not group.covers(resource_id, since, self.schedule.window):
+                resource_ids = sorted(group.resource_ids)
+
+                group.update(
+                    self.operation(**{parameter: resource_ids}), resource_ids
+                )
+
+            response = group.response
+            polled_ids = group.polled_ids
+            polled_at = group.polled_at
+
+        if "Error" in response and len(polled_ids) > 1:
+            # the error may concern another resource of the group
+            return (
+                self.operation(**{parameter: [resource_id]}),
+                time.monotonic(),
+            )
+
+        return self.select(response, resource_id), polled_at
+
+
+class AsyncAdaptiveWaiter(AdaptiveWaiter):
+    """
+    AdaptiveWaiter for an event loop: the waiter sleeps with asyncio, so
+    that a wait doesn't hold a thread, and the describe calls run in an
+    executor. The multiplexed waits of the same event loop share their
+    describe calls.
+    Keyword arguments:
+        executor -- the executor of the describe calls, if not set the
+        default executor of the event loop.
+    """
+
+    # event loop: {(client, waiter): AsyncWaitGroup}, dropped with the loop
+    __groups = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self, client, waiter_nm: str, schedule: WaiterSchedule, executor=None
+    ):
+        super().__init__(client, waiter_nm, schedule)
+        self.executor = executor
+
+    async def wait(self, **kwargs) -> None:
+        """
+        Polls until an acceptor matches.
+        Raises a WaiterError if the resource reaches a failure state, if AWS
+        returns an unexpected error or if the schedule times out.
+        """
+        deadline = time.monotonic() + self.schedule.timeout
+        delays = self.schedule.delays()
+        resource_id = self.get_multiplexed_id(kwargs)
+        polled_at = 0.0
+
+        if resource_id:
+            groups = AsyncAdaptiveWaiter.__groups.setdefault(
+                asyncio.get_running_loop(), {}
+            )
+            group = groups.setdefault(
+                (id(self.client), self.waiter_nm), AsyncWaitGroup()
+            )
+            group.join(resource_id)
+
+        try:
+            while True:
+                if resource_id:
+                    response, polled_at = await self.__poll_group(
+                        group, resource_id, polled_at
+                    )
+                else:
+                    response = await self.__call(kwargs)
+
+                if self.check(response):
+                    return
+
+                delay = next(delays)
+                self.check_deadline(deadline, delay, response)
+
+                await asyncio.sleep(delay)
+        finally:
+            if resource_id:
+                group.leave(resource_id)
+
+    async def __call(self, kwargs: dict) -> dict:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, lambda: self.operation(**kwargs)
+        )
+
+    async def __poll_group(
+        self, group: AsyncWaitGroup, resource_id: str, since: float
+    ) -> tuple:
+        """
+        Returns the describe response of the resource and the time of the
+        call, from the last call of the group if it covered the resource
+        after the previous poll of the waiter and within the window, from a
+        new call that describes all the resources of the group otherwise.
+        """
+        parameter = AdaptiveWaiter.MULTIPLEXED[self.waiter_nm][0]
+
+        async with group.poll_lock:
+            if not group.covers(resource_id, since, self.schedule.window):
+                resource_ids = group.get_pending_ids()
+
+                group.update(
+                    await self.__call({parameter: resource_ids}),
+                    resource_ids,
+                )
+
+            response = group.response
+            polled_ids = group.polled_ids
+            polled_at = group.polled_at
+
+        if "Error" in response and len(polled_ids) > 1:
+            # the error may concern another resource of the group
+            return (
+                await self.__call({parameter: [resource_id]}),
+                time.monotonic(),
+            )
+
+        return self.select(response, resource_id), polled_at
@@ -0,0 +1,351 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.base.trace import Tracer
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+
+
+class GraphNode(object):
+    """
+    A step of a resource graph.
+    Keyword arguments:
+        action -- function without arguments run by the step.
+        dependencies -- names of the nodes that must succeed before the step.
+        timeout -- seconds the step may run, if not set no limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        action,
+        dependencies: list = None,
+        timeout: float = None,
+    ):
+        self.name = name
+        self.action = action
+        self.dependencies = list(dependencies or [])
+        self.timeout = timeout
+
+
+class ResourceGraph(object):
+    """
+    Directed acyclic graph of the steps needed to create or delete a set of
+    resources, the edges go from a node to the nodes it depends on.
+    """
+
+    def __init__(self):
+        # keeps the insertion order, nodes ready at the same time are run in
+        # the order they were added
+        self.nodes = {}
+
+    def add_node(
+        self,
+        name: str,
+        action,
+        dependencies: list = None,
+        timeout: float = None,
+    ) -> GraphNode:
+        if name in self.nodes:
+            raise AwsException(f"Node {name} already in the graph!")
+
+        node = GraphNode(name, action, dependencies, timeout)
+        self.nodes[name] = node
+
+        return node
+
+    def dependents(self, name: str) -> list:
+        """
+        Returns the names of the nodes that depend directly on the node.
+        """
+        return [
+            node.name
+            for node in self.nodes.values()
+            if name in node.dependencies
+        ]
+
+    def validate(self) -> None:
+        """
+        Checks that all the dependencies are in the graph and that there are
+        no cycles.
+        """
+        for node in self.nodes.values():
+            for dependency in node.dependencies:
+                if dependency not in self.nodes:
+                    raise AwsException(
+                        f"Node {node.name} depends on unknown {dependency}!"
+                    )
+
+        remaining = {
+            name: len(node.dependencies) for name, node in self.nodes.items()
+        }
+        ready = [name for name, count in remaining.items() if count == 0]
+        visited = 0
+
+        while ready:
+            name = ready.pop()
+            visited += 1
+
+            for dependent in self.dependents(name):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if visited != len(self.nodes):
+            raise AwsException("The graph has a cycle!")
+
+
+class GraphResult(object):
+    """
+    Outcome of a graph execution, by node name: the state, the value
+    returned by the action, the error, the seconds it run and the seconds
+    from the start of the execution when it ended.
+    """
+
+    def __init__(self):
+        self.states = {}
+        self.values = {}
+        self.errors = {}
+        self.timings = {}
+        self.finished = {}
+        self.elapsed = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return all(
+            state == GraphExecutor.SUCCEEDED for state in self.states.values()
+        )
+
+    @property
+    def failed_nodes(self) -> list:
+        return [
+            name
+            for name, state in self.states.items()
+            if state in (GraphExecutor.FAILED, GraphExecutor.TIMED_OUT)
+        ]
+
+
+class GraphExecutor(object):
+    """
+    Runs the nodes of a resource graph in a bounded thread pool, each node as
+    soon as all its dependencies have succeeded.
+    With the fail-fast policy no new node is started after the first
+    failure, the running ones are waited for. With the continue-on-error
+    policy only the nodes that depend on a failed node are skipped.
+    A node that runs longer than its timeout is marked as timed out and its
+    thread is abandoned, Python threads can't be stopped.
+    With the run journal enabled the nodes that succeeded are recorded and
+    the ones recorded by a previous run aren't run again.
+    """
+
+    FAIL_FAST = "fail_fast"
+    CONTINUE_ON_ERROR = "continue_on_error"
+
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    SKIPPED = "skipped"
+
+    # seconds between the checks of a node with a timeout that is submitted
+    # but not yet started by its thread
+    START_POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        policy: str = FAIL_FAST,
+    ):
+        if max_workers < 1:
+            raise AwsException("Max workers must be greater than zero!")
+
+        if policy not in (
+            GraphExecutor.FAIL_FAST,
+            GraphExecutor.CONTINUE_ON_ERROR,
+        ):
+            raise AwsException(f"Unknown policy {policy}!")
+
+        self.max_workers = max_workers
+        self.policy = policy
+
+    def execute(self, graph: ResourceGraph) -> GraphResult:
+        """
+        Runs the graph.
+        Returns a GraphResult object.
+        """
+        graph.validate()
+
+        result = GraphResult()
+        lock = threading.Lock()
+        started = {}
+        remaining = {}
+
+        for name, node in graph.nodes.items():
+            result.states[name] = GraphExecutor.PENDING
+            remaining[name] = set(node.dependencies)
+
+        ready = [name for name in graph.nodes if not remaining[name]]
+        running = {}
+        stopped = False
+        abandoned = False
+
+        def run(node: GraphNode):
+            with lock:
+                started[node.name] = time.monotonic()
+
+            Logger.debug(f"Node {node.name} started ...")
+
+            with Tracer.span(node.name, Tracer.NODE):
+                value = node.action()
+
+            RunJournal.complete(node.name)
+
+            return value
+
+        def skip(name: str) -> None:
+            for dependent in graph.dependents(name):
+                if result.states[dependent] == GraphExecutor.PENDING:
+                    result.states[dependent] = GraphExecutor.SKIPPED
+                    Logger.warn(f"Node {dependent} skipped!")
+                    skip(dependent)
+
+        def complete(name: str, state: str, value=None, error=None) -> None:
+            nonlocal stopped
+
+            with lock:
+                result.timings[name] = time.monotonic() - started.get(
+                    name, time.monotonic()
+                )
+                result.finished[name] = time.monotonic() - start
+
+            result.states[name] = state
+
+            if state == GraphExecutor.SUCCEEDED:
+                result.values[name] = value
+                Logger.debug(f"Node {name} succeeded!")
+
+                for dependent in graph.dependents(name):
+                    remaining[dependent].discard(name)
+
+                    if (
+                        not remaining[dependent]
+                        and result.states[dependent] == GraphExecutor.PENDING
+                    ):
+                        ready.append(dependent)
+            else:
+                result.errors[name] = error
+                Logger.error(f"Node {name} {state}: {error}")
+
+                skip(name)
+
+                if self.policy == GraphExecutor.FAIL_FAST:
+                    stopped = True
+
+        start = time.monotonic()
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="graph"
+        )
+
+        try:
+            while True:
+                if not stopped:
+                    for name in ready:
+                        if RunJournal.is_completed(name):
+                            # completed by a previous run that failed, its
+                            # dependents are added to the ready ones
+                            Logger.info(f"Node {name} already completed!")
+                            complete(name, GraphExecutor.SUCCEEDED)
+                            continue
+
+                        # the node runs in the context of the caller, eg:
+                        # the region of the clients
+                        future = pool.submit(
+                            contextvars.copy_context().run,
+                            run,
+                            graph.nodes[name],
+                        )
+                        running[future] = name
+
+                ready.clear()
+
+                if not running:
+                    break
+
+                wait_timeout = None
+                now = time.monotonic()
+
+                with lock:
+                    for name in running.values():
+                        node_timeout = graph.nodes[name].timeout
+
+                        if node_timeout is None:
+                            continue
+
+                        if name in started:
+                            left = max(0, started[name] + node_timeout - now)
+                        else:
+                            # the thread hasn't started the node yet, its
+                            # timeout is checked again shortly
+                            left = GraphExecutor.START_POLL_INTERVAL
+
+                        if wait_timeout is None or left < wait_timeout:
+                            wait_timeout = left
+
+                done, _ = wait(
+                    running.keys(),
+                    timeout=wait_timeout,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+
+                    if error:
+                        complete(name, GraphExecutor.FAILED, error=error)
+                    else:
+                        complete(
+                            name, GraphExecutor.SUCCEEDED, future.result()
+                        )
+
+                now = time.monotonic()
+
+                for future, name in list(running.items()):
+                    node_timeout = graph.nodes[name].timeout
+
+                    with lock:
+                        start_time = started.get(name)
+
+                    if (
+                        node_timeout is not None
+                        and start_time is not None
+                        and now - start_time >= node_timeout
+                    ):
+                        running.pop(future)
+                        abandoned = True
+                        complete(
+                            name,
+                            GraphExecutor.TIMED_OUT,
+                            error=AwsException(
+                                f"Timed out after {node_timeout} seconds!"
+                            ),
+                        )
+        finally:
+            pool.shutdown(wait=not abandoned, cancel_futures=True)
+
+        for name, state in result.states.items():
+            if state == GraphExecutor.PENDING:
+                result.states[name] = GraphExecutor.SKIPPED
+
+        result.elapsed = time.monotonic() - start
+
+        return result
@@ -0,0 +1,206 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+
+
+class RunJournal(object):
+    """
+    Local journal of a run, kept until the run succeeds, so that a run
+    started again after a failure resumes it:
+    - the steps completed aren't run again;
+    - the AWS operations in flight, eg: instances launched, DNS changes
+      submitted, are joined instead of being requested again.
+    The journal is a JSON file, written whole after each change, eg:
+    {"run": "3f2a...", "steps": ["vpc"], "operations": {"launch:...": {}}}.
+    The run is the digest of the configuration, a journal written with a
+    different configuration is discarded.
+    """
+
+    __lock = threading.Lock()
+    __journal_file = None
+    __journal = {}
+
+    @staticmethod
+    def enable(journal_file: str, run_id: str) -> None:
+        """
+        Turns the journal on and reads it.
+        Keyword arguments:
+            journal_file -- the JSON file of the journal, created if missing.
+            run_id -- digest of the configuration of the run.
+        """
+        with RunJournal.__lock:
+            RunJournal.__journal_file = journal_file
+            journal = RunJournal.__read()
+
+            if journal.get("run") != run_id:
+                if journal:
+                    Logger.warn("Configuration changed, journal discarded!")
+
+                journal = {"run": run_id, "steps": [], "operations": {}}
+            else:
+                Logger.info(
+                    f"Resuming the run, {len(journal.get('steps'))} steps "
+                    "completed!"
+                )
+
+            RunJournal.__journal = journal
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the journal off, the file is kept.
+        """
+        with RunJournal.__lock:
+            RunJournal.__journal_file = None
+            RunJournal.__journal = {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return RunJournal.__journal_file is not None
+
+    @staticmethod
+    def close() -> None:
+        """
+        Removes the journal of a run that has succeeded and turns it off.
+        """
+        with RunJournal.__lock:
+            if not RunJournal.is_enabled():
+                return
+
+            RunJournal.__remove(RunJournal.__journal_file)
+            RunJournal.__journal_file = None
+            RunJournal.__journal = {}
+
+    @staticmethod
+    def discard(journal_file: str) -> None:
+        """
+        Removes the journal of a run, eg: the resources it records are
+        deleted.
+        """
+        with RunJournal.__lock:
+            RunJournal.__remove(journal_file)
+
+    @staticmethod
+    def build_run_id(config_files: list) -> str:
+        """
+        Returns the digest of the configuration files of a run and of the
+        default region.
+        """
+        digest = hashlib.sha256(str(os.getenv("AWS_DEFAULT_REGION")).encode())
+
+        for config_file in config_files:
+            with open(config_file, "rb") as file:
+                digest.update(file.read())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def is_completed(step_nm: str) -> bool:
+        with RunJournal.__lock:
+            return step_nm in RunJournal.__journal.get("steps", [])
+
+    @staticmethod
+    def complete(step_nm: str) -> None:
+        """
+        Records a step as completed.
+        """
+        with RunJournal.__lock:
+            if not RunJournal.is_enabled():
+                return
+
+            steps = RunJournal.__journal.get("steps")
+
+            if step_nm not in steps:
+                steps.append(step_nm)
+                RunJournal.__write()
+
+    @staticmethod
+    def get_operation(key: str) -> dict:
+        """
+        Returns the values recorded for an operation, None if not in the
+        journal.
+        """
+        with RunJournal.__lock:
+            operation = RunJournal.__journal.get("operations", {}).get(key)
+
+            return dict(operation) if operation is not None else None
+
+    @staticmethod
+    def record_operation(key: str, values: dict) -> None:
+        """
+        Records the values of an operation in flight, merged with the ones
+        already recorded.
+        """
+        with RunJournal.__lock:
+            if not RunJournal.is_enabled():
+                return
+
+            RunJournal.__journal.get("operations").setdefault(key, {}).update(
+                values
+            )
+            RunJournal.__write()
+
+    @staticmethod
+    def finish_operation(key: str) -> None:
+        """
+        Removes an operation that has completed.
+        """
+        with RunJournal.__lock:
+            if not RunJournal.is_enabled():
+                return
+
+            if RunJournal.__journal.get("operations").pop(key, None):
+                RunJournal.__write()
+
+    @staticmethod
+    def __read() -> dict:
+        if not os.path.exists(RunJournal.__journal_file):
+            return {}
+
+        try:
+            with open(RunJournal.__journal_file) as file:
+                return json.load(file)
+        except ValueError as e:
+            # the run starts from the beginning
+            Logger.warn(f"Journal file not readable, discarded: {e}")
+
+            return {}
+
+    @staticmethod
+    def __write() -> None:
+        try:
+            directory = os.path.dirname(RunJournal.__journal_file)
+
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # the file is replaced whole, a run that stops while writing
+            # leaves the previous journal
+            temp_file = f"{RunJournal.__journal_file}.tmp"
+
+            with open(temp_file, "w") as file:
+                json.dump(RunJournal.__journal, file, indent=2)
+
+            os.replace(temp_file, RunJournal.__journal_file)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error writing the journal!")
+
+    @staticmethod
+    def __remove(journal_file: str) -> None:
+        try:
+            if os.path.exists(journal_file):
+                os.remove(journal_file)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error removing the journal!")
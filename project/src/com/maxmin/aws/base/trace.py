@@ -0,0 +1,212 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Tracer(object):
+    """
+    Process-wide timeline of a run, exported in the Chrome trace event
+    format, that can be opened with chrome://tracing or Perfetto.
+    The graph nodes, the AWS calls and the waiters are recorded as spans on
+    the lane of the thread that run them, so the steps run in parallel show
+    up as overlapping lanes. The calls made by a waiter are recorded as polls
+    inside the span of the waiter.
+    The handlers are registered on every client and do nothing until the
+    tracer is enabled.
+    """
+
+    NODE = "node"
+    API = "api"
+    WAITER = "waiter"
+    POLL = "poll"
+
+    __START_KEY = "trace_start"
+
+    __enabled = False
+    __lock = threading.Lock()
+    __local = threading.local()
+    __origin = 0.0
+    __events = []
+    # thread identifier: thread name
+    __threads = {}
+
+    @staticmethod
+    def enable() -> None:
+        """
+        Turns the tracer on and discards the spans recorded.
+        """
+        with Tracer.__lock:
+            Tracer.__enabled = True
+            Tracer.__origin = time.perf_counter()
+            Tracer.__events.clear()
+            Tracer.__threads.clear()
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the tracer off and discards the spans recorded.
+        """
+        with Tracer.__lock:
+            Tracer.__enabled = False
+            Tracer.__events.clear()
+            Tracer.__threads.clear()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return Tracer.__enabled
+
+    @staticmethod
+    @contextmanager
+    def span(name: str, category: str, **args):
+        """
+        Records the time spent in the block as a span.
+        """
+        if not Tracer.__enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            Tracer.add(name, category, start, time.perf_counter(), **args)
+
+    @staticmethod
+    @contextmanager
+    def waiter(name: str):
+        """
+        Records the time spent in the block as the span of a waiter, the AWS
+        calls made in the block are recorded as polls.
+        """
+        Tracer.__local.waiting = True
+
+        try:
+            with Tracer.span(name, Tracer.WAITER):
+                yield
+        finally:
+            Tracer.__local.waiting = False
+
+    @staticmethod
+    def add(name: str, category: str, start: float, end: float, **args):
+        """
+        Records a span of the current thread, start and end are values of
+        time.perf_counter().
+        """
+        thread = threading.current_thread()
+
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - Tracer.__origin) * 1000000),
+            "dur": round((end - start) * 1000000),
+            "pid": os.getpid(),
+            "tid": thread.native_id,
+        }
+
+        if args:
+            event["args"] = args
+
+        with Tracer.__lock:
+            if Tracer.__enabled:
+                Tracer.__events.append(event)
+                Tracer.__threads[thread.native_id] = thread.name
+
+    @staticmethod
+    def attach(client) -> None:
+        """
+        Registers the tracer handlers on the events of a client.
+        """
+        events = client.meta.events
+
+        events.register(
+            "before-call",
+            Tracer.__before_call,
+            unique_id="trace-before-call",
+        )
+        events.register(
+            "after-call",
+            Tracer.__after_call,
+            unique_id="trace-after-call",
+        )
+        events.register(
+            "after-call-error",
+            Tracer.__after_call_error,
+            unique_id="trace-after-call-error",
+        )
+
+    @staticmethod
+    def to_dictionary() -> dict:
+        """
+        Returns the spans in the Chrome trace event format.
+        """
+        with Tracer.__lock:
+            events = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": thread_nm},
+                }
+                for tid, thread_nm in Tracer.__threads.items()
+            ]
+            events.extend(Tracer.__events)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @staticmethod
+    def export(file_nm: str) -> None:
+        """
+        Writes the spans to a JSON file. Does nothing if the tracer is
+        disabled.
+        """
+        if not Tracer.__enabled:
+            return
+
+        with open(file_nm, "w") as file:
+            json.dump(Tracer.to_dictionary(), file)
+
+    @staticmethod
+    def __before_call(context, **kwargs) -> None:
+        if Tracer.__enabled:
+            context[Tracer.__START_KEY] = time.perf_counter()
+
+    @staticmethod
+    def __after_call(model, parsed, context, **kwargs) -> None:
+        start = context.pop(Tracer.__START_KEY, None)
+
+        if start is not None:
+            code = (parsed.get("Error") or {}).get("Code")
+
+            Tracer.__add_call(model, start, code)
+
+    @staticmethod
+    def __after_call_error(model, context, exception, **kwargs) -> None:
+        start = context.pop(Tracer.__START_KEY, None)
+
+        if start is not None:
+            Tracer.__add_call(model, start, type(exception).__name__)
+
+    @staticmethod
+    def __add_call(model, start: float, error: str) -> None:
+        if getattr(Tracer.__local, "waiting", False):
+            category = Tracer.POLL
+        else:
+            category = Tracer.API
+
+        name = f"{model.service_model.service_name}.{model.name}"
+
+        if error:
+            Tracer.add(name, category, start, time.perf_counter(), error=error)
+        else:
+            Tracer.add(name, category, start, time.perf_counter())
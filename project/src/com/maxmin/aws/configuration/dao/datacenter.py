@@ -195,6 +195,7 @@ class DatacenterConfigDao(object):
             instance_config.target_img = instance.get("TargetImage")
             instance_config.dns_domain = instance.get("DnsDomain")
             instance_config.host_name = instance.get("HostName")
+            instance_config.readiness = instance.get("Readiness")
 
             instance_tags = instance.get("Tags")
             for tag in instance_tags:
@@ -205,4 +206,4 @@ class DatacenterConfigDao(object):
 
             response.instances.append(instance_config)
 
-            return response
+        return response
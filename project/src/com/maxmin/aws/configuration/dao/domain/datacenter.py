@@ -82,6 +82,7 @@ class InstanceConfig(object):
         self.target_img = None
         self.dns_domain = None
         self.host_name = None
+        self.readiness = None
         self.tags = []
 
 
@@ -16,6 +16,35 @@ class IniFileConstants(object):
         self.config = configparser.ConfigParser()
         self.config.read(ini_file)
 
+    def get_waiter_config(self, waiter_nm: str) -> dict:
+        """
+        Returns the schedule of a waiter, the values in the WAITER section
+        overridden by the values in the WAITER.<waiter_nm> section.
+        """
+        waiter_config = {}
+
+        for section in ("WAITER", f"WAITER.{waiter_nm}"):
+            if not self.config.has_section(section):
+                continue
+
+            for key in (
+                "first_delay",
+                "max_delay",
+                "multiplier",
+                "jitter",
+                "timeout",
+                "window",
+            ):
+                if self.config.has_option(section, key):
+                    waiter_config[key] = self.config.getfloat(section, key)
+
+            if self.config.has_option(section, "multiplexed"):
+                waiter_config["multiplexed"] = self.config.getboolean(
+                    section, "multiplexed"
+                )
+
+        return waiter_config
+
 
 class Ec2Constants(IniFileConstants):
     """
@@ -31,6 +60,164 @@ class Ec2Constants(IniFileConstants):
         self.volume_size = int(instance["volume_size"])
         self.instance_type = instance["instance_type"]
         self.tenancy = instance["tenancy"]
+        self.launch_max_workers = self.config.getint(
+            "INSTANCE", "launch_max_workers", fallback=8
+        )
+        self.inventory_enabled = self.config.getboolean(
+            "INVENTORY", "enabled", fallback=False
+        )
+        self.inventory_ttl = self.config.getint(
+            "INVENTORY", "ttl", fallback=60
+        )
+        self.state_enabled = self.config.getboolean(
+            "STATE", "enabled", fallback=False
+        )
+        self.state_file = os.path.join(
+            ProjectDirectories.STATE_DIR,
+            self.config.get("STATE", "file", fallback="datacenter-state.json"),
+        )
+        self.golden_enabled = self.config.getboolean(
+            "GOLDEN", "enabled", fallback=False
+        )
+        self.ssh_port = self.config.getint(
+            "READINESS", "ssh_port", fallback=22
+        )
+        self.ssh_timeout = self.config.getint(
+            "READINESS", "ssh_timeout", fallback=600
+        )
+        self.ssh_interval = self.config.getint(
+            "READINESS", "ssh_interval", fallback=5
+        )
+        self.max_results = self.config.getint(
+            "PAGINATION", "max_results", fallback=1000
+        )
+
+
+class ClientConstants(IniFileConstants):
+    """
+    Loads the client.ini file
+    """
+
+    def __init__(self):
+        super().__init__(ProjectFiles.CLIENT_CONSTANTS_FILE)
+
+        self.max_pool_connections = self.config.getint(
+            "CLIENT", "max_pool_connections", fallback=10
+        )
+        self.tcp_keepalive = self.config.getboolean(
+            "CLIENT", "tcp_keepalive", fallback=True
+        )
+        self.connect_timeout = self.config.getint(
+            "CLIENT", "connect_timeout", fallback=60
+        )
+        self.read_timeout = self.config.getint(
+            "CLIENT", "read_timeout", fallback=60
+        )
+        self.metrics_enabled = self.config.getboolean(
+            "METRICS", "enabled", fallback=False
+        )
+        self.metrics_file = self.config.get("METRICS", "file", fallback=None)
+        self.async_max_workers = self.config.getint(
+            "ASYNC", "max_workers", fallback=self.max_pool_connections
+        )
+
+
+class Route53Constants(IniFileConstants):
+    """
+    Loads the route53.ini file
+    """
+
+    def __init__(self):
+        super().__init__(ProjectFiles.ROUTE53_CONSTANTS_FILE)
+
+        self.record_ttl = self.config.getint("RECORD", "ttl", fallback=300)
+        self.max_changes = self.config.getint(
+            "RECORD", "max_changes", fallback=1000
+        )
+        self.index_enabled = self.config.getboolean(
+            "INDEX", "enabled", fallback=False
+        )
+        self.index_ttl = self.config.getint("INDEX", "ttl", fallback=60)
+        self.hosted_zone_cached = self.config.getboolean(
+            "HOSTED_ZONE", "cached", fallback=False
+        )
+
+
+class DatacenterConstants(IniFileConstants):
+    """
+    Loads the datacenter.ini file
+    """
+
+    def __init__(self):
+        super().__init__(ProjectFiles.DATACENTER_CONSTANTS_FILE)
+
+        self.startup_max_workers = self.config.getint(
+            "STARTUP", "max_workers", fallback=8
+        )
+        self.startup_policy = self.config.get(
+            "STARTUP", "policy", fallback="fail_fast"
+        )
+        self.startup_node_timeout = self.config.getint(
+            "STARTUP", "node_timeout", fallback=300
+        )
+        self.startup_instance_timeout = self.config.getint(
+            "STARTUP", "instance_timeout", fallback=1200
+        )
+        self.shutdown_max_workers = self.config.getint(
+            "SHUTDOWN", "max_workers", fallback=8
+        )
+        self.shutdown_policy = self.config.get(
+            "SHUTDOWN", "policy", fallback="continue_on_error"
+        )
+        self.shutdown_node_timeout = self.config.getint(
+            "SHUTDOWN", "node_timeout", fallback=300
+        )
+        self.shutdown_instance_timeout = self.config.getint(
+            "SHUTDOWN", "instance_timeout", fallback=1200
+        )
+        self.trace_enabled = self.config.getboolean(
+            "TRACE", "enabled", fallback=False
+        )
+        self.trace_file = self.config.get(
+            "TRACE", "file", fallback="datacenter-trace.json"
+        )
+        self.fanout_max_workers = self.config.getint(
+            "FANOUT", "max_workers", fallback=16
+        )
+        self.fanout_policy = self.config.get(
+            "FANOUT", "policy", fallback="continue_on_error"
+        )
+        self.fanout_report_file = self.config.get(
+            "FANOUT", "report_file", fallback=None
+        )
+        self.provision_max_workers = self.config.getint(
+            "PROVISION", "max_workers", fallback=4
+        )
+        self.provision_policy = self.config.get(
+            "PROVISION", "policy", fallback="continue_on_error"
+        )
+        self.provision_playbook_timeout = self.config.getint(
+            "PROVISION", "playbook_timeout", fallback=3600
+        )
+        self.provision_static_inventory = self.config.getboolean(
+            "PROVISION", "static_inventory", fallback=False
+        )
+        self.provision_inventory_file = os.path.join(
+            ProjectDirectories.PROVISION_DIR,
+            "inventory",
+            self.config.get(
+                "PROVISION", "inventory_file", fallback="datacenter.json"
+            ),
+        )
+        self.journal_enabled = self.config.getboolean(
+            "JOURNAL", "enabled", fallback=False
+        )
+        self.journal_file = os.path.join(
+            ProjectDirectories.STATE_DIR,
+            self.config.get(
+                "JOURNAL", "file", fallback="datacenter-journal.json"
+            ),
+        )
 
 
 class ProjectDirectories:
@@ -41,8 +228,15 @@ class ProjectDirectories:
     TEMPLATES_DIR = f"{__datacenter_dir}/project/templates"
     CONSTANTS_DIR = f"{__datacenter_dir}/project/constants"
     TEST_DIR = f"{__datacenter_dir}/project/tests"
+    STATE_DIR = f"{__datacenter_dir}/project/state"
+    PROVISION_DIR = f"{__datacenter_dir}/provision"
 
 
 class ProjectFiles:
     EC2_CONSTANTS_FILE = f"{ProjectDirectories.CONSTANTS_DIR}/ec2.ini"
+    CLIENT_CONSTANTS_FILE = f"{ProjectDirectories.CONSTANTS_DIR}/client.ini"
+    ROUTE53_CONSTANTS_FILE = f"{ProjectDirectories.CONSTANTS_DIR}/route53.ini"
+    DATACENTER_CONSTANTS_FILE = (
+        f"{ProjectDirectories.CONSTANTS_DIR}/datacenter.ini"
+    )
     CLOUDINIT_TEMPLATE = f"{ProjectDirectories.TEMPLATES_DIR}/cloudinit.yml.j2"
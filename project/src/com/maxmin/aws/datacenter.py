@@ -0,0 +1,930 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.graph import GraphExecutor, GraphResult, ResourceGraph
+from com.maxmin.aws.configuration.dao.domain.datacenter import (
+    CidrRuleConfig,
+    DatacenterConfig,
+    HostedZoneConfig,
+    InstanceConfig,
+    SecurityGroupConfig,
+    SubnetConfig,
+)
+from com.maxmin.aws.constants import Ec2Constants
+from com.maxmin.aws.ec2.dao.domain.instance import InstanceData
+from com.maxmin.aws.ec2.dao.domain.route_table import RouteData
+from com.maxmin.aws.ec2.dao.route_table import RouteDao
+from com.maxmin.aws.ec2.service.domain.security_group import (
+    CidrRule,
+    SecurityGroupRule,
+)
+from com.maxmin.aws.ec2.service.domain.tag import Tag
+from com.maxmin.aws.ec2.service.instance import InstanceService
+from com.maxmin.aws.ec2.service.internet_gateway import InternetGatewayService
+from com.maxmin.aws.ec2.service.route_table import RouteTableService
+from com.maxmin.aws.ec2.service.security_group import SecurityGroupService
+from com.maxmin.aws.ec2.service.ssh import KeyPairService
+from com.maxmin.aws.ec2.service.subnet import SubnetService
+from com.maxmin.aws.ec2.service.vpc import VpcService
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.route53.service.domain.record import RecordChange
+from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
+
+
+class StartupGraphBuilder(object):
+    """
+    Builds the graph of the steps that create a datacenter.
+    Each step creates a resource if it's not already there, so the graph can
+    be run again after a failure.
+    The internet gateway, the route table and the security groups depend on
+    the VPC, the subnets on the route table they are associated to, the
+    rules on their security group and on the security groups they grant
+    access to. The instances are launched together by a single step that
+    depends on their key pairs, subnets, security groups and on the route to
+    the Internet gateway, without waiting for them.
+    A step for each readiness level in use waits for the instances at that
+    level. The DNS records only need the public IP, they depend on the
+    running level and are published with a single change batch while the
+    stricter checks are still going on.
+    """
+
+    VPC = "vpc"
+    INTERNET_GATEWAY = "internet-gateway"
+    ROUTE_TABLE = "route-table"
+    ROUTE = "route"
+    SUBNET = "subnet"
+    SECURITY_GROUP = "security-group"
+    RULES = "rules"
+    KEY_PAIR = "key-pair"
+    INSTANCES = "instances"
+    READY = "ready"
+    DNS = "dns"
+
+    def __init__(
+        self,
+        datacenter_config: DatacenterConfig,
+        hosted_zone_config: HostedZoneConfig,
+        node_timeout: float = None,
+        instance_timeout: float = None,
+    ):
+        self.datacenter_config = datacenter_config
+        self.hosted_zone_config = hosted_zone_config
+        self.node_timeout = node_timeout
+        self.instance_timeout = instance_timeout
+
+    @staticmethod
+    def node_name(resource_type: str, resource_nm: str) -> str:
+        return f"{resource_type}:{resource_nm}"
+
+    def build(self) -> ResourceGraph:
+        """
+        Returns the graph of the steps.
+        """
+        graph = ResourceGraph()
+        timeout = self.node_timeout
+        name = StartupGraphBuilder.node_name
+
+        graph.add_node(StartupGraphBuilder.VPC, self.create_vpc, [], timeout)
+        graph.add_node(
+            StartupGraphBuilder.INTERNET_GATEWAY,
+            self.create_internet_gateway,
+            [StartupGraphBuilder.VPC],
+            timeout,
+        )
+        graph.add_node(
+            StartupGraphBuilder.ROUTE_TABLE,
+            self.create_route_table,
+            [StartupGraphBuilder.VPC],
+            timeout,
+        )
+        graph.add_node(
+            StartupGraphBuilder.ROUTE,
+            self.create_route,
+            [
+                StartupGraphBuilder.ROUTE_TABLE,
+                StartupGraphBuilder.INTERNET_GATEWAY,
+            ],
+            timeout,
+        )
+
+        for subnet_config in self.datacenter_config.subnets:
+            graph.add_node(
+                name(StartupGraphBuilder.SUBNET, subnet_config.name),
+                partial(self.create_subnet, subnet_config),
+                [StartupGraphBuilder.VPC, StartupGraphBuilder.ROUTE_TABLE],
+                timeout,
+            )
+
+        security_group_nms = [
+            security_group_config.name
+            for security_group_config in self.datacenter_config.security_groups
+        ]
+
+        for security_group_config in self.datacenter_config.security_groups:
+            graph.add_node(
+                name(
+                    StartupGraphBuilder.SECURITY_GROUP,
+                    security_group_config.name,
+                ),
+                partial(self.create_security_group, security_group_config),
+                [StartupGraphBuilder.VPC],
+                timeout,
+            )
+
+        for security_group_config in self.datacenter_config.security_groups:
+            dependencies = [
+                name(
+                    StartupGraphBuilder.SECURITY_GROUP,
+                    security_group_config.name,
+                )
+            ]
+
+            # the security groups granted access must exist
+            for rule_config in security_group_config.rules:
+                if (
+                    not isinstance(rule_config, CidrRuleConfig)
+                    and rule_config.sgp_name in security_group_nms
+                ):
+                    dependency = name(
+                        StartupGraphBuilder.SECURITY_GROUP,
+                        rule_config.sgp_name,
+                    )
+
+                    if dependency not in dependencies:
+                        dependencies.append(dependency)
+
+            graph.add_node(
+                name(StartupGraphBuilder.RULES, security_group_config.name),
+                partial(self.create_rules, security_group_config),
+                dependencies,
+                timeout,
+            )
+
+        for instance_config in self.datacenter_config.instances:
+            # key pair with the same name of the instance
+            graph.add_node(
+                name(StartupGraphBuilder.KEY_PAIR, instance_config.name),
+                partial(self.create_key_pair, instance_config),
+                [],
+                timeout,
+            )
+
+        # all the instances are launched at once
+        dependencies = [StartupGraphBuilder.ROUTE]
+
+        for instance_config in self.datacenter_config.instances:
+            for dependency in [
+                name(StartupGraphBuilder.KEY_PAIR, instance_config.name),
+                name(StartupGraphBuilder.SUBNET, instance_config.subnet),
+                name(
+                    StartupGraphBuilder.SECURITY_GROUP,
+                    instance_config.security_group,
+                ),
+            ]:
+                if dependency not in dependencies:
+                    dependencies.append(dependency)
+
+        graph.add_node(
+            StartupGraphBuilder.INSTANCES,
+            self.create_instances,
+            dependencies,
+            timeout,
+        )
+
+        for readiness in InstanceService.READINESS_LEVELS:
+            instance_nms = []
+
+            for instance_config in self.datacenter_config.instances:
+                if self.get_readiness(instance_config) == readiness or (
+                    readiness == InstanceService.RUNNING
+                    and self.hosted_zone_config.registered_domain
+                ):
+                    instance_nms.append(instance_config.name)
+
+            if instance_nms and readiness != InstanceService.NONE:
+                graph.add_node(
+                    name(StartupGraphBuilder.READY, readiness),
+                    partial(self.wait_instances, readiness, instance_nms),
+                    [StartupGraphBuilder.INSTANCES],
+                    self.instance_timeout,
+                )
+
+        if self.hosted_zone_config.registered_domain:
+            # all the records are published with a single change batch
+            graph.add_node(
+                StartupGraphBuilder.DNS,
+                self.create_dns_records,
+                [name(StartupGraphBuilder.READY, InstanceService.RUNNING)],
+                timeout,
+            )
+
+        return graph
+
+    def create_vpc(self) -> None:
+        vpc_config = self.datacenter_config.vpc
+        vpc_service = VpcService()
+        vpc = vpc_service.load_vpc(vpc_config.name)
+
+        if not vpc:
+            vpc_tags = []
+            for tag in vpc_config.tags:
+                vpc_tags.append(Tag(tag.key, tag.value))
+
+            vpc_service.create_vpc(vpc_config.name, vpc_config.cidr, vpc_tags)
+
+            Logger.info("VPC created!")
+        else:
+            Logger.warn("VPC already created!")
+
+    def create_internet_gateway(self) -> None:
+        internet_gateway_config = self.datacenter_config.internet_gateway
+        internet_gateway_service = InternetGatewayService()
+        internet_gateway = internet_gateway_service.load_internet_gateway(
+            internet_gateway_config.name
+        )
+
+        if not internet_gateway:
+            internet_gateway_tags = []
+            for tag in internet_gateway_config.tags:
+                internet_gateway_tags.append(Tag(tag.key, tag.value))
+
+            internet_gateway_service.create_internet_gateway(
+                internet_gateway_config.name,
+                self.datacenter_config.vpc.name,
+                internet_gateway_tags,
+            )
+
+            Logger.info("Internet gateway created!")
+        else:
+            Logger.warn("Internet gateway already created!")
+
+    def create_route_table(self) -> None:
+        route_table_config = self.datacenter_config.route_table
+        route_table_service = RouteTableService()
+        route_table = route_table_service.load_route_table(
+            route_table_config.name
+        )
+
+        if not route_table:
+            route_table_tags = []
+            for tag in route_table_config.tags:
+                route_table_tags.append(Tag(tag.key, tag.value))
+
+            route_table_service.create_route_table(
+                route_table_config.name,
+                self.datacenter_config.vpc.name,
+                route_table_tags,
+            )
+
+            Logger.info("Route table created!")
+        else:
+            Logger.warn("Route table already created!")
+
+    def create_route(self) -> None:
+        route_table_config = self.datacenter_config.route_table
+        internet_gateway_config = self.datacenter_config.internet_gateway
+        route_table_service = RouteTableService()
+        route = route_table_service.load_route(
+            route_table_config.name, internet_gateway_config.name, "0.0.0.0/0"
+        )
+
+        if not route:
+            route_table = route_table_service.load_route_table(
+                route_table_config.name
+            )
+            internet_gateway = InternetGatewayService().load_internet_gateway(
+                internet_gateway_config.name
+            )
+
+            route_dao = RouteDao()
+            route_data = RouteData()
+            route_data.route_table_id = route_table.route_table_id
+            route_data.internet_gateway_id = (
+                internet_gateway.internet_gateway_id
+            )
+            route_data.destination_cidr = "0.0.0.0/0"
+            route_dao.create(route_data)
+
+            Logger.info("Route to the Internet gateway created!")
+        else:
+            Logger.warn("Route to the Internet gateway already created!")
+
+    def create_subnet(self, subnet_config: SubnetConfig) -> None:
+        subnet_service = SubnetService()
+        subnet = subnet_service.load_subnet(subnet_config.name)
+
+        if not subnet:
+            subnet_tags = []
+            for tag in subnet_config.tags:
+                subnet_tags.append(Tag(tag.key, tag.value))
+
+            subnet_service.create_subnet(
+                subnet_config.name,
+                subnet_config.az,
+                subnet_config.cidr,
+                self.datacenter_config.vpc.name,
+                subnet_tags,
+            )
+
+            Logger.info("Subnet created!")
+
+            RouteTableService().associate_route_table(
+                self.datacenter_config.route_table.name, subnet_config.name
+            )
+        else:
+            Logger.warn("Subnet already created!")
+
+    def create_security_group(
+        self, security_group_config: SecurityGroupConfig
+    ) -> None:
+        security_group_service = SecurityGroupService()
+        security_group = security_group_service.load_security_group(
+            security_group_config.name
+        )
+
+        if not security_group:
+            security_group_tags = []
+            for tag in security_group_config.tags:
+                security_group_tags.append(Tag(tag.key, tag.value))
+
+            security_group_service.create_security_group(
+                security_group_config.name,
+                security_group_config.description,
+                self.datacenter_config.vpc.name,
+                security_group_tags,
+            )
+
+            Logger.info("Security group created!")
+        else:
+            Logger.warn("Security group already created!")
+
+    def create_rules(self, security_group_config: SecurityGroupConfig) -> None:
+        cidr_rules, security_group_rules = StartupGraphBuilder.build_rules(
+            security_group_config
+        )
+
+        # the rules of the group are loaded once and changed with a request
+        # for the missing rules and one for the rules no more configured
+        security_group_service = SecurityGroupService()
+        security_group_service.synchronize_rules(
+            security_group_config.name, cidr_rules, security_group_rules
+        )
+
+        Logger.info("Security group rules synchronized!")
+
+    @staticmethod
+    def build_rules(security_group_config: SecurityGroupConfig) -> tuple:
+        """
+        Returns the CidrRule and the SecurityGroupRule objects of the rules
+        of the security group.
+        """
+        cidr_rules = []
+        security_group_rules = []
+
+        for rule_config in security_group_config.rules:
+            if isinstance(rule_config, CidrRuleConfig):
+                cidr_rule = CidrRule()
+                cidr_rule.granted_cidr = rule_config.cidr
+                cidr_rules.append(cidr_rule)
+                rule = cidr_rule
+            else:
+                security_group_rule = SecurityGroupRule()
+                security_group_rule.granted_security_group_nm = (
+                    rule_config.sgp_name
+                )
+                security_group_rules.append(security_group_rule)
+                rule = security_group_rule
+
+            rule.from_port = rule_config.from_port
+            rule.to_port = rule_config.to_port
+            rule.protocol = rule_config.protocol
+            rule.description = rule_config.description
+
+        return cidr_rules, security_group_rules
+
+    def create_key_pair(self, instance_config: InstanceConfig) -> None:
+        keypair_service = KeyPairService()
+        keypair = keypair_service.load_key_pair(instance_config.name)
+
+        if not keypair:
+            keypair_service.create_key_pair(instance_config.name, None)
+            Logger.info("Instance key pair created!")
+        else:
+            Logger.warn("Instance key pair already created!")
+
+    def create_instances(self) -> None:
+        # the lookups needed to build the launch data are run concurrently,
+        # in the region of the step
+        with ThreadPoolExecutor(
+            max_workers=Ec2Constants().launch_max_workers,
+            thread_name_prefix="launch-data",
+        ) as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self.build_instance_data,
+                    instance_config,
+                )
+                for instance_config in self.datacenter_config.instances
+            ]
+
+            instance_datas = [
+                future.result() for future in futures if future.result()
+            ]
+
+        if not instance_datas:
+            return
+
+        Logger.info("Creating AWS instances ...")
+
+        # the readiness steps wait for the instances
+        InstanceService().create_instances(
+            instance_datas, InstanceService.NONE
+        )
+
+        Logger.info("AWS instances launched!")
+
+    def wait_instances(self, readiness: str, instance_nms: list) -> None:
+        Logger.info(f"Waiting for AWS instances {readiness} ...")
+
+        InstanceService().wait_instances(instance_nms, readiness)
+
+        Logger.info(f"AWS instances {readiness}!")
+
+    @staticmethod
+    def get_readiness(instance_config: InstanceConfig) -> str:
+        """
+        Returns the readiness level of the instance, status_ok if not set.
+        """
+        readiness = instance_config.readiness or InstanceService.STATUS_OK
+
+        if readiness not in InstanceService.READINESS_LEVELS:
+            raise AwsException(f"Unknown readiness level {readiness}!")
+
+        return readiness
+
+    def build_instance_data(
+        self, instance_config: InstanceConfig
+    ) -> InstanceData:
+        """
+        Returns the launch data of the instance, None if the instance is
+        already created.
+        """
+        instance_service = InstanceService()
+        instance = instance_service.load_instance(instance_config.name)
+
+        if instance:
+            Logger.warn(
+                f"AWS instance {instance_config.name} already created!"
+            )
+            return None
+
+        instance_tags = []
+        for tag in instance_config.tags:
+            instance_tags.append(Tag(tag.key, tag.value))
+
+        return instance_service.build_instance_data(
+            instance_config.name,
+            instance_config.private_ip,
+            instance_config.parent_img,
+            instance_config.security_group,
+            instance_config.subnet,
+            self.datacenter_config.vpc.name,
+            instance_config.username,
+            instance_config.password,
+            instance_config.host_name,
+            instance_config.name,
+            instance_tags,
+        )
+
+    def create_dns_records(self) -> None:
+        hosted_zone_service = HostedZoneService()
+        hosted_zone = hosted_zone_service.load_hosted_zone(
+            self.hosted_zone_config.registered_domain
+        )
+
+        if not hosted_zone:
+            Logger.info("AWS hosted zone not found!")
+            return
+
+        record_changes = []
+
+        for instance_config in self.datacenter_config.instances:
+            instance = InstanceService().load_instance(instance_config.name)
+
+            if not instance:
+                raise AwsException(
+                    f"Instance {instance_config.name} not found!"
+                )
+
+            # points the record to the current IP if it's already there
+            record_changes.append(
+                RecordChange(
+                    HostedZoneService.UPSERT,
+                    instance_config.dns_domain,
+                    instance.public_ip,
+                )
+            )
+
+        if not record_changes:
+            return
+
+        Logger.info("Creating AWS instance DNS records ...")
+
+        hosted_zone_service.change_records(
+            record_changes, hosted_zone.registered_domain
+        )
+
+        Logger.info("AWS instance DNS records created!")
+
+
+class ShutdownGraphBuilder(object):
+    """
+    Builds the graph of the steps that delete a datacenter, the dependencies
+    of the startup graph reversed.
+    The DNS records are deleted first, with a single change batch, then all
+    the instances are terminated with a single request while the key pairs
+    and the security group rules are deleted. The security groups, the
+    Internet gateway and the subnets are deleted when the instances are gone,
+    the route table after the subnets and the VPC last.
+    Each step deletes a resource only if it's there, so the graph can be
+    run again after a failure.
+    """
+
+    DNS = StartupGraphBuilder.DNS
+    INSTANCES = "instances"
+    KEY_PAIR = StartupGraphBuilder.KEY_PAIR
+    RULES = StartupGraphBuilder.RULES
+    SECURITY_GROUP = StartupGraphBuilder.SECURITY_GROUP
+    INTERNET_GATEWAY = StartupGraphBuilder.INTERNET_GATEWAY
+    SUBNET = StartupGraphBuilder.SUBNET
+    ROUTE_TABLE = StartupGraphBuilder.ROUTE_TABLE
+    VPC = StartupGraphBuilder.VPC
+
+    def __init__(
+        self,
+        datacenter_config: DatacenterConfig,
+        hosted_zone_config: HostedZoneConfig,
+        node_timeout: float = None,
+        instance_timeout: float = None,
+    ):
+        self.datacenter_config = datacenter_config
+        self.hosted_zone_config = hosted_zone_config
+        self.node_timeout = node_timeout
+        self.instance_timeout = instance_timeout
+
+    def build(self) -> ResourceGraph:
+        """
+        Returns the graph of the steps.
+        """
+        graph = ResourceGraph()
+        timeout = self.node_timeout
+        name = StartupGraphBuilder.node_name
+
+        dns_nodes = []
+
+        if self.hosted_zone_config.registered_domain:
+            # all the records are deleted with a single change batch
+            graph.add_node(
+                ShutdownGraphBuilder.DNS,
+                self.delete_dns_records,
+                [],
+                timeout,
+            )
+            dns_nodes.append(ShutdownGraphBuilder.DNS)
+
+        graph.add_node(
+            ShutdownGraphBuilder.INSTANCES,
+            self.delete_instances,
+            dns_nodes,
+            self.instance_timeout,
+        )
+
+        for instance_config in self.datacenter_config.instances:
+            graph.add_node(
+                name(ShutdownGraphBuilder.KEY_PAIR, instance_config.name),
+                partial(self.delete_key_pair, instance_config),
+                [],
+                timeout,
+            )
+
+        rules_nodes = []
+
+        for security_group_config in self.datacenter_config.security_groups:
+            rules_node = name(
+                ShutdownGraphBuilder.RULES, security_group_config.name
+            )
+            graph.add_node(
+                rules_node,
+                partial(self.delete_rules, security_group_config),
+                [],
+                timeout,
+            )
+            rules_nodes.append(rules_node)
+
+        # a security group can't be deleted while another group's rule
+        # grants it access
+        for security_group_config in self.datacenter_config.security_groups:
+            graph.add_node(
+                name(
+                    ShutdownGraphBuilder.SECURITY_GROUP,
+                    security_group_config.name,
+                ),
+                partial(self.delete_security_group, security_group_config),
+                [ShutdownGraphBuilder.INSTANCES] + rules_nodes,
+                timeout,
+            )
+
+        graph.add_node(
+            ShutdownGraphBuilder.INTERNET_GATEWAY,
+            self.delete_internet_gateway,
+            [ShutdownGraphBuilder.INSTANCES],
+            timeout,
+        )
+
+        subnet_nodes = []
+
+        for subnet_config in self.datacenter_config.subnets:
+            subnet_node = name(ShutdownGraphBuilder.SUBNET, subnet_config.name)
+            graph.add_node(
+                subnet_node,
+                partial(self.delete_subnet, subnet_config),
+                [ShutdownGraphBuilder.INSTANCES],
+                timeout,
+            )
+            subnet_nodes.append(subnet_node)
+
+        graph.add_node(
+            ShutdownGraphBuilder.ROUTE_TABLE,
+            self.delete_route_table,
+            subnet_nodes,
+            timeout,
+        )
+
+        graph.add_node(
+            ShutdownGraphBuilder.VPC,
+            self.delete_vpc,
+            [
+                name(
+                    ShutdownGraphBuilder.SECURITY_GROUP,
+                    security_group_config.name,
+                )
+                for security_group_config in (
+                    self.datacenter_config.security_groups
+                )
+            ]
+            + [
+                ShutdownGraphBuilder.INTERNET_GATEWAY,
+                ShutdownGraphBuilder.ROUTE_TABLE,
+            ]
+            + subnet_nodes,
+            timeout,
+        )
+
+        return graph
+
+    def delete_dns_records(self) -> None:
+        hosted_zone_service = HostedZoneService()
+        hosted_zone = hosted_zone_service.load_hosted_zone(
+            self.hosted_zone_config.registered_domain
+        )
+
+        if not hosted_zone:
+            Logger.info("AWS hosted zone not found!")
+            return
+
+        record_changes = [
+            RecordChange(HostedZoneService.DELETE, instance_config.dns_domain)
+            for instance_config in self.datacenter_config.instances
+        ]
+
+        if not record_changes:
+            return
+
+        Logger.info("Deleting AWS instance DNS records ...")
+
+        hosted_zone_service.change_records(
+            record_changes, hosted_zone.registered_domain
+        )
+
+        Logger.info("AWS instance DNS records deleted!")
+
+    def delete_instances(self) -> None:
+        instance_nms = [
+            instance_config.name
+            for instance_config in self.datacenter_config.instances
+        ]
+
+        if not instance_nms:
+            return
+
+        Logger.info("Deleting AWS instances ...")
+
+        InstanceService().terminate_instances(instance_nms)
+
+        Logger.info("AWS instances deleted!")
+
+    def delete_key_pair(self, instance_config: InstanceConfig) -> None:
+        keypair_service = KeyPairService()
+        keypair = keypair_service.load_key_pair(instance_config.name)
+
+        if keypair:
+            keypair_service.delete_key_pair(instance_config.name)
+            Logger.info("AWS instance key pair deleted!")
+        else:
+            Logger.warn("AWS instance key pair already deleted!")
+
+    def delete_rules(self, security_group_config: SecurityGroupConfig) -> None:
+        security_group_service = SecurityGroupService()
+        security_group = security_group_service.load_security_group(
+            security_group_config.name
+        )
+
+        if security_group:
+            security_group_service.delete_all_rules(security_group_config.name)
+            Logger.info("Security group rules deleted!")
+        else:
+            Logger.warn("Security group rules already deleted!")
+
+    def delete_security_group(
+        self, security_group_config: SecurityGroupConfig
+    ) -> None:
+        security_group_service = SecurityGroupService()
+        security_group = security_group_service.load_security_group(
+            security_group_config.name
+        )
+
+        if security_group:
+            security_group_service.delete_security_group(
+                security_group_config.name
+            )
+            Logger.info("Security group deleted!")
+        else:
+            Logger.warn("Security group already deleted!")
+
+    def delete_internet_gateway(self) -> None:
+        internet_gateway_config = self.datacenter_config.internet_gateway
+        internet_gateway_service = InternetGatewayService()
+        internet_gateway = internet_gateway_service.load_internet_gateway(
+            internet_gateway_config.name
+        )
+
+        if internet_gateway:
+            internet_gateway_service.delete_internet_gateway(
+                internet_gateway_config.name
+            )
+            Logger.info("Internet gateway deleted!")
+        else:
+            Logger.warn("Internet gateway already deleted")
+
+    def delete_subnet(self, subnet_config: SubnetConfig) -> None:
+        subnet_service = SubnetService()
+        subnet = subnet_service.load_subnet(subnet_config.name)
+
+        if subnet:
+            subnet_service.delete_subnet(subnet_config.name)
+            Logger.info("Subnet deleted!")
+        else:
+            Logger.warn("Subnet already deleted")
+
+    def delete_route_table(self) -> None:
+        route_table_config = self.datacenter_config.route_table
+        route_table_service = RouteTableService()
+        route_table = route_table_service.load_route_table(
+            route_table_config.name
+        )
+
+        if route_table:
+            route_table_service.delete_route_table(route_table_config.name)
+            Logger.info("Route table deleted!")
+        else:
+            Logger.warn("Route table already deleted")
+
+    def delete_vpc(self) -> None:
+        vpc_config = self.datacenter_config.vpc
+        vpc_service = VpcService()
+        vpc = vpc_service.load_vpc(vpc_config.name)
+
+        if vpc:
+            vpc_service.delete_vpc(vpc_config.name)
+            Logger.info("VPC deleted!")
+        else:
+            Logger.warn("VPC already deleted")
+
+
+class FanoutGraphBuilder(object):
+    """
+    Merges the graphs of several datacenters into a single graph, so that
+    a single GraphExecutor builds or deletes them at the same time within
+    one limit of workers, in about the time of the slowest one.
+    The nodes of a datacenter are named after its VPC, eg: myvpc/subnet:a,
+    and run with the clients of the region of the VPC, the region in the
+    environment if the VPC has none. Each region has its own clients and
+    connection pools.
+    Keyword arguments:
+        builders -- StartupGraphBuilder or ShutdownGraphBuilder objects, one
+        for each datacenter.
+    """
+
+    def __init__(self, builders: list):
+        self.builders = builders
+
+    @staticmethod
+    def get_datacenter_nm(builder) -> str:
+        return builder.datacenter_config.vpc.name
+
+    def build(self) -> ResourceGraph:
+        """
+        Returns the graph of the steps of all the datacenters.
+        """
+        graph = ResourceGraph()
+        datacenter_nms = set()
+
+        for builder in self.builders:
+            datacenter_nm = FanoutGraphBuilder.get_datacenter_nm(builder)
+            region_nm = builder.datacenter_config.vpc.region
+
+            if datacenter_nm in datacenter_nms:
+                raise AwsException(f"Datacenter {datacenter_nm} is repeated!")
+
+            datacenter_nms.add(datacenter_nm)
+
+            for node in builder.build().nodes.values():
+                graph.add_node(
+                    f"{datacenter_nm}/{node.name}",
+                    partial(FanoutGraphBuilder.run, region_nm, node.action),
+                    [
+                        f"{datacenter_nm}/{dependency}"
+                        for dependency in node.dependencies
+                    ],
+                    node.timeout,
+                )
+
+        return graph
+
+    @staticmethod
+    def run(region_nm: str, action):
+        with ClientRegistry.region(region_nm):
+            return action()
+
+    def report(self, result: GraphResult) -> list:
+        """
+        Returns the outcome of each datacenter in the graph result: the
+        region, if all its steps succeeded, the steps failed or timed out,
+        the steps skipped and the seconds from the start when its last step
+        ended.
+        """
+        report = []
+
+        for builder in self.builders:
+            datacenter_nm = FanoutGraphBuilder.get_datacenter_nm(builder)
+            prefix = f"{datacenter_nm}/"
+            states = {
+                name.removeprefix(prefix): state
+                for name, state in result.states.items()
+                if name.startswith(prefix)
+            }
+
+            report.append(
+                {
+                    "datacenter": datacenter_nm,
+                    "region": builder.datacenter_config.vpc.region,
+                    "succeeded": all(
+                        state == GraphExecutor.SUCCEEDED
+                        for state in states.values()
+                    ),
+                    "failed": [
+                        name
+                        for name, state in states.items()
+                        if state
+                        in (GraphExecutor.FAILED, GraphExecutor.TIMED_OUT)
+                    ],
+                    "skipped": [
+                        name
+                        for name, state in states.items()
+                        if state == GraphExecutor.SKIPPED
+                    ],
+                    "elapsed": round(
+                        max(
+                            [
+                                finished
+                                for name, finished in result.finished.items()
+                                if name.startswith(prefix)
+                            ],
+                            default=0.0,
+                        ),
+                        3,
+                    ),
+                }
+            )
+
+        return report
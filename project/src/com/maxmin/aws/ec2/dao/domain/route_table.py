@@ -21,6 +21,7 @@ class RouteTableData(BaseData, BaseTag):
         self.route_table_id = None
         self.vpc_id = None
         self.associated_subnet_ids = []
+        self.association_ids = []
 
     @classmethod
     def build(cls, route_table: dict) -> Self:
@@ -35,6 +36,9 @@ class RouteTableData(BaseData, BaseTag):
             subnet_id = association.get("SubnetId")
             if subnet_id:
                 rt.associated_subnet_ids.append(subnet_id)
+                rt.association_ids.append(
+                    association.get("RouteTableAssociationId")
+                )
 
         tags = route_table.get("Tags")
 
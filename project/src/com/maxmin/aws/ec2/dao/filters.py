@@ -0,0 +1,99 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+
+class FilterBuilder(object):
+    """
+    Builds the Filters argument of the EC2 describe requests, so that the
+    resources are selected by AWS and not by the daos.
+    The same filters are applied to the describe dictionaries kept by the
+    inventory, so the daos return the same resources with and without it.
+    A filter without values is not added.
+    """
+
+    # filter name: path of the attribute in the describe dictionary
+    __ATTRIBUTES = {
+        "vpc-id": ("VpcId",),
+        "state": ("State",),
+        "instance-state-name": ("State", "Name"),
+    }
+
+    def __init__(self):
+        self.__filters = []
+
+    def name(self, resource_nm: str) -> "FilterBuilder":
+        """
+        Selects the resources with a tag with key 'name' equal to
+        resource_nm.
+        """
+        return self.tag("name", resource_nm)
+
+    def tag(self, key: str, *values: str) -> "FilterBuilder":
+        """
+        Selects the resources with a tag with key equal to key and value equal
+        to one of values.
+        """
+        return self.add(f"tag:{key}", *values)
+
+    def vpc(self, vpc_id: str) -> "FilterBuilder":
+        """
+        Selects the resources in the VPC.
+        """
+        return self.add("vpc-id", vpc_id)
+
+    def state(self, filter_nm: str, states: list) -> "FilterBuilder":
+        """
+        Selects the resources in one of the states.
+        Keyword arguments:
+            filter_nm -- the name of the state filter of the resource, eg:
+            'state', 'instance-state-name'.
+        """
+        return self.add(filter_nm, *(states or []))
+
+    def add(self, filter_nm: str, *values: str) -> "FilterBuilder":
+        """
+        Adds a filter, values equal to None are discarded.
+        """
+        values = [value for value in values if value is not None]
+
+        if values:
+            self.__filters.append({"Name": filter_nm, "Values": values})
+
+        return self
+
+    def build(self) -> list:
+        """
+        Returns the list of filters of the describe request.
+        """
+        return [
+            {"Name": f.get("Name"), "Values": list(f.get("Values"))}
+            for f in self.__filters
+        ]
+
+    def matches(self, resource: dict) -> bool:
+        """
+        Returns True if the describe dictionary of a resource satisfies all
+        the filters.
+        """
+        for f in self.__filters:
+            filter_nm = f.get("Name")
+
+            if filter_nm.startswith("tag:"):
+                key = filter_nm.removeprefix("tag:")
+                value = None
+
+                for tag in resource.get("Tags") or []:
+                    if tag.get("Key") == key:
+                        value = tag.get("Value")
+            else:
+                value = resource
+                for attribute in FilterBuilder.__ATTRIBUTES[filter_nm]:
+                    value = (value or {}).get(attribute)
+
+            if value not in f.get("Values"):
+                return False
+
+        return True
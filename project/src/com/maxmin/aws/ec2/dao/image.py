@@ -3,7 +3,11 @@ Created on Mar 27, 2023
 
 @author: vagrant
 """
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.ec2.dao.domain.image import ImageData
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
@@ -20,13 +24,19 @@ class ImageDao(Ec2Dao):
         Returns a ImageData object.
         """
         try:
-            response = self.ec2.describe_images(
-                ImageIds=[
-                    image_id,
-                ],
-            ).get(
-                "Images"
-            )[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(InventoryDao.IMAGE, image_id)
+
+            if not response:
+                response = self.ec2.describe_images(
+                    ImageIds=[
+                        image_id,
+                    ],
+                ).get(
+                    "Images"
+                )[0]
 
             return ImageData.build(response)
         except Exception as e:
@@ -39,7 +49,9 @@ class ImageDao(Ec2Dao):
         Returns a list of ImageData objects.
         """
         try:
-            response = self.ec2.describe_images(
+            images = self.paginate(
+                "describe_images",
+                "Images",
                 Filters=[
                     {
                         "Name": "name",
@@ -48,11 +60,11 @@ class ImageDao(Ec2Dao):
                         ],
                     },
                 ],
-            ).get("Images")
+            )
 
             image_datas = []
 
-            for image in response:
+            for image in images:
                 image_datas.append(ImageData.build(image))
 
             return image_datas
@@ -60,29 +72,39 @@ class ImageDao(Ec2Dao):
             Logger.debug(str(e))
             raise AwsDaoException("Error loading the images!")
 
-    def load_all(self, image_nm: str) -> list:
+    def load_all(self, image_nm: str, states: list = None) -> list:
         """
         Loads all images with a tag with key 'name' equal to image_nm.
+        Keyword arguments:
+            states -- if set, only the images in one of the states.
         Returns a list of ImageData objects.
         """
-        try:
-            response = self.ec2.describe_images(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [
-                            image_nm,
-                        ],
-                    },
-                ],
-            ).get("Images")
+        return list(self.iterate_all(image_nm, states))
 
-            image_datas = []
-
-            for image in response:
-                image_datas.append(ImageData.build(image))
+    def iterate_all(self, image_nm: str, states: list = None) -> Iterator:
+        """
+        Iterates over the images with a tag with key 'name' equal to
+        image_nm, the pages are requested as the iteration goes.
+        Keyword arguments:
+            states -- if set, only the images in one of the states.
+        Yields ImageData objects.
+        """
+        filter_builder = FilterBuilder().name(image_nm).state("state", states)
 
-            return image_datas
+        try:
+            if InventoryDao.is_enabled():
+                images = InventoryDao().load_all(
+                    InventoryDao.IMAGE, image_nm, filter_builder
+                )
+            else:
+                images = self.paginate(
+                    "describe_images",
+                    "Images",
+                    Filters=filter_builder.build(),
+                )
+
+            for image in images:
+                yield ImageData.build(image)
         except Exception as e:
             Logger.debug(str(e))
             raise AwsDaoException("Error loading the images!")
@@ -107,12 +129,13 @@ class ImageDao(Ec2Dao):
                 TagSpecifications=tag_specifications,
             ).get("ImageId")
 
-            waiter = self.ec2.get_waiter("image_available")
-            waiter.wait(ImageIds=[identifier])
+            self.wait("image_available", ImageIds=[identifier])
 
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the image!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.IMAGE)
 
     def delete(self, image_data: ImageData) -> None:
         """
@@ -126,3 +149,5 @@ class ImageDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the image!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.IMAGE)
@@ -3,7 +3,14 @@ Created on Mar 26, 2023
 
 @author: vagrant
 """
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.constants import Ec2Constants
 from com.maxmin.aws.ec2.dao.domain.instance import InstanceData
 from com.maxmin.aws.exception import AwsDaoException
@@ -21,55 +28,259 @@ class InstanceDao(Ec2Dao):
         Returns a InstanceData object.
         """
         try:
-            response = (
-                self.ec2.describe_instances(
-                    InstanceIds=[
-                        instance_id,
-                    ],
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(
+                    InventoryDao.INSTANCE, instance_id
+                )
+
+            if not response:
+                response = (
+                    self.ec2.describe_instances(
+                        InstanceIds=[
+                            instance_id,
+                        ],
+                    )
+                    .get("Reservations")[0]
+                    .get("Instances")[0]
                 )
-                .get("Reservations")[0]
-                .get("Instances")[0]
-            )
 
             return InstanceData.build(response)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the instance!")
 
-    def load_all(self, instance_nm: str) -> list:
+    def load_all(
+        self, instance_nm: str, vpc_id: str = None, states: list = None
+    ) -> list:
         """
         Loads all instances with a tag with key 'name' equal to instance_nm.
+        Keyword arguments:
+            vpc_id -- if set, only the instances in the VPC.
+            states -- if set, only the instances in one of the states.
         Returns a list of RouteTableData objects.
         """
+        return list(self.iterate_all(instance_nm, vpc_id, states))
+
+    def iterate_all(
+        self, instance_nm: str, vpc_id: str = None, states: list = None
+    ) -> Iterator:
+        """
+        Iterates over the instances with a tag with key 'name' equal to
+        instance_nm, the pages are requested as the iteration goes.
+        Keyword arguments:
+            vpc_id -- if set, only the instances in the VPC.
+            states -- if set, only the instances in one of the states.
+        Yields InstanceData objects.
+        """
+        filter_builder = (
+            FilterBuilder()
+            .name(instance_nm)
+            .vpc(vpc_id)
+            .state("instance-state-name", states)
+        )
+
         try:
-            response = self.ec2.describe_instances(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [instance_nm],
-                    },
-                ],
-            ).get("Reservations")
+            if InventoryDao.is_enabled():
+                for instance in InventoryDao().load_all(
+                    InventoryDao.INSTANCE, instance_nm, filter_builder
+                ):
+                    yield InstanceData.build(instance)
 
-            instances = []
-            for reservation in response:
-                for instance in reservation.get("Instances"):
-                    i = InstanceData.build(instance)
-                    instances.append(i)
+                return
+
+            reservations = self.paginate(
+                "describe_instances",
+                "Reservations",
+                Filters=filter_builder.build(),
+            )
 
-            return instances
+            for reservation in reservations:
+                for instance in reservation.get("Instances"):
+                    yield InstanceData.build(instance)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the instances!")
 
-    def create(self, instance_data: InstanceData) -> None:
+    def create(
+        self,
+        instance_data: InstanceData,
+        waiter_nm: str = "instance_status_ok",
+    ) -> None:
         """
         Creates/runs an instance and waits until it's available.
         The instance is assigned a public IP address (not static/elastic).
         Keyword arguments:
             instance_data.cloud_init_data -- cloud-init directives with user data
+            waiter_nm -- the EC2 waiter to wait on, if not set no wait.
         """
 
+        try:
+            identifier = self.__run_instances(
+                self.__build_run_request(instance_data), 1
+            )[0]
+
+            if waiter_nm:
+                self.wait(waiter_nm, InstanceIds=[identifier])
+
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error creating the instance!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.INSTANCE)
+
+    def create_all(
+        self,
+        instance_datas: list,
+        waiter_nm: str = "instance_status_ok",
+    ) -> list:
+        """
+        Creates/runs the instances and waits until all of them are available,
+        so that N instances cost about the boot time of one.
+        Each instance is run with its own request, the requests are
+        concurrent.
+        Keyword arguments:
+            waiter_nm -- the EC2 waiter to wait on, if not set no wait.
+        Returns the identifiers of the instances, in the order of
+        instance_datas.
+        """
+        requests = [
+            self.__build_run_request(instance_data)
+            for instance_data in instance_datas
+        ]
+
+        if not requests:
+            return []
+
+        max_workers = min(len(requests), Ec2Constants().launch_max_workers)
+
+        try:
+            identifiers = []
+            errors = []
+
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="launch"
+            ) as pool:
+                futures = [
+                    pool.submit(self.__run_instances, request, 1)
+                    for request in requests
+                ]
+
+                for future in futures:
+                    if future.exception():
+                        errors.append(future.exception())
+                    else:
+                        identifiers.extend(future.result())
+
+            for error in errors:
+                Logger.error(str(error))
+
+            if errors:
+                raise AwsDaoException(f"{len(errors)} launch requests failed!")
+
+            if waiter_nm:
+                self.wait(waiter_nm, InstanceIds=identifiers)
+
+            return identifiers
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error creating the instances!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.INSTANCE)
+
+    def wait_all(self, instance_datas: list, waiter_nm: str) -> None:
+        """
+        Waits with a single EC2 waiter until all the instances reach the
+        state checked by the waiter, eg: instance_running.
+        """
+
+        instance_ids = []
+        for instance_data in instance_datas:
+            instance_ids.append(instance_data.instance_id)
+
+        try:
+            self.wait(waiter_nm, InstanceIds=instance_ids)
+
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error waiting for the instances!")
+        finally:
+            # the state and the public IP have changed
+            InventoryDao.invalidate(InventoryDao.INSTANCE)
+
+    def __run_instances(self, request: dict, count: int) -> list:
+        """
+        Runs count instances with the same launch request.
+        With the run journal enabled the request has an idempotency token
+        kept in the journal, a request repeated by the next run returns the
+        instances of the first one instead of running new ones.
+        Returns the identifiers of the instances.
+        """
+        launch_key = None
+
+        if RunJournal.is_enabled():
+            launch_key = self.__build_launch_key(request, count)
+            launch = RunJournal.get_operation(launch_key)
+            user_data = request.get("UserData")
+
+            if launch:
+                Logger.info(f"Launch {launch_key} resumed!")
+            else:
+                launch = {"token": uuid.uuid4().hex}
+
+                # the cloud-init data is base64 encoded bytes
+                if isinstance(user_data, bytes):
+                    launch["user_data"] = user_data.decode()
+                else:
+                    launch["user_data"] = user_data
+
+                RunJournal.record_operation(launch_key, launch)
+
+            request = dict(request, ClientToken=launch.get("token"))
+
+            # the user data has a random salt, with the same token AWS
+            # wants the same parameters
+            if isinstance(user_data, bytes):
+                request["UserData"] = launch.get("user_data").encode()
+            elif user_data is not None:
+                request["UserData"] = launch.get("user_data")
+
+        response = self.ec2.run_instances(
+            MaxCount=count, MinCount=count, **request
+        )
+
+        identifiers = [
+            instance.get("InstanceId")
+            for instance in response.get("Instances")
+        ]
+
+        if launch_key:
+            RunJournal.record_operation(
+                launch_key, {"instance_ids": identifiers}
+            )
+
+        return identifiers
+
+    def __build_launch_key(self, request: dict, count: int) -> str:
+        """
+        Returns the key of a launch in the run journal, by region and value
+        of the tag with key 'name' of the instances.
+        """
+        instance_nm = None
+
+        for tag_specification in request.get("TagSpecifications", []):
+            for tag in tag_specification.get("Tags"):
+                if tag.get("Key") == "name":
+                    instance_nm = tag.get("Value")
+
+        return f"launch:{self.ec2.meta.region_name}:{instance_nm}:{count}"
+
+    def __build_run_request(self, instance_data: InstanceData) -> dict:
+        """
+        Builds the arguments of a run_instances request for one instance,
+        the instance count excluded.
+        """
         ec2_constants = Ec2Constants()
         tag_specifications = [{"ResourceType": "instance", "Tags": []}]
 
@@ -80,46 +291,34 @@ class InstanceDao(Ec2Dao):
         for security_group_id in instance_data.security_group_ids:
             security_groups_ids.append(security_group_id)
 
-        try:
-            identifier = (
-                self.ec2.run_instances(
-                    BlockDeviceMappings=[
-                        {
-                            "DeviceName": ec2_constants.device,
-                            "Ebs": {
-                                "VolumeSize": ec2_constants.volume_size,
-                            },
-                        },
-                    ],
-                    ImageId=instance_data.image_id,
-                    InstanceType=ec2_constants.instance_type,
-                    MaxCount=1,
-                    MinCount=1,
-                    Placement={
-                        "Tenancy": ec2_constants.tenancy,
-                    },
-                    UserData=instance_data.cloud_init_data,
-                    NetworkInterfaces=[
-                        {
-                            "DeviceIndex": 0,
-                            "SubnetId": instance_data.subnet_id,
-                            "Groups": security_groups_ids,
-                            "PrivateIpAddress": instance_data.private_ip,
-                            "AssociatePublicIpAddress": True,
-                        },
-                    ],
-                    TagSpecifications=tag_specifications,
-                )
-                .get("Instances")[0]
-                .get("InstanceId")
-            )
+        network_interface = {
+            "DeviceIndex": 0,
+            "SubnetId": instance_data.subnet_id,
+            "Groups": security_groups_ids,
+            "AssociatePublicIpAddress": True,
+        }
 
-            waiter = self.ec2.get_waiter("instance_status_ok")
-            waiter.wait(InstanceIds=[identifier])
+        if instance_data.private_ip:
+            network_interface["PrivateIpAddress"] = instance_data.private_ip
 
-        except Exception as e:
-            Logger.error(str(e))
-            raise AwsDaoException("Error creating the instance!")
+        return {
+            "BlockDeviceMappings": [
+                {
+                    "DeviceName": ec2_constants.device,
+                    "Ebs": {
+                        "VolumeSize": ec2_constants.volume_size,
+                    },
+                },
+            ],
+            "ImageId": instance_data.image_id,
+            "InstanceType": ec2_constants.instance_type,
+            "Placement": {
+                "Tenancy": ec2_constants.tenancy,
+            },
+            "UserData": instance_data.cloud_init_data,
+            "NetworkInterfaces": [network_interface],
+            "TagSpecifications": tag_specifications,
+        }
 
     def delete(self, instance_data: InstanceData) -> None:
         """
@@ -138,9 +337,34 @@ class InstanceDao(Ec2Dao):
                 ],
             )
 
-            waiter = self.ec2.get_waiter("instance_terminated")
-            waiter.wait(InstanceIds=[instance_data.instance_id])
+            self.wait(
+                "instance_terminated",
+                InstanceIds=[instance_data.instance_id],
+            )
 
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the instance!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.INSTANCE)
+
+    def delete_all(self, instance_datas: list) -> None:
+        """
+        Terminates the instances with a single request and waits until all of
+        them are terminated.
+        """
+
+        instance_ids = []
+        for instance_data in instance_datas:
+            instance_ids.append(instance_data.instance_id)
+
+        try:
+            self.ec2.terminate_instances(InstanceIds=instance_ids)
+
+            self.wait("instance_terminated", InstanceIds=instance_ids)
+
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error deleting the instances!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.INSTANCE)
@@ -4,7 +4,11 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.ec2.dao.domain.internet_gateway import InternetGatewayData
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
@@ -17,11 +21,19 @@ class InternetGatewayDao(Ec2Dao):
         Returns a InternetGatewayData object.
         """
         try:
-            response = self.ec2.describe_internet_gateways(
-                InternetGatewayIds=[
-                    internet_gateway_id,
-                ],
-            ).get("InternetGateways")[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(
+                    InventoryDao.INTERNET_GATEWAY, internet_gateway_id
+                )
+
+            if not response:
+                response = self.ec2.describe_internet_gateways(
+                    InternetGatewayIds=[
+                        internet_gateway_id,
+                    ],
+                ).get("InternetGateways")[0]
 
             return InternetGatewayData.build(response)
         except Exception as e:
@@ -33,24 +45,32 @@ class InternetGatewayDao(Ec2Dao):
         Loads all Internet gateway with a tag with key 'name' equals internet_gateway_nm.
         Returns a list of InternetGatewayData objects.
         """
+        return list(self.iterate_all(internet_gateway_nm))
+
+    def iterate_all(self, internet_gateway_nm: str) -> Iterator:
+        """
+        Iterates over the Internet gateways with a tag with key 'name' equals
+        internet_gateway_nm, the pages are requested as the iteration goes.
+        Yields InternetGatewayData objects.
+        """
+        filter_builder = FilterBuilder().name(internet_gateway_nm)
+
         try:
-            response = self.ec2.describe_internet_gateways(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [internet_gateway_nm],
-                    },
-                ],
-            ).get("InternetGateways")
-
-            internet_gateway_datas = []
-
-            for internet_gateway in response:
-                internet_gateway_datas.append(
-                    InternetGatewayData.build(internet_gateway)
+            if InventoryDao.is_enabled():
+                internet_gateways = InventoryDao().load_all(
+                    InventoryDao.INTERNET_GATEWAY,
+                    internet_gateway_nm,
+                    filter_builder,
+                )
+            else:
+                internet_gateways = self.paginate(
+                    "describe_internet_gateways",
+                    "InternetGateways",
+                    Filters=filter_builder.build(),
                 )
 
-            return internet_gateway_datas
+            for internet_gateway in internet_gateways:
+                yield InternetGatewayData.build(internet_gateway)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the Internet gateways!")
@@ -75,12 +95,15 @@ class InternetGatewayDao(Ec2Dao):
                 .get("InternetGatewayId")
             )
 
-            waiter = self.ec2.get_waiter("internet_gateway_exists")
-            waiter.wait(InternetGatewayIds=[identifier])
+            self.wait(
+                "internet_gateway_exists", InternetGatewayIds=[identifier]
+            )
 
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the Internet gateway!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.INTERNET_GATEWAY)
 
     def delete(self, internet_gateway_data: InternetGatewayData) -> None:
         """
@@ -93,6 +116,8 @@ class InternetGatewayDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the Internet gateway!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.INTERNET_GATEWAY)
 
     def attach(self, internet_gateway_data: InternetGatewayData):
         """
@@ -110,6 +135,8 @@ class InternetGatewayDao(Ec2Dao):
             raise AwsDaoException(
                 "Error attaching the Internet gateway to the VPC!"
             )
+        finally:
+            InventoryDao.invalidate(InventoryDao.INTERNET_GATEWAY)
 
     def detach(self, internet_gateway_data: InternetGatewayData):
         """
@@ -126,3 +153,5 @@ class InternetGatewayDao(Ec2Dao):
             raise AwsDaoException(
                 "Error detaching the Internet gateway from the VPC!"
             )
+        finally:
+            InventoryDao.invalidate(InventoryDao.INTERNET_GATEWAY)
@@ -0,0 +1,391 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import threading
+import time
+
+from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.state import StateDao
+from com.maxmin.aws.exception import AwsDaoException
+from com.maxmin.aws.logs import Logger
+
+
+class InventoryDao(Ec2Dao):
+    """
+    Run-scoped snapshot of the EC2 resources in the account.
+    When enabled, each resource type is fetched once with paginated describe
+    calls and indexed by the value of the tag with key 'name' and by unique
+    identifier, so that the daos answer the lookups without calling AWS.
+    A snapshot expires after the TTL, the daos invalidate it explicitly
+    every time they change a resource of its type.
+    The snapshot holds the describe dictionaries, the daos build new data
+    objects from them at every lookup.
+    There is a snapshot for each region, the region of the client of the
+    dao.
+    When the state is enabled, a type is first fetched by the identifiers
+    recorded by the previous runs, making a partial snapshot that is
+    completed with a scan when a name not recorded is looked up. The types
+    changed by the run are always scanned.
+    """
+
+    VPC = "vpc"
+    SUBNET = "subnet"
+    INTERNET_GATEWAY = "internet-gateway"
+    ROUTE_TABLE = "route-table"
+    SECURITY_GROUP = "security-group"
+    INSTANCE = "instance"
+    KEY_PAIR = "key-pair"
+    IMAGE = "image"
+
+    # resource type: (describe operation, response key, identifier key,
+    # identifiers parameter)
+    __RESOURCE_TYPES = {
+        VPC: ("describe_vpcs", "Vpcs", "VpcId", "VpcIds"),
+        SUBNET: ("describe_subnets", "Subnets", "SubnetId", "SubnetIds"),
+        INTERNET_GATEWAY: (
+            "describe_internet_gateways",
+            "InternetGateways",
+            "InternetGatewayId",
+            "InternetGatewayIds",
+        ),
+        ROUTE_TABLE: (
+            "describe_route_tables",
+            "RouteTables",
+            "RouteTableId",
+            "RouteTableIds",
+        ),
+        SECURITY_GROUP: (
+            "describe_security_groups",
+            "SecurityGroups",
+            "GroupId",
+            "GroupIds",
+        ),
+        INSTANCE: (
+            "describe_instances",
+            "Reservations",
+            "InstanceId",
+            "InstanceIds",
+        ),
+        KEY_PAIR: (
+            "describe_key_pairs",
+            "KeyPairs",
+            "KeyPairId",
+            "KeyPairIds",
+        ),
+        IMAGE: ("describe_images", "Images", "ImageId", "ImageIds"),
+    }
+    # states of the resources that are gone but still described
+    __DELETED_STATES = ("shutting-down", "terminated", "deregistered")
+
+    __enabled = False
+    __ttl = 60
+    __lock = threading.Lock()
+    # (region, resource type): lock
+    __type_locks = {}
+    # (region, resource type): (time, by name, by identifier, complete)
+    __snapshots = {}
+    # resource types changed by the run, not fetched by the identifiers in
+    # the state
+    __changed = set()
+    # incremented at each invalidation, a snapshot fetched while its type
+    # is invalidated is not stored
+    __generations = {resource_type: 0 for resource_type in __RESOURCE_TYPES}
+
+    @staticmethod
+    def enable(ttl: int = None) -> None:
+        """
+        Turns the snapshot on.
+        Keyword arguments:
+            ttl -- seconds after which a snapshot is fetched again.
+        """
+        with InventoryDao.__lock:
+            InventoryDao.__enabled = True
+            if ttl is not None:
+                InventoryDao.__ttl = ttl
+            InventoryDao.__clear(InventoryDao.__RESOURCE_TYPES.keys())
+            InventoryDao.__changed.clear()
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the snapshot off and discards it, the daos call AWS directly.
+        """
+        with InventoryDao.__lock:
+            InventoryDao.__enabled = False
+            InventoryDao.__clear(InventoryDao.__RESOURCE_TYPES.keys())
+            InventoryDao.__changed.clear()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return InventoryDao.__enabled
+
+    @staticmethod
+    def invalidate(*resource_types: str) -> None:
+        """
+        Discards the snapshot of the resource types, all the snapshots if
+        none is passed.
+        """
+        with InventoryDao.__lock:
+            if not resource_types:
+                resource_types = InventoryDao.__RESOURCE_TYPES.keys()
+
+            InventoryDao.__clear(resource_types)
+            InventoryDao.__changed.update(resource_types)
+
+    @staticmethod
+    def __clear(resource_types) -> None:
+        for key in list(InventoryDao.__snapshots):
+            if key[1] in resource_types:
+                del InventoryDao.__snapshots[key]
+
+        for resource_type in resource_types:
+            InventoryDao.__generations[resource_type] += 1
+
+    def load_all(
+        self,
+        resource_type: str,
+        resource_nm: str,
+        filter_builder: FilterBuilder = None,
+    ) -> list:
+        """
+        Returns the dictionaries of the resources with a tag with key 'name'
+        equal to resource_nm.
+        Keyword arguments:
+            filter_builder -- the filters of the describe request, applied to
+            the snapshot.
+        """
+        by_name, _, complete = self.__get_snapshot(resource_type)
+
+        if not complete and resource_nm not in by_name:
+            by_name, _, _ = self.__get_snapshot(resource_type, complete=True)
+
+        resources = by_name.get(resource_nm, [])
+
+        if StateDao.is_enabled():
+            self.__record(resource_type, resource_nm, resources)
+
+        return [
+            resource
+            for resource in resources
+            if not filter_builder or filter_builder.matches(resource)
+        ]
+
+    def load(self, resource_type: str, resource_id: str) -> dict:
+        """
+        Returns the dictionary of a resource by its unique identifier,
+        None if the resource is not in the snapshot.
+        """
+        _, by_id, _ = self.__get_snapshot(resource_type)
+
+        return by_id.get(resource_id)
+
+    def __get_snapshot(
+        self, resource_type: str, complete: bool = False
+    ) -> tuple:
+        """
+        Returns the resources of a type by name and by identifier, and
+        whether all the resources of the type are there.
+        Keyword arguments:
+            complete -- if True, a partial snapshot is replaced by a scan.
+        """
+        key = (self.ec2.meta.region_name, resource_type)
+
+        with InventoryDao.__lock:
+            type_lock = InventoryDao.__type_locks.setdefault(
+                key, threading.Lock()
+            )
+
+        with type_lock:
+            snapshot = InventoryDao.__snapshots.get(key)
+
+            if (
+                not snapshot
+                or (time.monotonic() - snapshot[0] > InventoryDao.__ttl)
+                or (complete and not snapshot[3])
+            ):
+                generation = InventoryDao.__generations[resource_type]
+                snapshot = (
+                    time.monotonic(),
+                    *self.__fetch(resource_type, complete),
+                )
+
+                with InventoryDao.__lock:
+                    if (
+                        InventoryDao.__enabled
+                        and generation
+                        == InventoryDao.__generations[resource_type]
+                    ):
+                        InventoryDao.__snapshots[key] = snapshot
+
+            return snapshot[1], snapshot[2], snapshot[3]
+
+    def __fetch(self, resource_type: str, complete: bool) -> tuple:
+        """
+        Returns the resources of a type by name and by identifier, and
+        whether all the resources of the type are there.
+        """
+        recorded = None
+
+        if (
+            not complete
+            and StateDao.is_enabled()
+            and resource_type not in InventoryDao.__changed
+        ):
+            recorded = StateDao.get_ids(
+                self.ec2.meta.region_name, resource_type
+            )
+
+        if recorded:
+            indexes = self.__fetch_recorded(resource_type, recorded)
+
+            if indexes:
+                return (*indexes, False)
+
+        try:
+            indexes = self.__index(
+                resource_type, self.__describe(resource_type)
+            )
+
+            Logger.debug(f"Inventory of {resource_type} loaded!")
+
+            if recorded:
+                # the state was out of date, all the names recorded are
+                # corrected, not only the ones looked up by the run
+                for resource_nm in recorded:
+                    self.__record(
+                        resource_type,
+                        resource_nm,
+                        indexes[0].get(resource_nm, []),
+                    )
+
+            return (*indexes, True)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error loading the inventory!")
+
+    def __fetch_recorded(self, resource_type: str, recorded: dict) -> tuple:
+        """
+        Returns the resources recorded in the state by name and by
+        identifier, None if any of them is gone or has changed name.
+        """
+        try:
+            by_name, by_id = self.__index(
+                resource_type,
+                self.__describe(
+                    resource_type,
+                    [
+                        resource_id
+                        for resource_ids in recorded.values()
+                        for resource_id in resource_ids
+                    ],
+                ),
+            )
+        except Exception as e:
+            Logger.warn(f"State of {resource_type} out of date: {e}")
+
+            return None
+
+        for resource_nm, resource_ids in recorded.items():
+            for resource_id in resource_ids:
+                resource = by_id.get(resource_id)
+
+                if (
+                    not resource
+                    or InventoryDao.__is_deleted(resource)
+                    or resource not in by_name.get(resource_nm, [])
+                ):
+                    Logger.warn(
+                        f"State of {resource_type} out of date: "
+                        f"{resource_nm} {resource_id}"
+                    )
+
+                    return None
+
+        Logger.debug(f"Inventory of {resource_type} loaded from the state!")
+
+        return by_name, by_id
+
+    def __describe(self, resource_type: str, resource_ids: list = None):
+        """
+        Returns the describe dictionaries of the resources of a type, all of
+        them or the ones with the identifiers.
+        """
+        operation, response_key, _, ids_key = InventoryDao.__RESOURCE_TYPES[
+            resource_type
+        ]
+
+        kwargs = {}
+
+        if resource_type == InventoryDao.KEY_PAIR:
+            kwargs["IncludePublicKey"] = True
+        elif resource_type == InventoryDao.IMAGE:
+            # the images are looked up by the tag with key 'name', as the
+            # image dao does without the inventory, the public images
+            # without the tag are not scanned
+            kwargs["Filters"] = [{"Name": "tag-key", "Values": ["name"]}]
+
+        if resource_ids:
+            # the describe requests by identifier are not paginated
+            items = getattr(self.ec2, operation)(
+                **{ids_key: resource_ids}, **kwargs
+            ).get(response_key)
+        else:
+            items = self.paginate(operation, response_key, **kwargs)
+
+        resources = []
+        for item in items:
+            if resource_type == InventoryDao.INSTANCE:
+                resources.extend(item.get("Instances"))
+            else:
+                resources.append(item)
+
+        return resources
+
+    def __record(
+        self, resource_type: str, resource_nm: str, resources: list
+    ) -> None:
+        """
+        Records in the state the identifiers of the resources with a name
+        that are not gone.
+        """
+        id_key = InventoryDao.__RESOURCE_TYPES[resource_type][2]
+
+        StateDao.record(
+            self.ec2.meta.region_name,
+            resource_type,
+            resource_nm,
+            [
+                resource.get(id_key)
+                for resource in resources
+                if not InventoryDao.__is_deleted(resource)
+            ],
+        )
+
+    @staticmethod
+    def __index(resource_type: str, resources: list) -> tuple:
+        id_key = InventoryDao.__RESOURCE_TYPES[resource_type][2]
+
+        by_name = {}
+        by_id = {}
+
+        for resource in resources:
+            by_id[resource.get(id_key)] = resource
+
+            for tag in resource.get("Tags") or []:
+                if tag.get("Key") == "name":
+                    by_name.setdefault(tag.get("Value"), []).append(resource)
+
+        return by_name, by_id
+
+    @staticmethod
+    def __is_deleted(resource: dict) -> bool:
+        state = resource.get("State")
+
+        if isinstance(state, dict):
+            state = state.get("Name")
+
+        return state in InventoryDao.__DELETED_STATES
@@ -4,7 +4,11 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
 from com.maxmin.aws.ec2.dao.domain.route_table import RouteTableData, RouteData
@@ -17,38 +21,58 @@ class RouteTableDao(Ec2Dao):
         Returns a RouteTableData object.
         """
         try:
-            response = self.ec2.describe_route_tables(
-                RouteTableIds=[
-                    route_table_id,
-                ],
-            ).get("RouteTables")[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(
+                    InventoryDao.ROUTE_TABLE, route_table_id
+                )
+
+            if not response:
+                response = self.ec2.describe_route_tables(
+                    RouteTableIds=[
+                        route_table_id,
+                    ],
+                ).get("RouteTables")[0]
 
             return RouteTableData.build(response)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the route table!")
 
-    def load_all(self, route_table_nm) -> list:
+    def load_all(self, route_table_nm: str, vpc_id: str = None) -> list:
         """
         Loads all route tables with a tag with key 'name' equal to route_table_nm.
+        Keyword arguments:
+            vpc_id -- if set, only the route tables in the VPC.
         Returns a list of RouteTableData objects.
         """
-        try:
-            response = self.ec2.describe_route_tables(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [route_table_nm],
-                    },
-                ],
-            ).get("RouteTables")
+        return list(self.iterate_all(route_table_nm, vpc_id))
 
-            route_table_datas = []
+    def iterate_all(self, route_table_nm: str, vpc_id: str = None) -> Iterator:
+        """
+        Iterates over the route tables with a tag with key 'name' equal to
+        route_table_nm, the pages are requested as the iteration goes.
+        Keyword arguments:
+            vpc_id -- if set, only the route tables in the VPC.
+        Yields RouteTableData objects.
+        """
+        filter_builder = FilterBuilder().name(route_table_nm).vpc(vpc_id)
 
-            for route_table in response:
-                route_table_datas.append(RouteTableData.build(route_table))
+        try:
+            if InventoryDao.is_enabled():
+                route_tables = InventoryDao().load_all(
+                    InventoryDao.ROUTE_TABLE, route_table_nm, filter_builder
+                )
+            else:
+                route_tables = self.paginate(
+                    "describe_route_tables",
+                    "RouteTables",
+                    Filters=filter_builder.build(),
+                )
 
-            return route_table_datas
+            for route_table in route_tables:
+                yield RouteTableData.build(route_table)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the route tables!")
@@ -71,6 +95,8 @@ class RouteTableDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the route table!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.ROUTE_TABLE)
 
     def delete(self, route_table_data: RouteTableData) -> None:
         """
@@ -83,6 +109,8 @@ class RouteTableDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the route table!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.ROUTE_TABLE)
 
     def associate(self, route_table_data: RouteTableData) -> None:
         """
@@ -99,6 +127,23 @@ class RouteTableDao(Ec2Dao):
             raise AwsDaoException(
                 "Error associating the subnet to the route table!"
             )
+        finally:
+            InventoryDao.invalidate(InventoryDao.ROUTE_TABLE)
+
+    def disassociate(self, route_table_data: RouteTableData) -> None:
+        """
+        Removes the associations between the route table and its subnets.
+        """
+        try:
+            for association_id in route_table_data.association_ids:
+                self.ec2.disassociate_route_table(AssociationId=association_id)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException(
+                "Error disassociating the subnets from the route table!"
+            )
+        finally:
+            InventoryDao.invalidate(InventoryDao.ROUTE_TABLE)
 
 
 class RouteDao(Ec2Dao):
@@ -108,11 +153,19 @@ class RouteDao(Ec2Dao):
         Returns a list of RouteData objects.
         """
         try:
-            response = self.ec2.describe_route_tables(
-                RouteTableIds=[
-                    route_table_id,
-                ],
-            ).get("RouteTables")[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(
+                    InventoryDao.ROUTE_TABLE, route_table_id
+                )
+
+            if not response:
+                response = self.ec2.describe_route_tables(
+                    RouteTableIds=[
+                        route_table_id,
+                    ],
+                ).get("RouteTables")[0]
 
             routes = []
 
@@ -137,3 +190,5 @@ class RouteDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the route!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.ROUTE_TABLE)
@@ -4,7 +4,11 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
 from com.maxmin.aws.ec2.dao.domain.security_group import (
@@ -21,40 +25,62 @@ class SecurityGroupDao(Ec2Dao):
         Returns a SecurityGroupData object.
         """
         try:
-            response = self.ec2.describe_security_groups(
-                GroupIds=[
-                    security_group_id,
-                ],
-            ).get("SecurityGroups")[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(
+                    InventoryDao.SECURITY_GROUP, security_group_id
+                )
+
+            if not response:
+                response = self.ec2.describe_security_groups(
+                    GroupIds=[
+                        security_group_id,
+                    ],
+                ).get("SecurityGroups")[0]
 
             return SecurityGroupData.build(response)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the security group!")
 
-    def load_all(self, security_group_nm: str) -> list:
+    def load_all(self, security_group_nm: str, vpc_id: str = None) -> list:
         """
         Loads the security groups with a tag with key 'name' equals security_group_nm.
+        Keyword arguments:
+            vpc_id -- if set, only the security groups in the VPC.
         Returns a list of SecurityGroupData objects.
         """
-        try:
-            response = self.ec2.describe_security_groups(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [security_group_nm],
-                    },
-                ],
-            ).get("SecurityGroups")
+        return list(self.iterate_all(security_group_nm, vpc_id))
 
-            security_group_datas = []
+    def iterate_all(
+        self, security_group_nm: str, vpc_id: str = None
+    ) -> Iterator:
+        """
+        Iterates over the security groups with a tag with key 'name' equals
+        security_group_nm, the pages are requested as the iteration goes.
+        Keyword arguments:
+            vpc_id -- if set, only the security groups in the VPC.
+        Yields SecurityGroupData objects.
+        """
+        filter_builder = FilterBuilder().name(security_group_nm).vpc(vpc_id)
 
-            for security_group in response:
-                security_group_datas.append(
-                    SecurityGroupData.build(security_group)
+        try:
+            if InventoryDao.is_enabled():
+                security_groups = InventoryDao().load_all(
+                    InventoryDao.SECURITY_GROUP,
+                    security_group_nm,
+                    filter_builder,
+                )
+            else:
+                security_groups = self.paginate(
+                    "describe_security_groups",
+                    "SecurityGroups",
+                    Filters=filter_builder.build(),
                 )
 
-            return security_group_datas
+            for security_group in security_groups:
+                yield SecurityGroupData.build(security_group)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the security groups!")
@@ -78,12 +104,13 @@ class SecurityGroupDao(Ec2Dao):
                 VpcId=security_group_data.vpc_id,
             ).get("GroupId")
 
-            waiter = self.ec2.get_waiter("security_group_exists")
-            waiter.wait(GroupIds=[identifier])
+            self.wait("security_group_exists", GroupIds=[identifier])
 
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the security group!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
 
     def delete(self, security_group_data: SecurityGroupData) -> None:
         """
@@ -96,6 +123,162 @@ class SecurityGroupDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the security group!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
+
+    def delete_all_rules(self, security_group_data: SecurityGroupData) -> None:
+        """
+        Deletes all the inbound rules of the security group with a single
+        request.
+        """
+        try:
+            ip_permissions = (
+                self.ec2.describe_security_groups(
+                    GroupIds=[
+                        security_group_data.security_group_id,
+                    ],
+                )
+                .get("SecurityGroups")[0]
+                .get("IpPermissions")
+            )
+
+            if ip_permissions:
+                self.ec2.revoke_security_group_ingress(
+                    GroupId=security_group_data.security_group_id,
+                    IpPermissions=ip_permissions,
+                )
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error deleting the security group rules!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
+
+    def load_all_rules(self, security_group_id: str) -> list:
+        """
+        Loads all the inbound rules of the security group with a single
+        request, one rule for each granted CIDR interval or security group.
+        Returns a list of CidrRuleData and SecurityGroupRuleData objects.
+        """
+        try:
+            security_group = None
+
+            if InventoryDao.is_enabled():
+                security_group = InventoryDao().load(
+                    InventoryDao.SECURITY_GROUP, security_group_id
+                )
+
+            if not security_group:
+                security_group = self.ec2.describe_security_groups(
+                    GroupIds=[
+                        security_group_id,
+                    ],
+                ).get("SecurityGroups")[0]
+
+            rules = []
+
+            for permission in security_group.get("IpPermissions"):
+                for ip_range in permission.get("IpRanges", []):
+                    rules.append(
+                        CidrRuleData.build(
+                            dict(permission, IpRanges=[ip_range]),
+                            security_group_id,
+                        )
+                    )
+
+                for user_id_group_pair in permission.get(
+                    "UserIdGroupPairs", []
+                ):
+                    rules.append(
+                        SecurityGroupRuleData.build(
+                            dict(
+                                permission,
+                                UserIdGroupPairs=[user_id_group_pair],
+                            ),
+                            security_group_id,
+                        )
+                    )
+
+            return rules
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error loading the security group rules!")
+
+    def create_rules(self, security_group_id: str, rule_datas: list) -> None:
+        """
+        Creates the inbound rules with a single request.
+        Keyword arguments:
+            rule_datas -- list of CidrRuleData and SecurityGroupRuleData
+            objects.
+        """
+        try:
+            self.ec2.authorize_security_group_ingress(
+                GroupId=security_group_id,
+                IpPermissions=[
+                    self.__build_permission(rule_data)
+                    for rule_data in rule_datas
+                ],
+            )
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error creating the security group rules!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
+
+    def delete_rules(self, security_group_id: str, rule_datas: list) -> None:
+        """
+        Deletes the inbound rules with a single request.
+        Keyword arguments:
+            rule_datas -- list of CidrRuleData and SecurityGroupRuleData
+            objects.
+        """
+        try:
+            self.ec2.revoke_security_group_ingress(
+                GroupId=security_group_id,
+                IpPermissions=[
+                    self.__build_permission(rule_data)
+                    for rule_data in rule_datas
+                ],
+            )
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error deleting the security group rules!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
+
+    def __build_permission(self, rule_data) -> dict:
+        permission = {"IpProtocol": rule_data.protocol}
+
+        # all the protocols, no port range
+        if rule_data.protocol != "-1":
+            permission["FromPort"] = rule_data.from_port
+            permission["ToPort"] = rule_data.to_port
+
+        if isinstance(rule_data, CidrRuleData):
+            permission["IpRanges"] = []
+
+            for ip_range_data in rule_data.ip_ranges:
+                ip_range = {"CidrIp": ip_range_data.cidr_ip}
+
+                if ip_range_data.description:
+                    ip_range["Description"] = ip_range_data.description
+
+                permission["IpRanges"].append(ip_range)
+        else:
+            permission["UserIdGroupPairs"] = []
+
+            for user_id_group_pair_data in rule_data.user_id_group_pairs:
+                user_id_group_pair = {
+                    "GroupId": user_id_group_pair_data.group_id
+                }
+
+                if user_id_group_pair_data.description:
+                    user_id_group_pair[
+                        "Description"
+                    ] = user_id_group_pair_data.description
+
+                permission["UserIdGroupPairs"].append(user_id_group_pair)
+
+        return permission
 
 
 class CidrRuleDao(Ec2Dao):
@@ -105,15 +288,21 @@ class CidrRuleDao(Ec2Dao):
         Returns a list of CidrRuleData objects.
         """
         try:
-            response = (
-                self.ec2.describe_security_groups(
+            security_group = None
+
+            if InventoryDao.is_enabled():
+                security_group = InventoryDao().load(
+                    InventoryDao.SECURITY_GROUP, security_group_id
+                )
+
+            if not security_group:
+                security_group = self.ec2.describe_security_groups(
                     GroupIds=[
                         security_group_id,
                     ],
-                )
-                .get("SecurityGroups")[0]
-                .get("IpPermissions")
-            )
+                ).get("SecurityGroups")[0]
+
+            response = security_group.get("IpPermissions")
 
             rules = []
 
@@ -150,6 +339,8 @@ class CidrRuleDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the security group rule!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
 
     def delete(self, cidr_rule_data: CidrRuleData) -> None:
         """
@@ -175,6 +366,8 @@ class CidrRuleDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the security group rule!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
 
 
 class SecurityGroupRuleDao(Ec2Dao):
@@ -184,15 +377,21 @@ class SecurityGroupRuleDao(Ec2Dao):
         Returns a list of SecurityGroupRuleData objects.
         """
         try:
-            response = (
-                self.ec2.describe_security_groups(
+            security_group = None
+
+            if InventoryDao.is_enabled():
+                security_group = InventoryDao().load(
+                    InventoryDao.SECURITY_GROUP, security_group_id
+                )
+
+            if not security_group:
+                security_group = self.ec2.describe_security_groups(
                     GroupIds=[
                         security_group_id,
                     ],
-                )
-                .get("SecurityGroups")[0]
-                .get("IpPermissions")
-            )
+                ).get("SecurityGroups")[0]
+
+            response = security_group.get("IpPermissions")
 
             rules = []
 
@@ -234,6 +433,8 @@ class SecurityGroupRuleDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the security group rule!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
 
     def delete(self, security_group_rule_data: SecurityGroupRuleData) -> None:
         """
@@ -263,3 +464,5 @@ class SecurityGroupRuleDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the security group rule!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SECURITY_GROUP)
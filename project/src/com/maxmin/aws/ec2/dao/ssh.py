@@ -4,7 +4,11 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.ec2.dao.domain.ssh import KeyPairData
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
@@ -17,12 +21,20 @@ class KeyPairDao(Ec2Dao):
         Returns a KeyPairData object.
         """
         try:
-            response = self.ec2.describe_key_pairs(
-                KeyPairIds=[
-                    key_pair_id,
-                ],
-                IncludePublicKey=True,
-            ).get("KeyPairs")[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(
+                    InventoryDao.KEY_PAIR, key_pair_id
+                )
+
+            if not response:
+                response = self.ec2.describe_key_pairs(
+                    KeyPairIds=[
+                        key_pair_id,
+                    ],
+                    IncludePublicKey=True,
+                ).get("KeyPairs")[0]
 
             return KeyPairData.build(response)
         except Exception as e:
@@ -34,25 +46,32 @@ class KeyPairDao(Ec2Dao):
         Loads all key pairs with a tag with key 'name' equals key_pair_nm.
         Returns a list of KeyPairData objects.
         """
+        return list(self.iterate_all(key_pair_nm))
+
+    def iterate_all(self, key_pair_nm: str) -> Iterator:
+        """
+        Iterates over the key pairs with a tag with key 'name' equals
+        key_pair_nm. describe_key_pairs is not paginated, the key pairs are
+        returned by a single request.
+        Yields KeyPairData objects.
+        """
+        filter_builder = FilterBuilder().name(key_pair_nm)
+
         try:
-            response = self.ec2.describe_key_pairs(
-                IncludePublicKey=True,
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [
-                            key_pair_nm,
-                        ],
-                    },
-                ],
-            ).get("KeyPairs")
-
-            key_pair_datas = []
-
-            for key_pair in response:
-                key_pair_datas.append(KeyPairData.build(key_pair))
-
-            return key_pair_datas
+            if InventoryDao.is_enabled():
+                key_pairs = InventoryDao().load_all(
+                    InventoryDao.KEY_PAIR, key_pair_nm, filter_builder
+                )
+            else:
+                key_pairs = self.paginate(
+                    "describe_key_pairs",
+                    "KeyPairs",
+                    IncludePublicKey=True,
+                    Filters=filter_builder.build(),
+                )
+
+            for key_pair in key_pairs:
+                yield KeyPairData.build(key_pair)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the key pairs!")
@@ -84,6 +103,8 @@ class KeyPairDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the key pair!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.KEY_PAIR)
 
     def delete(self, key_pair_data: KeyPairData) -> None:
         """
@@ -95,3 +116,5 @@ class KeyPairDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the key pair!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.KEY_PAIR)
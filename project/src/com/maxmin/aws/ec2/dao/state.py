@@ -0,0 +1,195 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+from com.maxmin.aws.exception import AwsDaoException
+from com.maxmin.aws.logs import Logger
+
+
+class StateDao(object):
+    """
+    Local store of the identifiers of the EC2 resources found in the previous
+    runs, by region, resource type and value of the tag with key 'name', eg:
+    {"eu-west-1": {"vpc": {"dtc-datacenter": ["vpc-0a1b2c3d"]}}}.
+    The inventory checks the identifiers with a single describe request by
+    identifier for each type instead of scanning all the resources of the
+    type, when a resource is gone or has changed name the type is scanned
+    and the store is corrected.
+    The store is a JSON file, read when enabled and written by save under an
+    exclusive lock, merging the names changed by the run into the file, so
+    that concurrent runs don't lose each other's changes.
+    """
+
+    __lock = threading.Lock()
+    __state_file = None
+    # region: resource type: name: identifiers
+    __state = {}
+    # (region, resource type, name): identifiers, changed by the run
+    __changes = {}
+
+    @staticmethod
+    def enable(state_file: str) -> None:
+        """
+        Turns the store on and reads it.
+        Keyword arguments:
+            state_file -- the JSON file of the store, created if missing.
+        """
+        with StateDao.__lock:
+            StateDao.__state_file = state_file
+            StateDao.__changes = {}
+
+            with StateDao.__locked(fcntl.LOCK_SH):
+                StateDao.__state = StateDao.__read()
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the store off, the changes not saved are discarded.
+        """
+        with StateDao.__lock:
+            StateDao.__state_file = None
+            StateDao.__state = {}
+            StateDao.__changes = {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return StateDao.__state_file is not None
+
+    @staticmethod
+    def get_ids(region_nm: str, resource_type: str) -> dict:
+        """
+        Returns the identifiers of the resources of a type, by name.
+        """
+        with StateDao.__lock:
+            return {
+                resource_nm: list(resource_ids)
+                for resource_nm, resource_ids in StateDao.__state.get(
+                    region_nm, {}
+                )
+                .get(resource_type, {})
+                .items()
+            }
+
+    @staticmethod
+    def record(
+        region_nm: str,
+        resource_type: str,
+        resource_nm: str,
+        resource_ids: list,
+    ) -> None:
+        """
+        Records the identifiers of the resources with a name, the name is
+        removed if there are none.
+        """
+        resource_ids = sorted(resource_ids)
+
+        with StateDao.__lock:
+            if not StateDao.is_enabled():
+                return
+
+            if StateDao.__apply(
+                StateDao.__state,
+                region_nm,
+                resource_type,
+                resource_nm,
+                resource_ids,
+            ):
+                StateDao.__changes[
+                    (region_nm, resource_type, resource_nm)
+                ] = resource_ids
+
+    @staticmethod
+    def save() -> None:
+        """
+        Writes the changes of the run into the file of the store.
+        """
+        with StateDao.__lock:
+            if not StateDao.is_enabled() or not StateDao.__changes:
+                return
+
+            try:
+                with StateDao.__locked(fcntl.LOCK_EX):
+                    state = StateDao.__read()
+
+                    for key, resource_ids in StateDao.__changes.items():
+                        StateDao.__apply(state, *key, resource_ids)
+
+                    # the file is replaced whole, a reader never sees it
+                    # half written
+                    temp_file = f"{StateDao.__state_file}.tmp"
+
+                    with open(temp_file, "w") as file:
+                        json.dump(state, file, indent=2, sort_keys=True)
+
+                    os.replace(temp_file, StateDao.__state_file)
+
+                StateDao.__state = state
+                StateDao.__changes = {}
+
+                Logger.debug("State saved!")
+            except Exception as e:
+                Logger.error(str(e))
+                raise AwsDaoException("Error saving the state!")
+
+    @staticmethod
+    @contextmanager
+    def __locked(operation: int):
+        directory = os.path.dirname(StateDao.__state_file)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(f"{StateDao.__state_file}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, operation)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def __read() -> dict:
+        if not os.path.exists(StateDao.__state_file):
+            return {}
+
+        try:
+            with open(StateDao.__state_file) as file:
+                return json.load(file)
+        except ValueError as e:
+            # the inventory scans the resources and the store is written
+            # again
+            Logger.warn(f"State file not readable, discarded: {e}")
+
+            return {}
+
+    @staticmethod
+    def __apply(
+        state: dict,
+        region_nm: str,
+        resource_type: str,
+        resource_nm: str,
+        resource_ids: list,
+    ) -> bool:
+        """
+        Sets the identifiers of a name in a state.
+        Returns True if the state has changed.
+        """
+        names = state.setdefault(region_nm, {}).setdefault(resource_type, {})
+
+        if names.get(resource_nm, []) == resource_ids:
+            return False
+
+        if resource_ids:
+            names[resource_nm] = resource_ids
+        else:
+            names.pop(resource_nm, None)
+
+        return True
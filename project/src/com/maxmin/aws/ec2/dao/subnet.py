@@ -4,7 +4,11 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
 from com.maxmin.aws.ec2.dao.domain.subnet import SubnetData
@@ -17,40 +21,64 @@ class SubnetDao(Ec2Dao):
         Returns a SubnetData object.
         """
         try:
-            response = self.ec2.describe_subnets(
-                SubnetIds=[
-                    subnet_id,
-                ],
-            ).get(
-                "Subnets"
-            )[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(InventoryDao.SUBNET, subnet_id)
+
+            if not response:
+                response = self.ec2.describe_subnets(
+                    SubnetIds=[
+                        subnet_id,
+                    ],
+                ).get("Subnets")[0]
 
             return SubnetData.build(response)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the subnet!")
 
-    def load_all(self, subnet_nm: str) -> list:
+    def load_all(
+        self, subnet_nm: str, vpc_id: str = None, states: list = None
+    ) -> list:
         """
         Loads all subnets with a tag with key 'name' equal to subnet_nm.
+        Keyword arguments:
+            vpc_id -- if set, only the subnets in the VPC.
+            states -- if set, only the subnets in one of the states.
         Returns a list of SubnetData objects.
         """
-        try:
-            response = self.ec2.describe_subnets(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [subnet_nm],
-                    },
-                ],
-            ).get("Subnets")
+        return list(self.iterate_all(subnet_nm, vpc_id, states))
 
-            subnet_datas = []
+    def iterate_all(
+        self, subnet_nm: str, vpc_id: str = None, states: list = None
+    ) -> Iterator:
+        """
+        Iterates over the subnets with a tag with key 'name' equal to
+        subnet_nm, the pages are requested as the iteration goes.
+        Keyword arguments:
+            vpc_id -- if set, only the subnets in the VPC.
+            states -- if set, only the subnets in one of the states.
+        Yields SubnetData objects.
+        """
+        filter_builder = (
+            FilterBuilder().name(subnet_nm).vpc(vpc_id).state("state", states)
+        )
 
-            for subnet in response:
-                subnet_datas.append(SubnetData.build(subnet))
+        try:
+            if InventoryDao.is_enabled():
+                subnets = InventoryDao().load_all(
+                    InventoryDao.SUBNET, subnet_nm, filter_builder
+                )
+            else:
+                subnets = self.paginate(
+                    "describe_subnets",
+                    "Subnets",
+                    Filters=filter_builder.build(),
+                )
 
-            return subnet_datas
+            for subnet in subnets:
+                yield SubnetData.build(subnet)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the subnet!")
@@ -76,12 +104,13 @@ class SubnetDao(Ec2Dao):
                 .get("SubnetId")
             )
 
-            waiter = self.ec2.get_waiter("subnet_available")
-            waiter.wait(SubnetIds=[identifier])
+            self.wait("subnet_available", SubnetIds=[identifier])
 
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the subnet!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.SUBNET)
 
     def delete(self, subnet_data: SubnetData) -> None:
         """
@@ -92,3 +121,8 @@ class SubnetDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the subnet!")
+        finally:
+            # the subnet associations are removed from the route tables
+            InventoryDao.invalidate(
+                InventoryDao.SUBNET, InventoryDao.ROUTE_TABLE
+            )
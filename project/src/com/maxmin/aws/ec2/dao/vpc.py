@@ -1,4 +1,8 @@
+from typing import Iterator
+
 from com.maxmin.aws.base.dao.client import Ec2Dao
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
 from com.maxmin.aws.ec2.dao.domain.vpc import VpcData
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
@@ -11,40 +15,58 @@ class VpcDao(Ec2Dao):
         Returns a VpcData object.
         """
         try:
-            response = self.ec2.describe_vpcs(
-                VpcIds=[
-                    vpc_id,
-                ],
-            ).get(
-                "Vpcs"
-            )[0]
+            response = None
+
+            if InventoryDao.is_enabled():
+                response = InventoryDao().load(InventoryDao.VPC, vpc_id)
+
+            if not response:
+                response = self.ec2.describe_vpcs(
+                    VpcIds=[
+                        vpc_id,
+                    ],
+                ).get(
+                    "Vpcs"
+                )[0]
 
             return VpcData.build(response)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the VPC!")
 
-    def load_all(self, vpc_nm: str) -> list:
+    def load_all(self, vpc_nm: str, states: list = None) -> list:
         """
         Loads all VPCs with a tag with key 'name' equals vpc_nm.
+        Keyword arguments:
+            states -- if set, only the VPCs in one of the states.
         Returns a list of VpcData objects.
         """
-        try:
-            response = self.ec2.describe_vpcs(
-                Filters=[
-                    {
-                        "Name": "tag-value",
-                        "Values": [vpc_nm],
-                    },
-                ],
-            ).get("Vpcs")
+        return list(self.iterate_all(vpc_nm, states))
 
-            vpc_datas = []
+    def iterate_all(self, vpc_nm: str, states: list = None) -> Iterator:
+        """
+        Iterates over the VPCs with a tag with key 'name' equals vpc_nm, the
+        pages are requested as the iteration goes.
+        Keyword arguments:
+            states -- if set, only the VPCs in one of the states.
+        Yields VpcData objects.
+        """
+        filter_builder = FilterBuilder().name(vpc_nm).state("state", states)
 
-            for vpc in response:
-                vpc_datas.append(VpcData.build(vpc))
+        try:
+            if InventoryDao.is_enabled():
+                vpcs = InventoryDao().load_all(
+                    InventoryDao.VPC, vpc_nm, filter_builder
+                )
+            else:
+                vpcs = self.paginate(
+                    "describe_vpcs",
+                    "Vpcs",
+                    Filters=filter_builder.build(),
+                )
 
-            return vpc_datas
+            for vpc in vpcs:
+                yield VpcData.build(vpc)
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the VPCs!")
@@ -68,12 +90,13 @@ class VpcDao(Ec2Dao):
                 .get("VpcId")
             )
 
-            waiter = self.ec2.get_waiter("vpc_available")
-            waiter.wait(VpcIds=[identifier])
+            self.wait("vpc_available", VpcIds=[identifier])
 
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the VPC!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.VPC)
 
     def delete(self, vpc_data: VpcData) -> None:
         """
@@ -84,3 +107,5 @@ class VpcDao(Ec2Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the VPC!")
+        finally:
+            InventoryDao.invalidate(InventoryDao.VPC)
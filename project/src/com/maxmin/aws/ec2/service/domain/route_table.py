@@ -19,6 +19,7 @@ class RouteTable(BaseTag):
         self.route_table_id = None
         self.vpc_id = None
         self.associated_subnet_ids = []
+        self.association_ids = []
 
 
 class Route(object):
@@ -5,9 +5,13 @@ Created on Mar 20, 2023
 """
 import base64
 import crypt
+import socket
+import time
 
 import jinja2
 
+from com.maxmin.aws.base.dao.async_client import AsyncEc2Dao
+from com.maxmin.aws.base.dao.executor import AsyncExecutor
 from com.maxmin.aws.ec2.dao.domain.instance import InstanceData
 from com.maxmin.aws.ec2.dao.instance import InstanceDao
 from com.maxmin.aws.ec2.dao.vpc import VpcDao
@@ -18,12 +22,35 @@ from com.maxmin.aws.ec2.service.subnet import SubnetService
 from com.maxmin.aws.ec2.service.vpc import VpcService
 from com.maxmin.aws.exception import AwsServiceException
 from com.maxmin.aws.logs import Logger
-from com.maxmin.aws.constants import ProjectFiles
+from com.maxmin.aws.constants import Ec2Constants, ProjectFiles
 from com.maxmin.aws.ec2.service.ssh import KeyPairService
 from com.maxmin.aws.ec2.dao.domain.tag import TagData
 
 
 class InstanceService(object):
+    """
+    Handles the EC2 instances.
+    The readiness level tells how long to wait after an instance is launched:
+    none, not at all; running, until it's running and has its public IP;
+    status_ok, until both the EC2 status checks pass; ssh_reachable, until
+    it accepts connections on the SSH port.
+    """
+
+    NONE = "none"
+    RUNNING = "running"
+    STATUS_OK = "status_ok"
+    SSH_REACHABLE = "ssh_reachable"
+
+    READINESS_LEVELS = (NONE, RUNNING, STATUS_OK, SSH_REACHABLE)
+
+    # the EC2 waiter of each readiness level
+    __WAITERS = {
+        NONE: None,
+        RUNNING: "instance_running",
+        STATUS_OK: "instance_status_ok",
+        SSH_REACHABLE: "instance_running",
+    }
+
     def load_instance(
         self,
         instance_nm: str,
@@ -37,15 +64,9 @@ class InstanceService(object):
 
         try:
             instance_dao = InstanceDao()
-            instance_datas = instance_dao.load_all(instance_nm)
-
-            active_instance_datas = []
-            for instance_data in instance_datas:
-                if (
-                    instance_data.state == "pending"
-                    or instance_data.state == "running"
-                ):
-                    active_instance_datas.append(instance_data)
+            active_instance_datas = instance_dao.load_all(
+                instance_nm, states=["pending", "running"]
+            )
 
             if len(active_instance_datas) > 1:
                 raise AwsServiceException("Found more than one instance!")
@@ -86,7 +107,7 @@ class InstanceService(object):
             Logger.error(str(e))
             raise AwsServiceException("Error loading the instance!")
 
-    def create_instance(
+    def build_instance_data(
         self,
         instance_nm: str,
         private_ip: str,
@@ -99,9 +120,11 @@ class InstanceService(object):
         host_nm: str,
         key_pair_nm: str,
         tags: list,
-    ) -> None:
+    ) -> InstanceData:
         """
-        Creates an instance for the specified VPC with a tag with key 'name' equal to instance_nm.
+        Builds the launch data of an instance for the specified VPC with a tag
+        with key 'name' equal to instance_nm, the instance is not created.
+        Returns an InstanceData object.
         """
         if not instance_nm:
             raise AwsServiceException("Instance name is mandatory!")
@@ -197,8 +220,6 @@ class InstanceService(object):
                 bytes(str(cloudinit_config), "utf-8")
             )
 
-            Logger.debug("Creating instance ...")
-
             instance_data = InstanceData()
             instance_data.image_id = image.image_id
             instance_data.security_group_ids.append(
@@ -213,8 +234,62 @@ class InstanceService(object):
                 for tag in tags:
                     instance_data.tags.append(TagData(tag.key, tag.value))
 
+            return instance_data
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error creating the instance!")
+
+    def create_instance(
+        self,
+        instance_nm: str,
+        private_ip: str,
+        image_nm: str,
+        security_group_nm: str,
+        subnet_nm: str,
+        vpc_nm: str,
+        user_nm: str,
+        user_pwd: str,
+        host_nm: str,
+        key_pair_nm: str,
+        tags: list,
+        readiness: str = STATUS_OK,
+    ) -> None:
+        """
+        Creates an instance for the specified VPC with a tag with key 'name' equal to instance_nm.
+        Keyword arguments:
+            readiness -- the readiness level to wait for, status_ok if not set.
+        """
+        if readiness not in InstanceService.READINESS_LEVELS:
+            raise AwsServiceException(f"Unknown readiness level {readiness}!")
+
+        instance_data = self.build_instance_data(
+            instance_nm,
+            private_ip,
+            image_nm,
+            security_group_nm,
+            subnet_nm,
+            vpc_nm,
+            user_nm,
+            user_pwd,
+            host_nm,
+            key_pair_nm,
+            tags,
+        )
+
+        try:
+            Logger.debug("Creating instance ...")
+
             instance_dao = InstanceDao()
-            instance_dao.create(instance_data)
+            instance_dao.create(
+                instance_data, InstanceService.__WAITERS[readiness]
+            )
+
+            if readiness == InstanceService.SSH_REACHABLE:
+                instance = self.load_instance(instance_nm)
+                self.wait_ssh_reachable(instance.public_ip)
 
             Logger.debug("Instance successfully created!")
         except AwsServiceException as ex:
@@ -224,6 +299,135 @@ class InstanceService(object):
             Logger.error(str(e))
             raise AwsServiceException("Error creating the instance!")
 
+    def create_instances(
+        self,
+        instance_datas: list,
+        readiness: str = STATUS_OK,
+    ) -> None:
+        """
+        Launches all the instances at once and waits until all of them are
+        available.
+        Keyword arguments:
+            instance_datas -- InstanceData objects from build_instance_data.
+            readiness -- the readiness level to wait for, status_ok if not set.
+        """
+        if not instance_datas:
+            raise AwsServiceException("Instance data are mandatory!")
+
+        if readiness not in InstanceService.READINESS_LEVELS:
+            raise AwsServiceException(f"Unknown readiness level {readiness}!")
+
+        try:
+            Logger.debug("Creating instances ...")
+
+            instance_dao = InstanceDao()
+            instance_ids = instance_dao.create_all(
+                instance_datas, InstanceService.__WAITERS[readiness]
+            )
+
+            if readiness == InstanceService.SSH_REACHABLE:
+                for instance_id in instance_ids:
+                    instance_data = instance_dao.load(instance_id)
+                    self.wait_ssh_reachable(instance_data.public_ip)
+
+            Logger.debug("Instances successfully created!")
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error creating the instances!")
+
+    def wait_instances(self, instance_nms: list, readiness: str) -> None:
+        """
+        Waits until all the instances with a tag with key 'name' equal to one
+        of instance_nms reach the readiness level.
+        """
+        if not instance_nms:
+            raise AwsServiceException("Instance names are mandatory!")
+
+        if readiness not in InstanceService.READINESS_LEVELS:
+            raise AwsServiceException(f"Unknown readiness level {readiness}!")
+
+        try:
+            instance_datas = []
+
+            for instance_nm in instance_nms:
+                instance = self.load_instance(instance_nm)
+
+                if not instance:
+                    raise AwsServiceException(
+                        f"Instance {instance_nm} not found!"
+                    )
+
+                instance_data = InstanceData()
+                instance_data.instance_id = instance.instance_id
+                instance_datas.append(instance_data)
+
+            waiter_nm = InstanceService.__WAITERS[readiness]
+
+            if waiter_nm:
+                instance_dao = InstanceDao()
+                instance_dao.wait_all(instance_datas, waiter_nm)
+
+            if readiness == InstanceService.SSH_REACHABLE:
+                for instance_nm in instance_nms:
+                    instance = self.load_instance(instance_nm)
+                    self.wait_ssh_reachable(instance.public_ip)
+
+            Logger.debug(f"Instances {readiness}!")
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error waiting for the instances!")
+
+    def wait_ssh_reachable(
+        self,
+        ip_address: str,
+        port: int = None,
+        timeout: float = None,
+    ) -> None:
+        """
+        Waits until a TCP connection to the SSH port of the address succeeds.
+        Keyword arguments:
+            port -- the SSH port, if not set the value in ec2.ini.
+            timeout -- seconds to wait, if not set the value in ec2.ini.
+        """
+        if not ip_address:
+            raise AwsServiceException("IP address is mandatory!")
+
+        ec2_constants = Ec2Constants()
+
+        if port is None:
+            port = ec2_constants.ssh_port
+
+        if timeout is None:
+            timeout = ec2_constants.ssh_timeout
+
+        interval = ec2_constants.ssh_interval
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                connection = socket.create_connection(
+                    (ip_address, port),
+                    timeout=max(0.1, min(interval, timeout)),
+                )
+                connection.close()
+
+                return
+            except OSError as e:
+                Logger.debug(f"{ip_address}:{port} not reachable: {e}")
+
+            if time.monotonic() + interval > deadline:
+                raise AwsServiceException(
+                    f"{ip_address}:{port} not reachable!"
+                )
+
+            time.sleep(interval)
+
     def terminate_instance(
         self,
         instance_nm: str,
@@ -256,3 +460,120 @@ class InstanceService(object):
         except Exception as e:
             Logger.error(str(e))
             raise AwsServiceException("Error deleting the instance!")
+
+    def terminate_instances(
+        self,
+        instance_nms: list,
+    ) -> None:
+        """
+        Deletes all the instances with a tag with key 'name' equal to one of
+        instance_nms, with a single request, and waits until all of them are
+        terminated.
+        """
+        if not instance_nms:
+            raise AwsServiceException("Instance names are mandatory!")
+
+        try:
+            instance_datas = []
+
+            for instance_nm in instance_nms:
+                instance = self.load_instance(instance_nm)
+
+                if instance and (
+                    instance.state == "pending" or instance.state == "running"
+                ):
+                    instance_data = InstanceData()
+                    instance_data.instance_id = instance.instance_id
+                    instance_datas.append(instance_data)
+                else:
+                    Logger.debug(f"Instance {instance_nm} not found!")
+
+            if instance_datas:
+                instance_dao = InstanceDao()
+                instance_dao.delete_all(instance_datas)
+
+                Logger.debug("Instances deleted!")
+
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error deleting the instances!")
+
+    async def load_instance_async(self, instance_nm: str) -> Instance:
+        """
+        Coroutine of load_instance.
+        """
+        return await AsyncExecutor.run(self.load_instance, instance_nm)
+
+    async def create_instance_async(
+        self,
+        instance_nm: str,
+        private_ip: str,
+        image_nm: str,
+        security_group_nm: str,
+        subnet_nm: str,
+        vpc_nm: str,
+        user_nm: str,
+        user_pwd: str,
+        host_nm: str,
+        key_pair_nm: str,
+        tags: list,
+        readiness: str = STATUS_OK,
+    ) -> None:
+        """
+        Coroutine of create_instance, the instance is waited for from the
+        event loop.
+        Keyword arguments:
+            readiness -- the readiness level to wait for, status_ok if not set.
+        """
+        if readiness not in InstanceService.READINESS_LEVELS:
+            raise AwsServiceException(f"Unknown readiness level {readiness}!")
+
+        if readiness == InstanceService.SSH_REACHABLE:
+            # the public IP is known once the instance is running
+            ec2_readiness = InstanceService.RUNNING
+        else:
+            ec2_readiness = readiness
+
+        try:
+            await AsyncEc2Dao().run(
+                self.create_instance,
+                instance_nm,
+                private_ip,
+                image_nm,
+                security_group_nm,
+                subnet_nm,
+                vpc_nm,
+                user_nm,
+                user_pwd,
+                host_nm,
+                key_pair_nm,
+                tags,
+                ec2_readiness,
+            )
+
+            if readiness == InstanceService.SSH_REACHABLE:
+                instance = await self.load_instance_async(instance_nm)
+                await AsyncExecutor.run(
+                    self.wait_ssh_reachable, instance.public_ip
+                )
+        except AwsServiceException as ex:
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error creating the instance!")
+
+    async def terminate_instance_async(self, instance_nm: str) -> None:
+        """
+        Coroutine of terminate_instance, the termination is waited for from
+        the event loop.
+        """
+        try:
+            await AsyncEc2Dao().run(self.terminate_instance, instance_nm)
+        except AwsServiceException as ex:
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error deleting the instance!")
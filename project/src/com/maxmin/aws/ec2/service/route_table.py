@@ -54,6 +54,7 @@ class RouteTableService(object):
                 response.associated_subnet_ids = (
                     route_table_data.associated_subnet_ids
                 )
+                response.association_ids = route_table_data.association_ids
 
                 for t in route_table_data.tags:
                     response.tags.append(Tag(t.key, t.value))
@@ -128,10 +129,16 @@ class RouteTableService(object):
             route_table = self.load_route_table(route_table_nm)
 
             if route_table:
-                route_table_data = RouteTableData
+                route_table_data = RouteTableData()
                 route_table_data.route_table_id = route_table.route_table_id
+                route_table_data.association_ids = route_table.association_ids
 
                 route_table_dao = RouteTableDao()
+
+                # the associations left by the deleted subnets
+                if route_table_data.association_ids:
+                    route_table_dao.disassociate(route_table_data)
+
                 route_table_dao.delete(route_table_data)
 
                 Logger.debug("Route table deleted!")
@@ -171,10 +178,12 @@ class RouteTableService(object):
 
             Logger.debug("Associating the subnet with the route table ...")
 
-            route_table.associated_subnet_ids.append(subnet.subnet_id)
+            route_table_data = RouteTableData()
+            route_table_data.route_table_id = route_table.route_table_id
+            route_table_data.associated_subnet_ids.append(subnet.subnet_id)
 
             route_table_dao = RouteTableDao()
-            route_table_dao.associate(route_table)
+            route_table_dao.associate(route_table_data)
 
             Logger.debug(
                 "Subnet successfully associated with the route table!"
@@ -177,6 +177,228 @@ class SecurityGroupService(object):
             Logger.error(str(e))
             raise AwsServiceException("Error deleting the security group!")
 
+    def delete_all_rules(
+        self,
+        security_group_nm: str,
+    ) -> None:
+        """
+        Deletes all the inbound rules of the security group with a tag with
+        key 'name' equal to security_group_nm, with a single request.
+        """
+
+        if not security_group_nm:
+            raise AwsServiceException("Security group name is mandatory!")
+
+        try:
+            security_group = self.load_security_group(security_group_nm)
+
+            if security_group:
+                security_group_data = SecurityGroupData()
+                security_group_data.security_group_id = (
+                    security_group.security_group_id
+                )
+
+                security_group_dao = SecurityGroupDao()
+                security_group_dao.delete_all_rules(security_group_data)
+
+                Logger.debug("Security group rules deleted!")
+            else:
+                Logger.debug("Security group not found!")
+
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException(
+                "Error deleting the security group rules!"
+            )
+
+    def synchronize_rules(
+        self,
+        security_group_nm: str,
+        cidr_rules: list,
+        security_group_rules: list,
+        dry_run: bool = False,
+    ) -> tuple:
+        """
+        Makes the inbound rules of the security group with a tag with key
+        'name' equal to security_group_nm equal to the rules passed.
+        The rules of the group are loaded once and indexed by protocol, port
+        range and granted CIDR interval or security group, the missing rules
+        are created with a single request and the rules not passed are
+        deleted with a single request.
+        Keyword arguments:
+            cidr_rules -- list of CidrRule objects.
+            security_group_rules -- list of SecurityGroupRule objects.
+            dry_run -- if True, the rules are compared but not changed.
+        Returns the number of rules created and the number of rules deleted.
+        """
+
+        if not security_group_nm:
+            raise AwsServiceException("Security group name is mandatory!")
+
+        for rule in cidr_rules + security_group_rules:
+            if rule.from_port is None:
+                raise AwsServiceException("From port rule is mandatory!")
+
+            if rule.to_port is None:
+                raise AwsServiceException("To port rule is mandatory!")
+
+            if not rule.protocol:
+                raise AwsServiceException("Rule protocol is mandatory!")
+
+        for cidr_rule in cidr_rules:
+            if not cidr_rule.granted_cidr:
+                raise AwsServiceException(
+                    "Rule granted CIDR interval is mandatory!"
+                )
+
+        for security_group_rule in security_group_rules:
+            if not security_group_rule.granted_security_group_nm:
+                raise AwsServiceException(
+                    "Granted security group name is mandatory!"
+                )
+
+        try:
+            security_group = self.load_security_group(security_group_nm)
+
+            if not security_group:
+                raise AwsServiceException("Security group not found!")
+
+            # each granted security group is loaded once
+            granted_security_group_ids = {}
+
+            for security_group_rule in security_group_rules:
+                granted_security_group_nm = (
+                    security_group_rule.granted_security_group_nm
+                )
+
+                if granted_security_group_nm in granted_security_group_ids:
+                    continue
+
+                if granted_security_group_nm == security_group_nm:
+                    granted_security_group = security_group
+                else:
+                    granted_security_group = self.load_security_group(
+                        granted_security_group_nm
+                    )
+
+                if not granted_security_group:
+                    raise AwsServiceException(
+                        "Granted security group not found!"
+                    )
+
+                granted_security_group_ids[
+                    granted_security_group_nm
+                ] = granted_security_group.security_group_id
+
+            # expected rules by protocol, port range and granted CIDR or
+            # security group
+            rule_datas = {}
+
+            for cidr_rule in cidr_rules:
+                cidr_rule_data = CidrRuleData()
+                cidr_rule_data.security_group_id = (
+                    security_group.security_group_id
+                )
+                cidr_rule_data.from_port = cidr_rule.from_port
+                cidr_rule_data.to_port = cidr_rule.to_port
+                cidr_rule_data.protocol = cidr_rule.protocol
+
+                ip_range_data = IpRangeData()
+                ip_range_data.cidr_ip = cidr_rule.granted_cidr
+                ip_range_data.description = cidr_rule.description
+                cidr_rule_data.ip_ranges.append(ip_range_data)
+
+                rule_datas.setdefault(
+                    self.__get_rule_key(cidr_rule_data), cidr_rule_data
+                )
+
+            for security_group_rule in security_group_rules:
+                security_group_rule_data = SecurityGroupRuleData()
+                security_group_rule_data.security_group_id = (
+                    security_group.security_group_id
+                )
+                security_group_rule_data.from_port = (
+                    security_group_rule.from_port
+                )
+                security_group_rule_data.to_port = security_group_rule.to_port
+                security_group_rule_data.protocol = (
+                    security_group_rule.protocol
+                )
+
+                user_id_group_pair_data = UserIdGroupPairData()
+                user_id_group_pair_data.group_id = granted_security_group_ids[
+                    security_group_rule.granted_security_group_nm
+                ]
+                user_id_group_pair_data.description = (
+                    security_group_rule.description
+                )
+                security_group_rule_data.user_id_group_pairs.append(
+                    user_id_group_pair_data
+                )
+
+                rule_datas.setdefault(
+                    self.__get_rule_key(security_group_rule_data),
+                    security_group_rule_data,
+                )
+
+            security_group_dao = SecurityGroupDao()
+
+            current_rule_datas = {}
+            for rule_data in security_group_dao.load_all_rules(
+                security_group.security_group_id
+            ):
+                current_rule_datas[self.__get_rule_key(rule_data)] = rule_data
+
+            created_rule_datas = [
+                rule_data
+                for key, rule_data in rule_datas.items()
+                if key not in current_rule_datas
+            ]
+            deleted_rule_datas = [
+                rule_data
+                for key, rule_data in current_rule_datas.items()
+                if key not in rule_datas
+            ]
+
+            if dry_run:
+                return len(created_rule_datas), len(deleted_rule_datas)
+
+            if deleted_rule_datas:
+                Logger.debug(
+                    f"Deleting {len(deleted_rule_datas)} security group "
+                    "rules ..."
+                )
+
+                security_group_dao.delete_rules(
+                    security_group.security_group_id, deleted_rule_datas
+                )
+
+            if created_rule_datas:
+                Logger.debug(
+                    f"Creating {len(created_rule_datas)} security group "
+                    "rules ..."
+                )
+
+                security_group_dao.create_rules(
+                    security_group.security_group_id, created_rule_datas
+                )
+
+            Logger.debug("Security group rules successfully synchronized!")
+
+            return len(created_rule_datas), len(deleted_rule_datas)
+
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException(
+                "Error synchronizing the security group rules!"
+            )
+
     def load_cidr_rule(
         self,
         security_group_nm: str,
@@ -707,3 +929,17 @@ class SecurityGroupService(object):
                         security_group_rule_data = ru
                         break
         return security_group_rule_data
+
+    def __get_rule_key(self, rule_data) -> tuple:
+        # the rules for all the protocols have no port range
+        if rule_data.protocol == "-1":
+            ports = (None, None)
+        else:
+            ports = (rule_data.from_port, rule_data.to_port)
+
+        if isinstance(rule_data, CidrRuleData):
+            granted = rule_data.ip_ranges[0].cidr_ip
+        else:
+            granted = rule_data.user_id_group_pairs[0].group_id
+
+        return (rule_data.protocol,) + ports + (granted,)
@@ -4,6 +4,8 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from com.maxmin.aws.base.dao.async_client import AsyncEc2Dao
+from com.maxmin.aws.base.dao.executor import AsyncExecutor
 from com.maxmin.aws.ec2.dao.vpc import VpcDao
 from com.maxmin.aws.exception import AwsServiceException
 from com.maxmin.aws.logs import Logger
@@ -125,3 +127,29 @@ class VpcService(object):
         except Exception as e:
             Logger.error(str(e))
             raise AwsServiceException("Error deleting the VPC!")
+
+    async def load_vpc_async(self, vpc_nm: str) -> Vpc:
+        """
+        Coroutine of load_vpc.
+        """
+        return await AsyncExecutor.run(self.load_vpc, vpc_nm)
+
+    async def create_vpc_async(
+        self, vpc_nm: str, cidr: str, tags: list
+    ) -> None:
+        """
+        Coroutine of create_vpc, the VPC is waited for from the event loop.
+        """
+        try:
+            await AsyncEc2Dao().run(self.create_vpc, vpc_nm, cidr, tags)
+        except AwsServiceException as ex:
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error creating the VPC!")
+
+    async def delete_vpc_async(self, vpc_nm: str) -> None:
+        """
+        Coroutine of delete_vpc.
+        """
+        await AsyncExecutor.run(self.delete_vpc, vpc_nm)
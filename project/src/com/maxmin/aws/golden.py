@@ -0,0 +1,135 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import hashlib
+import os
+
+from com.maxmin.aws.configuration.dao.domain.datacenter import (
+    DatacenterConfig,
+)
+from com.maxmin.aws.ec2.service.domain.tag import Tag
+from com.maxmin.aws.ec2.service.image import ImageService
+from com.maxmin.aws.logs import Logger
+
+
+class ProvisionDigest(object):
+    """
+    Digest of the Ansible provisioning: the playbooks, their variables,
+    templates and files, the inventory and the Ansible configuration.
+    """
+
+    # written by the runs, not part of the provisioning
+    EXCLUDED_DIRS = ("cache", "logs")
+    EXCLUDED_FILES = (os.path.join("inventory", "datacenter.json"),)
+
+    @staticmethod
+    def compute(provision_dir: str) -> str:
+        """
+        Returns the digest of the files in the provisioning directory, by
+        relative path and content.
+        """
+        digest = hashlib.sha256()
+
+        for root, dirs, files in os.walk(provision_dir):
+            # the walk order doesn't depend on the file system
+            dirs[:] = sorted(
+                directory
+                for directory in dirs
+                if directory not in ProvisionDigest.EXCLUDED_DIRS
+            )
+
+            for file_nm in sorted(files):
+                file_path = os.path.join(root, file_nm)
+                relative_path = os.path.relpath(file_path, provision_dir)
+
+                if relative_path in ProvisionDigest.EXCLUDED_FILES:
+                    continue
+
+                digest.update(relative_path.encode())
+
+                with open(file_path, "rb") as file:
+                    digest.update(file.read())
+
+        return digest.hexdigest()
+
+
+class GoldenImageBaker(object):
+    """
+    Bakes the provisioned instances of a datacenter into golden images and
+    launches the instances from them.
+    The image of an instance is named after the instance and the digest of
+    the provisioning, with the full digest in the tag with key 'provision':
+    when the playbooks or the variables change the instances are launched
+    from their parent image again until a new image is baked.
+    """
+
+    def __init__(self, datacenter_config: DatacenterConfig, digest: str):
+        self.datacenter_config = datacenter_config
+        self.digest = digest
+
+    def get_image_nm(self, instance_nm: str) -> str:
+        return f"{instance_nm}-golden-{self.digest[:12]}"
+
+    def bake(self) -> list:
+        """
+        Creates an image of each instance, the instances are provisioned.
+        Returns the names of the images created.
+        """
+        image_service = ImageService()
+        image_nms = []
+
+        for instance_config in self.datacenter_config.instances:
+            image_nm = self.get_image_nm(instance_config.name)
+
+            if image_service.load_image(image_nm):
+                Logger.warn(f"Golden image {image_nm} already baked!")
+                continue
+
+            Logger.info(f"Baking golden image {image_nm} ...")
+
+            image_service.create_image(
+                image_nm,
+                f"{instance_config.name} provisioned, {self.digest}",
+                instance_config.name,
+                [
+                    Tag("provision", self.digest),
+                    Tag("parent", instance_config.parent_img),
+                ],
+            )
+            image_nms.append(image_nm)
+
+            Logger.info(f"Golden image {image_nm} baked!")
+
+        return image_nms
+
+    def apply(self) -> list:
+        """
+        Sets the parent image of the instances that have a golden image of
+        the current provisioning.
+        Returns the names of the instances launched from a golden image.
+        """
+        image_service = ImageService()
+        instance_nms = []
+
+        for instance_config in self.datacenter_config.instances:
+            image_nm = self.get_image_nm(instance_config.name)
+            image = image_service.load_image(image_nm)
+
+            if not image or image.state != "available":
+                Logger.info(
+                    f"No golden image for {instance_config.name}, launched "
+                    f"from {instance_config.parent_img}!"
+                )
+                continue
+
+            Logger.info(
+                f"AWS instance {instance_config.name} launched from golden "
+                f"image {image_nm}!"
+            )
+            instance_config.parent_img = image_nm
+            instance_nms.append(instance_config.name)
+
+        return instance_nms
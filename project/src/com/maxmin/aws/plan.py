@@ -0,0 +1,580 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+from com.maxmin.aws.configuration.dao.domain.datacenter import (
+    DatacenterConfig,
+    HostedZoneConfig,
+)
+from com.maxmin.aws.datacenter import StartupGraphBuilder
+from com.maxmin.aws.ec2.service.instance import InstanceService
+from com.maxmin.aws.ec2.service.internet_gateway import InternetGatewayService
+from com.maxmin.aws.ec2.service.route_table import RouteTableService
+from com.maxmin.aws.ec2.service.security_group import SecurityGroupService
+from com.maxmin.aws.ec2.service.ssh import KeyPairService
+from com.maxmin.aws.ec2.service.subnet import SubnetService
+from com.maxmin.aws.ec2.service.vpc import VpcService
+from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
+
+
+class PlanAction(object):
+    """
+    Change to a resource: the action, the resource type and name, the
+    requests and the waiters it costs and a detail, eg: +2 -1 rules.
+    The cost of a request shared by several actions, eg: the change batch
+    of the DNS records, is charged to the first of them.
+    """
+
+    def __init__(
+        self,
+        action: str,
+        resource_type: str,
+        resource_nm: str,
+        requests: int = 0,
+        waits: int = 0,
+        detail: str = None,
+    ):
+        self.action = action
+        self.resource_type = resource_type
+        self.resource_nm = resource_nm
+        self.requests = requests
+        self.waits = waits
+        self.detail = detail
+
+
+class Plan(object):
+    """
+    Changes a startup or a shutdown run would make, with the estimated
+    number of AWS requests and waiters. Each waiter polls until its
+    resources are ready, with the schedule set in the ini files.
+    """
+
+    CREATE = "create"
+    MODIFY = "modify"
+    DELETE = "delete"
+    KEEP = "keep"
+
+    __SYMBOLS = {CREATE: "+", MODIFY: "~", DELETE: "-"}
+
+    def __init__(self):
+        self.actions = []
+
+    def add(
+        self,
+        action: str,
+        resource_type: str,
+        resource_nm: str,
+        requests: int = 0,
+        waits: int = 0,
+        detail: str = None,
+    ) -> None:
+        self.actions.append(
+            PlanAction(
+                action, resource_type, resource_nm, requests, waits, detail
+            )
+        )
+
+    def count(self, action: str) -> int:
+        return len([a for a in self.actions if a.action == action])
+
+    @property
+    def requests(self) -> int:
+        return sum(a.requests for a in self.actions)
+
+    @property
+    def waits(self) -> int:
+        return sum(a.waits for a in self.actions)
+
+    @property
+    def changed(self) -> bool:
+        return any(a.action != Plan.KEEP for a in self.actions)
+
+    def format(self) -> list:
+        """
+        Returns the lines of the plan, a line for each change and a summary.
+        """
+        lines = []
+
+        for a in self.actions:
+            if a.action == Plan.KEEP:
+                continue
+
+            line = (
+                f"{Plan.__SYMBOLS[a.action]} {a.action:8}"
+                f"{a.resource_type:18}{a.resource_nm}"
+            )
+
+            if a.detail:
+                line += f" ({a.detail})"
+
+            lines.append(line)
+
+        lines.append(
+            f"Plan: {self.count(Plan.CREATE)} to create, "
+            f"{self.count(Plan.MODIFY)} to modify, "
+            f"{self.count(Plan.DELETE)} to delete, "
+            f"{self.count(Plan.KEEP)} unchanged, "
+            f"about {self.requests} requests and {self.waits} waiters."
+        )
+
+        return lines
+
+
+class StartupPlanner(object):
+    """
+    Computes the changes the startup would make to the account, without
+    changing it.
+    The resources are looked up by the services as the startup does, with
+    the inventory of the EC2 resources and the index of the DNS records
+    enabled they are read with a scan for each type.
+    """
+
+    VPC = StartupGraphBuilder.VPC
+    INTERNET_GATEWAY = StartupGraphBuilder.INTERNET_GATEWAY
+    ROUTE_TABLE = StartupGraphBuilder.ROUTE_TABLE
+    ROUTE = StartupGraphBuilder.ROUTE
+    SUBNET = StartupGraphBuilder.SUBNET
+    SECURITY_GROUP = StartupGraphBuilder.SECURITY_GROUP
+    RULES = StartupGraphBuilder.RULES
+    KEY_PAIR = StartupGraphBuilder.KEY_PAIR
+    INSTANCE = "instance"
+    RECORD = "record"
+
+    def __init__(
+        self,
+        datacenter_config: DatacenterConfig,
+        hosted_zone_config: HostedZoneConfig,
+    ):
+        self.datacenter_config = datacenter_config
+        self.hosted_zone_config = hosted_zone_config
+
+    def plan(self) -> Plan:
+        """
+        Returns the plan of the startup.
+        """
+        plan = Plan()
+        datacenter_config = self.datacenter_config
+
+        vpc = VpcService().load_vpc(datacenter_config.vpc.name)
+
+        self.add(
+            plan, vpc, StartupPlanner.VPC, datacenter_config.vpc.name, 1, 1
+        )
+
+        internet_gateway = InternetGatewayService().load_internet_gateway(
+            datacenter_config.internet_gateway.name
+        )
+
+        # created and attached to the VPC
+        self.add(
+            plan,
+            internet_gateway,
+            StartupPlanner.INTERNET_GATEWAY,
+            datacenter_config.internet_gateway.name,
+            2,
+            1,
+        )
+
+        route_table_service = RouteTableService()
+        route_table = route_table_service.load_route_table(
+            datacenter_config.route_table.name
+        )
+
+        self.add(
+            plan,
+            route_table,
+            StartupPlanner.ROUTE_TABLE,
+            datacenter_config.route_table.name,
+            1,
+        )
+
+        route = None
+
+        if route_table and internet_gateway:
+            route = route_table_service.load_route(
+                datacenter_config.route_table.name,
+                datacenter_config.internet_gateway.name,
+                "0.0.0.0/0",
+            )
+
+        self.add(
+            plan,
+            route,
+            StartupPlanner.ROUTE,
+            datacenter_config.route_table.name,
+            1,
+        )
+
+        subnet_service = SubnetService()
+
+        for subnet_config in datacenter_config.subnets:
+            # created and associated to the route table
+            self.add(
+                plan,
+                subnet_service.load_subnet(subnet_config.name),
+                StartupPlanner.SUBNET,
+                subnet_config.name,
+                2,
+                1,
+            )
+
+        self.plan_security_groups(plan)
+
+        key_pair_service = KeyPairService()
+
+        for instance_config in datacenter_config.instances:
+            self.add(
+                plan,
+                key_pair_service.load_key_pair(instance_config.name),
+                StartupPlanner.KEY_PAIR,
+                instance_config.name,
+                1,
+            )
+
+        self.plan_instances(plan)
+
+        return plan
+
+    def plan_security_groups(self, plan: Plan) -> None:
+        security_group_service = SecurityGroupService()
+        security_groups = {}
+
+        for security_group_config in self.datacenter_config.security_groups:
+            security_groups[
+                security_group_config.name
+            ] = security_group_service.load_security_group(
+                security_group_config.name
+            )
+
+            self.add(
+                plan,
+                security_groups[security_group_config.name],
+                StartupPlanner.SECURITY_GROUP,
+                security_group_config.name,
+                1,
+                1,
+            )
+
+        for security_group_config in self.datacenter_config.security_groups:
+            cidr_rules, security_group_rules = StartupGraphBuilder.build_rules(
+                security_group_config
+            )
+            granted_security_group_nms = {
+                rule.granted_security_group_nm for rule in security_group_rules
+            }
+
+            if security_groups[security_group_config.name] and all(
+                security_groups.get(security_group_nm)
+                or security_group_service.load_security_group(
+                    security_group_nm
+                )
+                for security_group_nm in granted_security_group_nms
+            ):
+                created, deleted = security_group_service.synchronize_rules(
+                    security_group_config.name,
+                    cidr_rules,
+                    security_group_rules,
+                    dry_run=True,
+                )
+                action = Plan.MODIFY
+            else:
+                # the groups granted access are created by the run
+                created = len(cidr_rules) + len(security_group_rules)
+                deleted = 0
+                action = Plan.CREATE
+
+            if created or deleted:
+                # a request for the missing rules and one for the others
+                plan.add(
+                    action,
+                    StartupPlanner.RULES,
+                    security_group_config.name,
+                    int(created > 0) + int(deleted > 0),
+                    detail=f"+{created} -{deleted} rules",
+                )
+            else:
+                plan.add(
+                    Plan.KEEP, StartupPlanner.RULES, security_group_config.name
+                )
+
+    def plan_instances(self, plan: Plan) -> None:
+        instance_service = InstanceService()
+        instances = {}
+
+        # a waiter for each readiness level, for all the instances
+        waits = len(
+            [
+                name
+                for name in StartupGraphBuilder(
+                    self.datacenter_config, self.hosted_zone_config
+                )
+                .build()
+                .nodes
+                if name.startswith(f"{StartupGraphBuilder.READY}:")
+            ]
+        )
+
+        for instance_config in self.datacenter_config.instances:
+            instances[instance_config.name] = instance_service.load_instance(
+                instance_config.name
+            )
+
+            if not instances[instance_config.name]:
+                plan.add(
+                    Plan.CREATE,
+                    StartupPlanner.INSTANCE,
+                    instance_config.name,
+                    1,
+                    waits,
+                )
+                waits = 0
+            else:
+                plan.add(
+                    Plan.KEEP, StartupPlanner.INSTANCE, instance_config.name
+                )
+
+        if not self.hosted_zone_config.registered_domain:
+            return
+
+        hosted_zone_service = HostedZoneService()
+        hosted_zone = hosted_zone_service.load_hosted_zone(
+            self.hosted_zone_config.registered_domain
+        )
+
+        if not hosted_zone:
+            return
+
+        # all the records are published with a single change batch
+        requests = 1
+
+        for instance_config in self.datacenter_config.instances:
+            record = hosted_zone_service.load_record(
+                instance_config.dns_domain, hosted_zone.registered_domain
+            )
+            instance = instances[instance_config.name]
+
+            if not record:
+                action = Plan.CREATE
+            elif not instance or instance.public_ip != record.ip_address:
+                action = Plan.MODIFY
+            else:
+                action = Plan.KEEP
+
+            if action == Plan.KEEP:
+                plan.add(
+                    action, StartupPlanner.RECORD, instance_config.dns_domain
+                )
+            else:
+                plan.add(
+                    action,
+                    StartupPlanner.RECORD,
+                    instance_config.dns_domain,
+                    requests,
+                )
+                requests = 0
+
+    @staticmethod
+    def add(
+        plan: Plan,
+        resource,
+        resource_type: str,
+        resource_nm: str,
+        requests: int,
+        waits: int = 0,
+    ) -> None:
+        """
+        Adds the creation of a resource if it's not there.
+        """
+        if resource:
+            plan.add(Plan.KEEP, resource_type, resource_nm)
+        else:
+            plan.add(Plan.CREATE, resource_type, resource_nm, requests, waits)
+
+
+class ShutdownPlanner(object):
+    """
+    Computes the changes the shutdown would make to the account, without
+    changing it.
+    """
+
+    def __init__(
+        self,
+        datacenter_config: DatacenterConfig,
+        hosted_zone_config: HostedZoneConfig,
+    ):
+        self.datacenter_config = datacenter_config
+        self.hosted_zone_config = hosted_zone_config
+
+    def plan(self) -> Plan:
+        """
+        Returns the plan of the shutdown.
+        """
+        plan = Plan()
+        datacenter_config = self.datacenter_config
+
+        self.plan_instances(plan)
+
+        key_pair_service = KeyPairService()
+
+        for instance_config in datacenter_config.instances:
+            self.add(
+                plan,
+                key_pair_service.load_key_pair(instance_config.name),
+                StartupPlanner.KEY_PAIR,
+                instance_config.name,
+                1,
+            )
+
+        security_group_service = SecurityGroupService()
+        security_groups = {}
+
+        for security_group_config in datacenter_config.security_groups:
+            security_groups[
+                security_group_config.name
+            ] = security_group_service.load_security_group(
+                security_group_config.name
+            )
+
+            deleted = 0
+
+            if security_groups[security_group_config.name]:
+                _, deleted = security_group_service.synchronize_rules(
+                    security_group_config.name, [], [], dry_run=True
+                )
+
+            if deleted:
+                # all the rules are deleted with a single request
+                plan.add(
+                    Plan.DELETE,
+                    StartupPlanner.RULES,
+                    security_group_config.name,
+                    1,
+                    detail=f"-{deleted} rules",
+                )
+            else:
+                plan.add(
+                    Plan.KEEP, StartupPlanner.RULES, security_group_config.name
+                )
+
+        for security_group_config in datacenter_config.security_groups:
+            self.add(
+                plan,
+                security_groups[security_group_config.name],
+                StartupPlanner.SECURITY_GROUP,
+                security_group_config.name,
+                1,
+            )
+
+        # detached from the VPC and deleted
+        self.add(
+            plan,
+            InternetGatewayService().load_internet_gateway(
+                datacenter_config.internet_gateway.name
+            ),
+            StartupPlanner.INTERNET_GATEWAY,
+            datacenter_config.internet_gateway.name,
+            2,
+        )
+
+        subnet_service = SubnetService()
+        subnets = 0
+
+        for subnet_config in datacenter_config.subnets:
+            subnet = subnet_service.load_subnet(subnet_config.name)
+
+            if subnet:
+                subnets += 1
+
+            self.add(
+                plan, subnet, StartupPlanner.SUBNET, subnet_config.name, 1
+            )
+
+        # disassociated from the subnets and deleted
+        self.add(
+            plan,
+            RouteTableService().load_route_table(
+                datacenter_config.route_table.name
+            ),
+            StartupPlanner.ROUTE_TABLE,
+            datacenter_config.route_table.name,
+            1 + subnets,
+        )
+
+        self.add(
+            plan,
+            VpcService().load_vpc(datacenter_config.vpc.name),
+            StartupPlanner.VPC,
+            datacenter_config.vpc.name,
+            1,
+        )
+
+        return plan
+
+    def plan_instances(self, plan: Plan) -> None:
+        hosted_zone = None
+
+        if self.hosted_zone_config.registered_domain:
+            hosted_zone_service = HostedZoneService()
+            hosted_zone = hosted_zone_service.load_hosted_zone(
+                self.hosted_zone_config.registered_domain
+            )
+
+        if hosted_zone:
+            # all the records are deleted with a single change batch
+            requests = 1
+
+            for instance_config in self.datacenter_config.instances:
+                record = hosted_zone_service.load_record(
+                    instance_config.dns_domain, hosted_zone.registered_domain
+                )
+
+                self.add(
+                    plan,
+                    record,
+                    StartupPlanner.RECORD,
+                    instance_config.dns_domain,
+                    requests,
+                )
+
+                if record:
+                    requests = 0
+
+        instance_service = InstanceService()
+
+        # all the instances are terminated with a single request and a
+        # waiter
+        requests = 1
+
+        for instance_config in self.datacenter_config.instances:
+            instance = instance_service.load_instance(instance_config.name)
+
+            self.add(
+                plan,
+                instance,
+                StartupPlanner.INSTANCE,
+                instance_config.name,
+                requests,
+                requests,
+            )
+
+            if instance:
+                requests = 0
+
+    @staticmethod
+    def add(
+        plan: Plan,
+        resource,
+        resource_type: str,
+        resource_nm: str,
+        requests: int,
+        waits: int = 0,
+    ) -> None:
+        """
+        Adds the deletion of a resource if it's there.
+        """
+        if resource:
+            plan.add(Plan.DELETE, resource_type, resource_nm, requests, waits)
+        else:
+            plan.add(Plan.KEEP, resource_type, resource_nm)
@@ -0,0 +1,147 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import os
+import subprocess
+from functools import partial
+
+from com.maxmin.aws.base.graph import ResourceGraph
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+
+
+class PlaybookGraphBuilder(object):
+    """
+    Builds the graph of the Ansible playbooks that provision the instances:
+    the packages, OpenSSL and Python are installed first, one after the
+    other, then the independent stacks run at the same time, eg: Java and
+    Tomcat, PostgreSQL, Nginx, each one as soon as the playbooks it needs
+    have succeeded.
+    The playbooks read the static inventory written by the startup run, if
+    there is one, otherwise the aws_ec2 dynamic inventory is refreshed once
+    and read from the inventory cache. The playbooks share the facts cache
+    and the SSH connections, see ansible.cfg.
+    The output of each playbook is written to its own file in the logs
+    directory.
+    """
+
+    INVENTORY = "inventory"
+
+    # playbook: the playbooks it needs, the files copied to the instances
+    # are downloaded on the control node while the packages are upgraded
+    PLAYBOOKS = {
+        "upgrade": [],
+        "downloads": [],
+        "openssl": ["upgrade", "downloads"],
+        "python": ["openssl"],
+        "java": ["python"],
+        "tomcat": ["java"],
+        "postgresql": ["python"],
+        "nginx": ["python"],
+        "docker": ["python"],
+        "mariadb": ["python"],
+        "phpmyadmin": ["docker"],
+    }
+
+    def __init__(
+        self,
+        provision_dir: str,
+        ansible_bin_dir: str = None,
+        playbook_timeout: float = None,
+        inventory_file: str = None,
+    ):
+        """
+        Keyword arguments:
+            ansible_bin_dir -- directory of the Ansible commands, if not set
+                the commands are looked up in the PATH.
+            playbook_timeout -- seconds a playbook may run, if not set no
+                limit.
+            inventory_file -- static inventory, see StaticInventory, if not
+                set or not there the dynamic inventory is used.
+        """
+        self.provision_dir = provision_dir
+        self.ansible_bin_dir = ansible_bin_dir
+        self.playbook_timeout = playbook_timeout
+        self.inventory_file = inventory_file
+
+    def is_static(self) -> bool:
+        return bool(self.inventory_file) and os.path.exists(
+            self.inventory_file
+        )
+
+    def build(self) -> ResourceGraph:
+        graph = ResourceGraph()
+        roots = []
+
+        if not self.is_static():
+            graph.add_node(
+                PlaybookGraphBuilder.INVENTORY, self.refresh_inventory
+            )
+            roots = [PlaybookGraphBuilder.INVENTORY]
+
+        for playbook, dependencies in PlaybookGraphBuilder.PLAYBOOKS.items():
+            graph.add_node(
+                playbook,
+                partial(self.run_playbook, playbook),
+                dependencies or roots,
+            )
+
+        return graph
+
+    def refresh_inventory(self) -> None:
+        Logger.info("Refreshing the inventory ...")
+
+        self.run_command(
+            PlaybookGraphBuilder.INVENTORY,
+            ["ansible-inventory", "--list", "--flush-cache"],
+        )
+
+        Logger.info("Inventory refreshed!")
+
+    def run_playbook(self, playbook: str) -> None:
+        Logger.info(f"{playbook} ...")
+
+        command = ["ansible-playbook", f"playbooks/{playbook}.yml"]
+
+        if self.is_static():
+            command += ["-i", self.inventory_file]
+
+        self.run_command(playbook, command)
+
+        Logger.info(f"{playbook} provisioned!")
+
+    def run_command(self, step_nm: str, command: list) -> None:
+        """
+        Runs an Ansible command in the provisioning directory, the output
+        written to logs/<step_nm>.log.
+        """
+        if self.ansible_bin_dir:
+            command = [
+                os.path.join(self.ansible_bin_dir, command[0]),
+                *command[1:],
+            ]
+
+        log_file = os.path.join(self.provision_dir, "logs", f"{step_nm}.log")
+
+        try:
+            with open(log_file, "w") as output:
+                process = subprocess.run(
+                    command,
+                    cwd=self.provision_dir,
+                    stdout=output,
+                    stderr=subprocess.STDOUT,
+                    timeout=self.playbook_timeout,
+                )
+        except subprocess.TimeoutExpired:
+            raise AwsException(
+                f"{step_nm} timed out after {self.playbook_timeout} seconds!"
+            )
+        except OSError as e:
+            Logger.error(str(e))
+            raise AwsException(f"Error running {step_nm}!")
+
+        if process.returncode != 0:
+            raise AwsException(f"{step_nm} failed, see {log_file}!")
@@ -0,0 +1,91 @@
+import os
+import sys
+
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.constants import DatacenterConstants, ProjectDirectories
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.playbook import PlaybookGraphBuilder
+
+"""
+Provisions the instances of the datacenter with the Ansible playbooks in a
+single run, the independent stacks at the same time, see datacenter.ini.
+Ansible reads the instances from the static inventory written by
+startup.py, or with the aws_ec2 dynamic inventory plugin if there isn't one.
+
+export AWS_ACCESS_KEY_ID=xxxxxx
+export AWS_SECRET_ACCESS_KEY=yyyyyy
+export AWS_DEFAULT_REGION=zzzzzz
+
+python provision.py [ansible bin directory]
+"""
+
+if __name__ == "__main__":
+    # AWS IAM user credentials
+
+    if not os.getenv("AWS_ACCESS_KEY_ID"):
+        raise AwsException("environment variable AWS_ACCESS_KEY_ID not set!")
+
+    if not os.getenv("AWS_SECRET_ACCESS_KEY"):
+        raise AwsException(
+            "environment variable AWS_SECRET_ACCESS_KEY not set!"
+        )
+
+    if not os.getenv("AWS_DEFAULT_REGION"):
+        raise AwsException("environment variable AWS_DEFAULT_REGION not set!")
+
+    # directory where the datacenter project is downloaded from github
+    datacenter_dir = os.getenv("DATACENTER_DIR")
+
+    if not datacenter_dir:
+        """
+        see: constants.ProjectDirectories class
+        """
+        raise AwsException("environment variable DATACENTER_DIR not set!")
+
+    # the Ansible commands in the PATH if not passed
+    ansible_bin_dir = sys.argv[1] if len(sys.argv) > 1 else None
+
+    Logger.info(f"Datacenter directory {datacenter_dir}")
+    Logger.info(f"Provisioning directory {ProjectDirectories.PROVISION_DIR}")
+
+    Logger.info("Provisioning AWS instances ...")
+
+    datacenter_constants = DatacenterConstants()
+
+    inventory_file = None
+
+    if datacenter_constants.provision_static_inventory:
+        inventory_file = datacenter_constants.provision_inventory_file
+
+    builder = PlaybookGraphBuilder(
+        ProjectDirectories.PROVISION_DIR,
+        ansible_bin_dir,
+        datacenter_constants.provision_playbook_timeout,
+        inventory_file,
+    )
+
+    if builder.is_static():
+        Logger.info(f"Static inventory {inventory_file}")
+    else:
+        Logger.info("Dynamic inventory aws_ec2")
+
+    graph = builder.build()
+
+    graph_executor = GraphExecutor(
+        datacenter_constants.provision_max_workers,
+        datacenter_constants.provision_policy,
+    )
+    result = graph_executor.execute(graph)
+
+    for playbook, seconds in result.timings.items():
+        Logger.info(f"{playbook:40}{seconds:>10.1f}s")
+
+    if not result.succeeded:
+        raise AwsException(
+            "Error provisioning the instances: "
+            + ", ".join(result.failed_nodes)
+            + " failed!"
+        )
+
+    Logger.info(f"AWS instances provisioned in {result.elapsed:.1f} seconds!")
@@ -9,6 +9,7 @@ class RecordData(BaseData):
         self.dns_nm = None
         self.ip_address = None
         self.type = None
+        self.ttl = None
 
     @classmethod
     def build(cls, record: dict, hosted_zone_id: str) -> Self:
@@ -20,5 +21,6 @@ class RecordData(BaseData):
         r.dns_nm = record.get("Name")
         r.ip_address = record.get("ResourceRecords")[0].get("Value")
         r.type = record.get("Type")
+        r.ttl = record.get("TTL")
 
         return r
@@ -4,27 +4,118 @@ Created on Apr 10, 2023
 @author: vagrant
 """
 
+import threading
+
 from com.maxmin.aws.base.dao.client import Route53Dao
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
 from com.maxmin.aws.route53.dao.domain.hosted_zone import HostedZoneData
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
 
 
 class HostedZoneDao(Route53Dao):
+    """
+    When the cache is enabled, the hosted zones found by name are kept for
+    the life of the process, the zones are not looked up again.
+    """
+
+    __cached = False
+    __lock = threading.Lock()
+    __hosted_zones = {}
+
+    @staticmethod
+    def enable() -> None:
+        """
+        Turns the cache of the hosted zones on.
+        """
+        with HostedZoneDao.__lock:
+            HostedZoneDao.__cached = True
+            HostedZoneDao.__hosted_zones.clear()
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the cache of the hosted zones off and discards it.
+        """
+        with HostedZoneDao.__lock:
+            HostedZoneDao.__cached = False
+            HostedZoneDao.__hosted_zones.clear()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return HostedZoneDao.__cached
+
+    @staticmethod
+    def invalidate(*registered_domains: str) -> None:
+        """
+        Discards the cached hosted zones, all of them if no domain is passed.
+        """
+        with HostedZoneDao.__lock:
+            if not registered_domains:
+                HostedZoneDao.__hosted_zones.clear()
+
+            for registered_domain in registered_domains:
+                HostedZoneDao.__hosted_zones.pop(
+                    RecordIndexDao.normalize(registered_domain), None
+                )
+
+    def load(self, registered_domain: str) -> HostedZoneData:
+        """
+        Loads the hosted zone with the exact domain name, with a single
+        request that starts the listing at the name.
+        Returns a HostedZoneData object, None if the zone doesn't exist.
+        """
+        fqdn = RecordIndexDao.normalize(registered_domain)
+
+        hosted_zone_data = HostedZoneDao.__hosted_zones.get(fqdn)
+
+        if hosted_zone_data:
+            return hosted_zone_data
+
+        try:
+            # the zones are listed in name order, starting from the name
+            response = self.route53.list_hosted_zones_by_name(
+                DNSName=fqdn, MaxItems="1"
+            ).get("HostedZones")
+
+            hosted_zone_data = None
+            if (
+                response
+                and RecordIndexDao.normalize(response[0].get("Name")) == fqdn
+            ):
+                hosted_zone_data = HostedZoneData.build(response[0])
+
+                with HostedZoneDao.__lock:
+                    if HostedZoneDao.__cached:
+                        HostedZoneDao.__hosted_zones[fqdn] = hosted_zone_data
+
+            return hosted_zone_data
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error loading the hosted zone!")
+
     def load_all(self) -> list:
         """
         Loads all the hosted zones that were created by the current Amazon Web Services account.
         Returns a list of HostedZoneData.
         """
         try:
-            response = self.route53.list_hosted_zones_by_name().get(
-                "HostedZones"
-            )
-
             hosted_zone_datas = []
+            request = {}
+
+            while True:
+                response = self.route53.list_hosted_zones_by_name(**request)
+
+                for zone in response.get("HostedZones"):
+                    hosted_zone_datas.append(HostedZoneData.build(zone))
+
+                if not response.get("IsTruncated"):
+                    break
 
-            for zone in response:
-                hosted_zone_datas.append(HostedZoneData.build(zone))
+                request = {
+                    "DNSName": response.get("NextDNSName"),
+                    "HostedZoneId": response.get("NextHostedZoneId"),
+                }
 
             return hosted_zone_datas
         except Exception as e:
@@ -4,37 +4,94 @@ Created on Apr 9, 2023
 @author: vagrant
 """
 
+import hashlib
+import json
+
 from com.maxmin.aws.base.dao.client import Route53Dao
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.constants import Route53Constants
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.logs import Logger
 from com.maxmin.aws.route53.dao.domain.record import RecordData
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
 
 
 class RecordDao(Route53Dao):
+    CREATE = "CREATE"
+    UPSERT = "UPSERT"
+    DELETE = "DELETE"
+
+    # Route53 counts the records in a change batch, an UPSERT counts twice
+    MAX_CHANGES = 1000
+
     def load_all(self, hosted_zone_id: str) -> list:
         """
-        Loads all the DNS records in a hosted zone.
+        Loads all the DNS records in a hosted zone, following all the pages.
         Returns a list of RecordData objects
         """
         try:
-            response = self.route53.list_resource_record_sets(
-                HostedZoneId=hosted_zone_id
-            ).get("ResourceRecordSets")
+            pages = self.route53.get_paginator(
+                "list_resource_record_sets"
+            ).paginate(HostedZoneId=hosted_zone_id)
 
             records = []
 
-            for record in response:
-                r = RecordData.build(record, hosted_zone_id)
-                records.append(r)
+            for page in pages:
+                for record in page.get("ResourceRecordSets"):
+                    r = RecordData.build(record, hosted_zone_id)
+                    records.append(r)
 
             return records
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error loading the records!")
 
+    def load(
+        self, hosted_zone_id: str, dns_nm: str, record_type: str = "A"
+    ) -> RecordData:
+        """
+        Loads a DNS record by its name and type.
+        Records are listed in name order, the lookup fetches the single
+        record at the name, or the index of the zone if it's enabled.
+        Returns a RecordData object, None if the record is not found.
+        """
+        try:
+            fqdn = RecordIndexDao.normalize(dns_nm)
+
+            if RecordIndexDao.is_enabled():
+                record = RecordIndexDao().load(
+                    hosted_zone_id, fqdn, record_type
+                )
+            else:
+                records = self.route53.list_resource_record_sets(
+                    HostedZoneId=hosted_zone_id,
+                    StartRecordName=fqdn,
+                    StartRecordType=record_type,
+                    MaxItems="1",
+                ).get("ResourceRecordSets")
+
+                # the next record in order if the record is not there
+                record = None
+                if (
+                    records
+                    and RecordIndexDao.normalize(records[0].get("Name"))
+                    == fqdn
+                    and records[0].get("Type") == record_type
+                ):
+                    record = records[0]
+
+            if not record:
+                return None
+
+            return RecordData.build(record, hosted_zone_id)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error loading the record!")
+
     def create(self, record_data: RecordData) -> None:
         """
         Creates a route53 DNS type A record and waits until it s ready.
+        If the record TTL is not set, the TTL in route53.ini.
         """
         try:
             response = (
@@ -42,17 +99,11 @@ class RecordDao(Route53Dao):
                     HostedZoneId=record_data.hosted_zone_id,
                     ChangeBatch={
                         "Changes": [
-                            {
-                                "Action": "CREATE",
-                                "ResourceRecordSet": {
-                                    "Name": record_data.dns_nm,
-                                    "Type": "A",
-                                    "TTL": 300,
-                                    "ResourceRecords": [
-                                        {"Value": record_data.ip_address}
-                                    ],
-                                },
-                            }
+                            self.__build_change(
+                                RecordDao.CREATE,
+                                record_data,
+                                Route53Constants().record_ttl,
+                            )
                         ]
                     },
                 )
@@ -62,33 +113,137 @@ class RecordDao(Route53Dao):
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error creating the record!")
+        finally:
+            RecordIndexDao.invalidate(record_data.hosted_zone_id)
 
-        waiter = self.route53.get_waiter("resource_record_sets_changed")
-        waiter.wait(Id=response)
+        self.wait("resource_record_sets_changed", Id=response)
 
     def delete(self, record_data: RecordData) -> None:
         """
         Deletes a route53 DNS type A record.
+        The record TTL must match the TTL of the record in Route53, if not
+        set the TTL in route53.ini.
         """
         try:
             self.route53.change_resource_record_sets(
                 HostedZoneId=record_data.hosted_zone_id,
                 ChangeBatch={
                     "Changes": [
-                        {
-                            "Action": "DELETE",
-                            "ResourceRecordSet": {
-                                "Name": record_data.dns_nm,
-                                "Type": "A",
-                                "TTL": 300,
-                                "ResourceRecords": [
-                                    {"Value": record_data.ip_address}
-                                ],
-                            },
-                        }
+                        self.__build_change(
+                            RecordDao.DELETE,
+                            record_data,
+                            Route53Constants().record_ttl,
+                        )
                     ]
                 },
             )
         except Exception as e:
             Logger.error(str(e))
             raise AwsDaoException("Error deleting the record!")
+        finally:
+            RecordIndexDao.invalidate(record_data.hosted_zone_id)
+
+    def change_all(self, hosted_zone_id: str, changes: list) -> list:
+        """
+        Applies the changes to the type A records of a hosted zone with as
+        few change batches as the Route53 limits allow, then waits once for
+        each batch.
+        With the run journal enabled the changes submitted are recorded
+        until they are in sync, a batch submitted by a previous run that
+        failed is waited for instead of being submitted again.
+        Keyword arguments:
+            changes -- list of (action, RecordData) tuples, action is one of
+                CREATE, UPSERT or DELETE.
+        Returns the identifiers of the changes.
+        """
+        constants = Route53Constants()
+        max_changes = min(constants.max_changes, RecordDao.MAX_CHANGES)
+
+        batches = []
+        batch = []
+        size = 0
+
+        for action, record_data in changes:
+            weight = 2 if action == RecordDao.UPSERT else 1
+
+            if batch and size + weight > max_changes:
+                batches.append(batch)
+                batch = []
+                size = 0
+
+            batch.append(
+                self.__build_change(action, record_data, constants.record_ttl)
+            )
+            size += weight
+
+        if batch:
+            batches.append(batch)
+
+        try:
+            change_ids = []
+            change_keys = []
+
+            for batch in batches:
+                change_key = self.__build_change_key(hosted_zone_id, batch)
+                change = RunJournal.get_operation(change_key)
+
+                if change:
+                    Logger.info(f"Change {change.get('change_id')} resumed!")
+                    change_id = change.get("change_id")
+                else:
+                    change_id = (
+                        self.route53.change_resource_record_sets(
+                            HostedZoneId=hosted_zone_id,
+                            ChangeBatch={"Changes": batch},
+                        )
+                        .get("ChangeInfo")
+                        .get("Id")
+                    )
+                    RunJournal.record_operation(
+                        change_key, {"change_id": change_id}
+                    )
+
+                change_ids.append(change_id)
+                change_keys.append(change_key)
+
+            # the batches propagate together, after the first wait the
+            # others return at once
+            for change_id in change_ids:
+                self.wait("resource_record_sets_changed", Id=change_id)
+
+            for change_key in change_keys:
+                RunJournal.finish_operation(change_key)
+
+            return change_ids
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error changing the records!")
+        finally:
+            RecordIndexDao.invalidate(hosted_zone_id)
+
+    def __build_change_key(self, hosted_zone_id: str, batch: list) -> str:
+        """
+        Returns the key of a change batch in the run journal, by hosted zone
+        and digest of the changes.
+        """
+        digest = hashlib.sha256(
+            json.dumps(batch, sort_keys=True).encode()
+        ).hexdigest()
+
+        return f"change:{hosted_zone_id}:{digest}"
+
+    def __build_change(
+        self, action: str, record_data: RecordData, ttl: int
+    ) -> dict:
+        """
+        Builds the change of a type A record, with the record TTL if set.
+        """
+        return {
+            "Action": action,
+            "ResourceRecordSet": {
+                "Name": record_data.dns_nm,
+                "Type": "A",
+                "TTL": record_data.ttl or ttl,
+                "ResourceRecords": [{"Value": record_data.ip_address}],
+            },
+        }
@@ -0,0 +1,147 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import threading
+import time
+
+from com.maxmin.aws.base.dao.client import Route53Dao
+from com.maxmin.aws.exception import AwsDaoException
+from com.maxmin.aws.logs import Logger
+
+
+class RecordIndexDao(Route53Dao):
+    """
+    Run-scoped index of the DNS records of the hosted zones.
+    When enabled, the records of a hosted zone are listed once, following
+    all the pages, and indexed by fully qualified name and type, so that the
+    record lookups don't call AWS.
+    An index expires after the TTL, the record dao invalidates it explicitly
+    every time it changes a record of the zone.
+    """
+
+    __enabled = False
+    __ttl = 60
+    __lock = threading.Lock()
+    __zone_locks = {}
+    __indexes = {}
+    # incremented at each invalidation, an index fetched while its zone is
+    # invalidated is not stored
+    __generations = {}
+
+    @staticmethod
+    def enable(ttl: int = None) -> None:
+        """
+        Turns the index on.
+        Keyword arguments:
+            ttl -- seconds after which the records of a zone are listed again.
+        """
+        with RecordIndexDao.__lock:
+            RecordIndexDao.__enabled = True
+            if ttl is not None:
+                RecordIndexDao.__ttl = ttl
+            RecordIndexDao.__clear(list(RecordIndexDao.__generations.keys()))
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Turns the index off and discards it, the record dao calls AWS
+        directly.
+        """
+        with RecordIndexDao.__lock:
+            RecordIndexDao.__enabled = False
+            RecordIndexDao.__clear(list(RecordIndexDao.__generations.keys()))
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return RecordIndexDao.__enabled
+
+    @staticmethod
+    def invalidate(*hosted_zone_ids: str) -> None:
+        """
+        Discards the index of the hosted zones, all the indexes if none is
+        passed.
+        """
+        with RecordIndexDao.__lock:
+            if not hosted_zone_ids:
+                hosted_zone_ids = list(RecordIndexDao.__generations.keys())
+
+            RecordIndexDao.__clear(hosted_zone_ids)
+
+    @staticmethod
+    def __clear(hosted_zone_ids) -> None:
+        for hosted_zone_id in hosted_zone_ids:
+            RecordIndexDao.__indexes.pop(hosted_zone_id, None)
+            RecordIndexDao.__generations[hosted_zone_id] = (
+                RecordIndexDao.__generations.get(hosted_zone_id, 0) + 1
+            )
+
+    @staticmethod
+    def normalize(dns_nm: str) -> str:
+        """
+        Returns the name as Route53 lists it, lower case and fully qualified.
+        """
+        return dns_nm.rstrip(".").lower() + "."
+
+    def load(
+        self, hosted_zone_id: str, dns_nm: str, record_type: str = "A"
+    ) -> dict:
+        """
+        Returns the dictionary of the record with the name and type, None if
+        the record is not in the zone.
+        """
+        index = self.__get_index(hosted_zone_id)
+
+        return index.get((RecordIndexDao.normalize(dns_nm), record_type))
+
+    def __get_index(self, hosted_zone_id: str) -> dict:
+        with RecordIndexDao.__lock:
+            zone_lock = RecordIndexDao.__zone_locks.setdefault(
+                hosted_zone_id, threading.Lock()
+            )
+            RecordIndexDao.__generations.setdefault(hosted_zone_id, 0)
+
+        with zone_lock:
+            index = RecordIndexDao.__indexes.get(hosted_zone_id)
+
+            if not index or (
+                time.monotonic() - index[0] > RecordIndexDao.__ttl
+            ):
+                generation = RecordIndexDao.__generations[hosted_zone_id]
+                index = (time.monotonic(), self.__fetch(hosted_zone_id))
+
+                with RecordIndexDao.__lock:
+                    if (
+                        RecordIndexDao.__enabled
+                        and generation
+                        == RecordIndexDao.__generations[hosted_zone_id]
+                    ):
+                        RecordIndexDao.__indexes[hosted_zone_id] = index
+
+            return index[1]
+
+    def __fetch(self, hosted_zone_id: str) -> dict:
+        try:
+            pages = self.route53.get_paginator(
+                "list_resource_record_sets"
+            ).paginate(HostedZoneId=hosted_zone_id)
+
+            index = {}
+
+            for page in pages:
+                for record in page.get("ResourceRecordSets"):
+                    index[
+                        (
+                            RecordIndexDao.normalize(record.get("Name")),
+                            record.get("Type"),
+                        )
+                    ] = record
+
+            Logger.debug(f"Index of the records of {hosted_zone_id} loaded!")
+
+            return index
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsDaoException("Error loading the record index!")
@@ -3,3 +3,18 @@ class Record(object):
         super().__init__()
         self.dns_nm = None
         self.ip_address = None
+
+
+class RecordChange(object):
+    """
+    Change to a type A record: the action, CREATE, UPSERT or DELETE, the DNS
+    name and the IP address, not needed to delete the record.
+    """
+
+    def __init__(
+        self, action: str, dns_nm: str, ip_address: str = None
+    ) -> None:
+        super().__init__()
+        self.action = action
+        self.dns_nm = dns_nm
+        self.ip_address = ip_address
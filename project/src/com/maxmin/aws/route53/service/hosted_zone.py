@@ -3,8 +3,8 @@ Created on Mar 31, 2024
 
 @author: vagrant
 """
-import re
 
+from com.maxmin.aws.base.dao.async_client import AsyncRoute53Dao
 from com.maxmin.aws.exception import AwsServiceException, AwsDaoException
 from com.maxmin.aws.logs import Logger
 from com.maxmin.aws.route53.dao.domain.record import RecordData
@@ -15,9 +15,13 @@ from com.maxmin.aws.route53.service.domain.record import Record
 
 
 class HostedZoneService(object):
+    CREATE = RecordDao.CREATE
+    UPSERT = RecordDao.UPSERT
+    DELETE = RecordDao.DELETE
+
     def load_hosted_zone(self, registered_domain: str) -> HostedZone:
         """
-        Loads a hosted zones by its name.
+        Loads a hosted zone by its exact name.
         Returns a HostedZone object.
         Keyword arguments:
             registered_domain -- the name of the domain. For public hosted zones, this is the name that you have registered with your DNS registrar.
@@ -30,20 +34,13 @@ class HostedZoneService(object):
 
         try:
             hosted_zone_dao = HostedZoneDao()
-            hosted_zone_datas = hosted_zone_dao.load_all()
-
-            # fully qualified domain pattern
-            fqdn_pattern = re.compile(registered_domain + "[.]?")
+            hosted_zone_data = hosted_zone_dao.load(registered_domain)
 
             response = None
-            for hosted_zone_data in hosted_zone_datas:
-                if fqdn_pattern.match(hosted_zone_data.registered_domain):
-                    response = HostedZone()
-                    response.hosted_zone_id = hosted_zone_data.hosted_zone_id
-                    response.registered_domain = (
-                        hosted_zone_data.registered_domain
-                    )
-                    break
+            if hosted_zone_data:
+                response = HostedZone()
+                response.hosted_zone_id = hosted_zone_data.hosted_zone_id
+                response.registered_domain = hosted_zone_data.registered_domain
 
             return response
 
@@ -76,20 +73,15 @@ class HostedZoneService(object):
                 raise AwsServiceException("Hosted zone not found!")
 
             record_dao = RecordDao()
-            record_datas = record_dao.load_all(hosted_zone.hosted_zone_id)
-
-            # fully qualified domain pattern
-            fqdn_pattern = re.compile(record_dns_nm + "[.]?")
+            record_data = record_dao.load(
+                hosted_zone.hosted_zone_id, record_dns_nm, "A"
+            )
 
             response = None
-            for record_data in record_datas:
-                if "A" == record_data.type and fqdn_pattern.match(
-                    record_data.dns_nm
-                ):
-                    response = Record()
-                    response.dns_nm = record_data.dns_nm
-                    response.ip_address = record_data.ip_address
-                    break
+            if record_data:
+                response = Record()
+                response.dns_nm = record_data.dns_nm
+                response.ip_address = record_data.ip_address
 
             return response
 
@@ -158,3 +150,114 @@ class HostedZoneService(object):
         except Exception as e:
             Logger.error(str(e))
             raise AwsServiceException("Error creating the DNS record!")
+
+    def change_records(
+        self, record_changes: list, registered_domain: str
+    ) -> None:
+        """
+        Applies the changes to the type A records of a hosted zone in a single
+        change batch, chunked to the Route53 limits, and waits once for the
+        batch to propagate.
+        A CREATE of an existing record fails, a DELETE of a missing record is
+        skipped. The records are looked up by name, in the run-scoped index
+        of the zone if it's enabled, see RecordIndexDao.
+        Keyword arguments:
+            record_changes -- list of RecordChange objects.
+            registered_domain -- the name of the domain. For public hosted zones, this is the name that you have registered with your DNS registrar.
+        """
+        if not record_changes:
+            raise AwsServiceException("Record changes are mandatory!")
+
+        if not registered_domain:
+            raise AwsServiceException("Hosted zone DNS name is mandatory!")
+
+        for record_change in record_changes:
+            if record_change.action not in (
+                HostedZoneService.CREATE,
+                HostedZoneService.UPSERT,
+                HostedZoneService.DELETE,
+            ):
+                raise AwsServiceException(
+                    f"Unknown record action {record_change.action}!"
+                )
+
+            if not record_change.dns_nm:
+                raise AwsServiceException("Record DNS name is mandatory!")
+
+            if (
+                record_change.action != HostedZoneService.DELETE
+                and not record_change.ip_address
+            ):
+                raise AwsServiceException("Record IP address is mandatory!")
+
+        try:
+            hosted_zone = self.load_hosted_zone(registered_domain)
+
+            if not hosted_zone:
+                raise AwsServiceException("Hosted zone not found!")
+
+            record_dao = RecordDao()
+
+            changes = []
+
+            for record_change in record_changes:
+                # from the index of the zone, if it's enabled
+                record_data = record_dao.load(
+                    hosted_zone.hosted_zone_id, record_change.dns_nm
+                )
+
+                if record_change.action == HostedZoneService.DELETE:
+                    if not record_data:
+                        Logger.debug(
+                            f"Record {record_change.dns_nm} already deleted!"
+                        )
+                        continue
+
+                    # deleted with its current values and TTL
+                    changes.append((record_change.action, record_data))
+                    continue
+
+                if (
+                    record_change.action == HostedZoneService.CREATE
+                    and record_data
+                ):
+                    raise AwsServiceException(
+                        f"Record {record_change.dns_nm} already created!"
+                    )
+
+                record_data = RecordData()
+                record_data.dns_nm = record_change.dns_nm
+                record_data.ip_address = record_change.ip_address
+                record_data.hosted_zone_id = hosted_zone.hosted_zone_id
+                changes.append((record_change.action, record_data))
+
+            if changes:
+                Logger.debug(f"Applying {len(changes)} DNS record changes ...")
+
+                record_dao.change_all(hosted_zone.hosted_zone_id, changes)
+
+                Logger.debug("DNS records successfully changed!")
+
+        except AwsServiceException as ex:
+            Logger.error(str(ex))
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error changing the DNS records!")
+
+    async def change_records_async(
+        self, record_changes: list, registered_domain: str
+    ) -> None:
+        """
+        Coroutine of change_records, the propagation of the changes is waited
+        for from the event loop.
+        """
+        try:
+            await AsyncRoute53Dao().run(
+                self.change_records, record_changes, registered_domain
+            )
+        except AwsServiceException as ex:
+            raise ex
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsServiceException("Error changing the DNS records!")
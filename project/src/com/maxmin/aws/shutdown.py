@@ -1,25 +1,32 @@
+import atexit
 import os
 import sys
 
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.base.trace import Tracer
 from com.maxmin.aws.configuration.dao.datacenter import (
     DatacenterConfigDao,
     HostedZoneConfigDao,
 )
-from com.maxmin.aws.configuration.dao.domain.datacenter import CidrRuleConfig
-from com.maxmin.aws.ec2.service.instance import InstanceService
-from com.maxmin.aws.ec2.service.internet_gateway import InternetGatewayService
-from com.maxmin.aws.ec2.service.route_table import RouteTableService
-from com.maxmin.aws.ec2.service.security_group import SecurityGroupService
-from com.maxmin.aws.ec2.service.ssh import KeyPairService
-from com.maxmin.aws.ec2.service.subnet import SubnetService
-from com.maxmin.aws.ec2.service.vpc import VpcService
+from com.maxmin.aws.datacenter import ShutdownGraphBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.dao.state import StateDao
+from com.maxmin.aws.static_inventory import StaticInventory
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from com.maxmin.aws.constants import (
+    ClientConstants,
+    DatacenterConstants,
+    Ec2Constants,
+    Route53Constants,
+)
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
-from com.maxmin.aws.route53.dao.domain.record import RecordData
-from com.maxmin.aws.route53.dao.record import RecordDao
-from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
+from com.maxmin.aws.plan import ShutdownPlanner
 
-'''
+"""
 The program uses AWS boto3 library to make AWS requests.
 You must have both AWS credentials and an AWS Region set in order to make requests.
 See: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html.
@@ -27,17 +34,22 @@ See: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.h
 export the AWS access key id
 export the AWS secret access key
 export the AWS region
-'''
+
+python shutdown.py datacenter.json hostedzone.json [--plan]
+
+--plan prints the changes the run would make, without making them.
+"""
 
 if __name__ == "__main__":
-    
     # AWS IAM user credentials
 
     if not os.getenv("AWS_ACCESS_KEY_ID"):
         raise AwsException("environment variable AWS_ACCESS_KEY_ID not set!")
 
     if not os.getenv("AWS_SECRET_ACCESS_KEY"):
-        raise AwsException("environment variable AWS_SECRET_ACCESS_KEY not set!")
+        raise AwsException(
+            "environment variable AWS_SECRET_ACCESS_KEY not set!"
+        )
 
     if not os.getenv("AWS_DEFAULT_REGION"):
         raise AwsException("environment variable AWS_DEFAULT_REGION not set!")
@@ -54,6 +66,9 @@ if __name__ == "__main__":
     datacenter_config_file = sys.argv[1]
     hosted_zone_config_file = sys.argv[2]
 
+    # prints the changes the run would make, without making them
+    plan_mode = "--plan" in sys.argv[3:]
+
     if not datacenter_config_file:
         raise AwsException("Datacenter configuration file not passed!")
 
@@ -74,198 +89,96 @@ if __name__ == "__main__":
     hosted_zone_config_dao = HostedZoneConfigDao()
     hostedzone_config = hosted_zone_config_dao.load(hosted_zone_config_file)
 
-    Logger.info("Deleting AWS data center ...")
+    # run-scoped snapshot of the EC2 resources, see ec2.ini
 
-    #
-    # DNS hosted zone
-    #
+    ec2_constants = Ec2Constants()
 
-    instance_configs = datacenter_config.instances
-    instance_service = InstanceService()
-    hosted_zone_service = HostedZoneService()
-    record_dao = RecordDao()
+    if ec2_constants.inventory_enabled:
+        InventoryDao.enable(ec2_constants.inventory_ttl)
 
-    if hostedzone_config.registered_domain:
-        hosted_zone = hosted_zone_service.load_hosted_zone(
-            hostedzone_config.registered_domain
-        )
-        if hosted_zone:
-            for instance_config in instance_configs:
-                instance = instance_service.load_instance(instance_config.name)
-                if instance:
-                    dns_record = hosted_zone_service.load_record(
-                        instance_config.dns_domain,
-                        hosted_zone.registered_domain,
-                    )
-                    if dns_record:
-                        Logger.info("Deleting AWS instance DNS record ...")
-                        record_data = RecordData()
-                        record_data.ip_address = instance.public_ip
-                        record_data.dns_nm = instance_config.dns_domain
-                        record_data.hosted_zone_id = hosted_zone.hosted_zone_id
-                        record_dao.delete(record_data)
-                        Logger.info("AWS instance DNS record deleted!")
-                    else:
-                        Logger.warn("AWS instance DNS record already deleted!")
-
-    #
-    # instances
-    #
+    # identifiers of the EC2 resources found by the previous runs, checked
+    # instead of scanning the resources, see ec2.ini
 
-    keypair_service = KeyPairService()
+    if ec2_constants.inventory_enabled and ec2_constants.state_enabled:
+        StateDao.enable(ec2_constants.state_file)
+        atexit.register(StateDao.save)
 
-    for instance_config in instance_configs:
-        instance = instance_service.load_instance(instance_config.name)
+    # run-scoped index of the DNS records, see route53.ini
 
-        if instance:
-            Logger.info("Deleting AWS instance ...")
-            instance_service.terminate_instance(instance_config.name)
-            Logger.info("AWS instance deleted!")
-        else:
-            Logger.warn("AWS instance already deleted!")
+    route53_constants = Route53Constants()
 
-        for instance_config in instance_configs:
-            # key pair with the same name of the instance
-            keypair = keypair_service.load_key_pair(instance_config.name)
+    if route53_constants.index_enabled:
+        RecordIndexDao.enable(route53_constants.index_ttl)
 
-            if keypair:
-                keypair_service.delete_key_pair(instance_config.name)
-                Logger.info("AWS instance key pair deleted!")
-            else:
-                Logger.warn("AWS instance key pair already deleted!")
-
-    #
-    # security groups
-    #
+    # hosted zones found by name, kept for the whole run
 
-    security_group_configs = datacenter_config.security_groups
-    security_group_service = SecurityGroupService()
+    if route53_constants.hosted_zone_cached:
+        HostedZoneDao.enable()
 
-    for security_group_config in security_group_configs:
-        security_group = security_group_service.load_security_group(
-            security_group_config.name
-        )
-        if security_group:
-            for rule_config in security_group_config.rules:
-                if isinstance(rule_config, CidrRuleConfig):
-                    cidr_rule = security_group_service.load_cidr_rule(
-                        security_group_config.name,
-                        rule_config.from_port,
-                        rule_config.to_port,
-                        rule_config.protocol,
-                        rule_config.cidr,
-                    )
-
-                    if cidr_rule:
-                        security_group_service.delete_cidr_rule(
-                            security_group_config.name,
-                            rule_config.from_port,
-                            rule_config.to_port,
-                            rule_config.protocol,
-                            rule_config.cidr,
-                            rule_config.description,
-                        )
-                        Logger.info("Cidr rule deleted!")
-                    else:
-                        Logger.warn("Cidr rule already deleted!")
-                else:
-                    sgp_rule = security_group_service.load_security_group_rule(
-                        security_group_config.name,
-                        rule_config.from_port,
-                        rule_config.to_port,
-                        rule_config.protocol,
-                        rule_config.sgp_name,
-                    )
-
-                    if sgp_rule:
-                        security_group_service.delete_security_group_rule(
-                            security_group_config.name,
-                            rule_config.from_port,
-                            rule_config.to_port,
-                            rule_config.protocol,
-                            rule_config.sgp_name,
-                            rule_config.description,
-                        )
-                        Logger.info("Sgp rule deleted!")
-                    else:
-                        Logger.warn("Sgp rule already deleted!")
-
-    for security_group_config in security_group_configs:
-        security_group = security_group_service.load_security_group(
-            security_group_config.name
-        )
+    # AWS calls, retries and waiters of the run, reported at exit, see
+    # client.ini
 
-        if security_group:
-            security_group_service.delete_security_group(
-                security_group_config.name
-            )
+    client_constants = ClientConstants()
 
-            Logger.info("Security group deleted!")
+    if client_constants.metrics_enabled:
+        ApiMetrics.enable()
+        atexit.register(ApiMetrics.report, client_constants.metrics_file)
 
-        else:
-            Logger.warn("Security group already deleted!")
+    if plan_mode:
+        # the resources are read with a scan for each type
+        InventoryDao.enable(ec2_constants.inventory_ttl)
+        RecordIndexDao.enable(route53_constants.index_ttl)
+        HostedZoneDao.enable()
 
-    #
-    # Internet gateway
-    #
+        plan = ShutdownPlanner(datacenter_config, hostedzone_config).plan()
 
-    internet_gateway_config = datacenter_config.internet_gateway
-    internet_gateway_service = InternetGatewayService()
-    internet_gateway = internet_gateway_service.load_internet_gateway(
-        datacenter_config.internet_gateway.name
-    )
+        for line in plan.format():
+            Logger.info(line)
 
-    if internet_gateway:
-        internet_gateway_service.delete_internet_gateway(
-            internet_gateway_config.name
-        )
+        sys.exit(0)
 
-        Logger.info("Internet gateway deleted!")
-    else:
-        Logger.warn("Internet gateway already deleted")
+    Logger.info("Deleting AWS data center ...")
 
     #
-    # subnets
+    # resources graph, each resource is deleted as soon as the resources that
+    # depend on it are gone, see datacenter.ini
     #
 
-    subnet_configs = datacenter_config.subnets
-    subnet_service = SubnetService()
+    datacenter_constants = DatacenterConstants()
 
-    for subnet_config in subnet_configs:
-        subnet = subnet_service.load_subnet(subnet_config.name)
+    # timeline of the run, in the Chrome trace event format
 
-        if subnet:
-            subnet_service.delete_subnet(subnet_config.name)
-            Logger.info("Subnet deleted!")
-        else:
-            Logger.warn("Subnet already deleted")
+    if datacenter_constants.trace_enabled:
+        Tracer.enable()
+        atexit.register(Tracer.export, datacenter_constants.trace_file)
 
-    #
-    # route table
-    #
+    # the resources recorded by the journal of a failed startup are deleted,
+    # the next startup runs from the beginning
 
-    route_table_config = datacenter_config.route_table
-    route_table_service = RouteTableService()
-    route_table = route_table_service.load_route_table(
-        datacenter_config.route_table.name
-    )
+    RunJournal.discard(datacenter_constants.journal_file)
+    StaticInventory.discard(datacenter_constants.provision_inventory_file)
 
-    if route_table:
-        route_table_service.delete_route_table(route_table_config.name)
-        Logger.info("Route table deleted!")
-    else:
-        Logger.warn("Route table already deleted")
+    graph = ShutdownGraphBuilder(
+        datacenter_config,
+        hostedzone_config,
+        datacenter_constants.shutdown_node_timeout,
+        datacenter_constants.shutdown_instance_timeout,
+    ).build()
 
-    #
-    # VPC
-    #
+    graph_executor = GraphExecutor(
+        datacenter_constants.shutdown_max_workers,
+        datacenter_constants.shutdown_policy,
+    )
+    result = graph_executor.execute(graph)
+
+    for node_nm, seconds in result.timings.items():
+        Logger.info(f"{node_nm:40}{seconds:>10.1f}s")
 
-    vpc_config = datacenter_config.vpc
-    vpc_service = VpcService()
-    vpc = vpc_service.load_vpc(vpc_config.name)
+    if not result.succeeded:
+        raise AwsException(
+            "Error deleting the data center: "
+            + ", ".join(result.failed_nodes)
+            + " failed!"
+        )
 
-    if vpc:
-        vpc_service.delete_vpc(datacenter_config.vpc.name)
-        Logger.info("VPC deleted!")
-    else:
-        Logger.warn("VPC already deleted")
+    Logger.info(f"AWS data center deleted in {result.elapsed:.1f} seconds!")
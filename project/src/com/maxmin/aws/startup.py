@@ -1,27 +1,36 @@
+import atexit
 import os
 import sys
 
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.base.trace import Tracer
 from com.maxmin.aws.configuration.dao.datacenter import (
     DatacenterConfigDao,
     HostedZoneConfigDao,
 )
-from com.maxmin.aws.configuration.dao.domain.datacenter import CidrRuleConfig
-from com.maxmin.aws.ec2.dao.domain.route_table import RouteData
-from com.maxmin.aws.ec2.dao.route_table import RouteDao
-from com.maxmin.aws.ec2.service.domain.tag import Tag
+from com.maxmin.aws.datacenter import StartupGraphBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.dao.state import StateDao
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
 from com.maxmin.aws.ec2.service.instance import InstanceService
-from com.maxmin.aws.ec2.service.internet_gateway import InternetGatewayService
-from com.maxmin.aws.ec2.service.route_table import RouteTableService
-from com.maxmin.aws.ec2.service.security_group import SecurityGroupService
-from com.maxmin.aws.ec2.service.ssh import KeyPairService
-from com.maxmin.aws.ec2.service.subnet import SubnetService
-from com.maxmin.aws.ec2.service.vpc import VpcService
 from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.golden import GoldenImageBaker, ProvisionDigest
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.plan import StartupPlanner
 from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
-from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.static_inventory import StaticInventory
+from com.maxmin.aws.constants import (
+    ClientConstants,
+    DatacenterConstants,
+    Ec2Constants,
+    ProjectDirectories,
+    Route53Constants,
+)
 
-'''
+"""
 The program uses AWS boto3 library to make AWS requests.
 You must have both AWS credentials and an AWS Region set in order to make requests.
 See: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html.
@@ -29,21 +38,26 @@ See: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.h
 export AWS_ACCESS_KEY_ID=xxxxxx
 export AWS_SECRET_ACCESS_KEY=yyyyyy
 export AWS_DEFAULT_REGION=zzzzzz
-'''
+
+python startup.py datacenter.json hostedzone.json [--plan]
+
+--plan prints the changes the run would make, without making them.
+"""
 
 if __name__ == "__main__":
-    
     # AWS IAM user credentials
 
     if not os.getenv("AWS_ACCESS_KEY_ID"):
         raise AwsException("environment variable AWS_ACCESS_KEY_ID not set!")
 
     if not os.getenv("AWS_SECRET_ACCESS_KEY"):
-        raise AwsException("environment variable AWS_SECRET_ACCESS_KEY not set!")
+        raise AwsException(
+            "environment variable AWS_SECRET_ACCESS_KEY not set!"
+        )
 
     if not os.getenv("AWS_DEFAULT_REGION"):
         raise AwsException("environment variable AWS_DEFAULT_REGION not set!")
-    
+
     # directory where the datacenter project is downloaded from github
     datacenter_dir = os.getenv("DATACENTER_DIR")
 
@@ -56,6 +70,9 @@ if __name__ == "__main__":
     datacenter_config_file = sys.argv[1]
     hosted_zone_config_file = sys.argv[2]
 
+    # prints the changes the run would make, without making them
+    plan_mode = "--plan" in sys.argv[3:]
+
     if not datacenter_config_file:
         raise AwsException("Datacenter configuration file not passed!")
 
@@ -77,293 +94,130 @@ if __name__ == "__main__":
     hosted_zone_config_dao = HostedZoneConfigDao()
     hostedzone_config = hosted_zone_config_dao.load(hosted_zone_config_file)
 
-    Logger.info("Creating AWS data center ...")
+    # run-scoped snapshot of the EC2 resources, see ec2.ini
 
-    #
-    # VPC
-    #
+    ec2_constants = Ec2Constants()
 
-    vpc_config = datacenter_config.vpc
-    vpc_service = VpcService()
-    vpc = vpc_service.load_vpc(vpc_config.name)
+    if ec2_constants.inventory_enabled:
+        InventoryDao.enable(ec2_constants.inventory_ttl)
 
-    if not vpc:
-        vpc_tags = []
-        for tag in vpc_config.tags:
-            vpc_tags.append(Tag(tag.key, tag.value))
+    # the instances are launched from the images baked with the current
+    # playbooks and variables, see bake.py and ec2.ini
 
-        vpc_service.create_vpc(
-            datacenter_config.vpc.name, datacenter_config.vpc.cidr, vpc_tags
-        )
+    if ec2_constants.golden_enabled:
+        GoldenImageBaker(
+            datacenter_config,
+            ProvisionDigest.compute(ProjectDirectories.PROVISION_DIR),
+        ).apply()
 
-        Logger.info("VPC created!")
+    # identifiers of the EC2 resources found by the previous runs, checked
+    # instead of scanning the resources, see ec2.ini
 
-        vpc = vpc_service.load_vpc(vpc_config.name)
-    else:
-        Logger.warn("VPC already created!")
+    if ec2_constants.inventory_enabled and ec2_constants.state_enabled:
+        StateDao.enable(ec2_constants.state_file)
+        atexit.register(StateDao.save)
 
-    #
-    # Internet gateway
-    #
+    # run-scoped index of the DNS records, see route53.ini
 
-    internet_gateway_config = datacenter_config.internet_gateway
-    internet_gateway_service = InternetGatewayService()
-    internet_gateway = internet_gateway_service.load_internet_gateway(
-        datacenter_config.internet_gateway.name
-    )
+    route53_constants = Route53Constants()
 
-    if not internet_gateway:
-        internet_gateway_tags = []
-        for tag in internet_gateway_config.tags:
-            internet_gateway_tags.append(Tag(tag.key, tag.value))
-
-        internet_gateway_service.create_internet_gateway(
-            internet_gateway_config.name,
-            vpc_config.name,
-            internet_gateway_tags,
-        )
+    if route53_constants.index_enabled:
+        RecordIndexDao.enable(route53_constants.index_ttl)
 
-        Logger.info("Internet gateway created!")
+    # hosted zones found by name, kept for the whole run
 
-        internet_gateway = internet_gateway_service.load_internet_gateway(
-            datacenter_config.internet_gateway.name
-        )
-    else:
-        Logger.warn("Internet gateway already created!")
-
-    #
-    # route table
-    #
+    if route53_constants.hosted_zone_cached:
+        HostedZoneDao.enable()
 
-    route_table_config = datacenter_config.route_table
-    route_table_service = RouteTableService()
-    route_table = route_table_service.load_route_table(
-        datacenter_config.route_table.name
-    )
+    # AWS calls, retries and waiters of the run, reported at exit, see
+    # client.ini
 
-    if not route_table:
-        route_table_tags = []
-        for tag in route_table_config.tags:
-            route_table_tags.append(Tag(tag.key, tag.value))
+    client_constants = ClientConstants()
 
-        route_table_service.create_route_table(
-            route_table_config.name, vpc_config.name, route_table_tags
-        )
+    if client_constants.metrics_enabled:
+        ApiMetrics.enable()
+        atexit.register(ApiMetrics.report, client_constants.metrics_file)
 
-        Logger.info("Route table created!")
+    if plan_mode:
+        # the resources are read with a scan for each type
+        InventoryDao.enable(ec2_constants.inventory_ttl)
+        RecordIndexDao.enable(route53_constants.index_ttl)
+        HostedZoneDao.enable()
 
-        route_table = route_table_service.load_route_table(
-            datacenter_config.route_table.name
-        )
-    else:
-        Logger.warn("Route table already created!")
+        plan = StartupPlanner(datacenter_config, hostedzone_config).plan()
 
-    route = route_table_service.load_route(
-        route_table_config.name, internet_gateway_config.name, "0.0.0.0/0"
-    )
+        for line in plan.format():
+            Logger.info(line)
 
-    if not route:
-        route_dao = RouteDao()
-        route_data = RouteData()
-        route_data.route_table_id = route_table.route_table_id
-        route_data.internet_gateway_id = internet_gateway.internet_gateway_id
-        route_data.destination_cidr = "0.0.0.0/0"
-        route_dao.create(route_data)
+        sys.exit(0)
 
-        Logger.info("Route to the Internet gateway created!")
-    else:
-        Logger.warn("Route to the Internet gateway already created!")
+    Logger.info("Creating AWS data center ...")
 
     #
-    # subnets
+    # resources graph, each resource is created as soon as the resources it
+    # depends on are there, see datacenter.ini
     #
 
-    subnet_configs = datacenter_config.subnets
-    subnet_service = SubnetService()
+    datacenter_constants = DatacenterConstants()
 
-    for subnet_config in subnet_configs:
-        subnet = subnet_service.load_subnet(subnet_config.name)
+    # timeline of the run, in the Chrome trace event format
 
-        if not subnet:
-            subnet_tags = []
-            for tag in subnet_config.tags:
-                subnet_tags.append(Tag(tag.key, tag.value))
+    if datacenter_constants.trace_enabled:
+        Tracer.enable()
+        atexit.register(Tracer.export, datacenter_constants.trace_file)
 
-            subnet_service.create_subnet(
-                subnet_config.name,
-                subnet_config.az,
-                subnet_config.cidr,
-                vpc_config.name,
-                subnet_tags,
-            )
+    # steps completed and AWS operations in flight, a run that fails is
+    # resumed by the next one, see datacenter.ini
 
-            Logger.info("Subnet created!")
-
-            subnet = subnet_service.load_subnet(subnet_config.name)
-
-            route_table_service.associate_route_table(
-                route_table_config.name, subnet_config.name
-            )
-        else:
-            Logger.warn("Subnet already created!")
-
-    #
-    # security groups
-    #
-
-    security_group_configs = datacenter_config.security_groups
-    security_group_service = SecurityGroupService()
-
-    for security_group_config in security_group_configs:
-        security_group = security_group_service.load_security_group(
-            security_group_config.name
+    if datacenter_constants.journal_enabled:
+        RunJournal.enable(
+            datacenter_constants.journal_file,
+            RunJournal.build_run_id(
+                [datacenter_config_file, hosted_zone_config_file]
+            ),
         )
 
-        if not security_group:
-            security_group_tags = []
-            for tag in security_group_config.tags:
-                security_group_tags.append(Tag(tag.key, tag.value))
+    graph = StartupGraphBuilder(
+        datacenter_config,
+        hostedzone_config,
+        datacenter_constants.startup_node_timeout,
+        datacenter_constants.startup_instance_timeout,
+    ).build()
 
-            security_group_service.create_security_group(
-                security_group_config.name,
-                security_group_config.description,
-                vpc_config.name,
-                security_group_tags,
-            )
+    graph_executor = GraphExecutor(
+        datacenter_constants.startup_max_workers,
+        datacenter_constants.startup_policy,
+    )
+    result = graph_executor.execute(graph)
 
-            Logger.info("Security group created!")
+    if not result.succeeded:
+        raise AwsException(
+            "Error creating the data center: "
+            + ", ".join(result.failed_nodes)
+            + " failed!"
+        )
 
-            security_group = security_group_service.load_security_group(
-                security_group_config.name
-            )
+    RunJournal.close()
 
-        else:
-            Logger.warn("Security group already created!")
-
-    for security_group_config in security_group_configs:
-        for rule_config in security_group_config.rules:
-            if isinstance(rule_config, CidrRuleConfig):
-                cidr_rule = security_group_service.load_cidr_rule(
-                    security_group_config.name,
-                    rule_config.from_port,
-                    rule_config.to_port,
-                    rule_config.protocol,
-                    rule_config.cidr,
-                )
+    Logger.info(f"AWS data center created in {result.elapsed:.1f} seconds!")
 
-                if not cidr_rule:
-                    security_group_service.create_cidr_rule(
-                        security_group_config.name,
-                        rule_config.from_port,
-                        rule_config.to_port,
-                        rule_config.protocol,
-                        rule_config.cidr,
-                        rule_config.description,
-                    )
-                    Logger.info("Cidr rule created!")
-                else:
-                    Logger.warn("Cidr rule already created!")
-            else:
-                sgp_rule = security_group_service.load_security_group_rule(
-                    security_group_config.name,
-                    rule_config.from_port,
-                    rule_config.to_port,
-                    rule_config.protocol,
-                    rule_config.sgp_name,
-                )
+    # the playbooks find the instances in the static inventory, without
+    # calling AWS, see datacenter.ini
 
-                if not sgp_rule:
-                    security_group_service.create_security_group_rule(
-                        security_group_config.name,
-                        rule_config.from_port,
-                        rule_config.to_port,
-                        rule_config.protocol,
-                        rule_config.sgp_name,
-                        rule_config.description,
-                    )
-                    Logger.info("Sgp rule created!")
-                else:
-                    Logger.warn("Sgp rule already created!")
+    if datacenter_constants.provision_static_inventory:
+        StaticInventory(datacenter_config).write(
+            datacenter_constants.provision_inventory_file
+        )
 
     #
-    # instances
+    # DNS hosted zone
     #
 
     instance_configs = datacenter_config.instances
     instance_service = InstanceService()
-    keypair_service = KeyPairService()
-
-    for instance_config in instance_configs:
-        # key pair with the same name of the instance
-        keypair = keypair_service.load_key_pair(instance_config.name)
-
-        if not keypair:
-            keypair_service.create_key_pair(instance_config.name, None)
-            Logger.info("Instance key pair created!")
-        else:
-            Logger.warn("Instance key pair already created!")
-
-    for instance_config in instance_configs:
-        instance = instance_service.load_instance(instance_config.name)
-
-        if not instance:
-            instance_tags = []
-            for tag in instance_config.tags:
-                instance_tags.append(Tag(tag.key, tag.value))
-
-            Logger.info("Creating AWS instance ...")
-
-            instance_service.create_instance(
-                instance_config.name,
-                instance_config.private_ip,
-                instance_config.parent_img,
-                security_group_config.name,
-                subnet_config.name,
-                vpc_config.name,
-                instance_config.username,
-                instance_config.password,
-                instance_config.host_name,
-                instance_config.name,
-                instance_tags,
-            )
-
-            Logger.info("AWS instance created!")
-
-            instance = instance_service.load_instance(instance_config.name)
-
-        else:
-            Logger.warn("AWS instance already created!")
-
-    #
-    # DNS hosted zone
-    #
-
     hosted_zone_service = HostedZoneService()
 
     if hostedzone_config.registered_domain:
-        hosted_zone = hosted_zone_service.load_hosted_zone(
-            hostedzone_config.registered_domain
-        )
-        if hosted_zone:
-            for instance_config in instance_configs:
-                instance = instance_service.load_instance(instance_config.name)
-                dns_record = hosted_zone_service.load_record(
-                    instance_config.dns_domain, hosted_zone.registered_domain
-                )
-                if not dns_record:
-                    Logger.info("Creating AWS instance DNS record ...")
-                    hosted_zone_service.create_record(
-                        instance_config.dns_domain,
-                        instance.public_ip,
-                        hosted_zone.registered_domain,
-                    )
-
-                    Logger.info("AWS instance DNS record created!")
-                else:
-                    Logger.warn("AWS instance DNS record already created!")
-        else:
-            Logger.info("AWS hosted zone not found!")
-
         hosted_zone = hosted_zone_service.load_hosted_zone(
             hostedzone_config.registered_domain
         )
@@ -390,9 +244,11 @@ if __name__ == "__main__":
                         + instance.public_ip
                     )
         else:
-            Logger.info(
-                "AWS Instance "
-                + instance_config.name
-                + " "
-                + instance.public_ip
-            )
+            for instance_config in instance_configs:
+                instance = instance_service.load_instance(instance_config.name)
+                Logger.info(
+                    "AWS Instance "
+                    + instance_config.name
+                    + " "
+                    + instance.public_ip
+                )
@@ -0,0 +1,220 @@
+import atexit
+import json
+import os
+import sys
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.base.trace import Tracer
+from com.maxmin.aws.configuration.dao.datacenter import (
+    DatacenterConfigDao,
+    HostedZoneConfigDao,
+)
+from com.maxmin.aws.datacenter import FanoutGraphBuilder, StartupGraphBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.dao.state import StateDao
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.golden import GoldenImageBaker, ProvisionDigest
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.constants import (
+    ClientConstants,
+    DatacenterConstants,
+    Ec2Constants,
+    ProjectDirectories,
+    Route53Constants,
+)
+
+"""
+Creates several data centers at the same time, each one in the region of its
+VPC, the region in AWS_DEFAULT_REGION if the VPC has none.
+The program uses AWS boto3 library to make AWS requests.
+See:
+https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html
+
+export AWS_ACCESS_KEY_ID=xxxxxx
+export AWS_SECRET_ACCESS_KEY=yyyyyy
+export AWS_DEFAULT_REGION=zzzzzz
+
+python startup_all.py hostedzone.json datacenter1.json datacenter2.json ...
+"""
+
+if __name__ == "__main__":
+    # AWS IAM user credentials
+
+    if not os.getenv("AWS_ACCESS_KEY_ID"):
+        raise AwsException("environment variable AWS_ACCESS_KEY_ID not set!")
+
+    if not os.getenv("AWS_SECRET_ACCESS_KEY"):
+        raise AwsException(
+            "environment variable AWS_SECRET_ACCESS_KEY not set!"
+        )
+
+    if not os.getenv("AWS_DEFAULT_REGION"):
+        raise AwsException("environment variable AWS_DEFAULT_REGION not set!")
+
+    # directory where the datacenter project is downloaded from github
+    datacenter_dir = os.getenv("DATACENTER_DIR")
+
+    if not datacenter_dir:
+        """
+        see: constants.ProjectDirectories class
+        """
+        raise AwsException("environment variable DATACENTER_DIR not set!")
+
+    if len(sys.argv) < 3:
+        raise AwsException(
+            "Hosted zone and datacenter configuration files not passed!"
+        )
+
+    hosted_zone_config_file = sys.argv[1]
+    datacenter_config_files = sys.argv[2:]
+
+    Logger.info(f"Datacenter directory {datacenter_dir}")
+    Logger.info(f"Hosted zone configuration file {hosted_zone_config_file}")
+
+    # load the configuration files
+
+    hosted_zone_config_dao = HostedZoneConfigDao()
+    hostedzone_config = hosted_zone_config_dao.load(hosted_zone_config_file)
+
+    datacenter_config_dao = DatacenterConfigDao()
+    datacenter_configs = []
+
+    for datacenter_config_file in datacenter_config_files:
+        Logger.info(f"Datacenter configuration file {datacenter_config_file}")
+
+        datacenter_configs.append(
+            datacenter_config_dao.load(datacenter_config_file)
+        )
+
+    # run-scoped snapshot of the EC2 resources, one for each region, see
+    # ec2.ini
+
+    ec2_constants = Ec2Constants()
+
+    if ec2_constants.inventory_enabled:
+        InventoryDao.enable(ec2_constants.inventory_ttl)
+
+    # the instances are launched from the images baked with the current
+    # playbooks and variables, see bake.py and ec2.ini
+
+    if ec2_constants.golden_enabled:
+        digest = ProvisionDigest.compute(ProjectDirectories.PROVISION_DIR)
+
+        # each data center has its images in the region of its VPC
+        for datacenter_config in datacenter_configs:
+            with ClientRegistry.region(datacenter_config.vpc.region):
+                GoldenImageBaker(datacenter_config, digest).apply()
+
+    # identifiers of the EC2 resources found by the previous runs, checked
+    # instead of scanning the resources, see ec2.ini
+
+    if ec2_constants.inventory_enabled and ec2_constants.state_enabled:
+        StateDao.enable(ec2_constants.state_file)
+        atexit.register(StateDao.save)
+
+    # run-scoped index of the DNS records, see route53.ini
+
+    route53_constants = Route53Constants()
+
+    if route53_constants.index_enabled:
+        RecordIndexDao.enable(route53_constants.index_ttl)
+
+    # hosted zones found by name, kept for the whole run
+
+    if route53_constants.hosted_zone_cached:
+        HostedZoneDao.enable()
+
+    # AWS calls, retries and waiters of the run, reported at exit, see
+    # client.ini
+
+    client_constants = ClientConstants()
+
+    if client_constants.metrics_enabled:
+        ApiMetrics.enable()
+        atexit.register(ApiMetrics.report, client_constants.metrics_file)
+
+    Logger.info(f"Creating {len(datacenter_configs)} AWS data centers ...")
+
+    #
+    # a single graph with the steps of all the data centers, run within one
+    # limit of workers, see the FANOUT section of datacenter.ini
+    #
+
+    datacenter_constants = DatacenterConstants()
+
+    # timeline of the run, in the Chrome trace event format
+
+    if datacenter_constants.trace_enabled:
+        Tracer.enable()
+        atexit.register(Tracer.export, datacenter_constants.trace_file)
+
+    # steps completed and AWS operations in flight, a run that fails is
+    # resumed by the next one, see datacenter.ini
+
+    if datacenter_constants.journal_enabled:
+        RunJournal.enable(
+            datacenter_constants.journal_file,
+            RunJournal.build_run_id(
+                [hosted_zone_config_file] + datacenter_config_files
+            ),
+        )
+
+    fanout_builder = FanoutGraphBuilder(
+        [
+            StartupGraphBuilder(
+                datacenter_config,
+                hostedzone_config,
+                datacenter_constants.startup_node_timeout,
+                datacenter_constants.startup_instance_timeout,
+            )
+            for datacenter_config in datacenter_configs
+        ]
+    )
+
+    graph_executor = GraphExecutor(
+        datacenter_constants.fanout_max_workers,
+        datacenter_constants.fanout_policy,
+    )
+    result = graph_executor.execute(fanout_builder.build())
+
+    report = fanout_builder.report(result)
+
+    for datacenter_report in report:
+        if datacenter_report.get("succeeded"):
+            state = "succeeded"
+        else:
+            state = "failed"
+
+        Logger.info(
+            f"{datacenter_report.get('datacenter'):30}"
+            f"{datacenter_report.get('region') or '':20}"
+            f"{state:12}"
+            f"{datacenter_report.get('elapsed'):>10.1f}s"
+        )
+
+    if datacenter_constants.fanout_report_file:
+        with open(datacenter_constants.fanout_report_file, "w") as file:
+            json.dump(
+                {"elapsed": round(result.elapsed, 3), "datacenters": report},
+                file,
+                indent=2,
+            )
+
+    if not result.succeeded:
+        raise AwsException(
+            "Error creating the data centers: "
+            + ", ".join(result.failed_nodes)
+            + " failed!"
+        )
+
+    RunJournal.close()
+
+    Logger.info(
+        f"{len(datacenter_configs)} AWS data centers created in "
+        f"{result.elapsed:.1f} seconds!"
+    )
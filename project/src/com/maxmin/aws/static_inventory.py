@@ -0,0 +1,125 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import re
+
+from com.maxmin.aws.configuration.dao.domain.datacenter import (
+    DatacenterConfig,
+)
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.service.instance import InstanceService
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+
+
+class StaticInventory(object):
+    """
+    Ansible inventory of the instances of a datacenter, written by the
+    startup run so that the playbooks don't call AWS to find the instances.
+    The hosts are grouped by the same tags as the aws_ec2 dynamic inventory,
+    see aws_ec2.yml, eg: the instance with tag name=dtc-box is in the group
+    name_dtc_box.
+    """
+
+    # tag keys the hosts are grouped by
+    GROUP_KEYS = (
+        "name",
+        "class",
+        "database",
+        "webserver",
+        "common",
+        "utility",
+        "jdk",
+    )
+
+    def __init__(self, datacenter_config: DatacenterConfig):
+        self.datacenter_config = datacenter_config
+
+    def build(self) -> dict:
+        """
+        Returns the inventory of the running instances, in the Ansible YAML
+        inventory format.
+        """
+        # the public IPs are assigned while the instances start
+        if InventoryDao.is_enabled():
+            InventoryDao.invalidate(InventoryDao.INSTANCE)
+
+        instance_service = InstanceService()
+        hosts = {}
+        groups = {}
+
+        for instance_config in self.datacenter_config.instances:
+            instance = instance_service.load_instance(instance_config.name)
+
+            if not instance or not instance.public_ip:
+                raise AwsException(
+                    f"Instance {instance_config.name} not running!"
+                )
+
+            tags = {tag.key: tag.value for tag in instance.tags}
+
+            hosts[instance_config.name] = {
+                "ansible_host": instance.public_ip,
+                "ansible_user": instance_config.username,
+                "ansible_ssh_private_key_file": os.path.join(
+                    ProjectDirectories.ACCESS_DIR, instance_config.name
+                ),
+                "instance_id": instance.instance_id,
+                "private_ip_address": instance.private_ip,
+                "public_ip_address": instance.public_ip,
+                "tags": tags,
+            }
+
+            for key in StaticInventory.GROUP_KEYS:
+                if tags.get(key):
+                    group_nm = StaticInventory.build_group_nm(key, tags[key])
+                    groups.setdefault(group_nm, {"hosts": {}})["hosts"][
+                        instance_config.name
+                    ] = None
+
+        return {"all": {"hosts": hosts, "children": groups}}
+
+    def write(self, inventory_file: str) -> None:
+        """
+        Writes the inventory file, replaced whole.
+        """
+        inventory = self.build()
+
+        try:
+            temp_file = f"{inventory_file}.tmp"
+
+            with open(temp_file, "w") as file:
+                json.dump(inventory, file, indent=2)
+
+            os.replace(temp_file, inventory_file)
+        except OSError as e:
+            Logger.error(str(e))
+            raise AwsException("Error writing the inventory!")
+
+        Logger.info(f"Ansible inventory written to {inventory_file}!")
+
+    @staticmethod
+    def discard(inventory_file: str) -> None:
+        """
+        Removes the inventory file, eg: the instances are deleted.
+        """
+        try:
+            if os.path.exists(inventory_file):
+                os.remove(inventory_file)
+        except OSError as e:
+            Logger.error(str(e))
+            raise AwsException("Error removing the inventory!")
+
+    @staticmethod
+    def build_group_nm(key: str, value: str) -> str:
+        """
+        Returns the name of the group of a tag, the characters not allowed by
+        Ansible replaced by underscores.
+        """
+        return re.sub(r"[^A-Za-z0-9_]", "_", f"{key}_{value}")
@@ -0,0 +1,131 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import asyncio
+import unittest
+
+from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.async_client import AsyncEc2Dao
+from com.maxmin.aws.base.dao.client import ClientRegistry, Ec2Dao
+from com.maxmin.aws.base.dao.executor import AsyncExecutor
+from com.maxmin.aws.ec2.dao.domain.tag import TagData
+from com.maxmin.aws.ec2.dao.domain.vpc import VpcData
+from com.maxmin.aws.ec2.dao.vpc import VpcDao
+from com.maxmin.aws.exception import AwsDaoException
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class AsyncDaoTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.test_utils = TestUtils()
+
+    def tearDown(self):
+        AsyncExecutor.shutdown()
+        ClientRegistry.clear()
+
+    def build_vpc_data(self, vpc_nm: str, cidr: str) -> VpcData:
+        vpc_data = VpcData()
+        vpc_data.cidr = cidr
+        vpc_data.tags = [TagData("name", vpc_nm)]
+
+        return vpc_data
+
+    @mock_aws
+    def test_call(self):
+        self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        )
+
+        # run the test
+        response = asyncio.run(AsyncEc2Dao().call("describe_vpcs"))
+
+        assert "10.0.10.0/16" in [
+            vpc.get("CidrBlock") for vpc in response.get("Vpcs")
+        ]
+
+    @mock_aws
+    def test_paginate(self):
+        self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        )
+
+        # run the test
+        vpcs = asyncio.run(AsyncEc2Dao().paginate("describe_vpcs", "Vpcs"))
+
+        assert "10.0.10.0/16" in [vpc.get("CidrBlock") for vpc in vpcs]
+
+    @mock_aws
+    def test_wait(self):
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        ).get("VpcId")
+
+        # run the test
+        asyncio.run(AsyncEc2Dao().wait("vpc_available", VpcIds=[vpc_id]))
+
+    @mock_aws
+    def test_run_deferring(self):
+        vpc_data = self.build_vpc_data("myvpc", "10.0.10.0/16")
+
+        # run the test
+        result, waits = asyncio.run(
+            AsyncExecutor.run_deferring(VpcDao().create, vpc_data)
+        )
+
+        assert result is None
+        assert len(waits) == 1
+        assert waits[0][1] == "ec2"
+        assert waits[0][2] == "vpc_available"
+        assert waits[0][4].get("VpcIds")
+
+    def test_defer_outside_run_deferring(self):
+        # run the test
+        deferred = AsyncExecutor.defer(
+            None, "ec2", "vpc_available", None, {"VpcIds": ["vpc-1"]}
+        )
+
+        assert not deferred
+
+    @mock_aws
+    def test_run(self):
+        async def create_vpcs() -> None:
+            vpc_dao = VpcDao()
+            async_dao = AsyncEc2Dao()
+
+            await asyncio.gather(
+                *[
+                    async_dao.run(
+                        vpc_dao.create,
+                        self.build_vpc_data(f"myvpc{i}", f"10.{i}.0.0/16"),
+                    )
+                    for i in range(10)
+                ]
+            )
+
+        # run the test
+        asyncio.run(create_vpcs())
+
+        for i in range(10):
+            vpcs = self.test_utils.describe_vpcs(f"myvpc{i}")
+
+            assert len(vpcs) == 1
+            assert vpcs[0].get("State") == "available"
+
+    @mock_aws
+    def test_run_wait_error(self):
+        def wait_not_existing_vpc() -> None:
+            Ec2Dao().wait("vpc_available", VpcIds=["vpc-12345678"])
+
+        try:
+            # run the test
+            asyncio.run(AsyncEc2Dao().run(wait_not_existing_vpc))
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsDaoException as e:
+            assert str(e) == "Error waiting for the resources!"
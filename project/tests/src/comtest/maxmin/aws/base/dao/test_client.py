@@ -0,0 +1,211 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.stub import ANY, Stubber
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry, Ec2Dao, Route53Dao
+
+
+class ClientRegistryTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+
+    def tearDown(self):
+        ClientRegistry.clear()
+
+    @mock_aws
+    def test_get_client_twice(self):
+        # run the test
+        client1 = ClientRegistry.get_client("ec2")
+        client2 = ClientRegistry.get_client("ec2")
+
+        assert client1 is client2
+
+    @mock_aws
+    def test_get_client_default_region(self):
+        # run the test
+        client1 = ClientRegistry.get_client("ec2")
+        client2 = ClientRegistry.get_client(
+            "ec2", region_nm=client1.meta.region_name
+        )
+
+        assert client1 is client2
+
+    @mock_aws
+    def test_get_client_different_keys(self):
+        # run the test
+        ec2 = ClientRegistry.get_client("ec2", region_nm="eu-west-1")
+        route53 = ClientRegistry.get_client("route53", region_nm="eu-west-1")
+        ec2_us = ClientRegistry.get_client("ec2", region_nm="us-east-1")
+        ec2_pool = ClientRegistry.get_client(
+            "ec2", region_nm="eu-west-1", max_pool_connections=50
+        )
+
+        assert ec2 is not route53
+        assert ec2 is not ec2_us
+        assert ec2 is not ec2_pool
+
+        assert ec2_us.meta.region_name == "us-east-1"
+        assert ec2_pool.meta.config.max_pool_connections == 50
+
+    @mock_aws
+    def test_get_client_concurrently(self):
+        # run the test
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            clients = list(
+                executor.map(
+                    lambda i: ClientRegistry.get_client("ec2"), range(50)
+                )
+            )
+
+        assert len(set(id(client) for client in clients)) == 1
+
+    @mock_aws
+    def test_daos_share_clients(self):
+        # run the test
+        assert Ec2Dao().ec2 is Ec2Dao().ec2
+        assert Route53Dao().route53 is Route53Dao().route53
+
+    @mock_aws
+    def test_get_client_region_context(self):
+        # run the test
+        with ClientRegistry.region("us-east-1"):
+            ec2_us = ClientRegistry.get_client("ec2")
+            ec2_eu = ClientRegistry.get_client("ec2", region_nm="eu-west-1")
+            dao_ec2 = Ec2Dao().ec2
+
+        ec2 = ClientRegistry.get_client("ec2")
+
+        assert ec2_us.meta.region_name == "us-east-1"
+        assert ec2_eu.meta.region_name == "eu-west-1"
+        assert dao_ec2 is ec2_us
+        assert ec2 is not ec2_us
+
+    @mock_aws
+    def test_get_client_region_context_in_threads(self):
+        def get_region(region_nm: str) -> str:
+            with ClientRegistry.region(region_nm):
+                return Ec2Dao().ec2.meta.region_name
+
+        # run the test
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            region_nms = list(
+                executor.map(
+                    get_region, ["us-east-1", "eu-west-1", "ap-south-1"] * 5
+                )
+            )
+
+        assert region_nms == ["us-east-1", "eu-west-1", "ap-south-1"] * 5
+
+    @mock_aws
+    def test_clear(self):
+        client1 = ClientRegistry.get_client("ec2")
+
+        # run the test
+        ClientRegistry.clear()
+
+        client2 = ClientRegistry.get_client("ec2")
+
+        assert client1 is not client2
+
+
+class Ec2DaoTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+
+    def tearDown(self):
+        ClientRegistry.clear()
+
+    @mock_aws
+    def test_paginate(self):
+        ec2_dao = Ec2Dao()
+        calls = []
+
+        ec2_dao.ec2.meta.events.register(
+            "provide-client-params.ec2.DescribeVpcs",
+            lambda params, **kwargs: calls.append(params),
+        )
+
+        with Stubber(ec2_dao.ec2) as stubber:
+            stubber.add_response(
+                "describe_vpcs",
+                {
+                    "Vpcs": [{"VpcId": "vpc-1"}, {"VpcId": "vpc-2"}],
+                    "NextToken": "t1",
+                },
+                {"Filters": ANY, "MaxResults": 1000},
+            )
+            stubber.add_response(
+                "describe_vpcs",
+                {"Vpcs": [{"VpcId": "vpc-3"}]},
+                {"Filters": ANY, "MaxResults": 1000, "NextToken": "t1"},
+            )
+
+            # run the test
+            vpcs = ec2_dao.paginate(
+                "describe_vpcs",
+                "Vpcs",
+                Filters=[{"Name": "tag-value", "Values": ["myvpc"]}],
+            )
+
+            # the first page is requested when the iteration starts
+            assert next(vpcs).get("VpcId") == "vpc-1"
+            assert next(vpcs).get("VpcId") == "vpc-2"
+
+            # the second page when the iteration reaches it
+            assert len(calls) == 1
+            assert [vpc.get("VpcId") for vpc in vpcs] == ["vpc-3"]
+            assert len(calls) == 2
+
+            stubber.assert_no_pending_responses()
+
+    @mock_aws
+    def test_paginate_page_limit(self):
+        ec2_dao = Ec2Dao()
+
+        with Stubber(ec2_dao.ec2) as stubber:
+            # describe_route_tables returns at most 100 results for page
+            stubber.add_response(
+                "describe_route_tables",
+                {"RouteTables": [{"RouteTableId": "rtb-1"}]},
+                {"MaxResults": 100},
+            )
+
+            # run the test
+            route_tables = list(
+                ec2_dao.paginate("describe_route_tables", "RouteTables")
+            )
+
+            assert len(route_tables) == 1
+
+            stubber.assert_no_pending_responses()
+
+    @mock_aws
+    def test_paginate_not_paginated(self):
+        ec2_dao = Ec2Dao()
+
+        with Stubber(ec2_dao.ec2) as stubber:
+            # describe_key_pairs has no pages
+            stubber.add_response(
+                "describe_key_pairs",
+                {"KeyPairs": [{"KeyPairId": "key-1"}, {"KeyPairId": "key-2"}]},
+                {"IncludePublicKey": True},
+            )
+
+            # run the test
+            key_pairs = list(
+                ec2_dao.paginate(
+                    "describe_key_pairs", "KeyPairs", IncludePublicKey=True
+                )
+            )
+
+            assert len(key_pairs) == 2
+
+            stubber.assert_no_pending_responses()
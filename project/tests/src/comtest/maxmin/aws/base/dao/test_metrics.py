@@ -0,0 +1,173 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from botocore.awsrequest import AWSResponse
+from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.client import ClientRegistry, Ec2Dao
+from com.maxmin.aws.base.dao.metrics import ApiMetrics, LatencyHistogram
+from com.maxmin.aws.ec2.dao.domain.tag import TagData
+from com.maxmin.aws.ec2.dao.domain.vpc import VpcData
+from com.maxmin.aws.ec2.dao.vpc import VpcDao
+
+
+class LatencyHistogramTestCase(unittest.TestCase):
+    def test_add(self):
+        histogram = LatencyHistogram()
+
+        # run the test
+        histogram.add(0.005)
+        histogram.add(0.030)
+        histogram.add(0.030)
+        histogram.add(60)
+
+        assert histogram.count == 4
+        assert histogram.max_seconds == 60
+        assert histogram.counts[0] == 1
+        assert histogram.counts[2] == 2
+        assert histogram.counts[-1] == 1
+
+    def test_percentile(self):
+        histogram = LatencyHistogram()
+
+        for i in range(19):
+            histogram.add(0.020)
+        histogram.add(0.200)
+
+        # run the test
+        assert histogram.percentile(50) == 25
+        assert histogram.percentile(95) == 25
+        assert histogram.percentile(100) == 200
+
+    def test_percentile_empty(self):
+        # run the test
+        assert LatencyHistogram().percentile(95) == 0
+
+
+class ApiMetricsTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        ApiMetrics.enable()
+
+    def tearDown(self):
+        ApiMetrics.disable()
+        ClientRegistry.clear()
+
+    def get_operation(self, operation_nm: str) -> dict:
+        for operation in ApiMetrics.to_dictionary().get("operations"):
+            if operation.get("operation") == operation_nm:
+                return operation
+
+        return None
+
+    @mock_aws
+    def test_count_calls(self):
+        ec2 = Ec2Dao().ec2
+
+        # run the test
+        ec2.describe_vpcs()
+        ec2.describe_vpcs()
+        ec2.describe_subnets()
+
+        metrics = ApiMetrics.to_dictionary()
+
+        assert metrics.get("total_calls") == 3
+
+        operation = self.get_operation("DescribeVpcs")
+
+        assert operation.get("service") == "ec2"
+        assert operation.get("calls") == 2
+        assert operation.get("errors") == 0
+        assert operation.get("latency").get("seconds") > 0
+        assert sum(operation.get("latency").get("buckets_ms").values()) == 2
+
+        assert self.get_operation("DescribeSubnets").get("calls") == 1
+
+    @mock_aws
+    def test_count_errors(self):
+        ec2 = Ec2Dao().ec2
+
+        try:
+            # run the test
+            ec2.describe_vpcs(VpcIds=["vpc-12345678"])
+
+            fail("ERROR: an exception should have been thrown!")
+        except Exception:
+            pass
+
+        operation = self.get_operation("DescribeVpcs")
+
+        assert operation.get("calls") == 1
+        assert operation.get("errors") == 1
+
+    @mock_aws
+    def test_count_throttles(self):
+        ec2 = Ec2Dao().ec2
+
+        # run the test
+        ec2.meta.events.emit(
+            "needs-retry.ec2.DescribeVpcs",
+            response=(
+                AWSResponse("https://ec2", 503, {}, None),
+                {"Error": {"Code": "RequestLimitExceeded"}},
+            ),
+            endpoint=None,
+            operation=ec2.meta.service_model.operation_model("DescribeVpcs"),
+            attempts=1,
+            caught_exception=None,
+            request_dict={"context": {}},
+        )
+
+        assert self.get_operation("DescribeVpcs").get("throttles") == 1
+
+    @mock_aws
+    def test_record_waiters(self):
+        vpc_data = VpcData()
+        vpc_data.cidr = "10.0.10.0/16"
+        vpc_data.tags = [TagData("name", "myvpc")]
+
+        # run the test
+        VpcDao().create(vpc_data)
+
+        waiters = ApiMetrics.to_dictionary().get("waiters")
+
+        assert len(waiters) == 1
+        assert waiters[0].get("service") == "ec2"
+        assert waiters[0].get("waiter") == "vpc_available"
+        assert waiters[0].get("waits") == 1
+        assert self.get_operation("CreateVpc").get("calls") == 1
+
+    @mock_aws
+    def test_disabled(self):
+        ApiMetrics.disable()
+        ec2 = Ec2Dao().ec2
+
+        # run the test
+        ec2.describe_vpcs()
+
+        assert ApiMetrics.to_dictionary().get("total_calls") == 0
+
+    @mock_aws
+    def test_export(self):
+        Ec2Dao().ec2.describe_vpcs()
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_nm = os.path.join(directory, "metrics.json")
+
+            # run the test
+            ApiMetrics.report(file_nm)
+
+            with open(file_nm) as file:
+                metrics = json.load(file)
+
+        assert metrics.get("total_calls") == 1
+        assert metrics.get("operations")[0].get("operation") == "DescribeVpcs"
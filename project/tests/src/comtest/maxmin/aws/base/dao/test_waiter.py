@@ -0,0 +1,325 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from botocore.exceptions import WaiterError
+from botocore.stub import Stubber
+from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.waiter import (
+    AdaptiveWaiter,
+    AsyncAdaptiveWaiter,
+    WaiterSchedule,
+)
+from com.maxmin.aws.constants import Ec2Constants
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class WaiterScheduleTestCase(unittest.TestCase):
+    def test_delays(self):
+        schedule = WaiterSchedule(
+            first_delay=1, max_delay=15, multiplier=2, jitter=0
+        )
+        delays = schedule.delays()
+
+        # run the test
+        assert [next(delays) for i in range(6)] == [1, 2, 4, 8, 15, 15]
+
+    def test_delays_with_jitter(self):
+        schedule = WaiterSchedule(
+            first_delay=1, max_delay=15, multiplier=2, jitter=0.5
+        )
+        delays = schedule.delays()
+
+        # run the test
+        for bound in [1, 2, 4, 8, 15, 15]:
+            delay = next(delays)
+
+            assert bound * 0.5 <= delay <= bound
+
+    def test_get_waiter_config(self):
+        # run the test
+        default_config = Ec2Constants().get_waiter_config("vpc_available")
+        instance_config = Ec2Constants().get_waiter_config(
+            "instance_status_ok"
+        )
+
+        assert default_config.get("first_delay") == 1
+        assert default_config.get("multiplexed") is True
+        assert instance_config.get("first_delay") == 10
+        assert instance_config.get("timeout") == 1200
+        assert instance_config.get("jitter") == default_config.get("jitter")
+
+
+class AdaptiveWaiterTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.test_utils = TestUtils()
+        self.ec2 = ClientRegistry.get_client("ec2")
+        self.schedule = WaiterSchedule(
+            first_delay=0.01, max_delay=0.02, jitter=0, timeout=1
+        )
+
+    def tearDown(self):
+        ClientRegistry.clear()
+
+    def vpc(self, vpc_id: str, state: str) -> dict:
+        return {"VpcId": vpc_id, "State": state}
+
+    @mock_aws
+    def test_wait(self):
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        ).get("VpcId")
+
+        waiter = AdaptiveWaiter(self.ec2, "vpc_available", self.schedule)
+
+        # run the test
+        waiter.wait(VpcIds=[vpc_id])
+
+    def test_wait_polls_until_success(self):
+        waiter = AdaptiveWaiter(self.ec2, "vpc_available", self.schedule)
+
+        with Stubber(self.ec2) as stubber:
+            for state in ("pending", "pending", "available"):
+                stubber.add_response(
+                    "describe_vpcs",
+                    {"Vpcs": [self.vpc("vpc-1", state)]},
+                    {"VpcIds": ["vpc-1"]},
+                )
+
+            # run the test
+            waiter.wait(VpcIds=["vpc-1"])
+
+            stubber.assert_no_pending_responses()
+
+    def test_wait_failure(self):
+        waiter = AdaptiveWaiter(self.ec2, "image_available", self.schedule)
+
+        with Stubber(self.ec2) as stubber:
+            stubber.add_response(
+                "describe_images",
+                {"Images": [{"ImageId": "ami-1", "State": "failed"}]},
+            )
+
+            try:
+                # run the test
+                waiter.wait(ImageIds=["ami-1"])
+
+                fail("ERROR: an exception should have been thrown!")
+            except WaiterError as e:
+                assert "terminal failure" in str(e)
+
+    def test_wait_unexpected_error(self):
+        waiter = AdaptiveWaiter(self.ec2, "vpc_available", self.schedule)
+
+        with Stubber(self.ec2) as stubber:
+            stubber.add_client_error("describe_vpcs", "UnauthorizedOperation")
+
+            try:
+                # run the test
+                waiter.wait(VpcIds=["vpc-1"])
+
+                fail("ERROR: an exception should have been thrown!")
+            except WaiterError as e:
+                assert "UnauthorizedOperation" in str(e)
+
+    def test_wait_retry_error(self):
+        waiter = AdaptiveWaiter(
+            self.ec2, "security_group_exists", self.schedule
+        )
+
+        with Stubber(self.ec2) as stubber:
+            stubber.add_client_error(
+                "describe_security_groups", "InvalidGroup.NotFound"
+            )
+            stubber.add_response(
+                "describe_security_groups",
+                {"SecurityGroups": [{"GroupId": "sg-1"}]},
+            )
+
+            # run the test
+            waiter.wait(GroupIds=["sg-1"])
+
+            stubber.assert_no_pending_responses()
+
+    def test_wait_timeout(self):
+        waiter = AdaptiveWaiter(
+            self.ec2,
+            "vpc_available",
+            WaiterSchedule(first_delay=0.05, jitter=0, timeout=0.12),
+        )
+
+        with Stubber(self.ec2) as stubber:
+            for i in range(3):
+                stubber.add_response(
+                    "describe_vpcs", {"Vpcs": [self.vpc("vpc-1", "pending")]}
+                )
+
+            try:
+                # run the test
+                waiter.wait(VpcIds=["vpc-1"])
+
+                fail("ERROR: an exception should have been thrown!")
+            except WaiterError as e:
+                assert "Timed out" in str(e)
+
+    def test_wait_multiplexed(self):
+        schedule = WaiterSchedule(first_delay=0.5, jitter=0, timeout=5)
+        errors = []
+
+        def wait(vpc_id: str) -> None:
+            try:
+                AdaptiveWaiter(self.ec2, "vpc_available", schedule).wait(
+                    VpcIds=[vpc_id]
+                )
+            except Exception as e:
+                errors.append(e)
+
+        with Stubber(self.ec2) as stubber:
+            stubber.add_response(
+                "describe_vpcs",
+                {"Vpcs": [self.vpc("vpc-1", "pending")]},
+                {"VpcIds": ["vpc-1"]},
+            )
+            stubber.add_response(
+                "describe_vpcs",
+                {
+                    "Vpcs": [
+                        self.vpc("vpc-1", "available"),
+                        self.vpc("vpc-2", "available"),
+                    ]
+                },
+                {"VpcIds": ["vpc-1", "vpc-2"]},
+            )
+
+            thread1 = threading.Thread(target=wait, args=["vpc-1"])
+            thread2 = threading.Thread(target=wait, args=["vpc-2"])
+
+            # run the test
+            thread1.start()
+            time.sleep(0.1)
+            thread2.start()
+
+            thread1.join()
+            thread2.join()
+
+            # the second describe call answered both waits
+            stubber.assert_no_pending_responses()
+
+        assert errors == []
+
+    def test_wait_not_multiplexed(self):
+        schedule = WaiterSchedule(
+            first_delay=0.01, jitter=0, timeout=1, multiplexed=False
+        )
+        waiter = AdaptiveWaiter(self.ec2, "vpc_available", schedule)
+
+        with Stubber(self.ec2) as stubber:
+            stubber.add_response(
+                "describe_vpcs",
+                {"Vpcs": [self.vpc("vpc-1", "available")]},
+                {"VpcIds": ["vpc-1"]},
+            )
+
+            # run the test
+            waiter.wait(VpcIds=["vpc-1"])
+
+            stubber.assert_no_pending_responses()
+
+
+class AsyncAdaptiveWaiterTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.ec2 = ClientRegistry.get_client("ec2")
+        self.schedule = WaiterSchedule(
+            first_delay=0.01, max_delay=0.02, jitter=0, timeout=1
+        )
+
+    def tearDown(self):
+        ClientRegistry.clear()
+
+    def vpc(self, vpc_id: str, state: str) -> dict:
+        return {"VpcId": vpc_id, "State": state}
+
+    def test_wait_polls_until_success(self):
+        waiter = AsyncAdaptiveWaiter(self.ec2, "vpc_available", self.schedule)
+
+        with Stubber(self.ec2) as stubber:
+            for state in ("pending", "pending", "available"):
+                stubber.add_response(
+                    "describe_vpcs",
+                    {"Vpcs": [self.vpc("vpc-1", state)]},
+                    {"VpcIds": ["vpc-1"]},
+                )
+
+            # run the test
+            asyncio.run(waiter.wait(VpcIds=["vpc-1"]))
+
+            stubber.assert_no_pending_responses()
+
+    def test_wait_timeout(self):
+        waiter = AsyncAdaptiveWaiter(
+            self.ec2,
+            "vpc_available",
+            WaiterSchedule(first_delay=0.05, jitter=0, timeout=0.12),
+        )
+
+        with Stubber(self.ec2) as stubber:
+            for i in range(3):
+                stubber.add_response(
+                    "describe_vpcs", {"Vpcs": [self.vpc("vpc-1", "pending")]}
+                )
+
+            try:
+                # run the test
+                asyncio.run(waiter.wait(VpcIds=["vpc-1"]))
+
+                fail("ERROR: an exception should have been thrown!")
+            except WaiterError as e:
+                assert "Timed out" in str(e)
+
+    def test_wait_multiplexed(self):
+        schedule = WaiterSchedule(first_delay=0.2, jitter=0, timeout=5)
+
+        async def wait_vpcs() -> None:
+            await asyncio.gather(
+                AsyncAdaptiveWaiter(self.ec2, "vpc_available", schedule).wait(
+                    VpcIds=["vpc-1"]
+                ),
+                AsyncAdaptiveWaiter(self.ec2, "vpc_available", schedule).wait(
+                    VpcIds=["vpc-2"]
+                ),
+            )
+
+        with Stubber(self.ec2) as stubber:
+            stubber.add_response(
+                "describe_vpcs",
+                {"Vpcs": [self.vpc("vpc-1", "pending")]},
+                {"VpcIds": ["vpc-1"]},
+            )
+            stubber.add_response(
+                "describe_vpcs",
+                {
+                    "Vpcs": [
+                        self.vpc("vpc-1", "available"),
+                        self.vpc("vpc-2", "available"),
+                    ]
+                },
+                {"VpcIds": ["vpc-1", "vpc-2"]},
+            )
+
+            # run the test
+            asyncio.run(wait_vpcs())
+
+            # the second describe call answered both waits
+            stubber.assert_no_pending_responses()
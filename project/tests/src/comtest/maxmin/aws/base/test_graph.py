@@ -0,0 +1,199 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import threading
+import time
+import unittest
+
+from pytest import fail
+
+from com.maxmin.aws.base.graph import GraphExecutor, ResourceGraph
+from com.maxmin.aws.exception import AwsException
+
+
+class GraphExecutorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def step(self, name: str, seconds: float = 0, error: bool = False):
+        def action():
+            time.sleep(seconds)
+
+            with self.lock:
+                self.calls.append(name)
+
+            if error:
+                raise AwsException(f"Error in {name}!")
+
+            return name
+
+        return action
+
+    def test_execute_in_dependency_order(self):
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc"))
+        graph.add_node("subnet", self.step("subnet"), ["vpc"])
+        graph.add_node("instance", self.step("instance"), ["subnet"])
+
+        # run the test
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+        assert self.calls == ["vpc", "subnet", "instance"]
+        assert result.values["instance"] == "instance"
+        assert set(result.timings.keys()) == {"vpc", "subnet", "instance"}
+
+    def test_execute_independent_nodes_concurrently(self):
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc"))
+
+        for i in range(4):
+            graph.add_node(f"sgp{i}", self.step(f"sgp{i}", 0.3), ["vpc"])
+
+        start = time.monotonic()
+
+        # run the test
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+        assert len(self.calls) == 5
+        assert time.monotonic() - start < 1.0
+
+    def test_execute_bounded_pool(self):
+        graph = ResourceGraph()
+
+        for i in range(4):
+            graph.add_node(f"sgp{i}", self.step(f"sgp{i}", 0.2))
+
+        start = time.monotonic()
+
+        # run the test
+        result = GraphExecutor(1).execute(graph)
+
+        assert result.succeeded is True
+        assert self.calls == ["sgp0", "sgp1", "sgp2", "sgp3"]
+        assert time.monotonic() - start >= 0.8
+
+    def test_execute_fail_fast(self):
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc", error=True))
+        graph.add_node("subnet", self.step("subnet"), ["vpc"])
+        graph.add_node("keypair", self.step("keypair", 0.2))
+        graph.add_node("instance", self.step("instance"), ["keypair"])
+
+        # run the test
+        result = GraphExecutor(2, GraphExecutor.FAIL_FAST).execute(graph)
+
+        assert result.succeeded is False
+        assert result.failed_nodes == ["vpc"]
+        assert str(result.errors["vpc"]) == "Error in vpc!"
+        assert result.states["subnet"] == GraphExecutor.SKIPPED
+        # the running node completes, no new node is started
+        assert result.states["keypair"] == GraphExecutor.SUCCEEDED
+        assert result.states["instance"] == GraphExecutor.SKIPPED
+        assert "instance" not in self.calls
+
+    def test_execute_continue_on_error(self):
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc", error=True))
+        graph.add_node("subnet", self.step("subnet"), ["vpc"])
+        graph.add_node("dns", self.step("dns"), ["subnet"])
+        graph.add_node("keypair", self.step("keypair", 0.2))
+        graph.add_node("instance", self.step("instance"), ["keypair"])
+
+        # run the test
+        result = GraphExecutor(2, GraphExecutor.CONTINUE_ON_ERROR).execute(
+            graph
+        )
+
+        assert result.succeeded is False
+        assert result.failed_nodes == ["vpc"]
+        assert result.states["subnet"] == GraphExecutor.SKIPPED
+        assert result.states["dns"] == GraphExecutor.SKIPPED
+        assert result.states["instance"] == GraphExecutor.SUCCEEDED
+
+    def test_execute_node_timeout(self):
+        graph = ResourceGraph()
+        graph.add_node("instance", self.step("instance", 1.0), [], 0.1)
+        graph.add_node("dns", self.step("dns"), ["instance"])
+
+        start = time.monotonic()
+
+        # run the test
+        result = GraphExecutor(2).execute(graph)
+
+        assert time.monotonic() - start < 0.8
+        assert result.states["instance"] == GraphExecutor.TIMED_OUT
+        assert result.states["dns"] == GraphExecutor.SKIPPED
+        assert result.failed_nodes == ["instance"]
+
+    def test_execute_node_timeout_long_sibling(self):
+        graph = ResourceGraph()
+        graph.add_node("wait", self.step("wait", 2.0))
+        graph.add_node("vpc", self.step("vpc"))
+        # submitted while the sibling runs
+        graph.add_node("instance", self.step("instance", 3.0), ["vpc"], 0.1)
+
+        # run the test
+        result = GraphExecutor(2, GraphExecutor.CONTINUE_ON_ERROR).execute(
+            graph
+        )
+
+        # not waited for the sibling to finish
+        assert result.finished["instance"] < 1.0
+        assert result.states["instance"] == GraphExecutor.TIMED_OUT
+        assert result.states["wait"] == GraphExecutor.SUCCEEDED
+
+    def test_add_node_twice(self):
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc"))
+
+        try:
+            # run the test
+            graph.add_node("vpc", self.step("vpc"))
+
+            fail("An exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Node vpc already in the graph!"
+
+    def test_execute_unknown_dependency(self):
+        graph = ResourceGraph()
+        graph.add_node("subnet", self.step("subnet"), ["vpc"])
+
+        try:
+            # run the test
+            GraphExecutor().execute(graph)
+
+            fail("An exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Node subnet depends on unknown vpc!"
+
+        assert self.calls == []
+
+    def test_execute_cycle(self):
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc"), ["subnet"])
+        graph.add_node("subnet", self.step("subnet"), ["vpc"])
+
+        try:
+            # run the test
+            GraphExecutor().execute(graph)
+
+            fail("An exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "The graph has a cycle!"
+
+        assert self.calls == []
+
+    def test_unknown_policy(self):
+        try:
+            # run the test
+            GraphExecutor(4, "retry")
+
+            fail("An exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Unknown policy retry!"
@@ -0,0 +1,211 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from pytest import fail
+
+from com.maxmin.aws.base.graph import GraphExecutor, ResourceGraph
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.exception import AwsException
+
+
+class RunJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.journal_dir = tempfile.TemporaryDirectory()
+        self.journal_file = os.path.join(self.journal_dir.name, "journal.json")
+        RunJournal.enable(self.journal_file, "run1")
+
+    def tearDown(self):
+        RunJournal.disable()
+        self.journal_dir.cleanup()
+
+    def read_journal_file(self) -> dict:
+        with open(self.journal_file) as file:
+            return json.load(file)
+
+    def test_complete(self):
+        # run the test
+        RunJournal.complete("vpc")
+
+        assert RunJournal.is_completed("vpc") is True
+        assert RunJournal.is_completed("subnet") is False
+        assert self.read_journal_file() == {
+            "run": "run1",
+            "steps": ["vpc"],
+            "operations": {},
+        }
+
+    def test_record_operation(self):
+        RunJournal.record_operation("launch:box", {"token": "abc"})
+
+        # run the test
+        RunJournal.record_operation("launch:box", {"instance_ids": ["i-1"]})
+
+        assert RunJournal.get_operation("launch:box") == {
+            "token": "abc",
+            "instance_ids": ["i-1"],
+        }
+        assert RunJournal.get_operation("launch:other") is None
+
+    def test_finish_operation(self):
+        RunJournal.record_operation("change:zone", {"change_id": "C1"})
+
+        # run the test
+        RunJournal.finish_operation("change:zone")
+
+        assert RunJournal.get_operation("change:zone") is None
+        assert self.read_journal_file().get("operations") == {}
+
+    def test_enable_resumes_run(self):
+        RunJournal.complete("vpc")
+        RunJournal.record_operation("launch:box", {"token": "abc"})
+
+        # run the test
+        RunJournal.disable()
+        RunJournal.enable(self.journal_file, "run1")
+
+        assert RunJournal.is_completed("vpc") is True
+        assert RunJournal.get_operation("launch:box") == {"token": "abc"}
+
+    def test_enable_configuration_changed(self):
+        RunJournal.complete("vpc")
+
+        # run the test
+        RunJournal.disable()
+        RunJournal.enable(self.journal_file, "run2")
+
+        assert RunJournal.is_completed("vpc") is False
+
+    def test_enable_journal_file_not_readable(self):
+        RunJournal.disable()
+
+        with open(self.journal_file, "w") as file:
+            file.write("{not json")
+
+        # run the test
+        RunJournal.enable(self.journal_file, "run1")
+
+        assert RunJournal.is_completed("vpc") is False
+
+    def test_close(self):
+        RunJournal.complete("vpc")
+
+        # run the test
+        RunJournal.close()
+
+        assert RunJournal.is_enabled() is False
+        assert not os.path.exists(self.journal_file)
+
+    def test_discard(self):
+        RunJournal.complete("vpc")
+        RunJournal.disable()
+
+        # run the test
+        RunJournal.discard(self.journal_file)
+
+        assert not os.path.exists(self.journal_file)
+
+    def test_complete_error(self):
+        os.mkdir(f"{self.journal_file}.tmp")
+
+        try:
+            # run the test
+            RunJournal.complete("vpc")
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Error writing the journal!"
+
+    def test_complete_disabled(self):
+        RunJournal.disable()
+
+        # run the test
+        RunJournal.complete("vpc")
+
+        assert RunJournal.is_completed("vpc") is False
+        assert not os.path.exists(self.journal_file)
+
+    def test_build_run_id(self):
+        config_file = os.path.join(self.journal_dir.name, "datacenter.json")
+
+        with open(config_file, "w") as file:
+            file.write('{"datacenter": {}}')
+
+        run_id = RunJournal.build_run_id([config_file])
+
+        with open(config_file, "w") as file:
+            file.write('{"datacenter": {"vpc": {}}}')
+
+        # run the test
+        changed_run_id = RunJournal.build_run_id([config_file])
+
+        assert changed_run_id != run_id
+
+
+class GraphExecutorResumeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.journal_dir = tempfile.TemporaryDirectory()
+        self.journal_file = os.path.join(self.journal_dir.name, "journal.json")
+        RunJournal.enable(self.journal_file, "run1")
+        self.calls = []
+        self.failing = {"instance"}
+
+    def tearDown(self):
+        RunJournal.disable()
+        self.journal_dir.cleanup()
+
+    def step(self, name: str):
+        def action():
+            self.calls.append(name)
+
+            if name in self.failing:
+                raise AwsException(f"Error in {name}!")
+
+            return name
+
+        return action
+
+    def build_graph(self) -> ResourceGraph:
+        graph = ResourceGraph()
+        graph.add_node("vpc", self.step("vpc"))
+        graph.add_node("subnet", self.step("subnet"), ["vpc"])
+        graph.add_node("sgp", self.step("sgp"), ["vpc"])
+        graph.add_node("instance", self.step("instance"), ["subnet", "sgp"])
+        graph.add_node("record", self.step("record"), ["instance"])
+
+        return graph
+
+    def test_execute_resumes_failed_run(self):
+        result = GraphExecutor(1).execute(self.build_graph())
+
+        assert result.failed_nodes == ["instance"]
+
+        self.failing.clear()
+        self.calls.clear()
+
+        # run the test
+        RunJournal.disable()
+        RunJournal.enable(self.journal_file, "run1")
+        result = GraphExecutor(1).execute(self.build_graph())
+
+        assert result.succeeded is True
+        assert self.calls == ["instance", "record"]
+
+    def test_execute_journal_disabled(self):
+        GraphExecutor(1).execute(self.build_graph())
+        self.failing.clear()
+        self.calls.clear()
+
+        # run the test
+        RunJournal.disable()
+        result = GraphExecutor(1).execute(self.build_graph())
+
+        assert result.succeeded is True
+        assert len(self.calls) == 5
@@ -0,0 +1,142 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry, Ec2Dao
+from com.maxmin.aws.base.graph import GraphExecutor, ResourceGraph
+from com.maxmin.aws.base.trace import Tracer
+from com.maxmin.aws.ec2.dao.domain.tag import TagData
+from com.maxmin.aws.ec2.dao.domain.vpc import VpcData
+from com.maxmin.aws.ec2.dao.vpc import VpcDao
+
+
+class TracerTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        Tracer.enable()
+
+    def tearDown(self):
+        Tracer.disable()
+        ClientRegistry.clear()
+
+    def get_spans(self, category: str) -> list:
+        return [
+            event
+            for event in Tracer.to_dictionary().get("traceEvents")
+            if event.get("cat") == category
+        ]
+
+    def test_span(self):
+        # run the test
+        with Tracer.span("vpc", Tracer.NODE, vpc_nm="myvpc"):
+            pass
+
+        spans = self.get_spans(Tracer.NODE)
+
+        assert len(spans) == 1
+        assert spans[0].get("name") == "vpc"
+        assert spans[0].get("ph") == "X"
+        assert spans[0].get("ts") >= 0
+        assert spans[0].get("dur") >= 0
+        assert spans[0].get("tid") == threading.current_thread().native_id
+        assert spans[0].get("args") == {"vpc_nm": "myvpc"}
+
+    def test_span_disabled(self):
+        Tracer.disable()
+
+        # run the test
+        with Tracer.span("vpc", Tracer.NODE):
+            pass
+
+        assert Tracer.to_dictionary().get("traceEvents") == []
+
+    def test_graph_nodes_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        graph = ResourceGraph()
+        graph.add_node("subnet1", barrier.wait)
+        graph.add_node("subnet2", barrier.wait)
+
+        # run the test
+        result = GraphExecutor(2).execute(graph)
+
+        assert result.succeeded
+
+        spans = self.get_spans(Tracer.NODE)
+
+        assert sorted(span.get("name") for span in spans) == [
+            "subnet1",
+            "subnet2",
+        ]
+        assert spans[0].get("tid") != spans[1].get("tid")
+
+        thread_nms = [
+            event.get("args").get("name")
+            for event in Tracer.to_dictionary().get("traceEvents")
+            if event.get("ph") == "M"
+        ]
+
+        assert len(thread_nms) == 2
+        assert all(nm.startswith("graph") for nm in thread_nms)
+
+    @mock_aws
+    def test_api_calls_and_waiters(self):
+        vpc_data = VpcData()
+        vpc_data.cidr = "10.0.10.0/16"
+        vpc_data.tags = [TagData("name", "myvpc")]
+
+        # run the test
+        VpcDao().create(vpc_data)
+
+        api_spans = self.get_spans(Tracer.API)
+        waiter_spans = self.get_spans(Tracer.WAITER)
+        poll_spans = self.get_spans(Tracer.POLL)
+
+        assert [span.get("name") for span in api_spans] == ["ec2.CreateVpc"]
+        assert [span.get("name") for span in waiter_spans] == [
+            "ec2.vpc_available"
+        ]
+        assert poll_spans[0].get("name") == "ec2.DescribeVpcs"
+        assert poll_spans[0].get("ts") >= waiter_spans[0].get("ts")
+
+    @mock_aws
+    def test_api_call_error(self):
+        try:
+            # run the test
+            Ec2Dao().ec2.describe_vpcs(VpcIds=["vpc-12345678"])
+        except Exception:
+            pass
+
+        spans = self.get_spans(Tracer.API)
+
+        assert len(spans) == 1
+        assert spans[0].get("args").get("error") == "InvalidVpcID.NotFound"
+
+    def test_export(self):
+        with Tracer.span("vpc", Tracer.NODE):
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_nm = os.path.join(directory, "trace.json")
+
+            # run the test
+            Tracer.export(file_nm)
+
+            with open(file_nm) as file:
+                trace = json.load(file)
+
+        assert trace.get("displayTimeUnit") == "ms"
+        assert [event.get("ph") for event in trace.get("traceEvents")] == [
+            "M",
+            "X",
+        ]
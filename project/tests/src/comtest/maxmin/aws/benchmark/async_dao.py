@@ -0,0 +1,146 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Measures the wall time, the peak of the live threads and the describe calls
+of 200 waits for VPCs turning available between 0.5 and 2.5 seconds after
+the start:
+- threads: a thread for each wait, each one polling with the adaptive
+  waiter, as the sync daos do;
+- async: all the waits from one event loop with AsyncEc2Dao, the describe
+  calls run in the pool of AsyncExecutor;
+- multiplexed: as async, the waits sharing their describe calls.
+The delays of the waiters are scaled down by 5 to keep the run short, the
+describe calls are answered by a fake clock-driven AWS.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.async_dao
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+from botocore.client import BaseClient
+
+from com.maxmin.aws.base.dao.async_client import AsyncEc2Dao
+from com.maxmin.aws.base.dao.client import ClientRegistry, Ec2Dao
+from com.maxmin.aws.base.dao.executor import AsyncExecutor
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.dao.waiter import WaiterSchedule
+
+
+class AsyncDaoBenchmark:
+    __test__ = False
+
+    VPC_COUNT = 200
+    SCALE = 5
+    LATENCY = 0.05
+
+    def run(self, mode: str) -> tuple:
+        """
+        Waits for the VPCs.
+        Returns the elapsed seconds, the peak of the live threads and the
+        number of describe calls.
+        """
+        make_api_call = BaseClient._make_api_call
+        get_schedule = Ec2Dao.get_schedule
+        lock = threading.Lock()
+        calls = []
+        peak = [threading.active_count()]
+
+        random.seed(16)
+        start = time.monotonic()
+        ready_at = {
+            f"vpc-{i:08x}": start + random.uniform(0.5, 2.5)
+            for i in range(AsyncDaoBenchmark.VPC_COUNT)
+        }
+
+        def fake_api_call(client, operation_name, api_params):
+            time.sleep(AsyncDaoBenchmark.LATENCY)
+
+            with lock:
+                calls.append(operation_name)
+                peak[0] = max(peak[0], threading.active_count())
+
+            now = time.monotonic()
+
+            return {
+                "Vpcs": [
+                    {
+                        "VpcId": vpc_id,
+                        "State": (
+                            "available"
+                            if now >= ready_at[vpc_id]
+                            else "pending"
+                        ),
+                    }
+                    for vpc_id in api_params.get("VpcIds")
+                ]
+            }
+
+        def scaled_schedule(waiter_nm: str) -> WaiterSchedule:
+            schedule = get_schedule(waiter_nm)
+
+            return WaiterSchedule(
+                first_delay=schedule.first_delay / AsyncDaoBenchmark.SCALE,
+                max_delay=schedule.max_delay / AsyncDaoBenchmark.SCALE,
+                multiplexed=mode == "multiplexed",
+            )
+
+        async def wait_async() -> None:
+            ec2_dao = AsyncEc2Dao()
+
+            await asyncio.gather(
+                *[
+                    ec2_dao.wait("vpc_available", VpcIds=[vpc_id])
+                    for vpc_id in ready_at
+                ]
+            )
+
+        ClientRegistry.clear()
+        ApiMetrics.disable()
+        BaseClient._make_api_call = fake_api_call
+        Ec2Dao.get_schedule = staticmethod(scaled_schedule)
+
+        try:
+            if mode == "threads":
+                threads = [
+                    threading.Thread(
+                        target=Ec2Dao().wait,
+                        args=["vpc_available"],
+                        kwargs={"VpcIds": [vpc_id]},
+                    )
+                    for vpc_id in ready_at
+                ]
+
+                for thread in threads:
+                    thread.start()
+
+                for thread in threads:
+                    thread.join()
+            else:
+                asyncio.run(wait_async())
+
+            elapsed = time.monotonic() - start
+        finally:
+            BaseClient._make_api_call = make_api_call
+            Ec2Dao.get_schedule = staticmethod(get_schedule)
+            AsyncExecutor.shutdown()
+            ClientRegistry.clear()
+
+        return elapsed, peak[0], len(calls)
+
+
+if __name__ == "__main__":
+    async_dao_benchmark = AsyncDaoBenchmark()
+
+    print(f"{'':12}{'seconds':>10}{'threads':>10}{'calls':>10}")
+
+    for mode in ("threads", "async", "multiplexed"):
+        elapsed, threads, calls = async_dao_benchmark.run(mode)
+
+        print(f"{mode:12}{elapsed:>10.2f}{threads:>10}{calls:>10}")
@@ -0,0 +1,94 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the boto3 clients built and the wall time of a full startup run
+against moto, building a new client for each dao (before) and
+sharing the clients through the ClientRegistry (after).
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.client
+"""
+
+import time
+
+import boto3
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.benchmark.utils import BenchmarkUtils
+
+
+class ClientBenchmark:
+    __test__ = False
+
+    def __init__(self):
+        self.constructions = 0
+
+    def run(self, pooled: bool) -> tuple:
+        """
+        Runs startup.
+        Returns the number of clients built and the elapsed seconds.
+        """
+        session_client = boto3.session.Session.client
+        registry_get_client = ClientRegistry.get_client
+        benchmark = self
+
+        def counting_client(session, *args, **kwargs):
+            benchmark.constructions += 1
+            return session_client(session, *args, **kwargs)
+
+        def unpooled_client(service_nm: str, *args, **kwargs):
+            return boto3.client(service_nm)
+
+        self.constructions = 0
+        ClientRegistry.clear()
+        boto3.session.Session.client = counting_client
+
+        if not pooled:
+            ClientRegistry.get_client = staticmethod(unpooled_client)
+
+        try:
+            with mock_aws():
+                utils = BenchmarkUtils()
+                datacenter_config_file = utils.write_datacenter_config()
+                hosted_zone_config_file = utils.write_hosted_zone_config()
+
+                # the client used to prepare the hosted zone is not counted
+                self.constructions = 0
+                start = time.perf_counter()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+
+                elapsed = time.perf_counter() - start
+
+                utils.delete_private_key_files(datacenter_config_file)
+        finally:
+            boto3.session.Session.client = session_client
+            ClientRegistry.get_client = registry_get_client
+            RecordIndexDao.disable()
+            HostedZoneDao.disable()
+            ApiMetrics.disable()
+            ClientRegistry.clear()
+
+        return self.constructions, elapsed
+
+
+if __name__ == "__main__":
+    client_benchmark = ClientBenchmark()
+
+    before_clients, before_time = client_benchmark.run(pooled=False)
+    after_clients, after_time = client_benchmark.run(pooled=True)
+
+    print(f"{'':10}{'clients':>10}{'seconds':>10}")
+    print(f"{'before':10}{before_clients:>10}{before_time:>10.2f}")
+    print(f"{'after':10}{after_clients:>10}{after_time:>10.2f}")
@@ -0,0 +1,91 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the VPCs returned by AWS and the wall time of the lookup of a VPC by
+name in an account with 200 VPCs tagged with class 'webservices', filtering
+on the value of any tag (before) and on the tag with key 'name' (after).
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.filters
+"""
+
+import time
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class FiltersBenchmark:
+    __test__ = False
+
+    VPC_NM = "webservices"
+    VPC_COUNT = 200
+    LOOKUP_COUNT = 20
+
+    def run(self, filters: list) -> tuple:
+        """
+        Looks up the VPC.
+        Returns the number of VPCs returned by AWS and the elapsed seconds.
+        """
+        test_utils = TestUtils()
+
+        start = time.perf_counter()
+
+        for i in range(FiltersBenchmark.LOOKUP_COUNT):
+            vpcs = test_utils.ec2.describe_vpcs(Filters=filters).get("Vpcs")
+
+        elapsed = time.perf_counter() - start
+
+        return len(vpcs), elapsed
+
+
+if __name__ == "__main__":
+    filters_benchmark = FiltersBenchmark()
+
+    ClientRegistry.clear()
+    InventoryDao.disable()
+
+    try:
+        with mock_aws():
+            test_utils = TestUtils()
+
+            for i in range(FiltersBenchmark.VPC_COUNT):
+                vpc_nm = FiltersBenchmark.VPC_NM if i == 0 else f"vpc{i}"
+
+                test_utils.create_vpc(
+                    "10.0.10.0/16",
+                    [
+                        test_utils.build_tag("class", "webservices"),
+                        test_utils.build_tag("name", vpc_nm),
+                    ],
+                )
+
+            print(f"{'':10}{'returned':>10}{'seconds':>10}")
+
+            for label, filters in (
+                (
+                    "before",
+                    [
+                        {
+                            "Name": "tag-value",
+                            "Values": [FiltersBenchmark.VPC_NM],
+                        }
+                    ],
+                ),
+                (
+                    "after",
+                    FilterBuilder().name(FiltersBenchmark.VPC_NM).build(),
+                ),
+            ):
+                count, elapsed = filters_benchmark.run(filters)
+
+                print(f"{label:10}{count:>10}{elapsed:>10.2f}")
+    finally:
+        ClientRegistry.clear()
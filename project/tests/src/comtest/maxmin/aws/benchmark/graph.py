@@ -0,0 +1,115 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Measures the wall time of a full startup and shutdown run against moto,
+running the resource graphs with a single worker (before) and with a pool of
+workers (after).
+moto answers in-process, each AWS call is delayed by a fixed latency to
+simulate the round trip to AWS.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.graph
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.constants import DatacenterConstants
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.benchmark.utils import BenchmarkUtils
+
+
+class GraphBenchmark:
+    __test__ = False
+
+    LATENCY = 0.05
+
+    def run(self, max_workers: int, instance_count: int) -> tuple:
+        """
+        Runs startup and shutdown.
+        Returns the elapsed seconds of each.
+        """
+        make_api_call = BaseClient._make_api_call
+        constants_init = DatacenterConstants.__init__
+
+        def delayed_api_call(client, operation_name, api_params):
+            time.sleep(GraphBenchmark.LATENCY)
+            return make_api_call(client, operation_name, api_params)
+
+        def workers_init(constants):
+            constants_init(constants)
+            constants.startup_max_workers = max_workers
+            constants.shutdown_max_workers = max_workers
+
+        ClientRegistry.clear()
+        InventoryDao.disable()
+        BaseClient._make_api_call = delayed_api_call
+        DatacenterConstants.__init__ = workers_init
+
+        try:
+            with mock_aws():
+                utils = BenchmarkUtils()
+                datacenter_config_file = utils.write_datacenter_config(
+                    instance_count
+                )
+                hosted_zone_config_file = utils.write_hosted_zone_config()
+
+                start = time.perf_counter()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+
+                startup_elapsed = time.perf_counter() - start
+                start = time.perf_counter()
+
+                utils.run_script(
+                    BenchmarkUtils.SHUTDOWN_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+
+                shutdown_elapsed = time.perf_counter() - start
+
+                utils.delete_private_key_files(datacenter_config_file)
+        finally:
+            BaseClient._make_api_call = make_api_call
+            DatacenterConstants.__init__ = constants_init
+            InventoryDao.disable()
+            RecordIndexDao.disable()
+            HostedZoneDao.disable()
+            ApiMetrics.disable()
+            ClientRegistry.clear()
+
+        return startup_elapsed, shutdown_elapsed
+
+
+if __name__ == "__main__":
+    graph_benchmark = GraphBenchmark()
+
+    print(
+        f"{'':10}{'instances':>10}{'workers':>10}"
+        f"{'startup':>10}{'shutdown':>10}"
+    )
+
+    for instance_count in (1, 5, 20):
+        for label, max_workers in (("before", 1), ("after", 8)):
+            startup, shutdown = graph_benchmark.run(
+                max_workers, instance_count
+            )
+
+            print(
+                f"{label:10}{instance_count:>10}{max_workers:>10}"
+                f"{startup:>10.2f}{shutdown:>10.2f}"
+            )
@@ -0,0 +1,110 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the Route53 calls and the wall time of 100 lookups of a hosted zone
+in an account with 300 zones, listing all the zones at each lookup (before)
+and starting the listing at the name of the zone, keeping the zone found for
+the rest of the run (after).
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.hosted_zone
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class HostedZoneBenchmark:
+    __test__ = False
+
+    REGISTERED_DOMAIN = "maxmin.it"
+    ZONE_COUNT = 300
+    LOOKUP_COUNT = 100
+
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, cached: bool) -> tuple:
+        """
+        Looks up the hosted zone.
+        Returns the number of Route53 calls and the elapsed seconds.
+        """
+        make_api_call = BaseClient._make_api_call
+        benchmark = self
+
+        def counting_api_call(client, operation_name, api_params):
+            benchmark.calls += 1
+            return make_api_call(client, operation_name, api_params)
+
+        ClientRegistry.clear()
+        HostedZoneDao.disable()
+
+        try:
+            with mock_aws():
+                test_utils = TestUtils()
+
+                for i in range(HostedZoneBenchmark.ZONE_COUNT - 1):
+                    test_utils.create_hosted_zone(f"zone{i}.com")
+
+                hosted_zone_id = test_utils.create_hosted_zone(
+                    HostedZoneBenchmark.REGISTERED_DOMAIN
+                ).get("Id")
+
+                BaseClient._make_api_call = counting_api_call
+                self.calls = 0
+                start = time.perf_counter()
+
+                if cached:
+                    HostedZoneDao.enable()
+                    hosted_zone_service = HostedZoneService()
+
+                    for i in range(HostedZoneBenchmark.LOOKUP_COUNT):
+                        hosted_zone = hosted_zone_service.load_hosted_zone(
+                            HostedZoneBenchmark.REGISTERED_DOMAIN
+                        )
+
+                        assert hosted_zone.hosted_zone_id == hosted_zone_id
+                else:
+                    hosted_zone_dao = HostedZoneDao()
+
+                    for i in range(HostedZoneBenchmark.LOOKUP_COUNT):
+                        hosted_zone_datas = [
+                            h
+                            for h in hosted_zone_dao.load_all()
+                            if h.registered_domain
+                            == HostedZoneBenchmark.REGISTERED_DOMAIN + "."
+                        ]
+
+                        assert (
+                            hosted_zone_datas[0].hosted_zone_id
+                            == hosted_zone_id
+                        )
+
+                elapsed = time.perf_counter() - start
+        finally:
+            BaseClient._make_api_call = make_api_call
+            HostedZoneDao.disable()
+            ClientRegistry.clear()
+
+        return self.calls, elapsed
+
+
+if __name__ == "__main__":
+    hosted_zone_benchmark = HostedZoneBenchmark()
+
+    print(f"{'':10}{'calls':>10}{'seconds':>10}")
+
+    for label, cached in (("before", False), ("after", True)):
+        calls, elapsed = hosted_zone_benchmark.run(cached)
+
+        print(f"{label:10}{calls:>10}{elapsed:>10.2f}")
@@ -0,0 +1,127 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the AWS calls and the wall time of a startup run against moto that
+follows a run failed while creating the DNS records:
+- before: the run goes through all the steps again;
+- after: the run resumes from the journal of the failed run.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.journal
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.datacenter import StartupGraphBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.benchmark.utils import BenchmarkUtils
+
+
+class JournalBenchmark:
+    __test__ = False
+
+    def __init__(self):
+        self.api_calls = 0
+
+    def run(self, journal: bool, instance_count: int) -> tuple:
+        """
+        Runs startup failing on the DNS records, then startup again.
+        Returns the number of AWS calls of the second run and the elapsed
+        seconds.
+        """
+        make_api_call = BaseClient._make_api_call
+        create_dns_records = StartupGraphBuilder.create_dns_records
+        journal_enable = RunJournal.enable
+        benchmark = self
+
+        def counting_api_call(client, operation_name, api_params):
+            benchmark.api_calls += 1
+            return make_api_call(client, operation_name, api_params)
+
+        def failing_create_dns_records(builder):
+            raise AwsException("Route53 not reachable!")
+
+        def disabled_enable(journal_file: str, run_id: str):
+            pass
+
+        ClientRegistry.clear()
+        BaseClient._make_api_call = counting_api_call
+
+        if not journal:
+            RunJournal.enable = staticmethod(disabled_enable)
+
+        try:
+            with mock_aws():
+                utils = BenchmarkUtils()
+                datacenter_config_file = utils.write_datacenter_config(
+                    instance_count
+                )
+                hosted_zone_config_file = utils.write_hosted_zone_config()
+
+                StartupGraphBuilder.create_dns_records = (
+                    failing_create_dns_records
+                )
+
+                try:
+                    utils.run_script(
+                        BenchmarkUtils.STARTUP_SCRIPT,
+                        datacenter_config_file,
+                        hosted_zone_config_file,
+                    )
+                except AwsException:
+                    pass
+
+                StartupGraphBuilder.create_dns_records = create_dns_records
+                InventoryDao.disable()
+                RecordIndexDao.disable()
+                HostedZoneDao.disable()
+                ClientRegistry.clear()
+
+                self.api_calls = 0
+                start = time.perf_counter()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+
+                elapsed = time.perf_counter() - start
+
+                utils.delete_private_key_files(datacenter_config_file)
+        finally:
+            BaseClient._make_api_call = make_api_call
+            StartupGraphBuilder.create_dns_records = create_dns_records
+            RunJournal.enable = journal_enable
+            RunJournal.disable()
+            InventoryDao.disable()
+            RecordIndexDao.disable()
+            HostedZoneDao.disable()
+            ApiMetrics.disable()
+            ClientRegistry.clear()
+
+        return self.api_calls, elapsed
+
+
+if __name__ == "__main__":
+    journal_benchmark = JournalBenchmark()
+
+    print(f"{'':10}{'instances':>10}{'calls':>10}{'seconds':>10}")
+
+    for instance_count in (1, 5):
+        for label, journal in (("before", False), ("after", True)):
+            calls, elapsed = journal_benchmark.run(journal, instance_count)
+
+            print(f"{label:10}{instance_count:>10}{calls:>10}{elapsed:>10.2f}")
@@ -0,0 +1,78 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Measures the wall time of 500 EC2 calls with the API metrics off and on,
+then prints the summary table of the metrics.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.metrics
+"""
+
+import time
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class MetricsBenchmark:
+    __test__ = False
+
+    CALL_COUNT = 500
+
+    def run(self, enabled: bool) -> float:
+        """
+        Makes the calls.
+        Returns the elapsed seconds.
+        """
+        if enabled:
+            ApiMetrics.enable()
+        else:
+            ApiMetrics.disable()
+
+        ec2 = ClientRegistry.get_client("ec2")
+
+        start = time.perf_counter()
+
+        for i in range(MetricsBenchmark.CALL_COUNT):
+            ec2.describe_vpcs()
+
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    metrics_benchmark = MetricsBenchmark()
+
+    ClientRegistry.clear()
+    InventoryDao.disable()
+
+    try:
+        with mock_aws():
+            TestUtils().create_vpc(
+                "10.0.10.0/16", [TestUtils().build_tag("name", "myvpc")]
+            )
+
+            # loads the service model and the endpoint rules
+            metrics_benchmark.run(False)
+
+            print(f"{'':10}{'calls':>10}{'seconds':>10}")
+
+            for label, enabled in (("off", False), ("on", True)):
+                elapsed = metrics_benchmark.run(enabled)
+
+                print(
+                    f"{label:10}{MetricsBenchmark.CALL_COUNT:>10}"
+                    f"{elapsed:>10.2f}"
+                )
+
+            print()
+            ApiMetrics.report()
+    finally:
+        ApiMetrics.disable()
+        ClientRegistry.clear()
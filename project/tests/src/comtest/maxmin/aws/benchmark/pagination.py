@@ -0,0 +1,163 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Measures the instances found, the wall time and the peak memory of the load
+of 10000 instances with the same name, returned by AWS in pages of 1000:
+- before: a single describe request, as the daos did, only the first page
+  is read;
+- list: load_all follows all the pages and builds the list of the
+  instances;
+- stream: iterate_all follows all the pages and yields the instances one at
+  a time.
+moto ignores MaxResults and slows down with the number of resources, so the
+instances are built by moto from a small seed and the pages are replayed to
+the client by a botocore stubber.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.pagination
+"""
+
+import copy
+import time
+import tracemalloc
+
+from botocore.stub import Stubber
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.ec2.dao.domain.instance import InstanceData
+from com.maxmin.aws.ec2.dao.instance import InstanceDao
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from comtest.maxmin.aws.constants import AMI_ID
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class PaginationBenchmark:
+    __test__ = False
+
+    INSTANCE_NM = "bench-box"
+    INSTANCE_COUNT = 10000
+    PAGE_SIZE = 1000
+
+    def build_pages(self) -> list:
+        """
+        Returns the pages of the describe_instances responses.
+        """
+        test_utils = TestUtils()
+
+        test_utils.ec2.run_instances(
+            ImageId=AMI_ID,
+            MinCount=1,
+            MaxCount=1,
+            TagSpecifications=[
+                {
+                    "ResourceType": "instance",
+                    "Tags": [
+                        {
+                            "Key": "name",
+                            "Value": PaginationBenchmark.INSTANCE_NM,
+                        }
+                    ],
+                }
+            ],
+        )
+
+        reservation = test_utils.ec2.describe_instances().get("Reservations")[
+            0
+        ]
+        instance = reservation.get("Instances")[0]
+
+        pages = []
+
+        for i in range(
+            0,
+            PaginationBenchmark.INSTANCE_COUNT,
+            PaginationBenchmark.PAGE_SIZE,
+        ):
+            instances = []
+            for j in range(i, i + PaginationBenchmark.PAGE_SIZE):
+                page_instance = copy.deepcopy(instance)
+                page_instance["InstanceId"] = f"i-{j:017x}"
+                instances.append(page_instance)
+
+            page = {"Reservations": [dict(reservation, Instances=instances)]}
+
+            if i + PaginationBenchmark.PAGE_SIZE < (
+                PaginationBenchmark.INSTANCE_COUNT
+            ):
+                page["NextToken"] = f"token-{i}"
+
+            pages.append(page)
+
+        return pages
+
+    def run(self, mode: str, pages: list) -> tuple:
+        """
+        Loads the instances.
+        Returns the number of instances, the elapsed seconds and the peak of
+        the memory allocated in MB.
+        """
+        instance_dao = InstanceDao()
+
+        with Stubber(instance_dao.ec2) as stubber:
+            for page in pages:
+                stubber.add_response("describe_instances", page)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+
+            if mode == "before":
+                count = 0
+                for reservation in instance_dao.ec2.describe_instances(
+                    Filters=[
+                        {
+                            "Name": "tag-value",
+                            "Values": [PaginationBenchmark.INSTANCE_NM],
+                        },
+                    ],
+                ).get("Reservations"):
+                    count += len(
+                        [
+                            InstanceData.build(instance)
+                            for instance in reservation.get("Instances")
+                        ]
+                    )
+            elif mode == "list":
+                count = len(
+                    instance_dao.load_all(PaginationBenchmark.INSTANCE_NM)
+                )
+            else:
+                count = 0
+                for instance_data in instance_dao.iterate_all(
+                    PaginationBenchmark.INSTANCE_NM
+                ):
+                    count += 1
+
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        return count, elapsed, peak / (1024 * 1024)
+
+
+if __name__ == "__main__":
+    pagination_benchmark = PaginationBenchmark()
+
+    ClientRegistry.clear()
+    InventoryDao.disable()
+
+    try:
+        with mock_aws():
+            pages = pagination_benchmark.build_pages()
+
+            print(f"{'':10}{'instances':>10}{'seconds':>10}{'peak MB':>10}")
+
+            for mode in ("before", "list", "stream"):
+                count, elapsed, peak = pagination_benchmark.run(mode, pages)
+
+                print(f"{mode:10}{count:>10}{elapsed:>10.2f}{peak:>10.1f}")
+    finally:
+        ClientRegistry.clear()
@@ -0,0 +1,111 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the EC2 describe calls and the wall time of startup --plan against
+moto, after a startup, probing AWS for each resource (before) and reading
+the resources with a scan for each type (after).
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.plan
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.benchmark.utils import BenchmarkUtils
+
+
+class PlanBenchmark:
+    __test__ = False
+
+    def __init__(self):
+        self.describe_calls = 0
+
+    def run(self, inventory: bool, instance_count: int) -> tuple:
+        """
+        Runs startup, then startup --plan.
+        Returns the number of describe calls of the plan and the elapsed
+        seconds.
+        """
+        make_api_call = BaseClient._make_api_call
+        inventory_enable = InventoryDao.enable
+        benchmark = self
+
+        def counting_api_call(client, operation_name, api_params):
+            if operation_name.startswith("Describe"):
+                benchmark.describe_calls += 1
+            return make_api_call(client, operation_name, api_params)
+
+        def disabled_enable(ttl: int = None):
+            pass
+
+        ClientRegistry.clear()
+        BaseClient._make_api_call = counting_api_call
+
+        try:
+            with mock_aws():
+                utils = BenchmarkUtils()
+                datacenter_config_file = utils.write_datacenter_config(
+                    instance_count
+                )
+                hosted_zone_config_file = utils.write_hosted_zone_config()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+                InventoryDao.disable()
+                RecordIndexDao.disable()
+
+                if not inventory:
+                    InventoryDao.enable = staticmethod(disabled_enable)
+
+                self.describe_calls = 0
+                start = time.perf_counter()
+
+                try:
+                    utils.run_script(
+                        BenchmarkUtils.STARTUP_SCRIPT,
+                        datacenter_config_file,
+                        hosted_zone_config_file,
+                        "--plan",
+                    )
+                except SystemExit:
+                    pass
+
+                elapsed = time.perf_counter() - start
+
+                utils.delete_private_key_files(datacenter_config_file)
+        finally:
+            BaseClient._make_api_call = make_api_call
+            InventoryDao.enable = inventory_enable
+            InventoryDao.disable()
+            RecordIndexDao.disable()
+            HostedZoneDao.disable()
+            ApiMetrics.disable()
+            ClientRegistry.clear()
+
+        return self.describe_calls, elapsed
+
+
+if __name__ == "__main__":
+    plan_benchmark = PlanBenchmark()
+
+    print(f"{'':10}{'instances':>10}{'describes':>10}{'seconds':>10}")
+
+    for instance_count in (1, 5):
+        for label, inventory in (("before", False), ("after", True)):
+            calls, elapsed = plan_benchmark.run(inventory, instance_count)
+
+            print(f"{label:10}{instance_count:>10}{calls:>10}{elapsed:>10.2f}")
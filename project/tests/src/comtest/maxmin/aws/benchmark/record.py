@@ -0,0 +1,115 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the Route53 calls and the wall time of the lookup of the DNS records
+of 100 instances in a hosted zone with 2000 other records, fetching the
+single record at each lookup (before) and answering the lookups from the
+index of the zone (after).
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.record
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.route53.dao.domain.record import RecordData
+from com.maxmin.aws.route53.dao.record import RecordDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class RecordBenchmark:
+    __test__ = False
+
+    REGISTERED_DOMAIN = "maxmin.it"
+    INSTANCE_COUNT = 100
+    OTHER_COUNT = 2000
+
+    def __init__(self):
+        self.calls = {}
+
+    def run(self, index: bool) -> tuple:
+        """
+        Looks up the records of the instances.
+        Returns the number of Route53 calls by operation and the elapsed
+        seconds.
+        """
+        make_api_call = BaseClient._make_api_call
+        benchmark = self
+
+        def counting_api_call(client, operation_name, api_params):
+            benchmark.calls[operation_name] = (
+                benchmark.calls.get(operation_name, 0) + 1
+            )
+            return make_api_call(client, operation_name, api_params)
+
+        ClientRegistry.clear()
+        RecordIndexDao.disable()
+
+        try:
+            with mock_aws():
+                hosted_zone_id = (
+                    TestUtils()
+                    .create_hosted_zone(RecordBenchmark.REGISTERED_DOMAIN)
+                    .get("Id")
+                )
+
+                changes = []
+                for i in range(
+                    RecordBenchmark.INSTANCE_COUNT
+                    + RecordBenchmark.OTHER_COUNT
+                ):
+                    record_data = RecordData()
+                    record_data.dns_nm = (
+                        f"box{i}.{RecordBenchmark.REGISTERED_DOMAIN}"
+                    )
+                    record_data.ip_address = f"10.0.{i // 250}.{i % 250}"
+                    changes.append((RecordDao.CREATE, record_data))
+
+                RecordDao().change_all(hosted_zone_id, changes)
+
+                if index:
+                    RecordIndexDao.enable()
+
+                BaseClient._make_api_call = counting_api_call
+                self.calls = {}
+                hosted_zone_service = HostedZoneService()
+                start = time.perf_counter()
+
+                for i in range(RecordBenchmark.INSTANCE_COUNT):
+                    record = hosted_zone_service.load_record(
+                        f"box{i}.{RecordBenchmark.REGISTERED_DOMAIN}",
+                        RecordBenchmark.REGISTERED_DOMAIN,
+                    )
+
+                    assert record is not None
+
+                elapsed = time.perf_counter() - start
+        finally:
+            BaseClient._make_api_call = make_api_call
+            RecordIndexDao.disable()
+            ClientRegistry.clear()
+
+        return self.calls, elapsed
+
+
+if __name__ == "__main__":
+    record_benchmark = RecordBenchmark()
+
+    print(f"{'':10}{'zones':>10}{'records':>10}{'seconds':>10}")
+
+    for label, index in (("before", False), ("after", True)):
+        calls, elapsed = record_benchmark.run(index)
+
+        print(
+            f"{label:10}{calls.get('ListHostedZonesByName', 0):>10}"
+            f"{calls.get('ListResourceRecordSets', 0):>10}{elapsed:>10.2f}"
+        )
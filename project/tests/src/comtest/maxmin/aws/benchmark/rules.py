@@ -0,0 +1,116 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the EC2 calls and the wall time of the creation of 50 inbound rules
+of a security group, loading and creating one rule at a time (before) and
+synchronizing all the rules of the group at once (after).
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.rules
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.ec2.service.domain.security_group import CidrRule
+from com.maxmin.aws.ec2.service.security_group import SecurityGroupService
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class RulesBenchmark:
+    __test__ = False
+
+    RULE_COUNT = 50
+
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, synchronized: bool) -> tuple:
+        """
+        Creates the rules.
+        Returns the number of EC2 calls and the elapsed seconds.
+        """
+        make_api_call = BaseClient._make_api_call
+        benchmark = self
+
+        def counting_api_call(client, operation_name, api_params):
+            benchmark.calls += 1
+            return make_api_call(client, operation_name, api_params)
+
+        ClientRegistry.clear()
+
+        try:
+            with mock_aws():
+                test_utils = TestUtils()
+
+                vpc_id = test_utils.create_vpc(
+                    "10.0.10.0/16", [test_utils.build_tag("name", "myvpc")]
+                ).get("VpcId")
+
+                test_utils.create_security_group(
+                    "mysecuritygroup",
+                    "my security group",
+                    vpc_id,
+                    [test_utils.build_tag("name", "mysecuritygroup")],
+                )
+
+                cidr_rules = []
+                for port in range(8000, 8000 + RulesBenchmark.RULE_COUNT):
+                    cidr_rule = CidrRule()
+                    cidr_rule.from_port = port
+                    cidr_rule.to_port = port
+                    cidr_rule.protocol = "tcp"
+                    cidr_rule.granted_cidr = "0.0.0.0/0"
+                    cidr_rule.description = f"port {port}"
+                    cidr_rules.append(cidr_rule)
+
+                BaseClient._make_api_call = counting_api_call
+                self.calls = 0
+                security_group_service = SecurityGroupService()
+                start = time.perf_counter()
+
+                if synchronized:
+                    security_group_service.synchronize_rules(
+                        "mysecuritygroup", cidr_rules, []
+                    )
+                else:
+                    for cidr_rule in cidr_rules:
+                        if not security_group_service.load_cidr_rule(
+                            "mysecuritygroup",
+                            cidr_rule.from_port,
+                            cidr_rule.to_port,
+                            cidr_rule.protocol,
+                            cidr_rule.granted_cidr,
+                        ):
+                            security_group_service.create_cidr_rule(
+                                "mysecuritygroup",
+                                cidr_rule.from_port,
+                                cidr_rule.to_port,
+                                cidr_rule.protocol,
+                                cidr_rule.granted_cidr,
+                                cidr_rule.description,
+                            )
+
+                elapsed = time.perf_counter() - start
+        finally:
+            BaseClient._make_api_call = make_api_call
+            ClientRegistry.clear()
+
+        return self.calls, elapsed
+
+
+if __name__ == "__main__":
+    rules_benchmark = RulesBenchmark()
+
+    print(f"{'':10}{'calls':>10}{'seconds':>10}")
+
+    for label, synchronized in (("before", False), ("after", True)):
+        calls, elapsed = rules_benchmark.run(synchronized)
+
+        print(f"{label:10}{calls:>10}{elapsed:>10.2f}")
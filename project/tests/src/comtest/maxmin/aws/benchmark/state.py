@@ -0,0 +1,156 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Counts the EC2 describe calls, the resources they return and the wall time
+of a second startup run against moto, in an account with 200 VPCs of other
+projects, each one with a subnet, a route table and a security group:
+- before: the inventory scans each type of resource;
+- after: the inventory checks the identifiers recorded in the state by the
+  first run.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.state
+"""
+
+import time
+
+import boto3
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.dao.state import StateDao
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.benchmark.utils import BenchmarkUtils
+
+
+class StateBenchmark:
+    __test__ = False
+
+    OTHER_VPC_COUNT = 200
+
+    def __init__(self):
+        self.describe_calls = 0
+        self.described = 0
+
+    def create_other_vpcs(self) -> None:
+        ec2 = boto3.client("ec2")
+
+        for i in range(StateBenchmark.OTHER_VPC_COUNT):
+            tags = [
+                {
+                    "ResourceType": resource_type,
+                    "Tags": [{"Key": "name", "Value": f"other-{i}"}],
+                }
+                for resource_type in ("vpc", "subnet", "security-group")
+            ]
+            vpc_id = (
+                ec2.create_vpc(
+                    CidrBlock="172.16.0.0/16", TagSpecifications=[tags[0]]
+                )
+                .get("Vpc")
+                .get("VpcId")
+            )
+            ec2.create_subnet(
+                VpcId=vpc_id,
+                CidrBlock="172.16.1.0/24",
+                TagSpecifications=[tags[1]],
+            )
+            ec2.create_security_group(
+                GroupName=f"other-{i}",
+                Description="other",
+                VpcId=vpc_id,
+                TagSpecifications=[tags[2]],
+            )
+
+    def run(self, state: bool) -> tuple:
+        """
+        Runs startup twice.
+        Returns the number of describe calls of the second run, the
+        resources they return and the elapsed seconds.
+        """
+        make_api_call = BaseClient._make_api_call
+        state_enable = StateDao.enable
+        benchmark = self
+
+        def counting_api_call(client, operation_name, api_params):
+            response = make_api_call(client, operation_name, api_params)
+
+            if operation_name.startswith("Describe"):
+                benchmark.describe_calls += 1
+
+                for key, value in response.items():
+                    if key == "Reservations":
+                        for reservation in value:
+                            benchmark.described += len(
+                                reservation.get("Instances")
+                            )
+                    elif isinstance(value, list):
+                        benchmark.described += len(value)
+
+            return response
+
+        def disabled_enable(state_file: str):
+            pass
+
+        ClientRegistry.clear()
+        BaseClient._make_api_call = counting_api_call
+
+        if not state:
+            StateDao.enable = staticmethod(disabled_enable)
+
+        try:
+            with mock_aws():
+                utils = BenchmarkUtils()
+                datacenter_config_file = utils.write_datacenter_config(3)
+                hosted_zone_config_file = utils.write_hosted_zone_config()
+                self.create_other_vpcs()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+                ClientRegistry.clear()
+
+                self.describe_calls = 0
+                self.described = 0
+                start = time.perf_counter()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+
+                elapsed = time.perf_counter() - start
+
+                utils.delete_private_key_files(datacenter_config_file)
+        finally:
+            BaseClient._make_api_call = make_api_call
+            StateDao.enable = state_enable
+            StateDao.disable()
+            InventoryDao.disable()
+            RecordIndexDao.disable()
+            HostedZoneDao.disable()
+            ApiMetrics.disable()
+            ClientRegistry.clear()
+
+        return self.describe_calls, self.described, elapsed
+
+
+if __name__ == "__main__":
+    state_benchmark = StateBenchmark()
+
+    print(f"{'':10}{'describes':>10}{'resources':>10}{'seconds':>10}")
+
+    for label, state in (("before", False), ("after", True)):
+        calls, described, elapsed = state_benchmark.run(state)
+
+        print(f"{label:10}{calls:>10}{described:>10}{elapsed:>10.2f}")
@@ -0,0 +1,109 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Runs startup against moto with the tracer on, writes the Chrome trace of the
+run to datacenter-trace.json in the current directory and prints the graph
+nodes and the waiters by elapsed time.
+moto answers in-process, each AWS call is delayed by a fixed latency to
+simulate the round trip to AWS.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.trace
+"""
+
+import time
+
+from botocore.client import BaseClient
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.metrics import ApiMetrics
+from com.maxmin.aws.base.trace import Tracer
+from com.maxmin.aws.constants import DatacenterConstants
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.benchmark.utils import BenchmarkUtils
+
+
+class TraceBenchmark:
+    __test__ = False
+
+    LATENCY = 0.05
+    INSTANCE_COUNT = 5
+    TRACE_FILE = "datacenter-trace.json"
+
+    def run(self) -> dict:
+        """
+        Runs startup.
+        Returns the trace of the run.
+        """
+        make_api_call = BaseClient._make_api_call
+        constants_init = DatacenterConstants.__init__
+
+        def delayed_api_call(client, operation_name, api_params):
+            time.sleep(TraceBenchmark.LATENCY)
+            return make_api_call(client, operation_name, api_params)
+
+        def trace_init(constants):
+            constants_init(constants)
+            constants.trace_enabled = True
+
+        ClientRegistry.clear()
+        InventoryDao.disable()
+        BaseClient._make_api_call = delayed_api_call
+        DatacenterConstants.__init__ = trace_init
+
+        try:
+            with mock_aws():
+                utils = BenchmarkUtils()
+                datacenter_config_file = utils.write_datacenter_config(
+                    TraceBenchmark.INSTANCE_COUNT
+                )
+                hosted_zone_config_file = utils.write_hosted_zone_config()
+
+                utils.run_script(
+                    BenchmarkUtils.STARTUP_SCRIPT,
+                    datacenter_config_file,
+                    hosted_zone_config_file,
+                )
+
+                Tracer.export(TraceBenchmark.TRACE_FILE)
+                trace = Tracer.to_dictionary()
+
+                utils.delete_private_key_files(datacenter_config_file)
+        finally:
+            BaseClient._make_api_call = make_api_call
+            DatacenterConstants.__init__ = constants_init
+            Tracer.disable()
+            InventoryDao.disable()
+            RecordIndexDao.disable()
+            HostedZoneDao.disable()
+            ApiMetrics.disable()
+            ClientRegistry.clear()
+
+        return trace
+
+
+if __name__ == "__main__":
+    trace = TraceBenchmark().run()
+
+    spans = [
+        event
+        for event in trace.get("traceEvents")
+        if event.get("cat") in (Tracer.NODE, Tracer.WAITER)
+    ]
+    lanes = {event.get("tid") for event in spans}
+
+    print(f"{len(spans)} spans on {len(lanes)} threads")
+    print(f"{'':50}{'start':>10}{'seconds':>10}")
+
+    for event in sorted(spans, key=lambda event: -event.get("dur"))[:15]:
+        print(
+            f"{event.get('cat') + ' ' + event.get('name'):50}"
+            f"{event.get('ts') / 1000000:>10.2f}"
+            f"{event.get('dur') / 1000000:>10.2f}"
+        )
@@ -0,0 +1,137 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import contextlib
+import io
+import json
+import os
+import runpy
+import sys
+import tempfile
+
+import boto3
+
+import com.maxmin.aws
+from com.maxmin.aws.base.journal import RunJournal
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.ec2.dao.state import StateDao
+from comtest.maxmin.aws.constants import AMI_NAME
+
+
+class BenchmarkUtils:
+    """
+    Utilities methods to run the startup and shutdown scripts against moto.
+    The methods must be called inside a moto mock.
+    """
+
+    __test__ = False
+
+    SCRIPTS_DIR = os.path.dirname(com.maxmin.aws.__file__)
+    STARTUP_SCRIPT = os.path.join(SCRIPTS_DIR, "startup.py")
+    SHUTDOWN_SCRIPT = os.path.join(SCRIPTS_DIR, "shutdown.py")
+
+    def __init__(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def write_datacenter_config(self, instance_count: int = 1) -> str:
+        """
+        Writes a datacenter configuration file based on config/datacenter.json
+        with instance_count instances booting from an image known by moto.
+        Returns the path of the file.
+        """
+        config_file = os.path.join(
+            ProjectDirectories.CONFIG_DIR, "datacenter.json"
+        )
+        with open(config_file, "r") as file:
+            config = json.load(file)
+
+        template = config["Datacenter"]["Instances"][0]
+        instances = []
+
+        for i in range(instance_count):
+            instance = json.loads(json.dumps(template))
+            instance["Name"] = f"{template['Name']}-{i}"
+            instance["PrivateIp"] = f"10.0.20.{10 + i}"
+            instance["DnsDomain"] = f"box{i}.{template['DnsDomain']}"
+            instance["ParentImage"] = AMI_NAME
+            instances.append(instance)
+
+        config["Datacenter"]["Instances"] = instances
+
+        datacenter_config_file = os.path.join(self.work_dir, "datacenter.json")
+        with open(datacenter_config_file, "w") as file:
+            json.dump(config, file)
+
+        return datacenter_config_file
+
+    def write_hosted_zone_config(self) -> str:
+        """
+        Creates the hosted zone in config/hostedzone.json.
+        Returns the path of the configuration file.
+        """
+        config_file = os.path.join(
+            ProjectDirectories.CONFIG_DIR, "hostedzone.json"
+        )
+        with open(config_file, "r") as file:
+            config = json.load(file)
+
+        boto3.client("route53").create_hosted_zone(
+            Name=config["HostedZone"]["RegisteredDomain"],
+            CallerReference=self.work_dir,
+        )
+
+        return config_file
+
+    def delete_private_key_files(self, datacenter_config_file: str) -> None:
+        """
+        Deletes the private key files written by the startup script.
+        """
+        with open(datacenter_config_file, "r") as file:
+            config = json.load(file)
+
+        for instance in config["Datacenter"]["Instances"]:
+            private_key_file = os.path.join(
+                ProjectDirectories.ACCESS_DIR, instance["Name"]
+            )
+
+            if os.path.isfile(private_key_file):
+                os.remove(private_key_file)
+
+    def run_script(
+        self,
+        script: str,
+        datacenter_config_file: str,
+        hosted_zone_config_file: str,
+        *options: str,
+    ) -> str:
+        """
+        Runs the startup or shutdown script as the main module, with the
+        state of the EC2 resources and the run journal in the work
+        directory, the state saved when the script ends.
+        Returns the script standard output.
+        """
+        argv = sys.argv
+        state_dir = ProjectDirectories.STATE_DIR
+        ProjectDirectories.STATE_DIR = self.work_dir
+        sys.argv = [
+            script,
+            datacenter_config_file,
+            hosted_zone_config_file,
+            *options,
+        ]
+        output = io.StringIO()
+
+        try:
+            with contextlib.redirect_stdout(output):
+                runpy.run_path(script, run_name="__main__")
+        finally:
+            sys.argv = argv
+            ProjectDirectories.STATE_DIR = state_dir
+            StateDao.save()
+            StateDao.disable()
+            RunJournal.disable()
+
+        return output.getvalue()
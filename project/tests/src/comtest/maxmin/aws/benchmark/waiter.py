@@ -0,0 +1,120 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Measures the wall time and the describe calls of 20 threads each waiting
+for a VPC to become available, the VPCs turning available between 0.5 and
+2.5 seconds after the start:
+- before: the botocore waiter, polling every VpcAvailable delay;
+- adaptive: the adaptive waiter, exponential delays with jitter, each
+  thread polling its own VPC;
+- multiplexed: the adaptive waiter, the threads sharing their describe
+  calls.
+The delays of the waiters are scaled down by 5 to keep the run short, the
+describe calls are answered by a fake clock-driven AWS.
+
+run:
+
+./benchmark.sh comtest.maxmin.aws.benchmark.waiter
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.client import BaseClient
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.dao.waiter import AdaptiveWaiter, WaiterSchedule
+
+
+class WaiterBenchmark:
+    __test__ = False
+
+    VPC_COUNT = 20
+    SCALE = 5
+    LATENCY = 0.05
+
+    def run(self, mode: str) -> tuple:
+        """
+        Waits for the VPCs.
+        Returns the elapsed seconds and the number of describe calls.
+        """
+        make_api_call = BaseClient._make_api_call
+        lock = threading.Lock()
+        calls = []
+
+        random.seed(13)
+        start = time.monotonic()
+        ready_at = {
+            f"vpc-{i:08x}": start + random.uniform(0.5, 2.5)
+            for i in range(WaiterBenchmark.VPC_COUNT)
+        }
+
+        def fake_api_call(client, operation_name, api_params):
+            time.sleep(WaiterBenchmark.LATENCY)
+
+            with lock:
+                calls.append(operation_name)
+
+            now = time.monotonic()
+
+            return {
+                "Vpcs": [
+                    {
+                        "VpcId": vpc_id,
+                        "State": (
+                            "available"
+                            if now >= ready_at[vpc_id]
+                            else "pending"
+                        ),
+                    }
+                    for vpc_id in api_params.get("VpcIds")
+                ]
+            }
+
+        ClientRegistry.clear()
+        BaseClient._make_api_call = fake_api_call
+
+        try:
+            ec2 = ClientRegistry.get_client("ec2")
+            delay = ec2.get_waiter("vpc_available").config.delay
+            schedule = WaiterSchedule(
+                first_delay=1 / WaiterBenchmark.SCALE,
+                max_delay=15 / WaiterBenchmark.SCALE,
+                multiplexed=mode == "multiplexed",
+            )
+
+            def wait(vpc_id: str) -> None:
+                if mode == "before":
+                    ec2.get_waiter("vpc_available").wait(
+                        VpcIds=[vpc_id],
+                        WaiterConfig={"Delay": delay / WaiterBenchmark.SCALE},
+                    )
+                else:
+                    AdaptiveWaiter(ec2, "vpc_available", schedule).wait(
+                        VpcIds=[vpc_id]
+                    )
+
+            with ThreadPoolExecutor(WaiterBenchmark.VPC_COUNT) as executor:
+                list(executor.map(wait, ready_at))
+
+            elapsed = time.monotonic() - start
+        finally:
+            BaseClient._make_api_call = make_api_call
+            ClientRegistry.clear()
+
+        return elapsed, len(calls)
+
+
+if __name__ == "__main__":
+    waiter_benchmark = WaiterBenchmark()
+
+    print(f"{'':12}{'seconds':>10}{'calls':>10}")
+
+    for mode in ("before", "adaptive", "multiplexed"):
+        elapsed, calls = waiter_benchmark.run(mode)
+
+        print(f"{mode:12}{elapsed:>10.2f}{calls:>10}")
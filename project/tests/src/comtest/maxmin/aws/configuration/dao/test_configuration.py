@@ -123,6 +123,7 @@ class ConfigurationDaoTestCase(unittest.TestCase):
         assert datacenter_config.instances[0].target_img == "my-new-image"
         assert datacenter_config.instances[0].dns_domain == "admin.maxmin.it"
         assert datacenter_config.instances[0].host_name == "host.maxmin.it"
+        assert datacenter_config.instances[0].readiness == "ssh_reachable"
 
         assert datacenter_config.instances[0].tags[0].key == "Class"
         assert datacenter_config.instances[0].tags[0].value == "webservices"
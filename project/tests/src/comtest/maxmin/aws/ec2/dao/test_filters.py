@@ -0,0 +1,70 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import unittest
+
+from com.maxmin.aws.ec2.dao.filters import FilterBuilder
+
+
+class FilterBuilderTestCase(unittest.TestCase):
+    def test_build(self):
+        # run the test
+        filters = (
+            FilterBuilder()
+            .name("myinstance")
+            .vpc("vpc-12345")
+            .state("instance-state-name", ["pending", "running"])
+            .build()
+        )
+
+        assert filters == [
+            {"Name": "tag:name", "Values": ["myinstance"]},
+            {"Name": "vpc-id", "Values": ["vpc-12345"]},
+            {"Name": "instance-state-name", "Values": ["pending", "running"]},
+        ]
+
+    def test_build_without_values(self):
+        # run the test
+        filters = (
+            FilterBuilder()
+            .name("myvpc")
+            .vpc(None)
+            .state("state", None)
+            .build()
+        )
+
+        assert filters == [{"Name": "tag:name", "Values": ["myvpc"]}]
+
+    def test_matches_tag(self):
+        filter_builder = FilterBuilder().name("myvpc")
+
+        # run the test
+        assert filter_builder.matches(
+            {"Tags": [{"Key": "name", "Value": "myvpc"}]}
+        )
+        assert not filter_builder.matches(
+            {"Tags": [{"Key": "class", "Value": "myvpc"}]}
+        )
+        assert not filter_builder.matches({})
+
+    def test_matches_vpc_and_state(self):
+        filter_builder = (
+            FilterBuilder()
+            .vpc("vpc-12345")
+            .state("instance-state-name", ["pending", "running"])
+        )
+
+        # run the test
+        assert filter_builder.matches(
+            {"VpcId": "vpc-12345", "State": {"Name": "running"}}
+        )
+        assert not filter_builder.matches(
+            {"VpcId": "vpc-12345", "State": {"Name": "terminated"}}
+        )
+        assert not filter_builder.matches(
+            {"VpcId": "vpc-67890", "State": {"Name": "running"}}
+        )
+        assert not filter_builder.matches({"VpcId": "vpc-12345"})
@@ -4,11 +4,16 @@ Created on Mar 28, 2023
 @author: vagrant
 """
 
+import base64
+import os
+import tempfile
 import unittest
 
 from moto import mock_aws
 from pytest import fail
 
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.journal import RunJournal
 from com.maxmin.aws.ec2.dao.domain.instance import InstanceData
 from com.maxmin.aws.ec2.dao.domain.tag import TagData
 from com.maxmin.aws.ec2.dao.instance import InstanceDao
@@ -159,6 +164,188 @@ class InstanceDaoTestCase(unittest.TestCase):
 
         assert len(instances) == 2
 
+    @mock_aws
+    def test_create_all_instances(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id, subnet_tags
+        ).get("SubnetId")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP1", "my security group", vpc_id, security_group_tags
+        ).get("GroupId")
+
+        instance_datas = []
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+            ("myinstance3", "10.0.10.12"),
+            ("myinstance4", "10.0.10.13"),
+        ]:
+            instance_data = InstanceData()
+            instance_data.image_id = AMI_ID
+            instance_data.security_group_ids.append(security_group_id)
+            instance_data.subnet_id = subnet_id
+            instance_data.private_ip = private_ip
+            instance_data.cloud_init_data = "ENCODED CLOUD INIT DATA"
+            instance_data.tags.append(TagData("name", instance_nm))
+            instance_datas.append(instance_data)
+
+        # run the test
+        identifiers = self.instance_dao.create_all(instance_datas)
+
+        assert len(identifiers) == 4
+
+        for index, (instance_nm, private_ip) in enumerate(
+            [
+                ("myinstance1", "10.0.10.10"),
+                ("myinstance2", "10.0.10.11"),
+                ("myinstance3", "10.0.10.12"),
+                ("myinstance4", "10.0.10.13"),
+            ]
+        ):
+            instances = self.test_utils.describe_instances(instance_nm)
+
+            assert len(instances) == 1
+            assert instances[0].get("PrivateIpAddress") == private_ip
+            assert instances[0].get("State").get("Name") == "running"
+            # in the order of the instances
+            assert instances[0].get("InstanceId") == identifiers[index]
+
+    @mock_aws
+    def test_create_all_instances_empty(self):
+        # run the test
+        identifiers = self.instance_dao.create_all([])
+
+        assert identifiers == []
+
+    @mock_aws
+    def test_create_all_instances_not_existing_subnet(self):
+        instance_data = InstanceData()
+        instance_data.image_id = AMI_ID
+        instance_data.subnet_id = "subnet-1234"
+        instance_data.private_ip = "10.0.10.10"
+        instance_data.tags.append(TagData("name", "myinstance"))
+
+        try:
+            # run the test
+            self.instance_dao.create_all([instance_data])
+
+            fail("ERROR: an exception should have been thrown!")
+
+        except AwsDaoException as e:
+            assert str(e) == "Error creating the instances!"
+        except Exception:
+            fail("ERROR: an AwsDaoException should have been raised!")
+
+    @mock_aws
+    def test_wait_all_instances(self):
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        ).get("VpcId")
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a",
+            "10.0.10.0/25",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysubnet")],
+        ).get("SubnetId")
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP1",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysecuritygroup")],
+        ).get("GroupId")
+
+        instance_datas = []
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+        ]:
+            instance_tags = []
+            instance_tags.append(
+                self.test_utils.build_tag("name", instance_nm)
+            )
+
+            instance_data = InstanceData()
+            instance_data.instance_id = self.test_utils.create_instance(
+                AMI_ID,
+                security_group_id,
+                subnet_id,
+                private_ip,
+                "ENCODED CLOUD INIT DATA",
+                instance_tags,
+            ).get("InstanceId")
+            instance_datas.append(instance_data)
+
+        # run the test
+        self.instance_dao.wait_all(instance_datas, "instance_running")
+
+        for instance_nm in ["myinstance1", "myinstance2"]:
+            response = self.test_utils.describe_instances(instance_nm)
+
+            assert response[0].get("State").get("Name") == "running"
+
+    @mock_aws
+    def test_wait_all_terminated_instances(self):
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        ).get("VpcId")
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a",
+            "10.0.10.0/25",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysubnet")],
+        ).get("SubnetId")
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP1",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysecuritygroup")],
+        ).get("GroupId")
+
+        instance_data = InstanceData()
+        instance_data.instance_id = self.test_utils.create_instance(
+            AMI_ID,
+            security_group_id,
+            subnet_id,
+            "10.0.10.10",
+            "ENCODED CLOUD INIT DATA",
+            [self.test_utils.build_tag("name", "myinstance")],
+        ).get("InstanceId")
+
+        self.instance_dao.delete(instance_data)
+
+        try:
+            # run the test
+            self.instance_dao.wait_all([instance_data], "instance_running")
+
+            fail("ERROR: an exception should have been thrown!")
+
+        except AwsDaoException as e:
+            assert str(e) == "Error waiting for the instances!"
+        except Exception:
+            fail("ERROR: an AwsDaoException should have been raised!")
+
     @mock_aws
     def test_delete_instance(self):
         vpc_tags = []
@@ -218,6 +405,64 @@ class InstanceDaoTestCase(unittest.TestCase):
 
         assert response[0].get("State").get("Name") == "terminated"
 
+    @mock_aws
+    def test_delete_all_instances(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("class", "webservices"))
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id, subnet_tags
+        ).get("SubnetId")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP1", "my security group", vpc_id, security_group_tags
+        ).get("GroupId")
+
+        instance_datas = []
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+        ]:
+            instance_tags = []
+            instance_tags.append(
+                self.test_utils.build_tag("name", instance_nm)
+            )
+
+            instance_data = InstanceData()
+            instance_data.instance_id = self.test_utils.create_instance(
+                AMI_ID,
+                security_group_id,
+                subnet_id,
+                private_ip,
+                "ENCODED CLOUD INIT DATA",
+                instance_tags,
+            ).get("InstanceId")
+            instance_datas.append(instance_data)
+
+        # run the test
+        self.instance_dao.delete_all(instance_datas)
+
+        for instance_nm in ["myinstance1", "myinstance2"]:
+            response = self.test_utils.describe_instances(instance_nm)
+
+            assert len(response) == 1
+            assert response[0].get("State").get("Name") == "terminated"
+
     @mock_aws
     def test_delete_not_existing_instance(self):
         instance_data = InstanceData()
@@ -552,3 +797,91 @@ class InstanceDaoTestCase(unittest.TestCase):
         instance_datas = self.instance_dao.load_all("myinstance")
 
         assert len(instance_datas) == 0
+
+
+class InstanceDaoJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.journal_dir = tempfile.TemporaryDirectory()
+        self.journal_file = os.path.join(self.journal_dir.name, "journal.json")
+        RunJournal.enable(self.journal_file, "run1")
+        self.test_utils = TestUtils()
+        self.instance_dao = InstanceDao()
+        self.run_requests = []
+
+        ClientRegistry.get_client("ec2").meta.events.register(
+            "before-parameter-build.ec2.RunInstances", self.count_run_requests
+        )
+
+    def tearDown(self):
+        RunJournal.disable()
+        ClientRegistry.clear()
+        self.journal_dir.cleanup()
+
+    def count_run_requests(self, params, **kwargs):
+        # the user data is already encoded
+        self.run_requests.append(
+            (
+                params.get("ClientToken"),
+                base64.b64decode(params.get("UserData")).decode(),
+            )
+        )
+
+    def build_instance_data(self, cloud_init_data) -> InstanceData:
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        ).get("VpcId")
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a",
+            "10.0.10.0/25",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysubnet")],
+        ).get("SubnetId")
+
+        instance_data = InstanceData()
+        instance_data.image_id = AMI_ID
+        instance_data.subnet_id = subnet_id
+        instance_data.cloud_init_data = cloud_init_data
+        instance_data.tags.append(TagData("name", "myinstance"))
+
+        return instance_data
+
+    @mock_aws
+    def test_create_all_instances_resumed(self):
+        instance_data = self.build_instance_data(b"CLOUD INIT DATA 1")
+        identifiers = self.instance_dao.create_all([instance_data], None)
+
+        # the next run builds the user data with a new salt
+        RunJournal.disable()
+        RunJournal.enable(self.journal_file, "run1")
+        instance_data.cloud_init_data = b"CLOUD INIT DATA 2"
+
+        # run the test
+        self.instance_dao.create_all([instance_data], None)
+
+        token = self.run_requests[0][0]
+
+        assert token
+        assert self.run_requests == [
+            (token, "CLOUD INIT DATA 1"),
+            (token, "CLOUD INIT DATA 1"),
+        ]
+        launch = RunJournal.get_operation(
+            f"launch:{self.instance_dao.ec2.meta.region_name}:myinstance:1"
+        )
+
+        assert launch.get("token") == token
+        assert launch.get("user_data") == "CLOUD INIT DATA 1"
+        # moto doesn't check the token, AWS returns the first instance
+        assert len(launch.get("instance_ids")) == 1
+        assert len(identifiers) == 1
+
+    @mock_aws
+    def test_create_all_instances_journal_disabled(self):
+        RunJournal.disable()
+        instance_data = self.build_instance_data("CLOUD INIT DATA")
+
+        # run the test
+        self.instance_dao.create_all([instance_data], None)
+
+        assert self.run_requests == [(None, "CLOUD INIT DATA")]
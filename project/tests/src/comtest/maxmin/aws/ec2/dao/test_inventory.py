@@ -0,0 +1,244 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import unittest
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.ec2.dao.domain.security_group import (
+    CidrRuleData,
+    IpRangeData,
+)
+from com.maxmin.aws.ec2.dao.domain.tag import TagData
+from com.maxmin.aws.ec2.dao.domain.vpc import VpcData
+from com.maxmin.aws.ec2.dao.image import ImageDao
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.dao.security_group import CidrRuleDao
+from com.maxmin.aws.ec2.dao.vpc import VpcDao
+from comtest.maxmin.aws.constants import AMI_ID
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class InventoryDaoTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        InventoryDao.enable(60)
+        self.test_utils = TestUtils()
+        self.vpc_dao = VpcDao()
+        self.cidr_rule_dao = CidrRuleDao()
+        self.describe_calls = []
+
+        ClientRegistry.get_client("ec2").meta.events.register(
+            "before-call.ec2.*", self.count_describe_calls
+        )
+
+    def tearDown(self):
+        InventoryDao.disable()
+        ClientRegistry.clear()
+
+    def count_describe_calls(self, model, **kwargs):
+        if model.name.startswith("Describe"):
+            self.describe_calls.append(model.name)
+
+    def create_vpc(self, vpc_nm: str) -> str:
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", vpc_nm))
+
+        return self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+    @mock_aws
+    def test_load_all_vpcs_from_inventory(self):
+        vpc_id = self.create_vpc("myvpc")
+
+        # run the test
+        vpcs = self.vpc_dao.load_all("myvpc")
+        vpcs_again = self.vpc_dao.load_all("myvpc")
+
+        assert len(vpcs) == 1
+        assert vpcs[0].vpc_id == vpc_id
+        assert vpcs[0].cidr == "10.0.10.0/16"
+        assert len(vpcs_again) == 1
+        assert vpcs_again[0].vpc_id == vpc_id
+        assert self.describe_calls == ["DescribeVpcs"]
+
+    @mock_aws
+    def test_load_all_vpcs_by_state_from_inventory(self):
+        self.create_vpc("myvpc")
+
+        # run the test
+        available_vpcs = self.vpc_dao.load_all("myvpc", ["available"])
+        pending_vpcs = self.vpc_dao.load_all("myvpc", ["pending"])
+
+        assert len(available_vpcs) == 1
+        assert len(pending_vpcs) == 0
+        assert self.describe_calls == ["DescribeVpcs"]
+
+    @mock_aws
+    def test_load_all_vpcs_from_inventory_by_region(self):
+        vpc_id = self.create_vpc("myvpc")
+
+        # run the test
+        vpcs = self.vpc_dao.load_all("myvpc")
+
+        with ClientRegistry.region("us-east-1"):
+            vpcs_us = VpcDao().load_all("myvpc")
+
+        assert [vpc.vpc_id for vpc in vpcs] == [vpc_id]
+        assert vpcs_us == []
+
+    @mock_aws
+    def test_load_vpc_from_inventory(self):
+        vpc_id = self.create_vpc("myvpc")
+
+        self.vpc_dao.load_all("myvpc")
+
+        # run the test
+        vpc = self.vpc_dao.load(vpc_id)
+
+        assert vpc.vpc_id == vpc_id
+        assert self.describe_calls == ["DescribeVpcs"]
+
+    @mock_aws
+    def test_load_vpc_not_in_inventory(self):
+        self.vpc_dao.load_all("myvpc")
+
+        vpc_id = self.create_vpc("myvpc")
+
+        # run the test
+        vpc = self.vpc_dao.load(vpc_id)
+
+        assert vpc.vpc_id == vpc_id
+        assert self.describe_calls == ["DescribeVpcs", "DescribeVpcs"]
+
+    @mock_aws
+    def test_create_vpc_invalidates_inventory(self):
+        assert len(self.vpc_dao.load_all("myvpc")) == 0
+
+        vpc_data = VpcData()
+        vpc_data.cidr = "10.0.10.0/16"
+        vpc_data.tags = [TagData("name", "myvpc")]
+
+        # run the test
+        self.vpc_dao.create(vpc_data)
+
+        vpcs = self.vpc_dao.load_all("myvpc")
+
+        assert len(vpcs) == 1
+
+    @mock_aws
+    def test_delete_vpc_invalidates_inventory(self):
+        self.create_vpc("myvpc")
+
+        vpcs = self.vpc_dao.load_all("myvpc")
+
+        # run the test
+        self.vpc_dao.delete(vpcs[0])
+
+        assert len(self.vpc_dao.load_all("myvpc")) == 0
+
+    @mock_aws
+    def test_invalidate_inventory(self):
+        assert len(self.vpc_dao.load_all("myvpc")) == 0
+
+        # the vpc is created bypassing the daos
+        self.create_vpc("myvpc")
+
+        assert len(self.vpc_dao.load_all("myvpc")) == 0
+
+        # run the test
+        InventoryDao.invalidate(InventoryDao.VPC)
+
+        assert len(self.vpc_dao.load_all("myvpc")) == 1
+
+    @mock_aws
+    def test_inventory_expired(self):
+        InventoryDao.enable(0)
+
+        self.create_vpc("myvpc")
+
+        # run the test
+        self.vpc_dao.load_all("myvpc")
+        self.vpc_dao.load_all("myvpc")
+
+        assert self.describe_calls == ["DescribeVpcs", "DescribeVpcs"]
+
+    @mock_aws
+    def test_inventory_disabled(self):
+        InventoryDao.disable()
+
+        self.create_vpc("myvpc")
+
+        # run the test
+        self.vpc_dao.load_all("myvpc")
+        self.vpc_dao.load_all("myvpc")
+
+        assert InventoryDao.is_enabled() is False
+        assert self.describe_calls == ["DescribeVpcs", "DescribeVpcs"]
+
+    @mock_aws
+    def test_load_all_images_inventory_on_and_off(self):
+        # a public image not owned by the account, tagged in the account
+        ClientRegistry.get_client("ec2").create_tags(
+            Resources=[AMI_ID],
+            Tags=[self.test_utils.build_tag("name", "myparent")],
+        )
+        image_dao = ImageDao()
+
+        # run the test
+        cached_images = image_dao.load_all("myparent")
+
+        InventoryDao.disable()
+
+        # run the test
+        images = image_dao.load_all("myparent")
+
+        assert [image.image_id for image in cached_images] == [AMI_ID]
+        assert [image.image_id for image in images] == [AMI_ID]
+
+    @mock_aws
+    def test_load_cidr_rules_from_inventory(self):
+        vpc_id = self.create_vpc("myvpc")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "mysecuritygroup", "my security group", vpc_id, security_group_tags
+        ).get("GroupId")
+
+        assert len(self.cidr_rule_dao.load_all(security_group_id)) == 0
+
+        cidr_rule_data = CidrRuleData()
+        cidr_rule_data.security_group_id = security_group_id
+        cidr_rule_data.from_port = 80
+        cidr_rule_data.to_port = 90
+        cidr_rule_data.protocol = "tcp"
+
+        ip_range_data = IpRangeData()
+        ip_range_data.cidr_ip = "10.0.10.0/24"
+        ip_range_data.description = "HTTP access home"
+
+        cidr_rule_data.ip_ranges.append(ip_range_data)
+
+        # run the test
+        self.cidr_rule_dao.create(cidr_rule_data)
+
+        rules = self.cidr_rule_dao.load_all(security_group_id)
+        rules_again = self.cidr_rule_dao.load_all(security_group_id)
+
+        assert len(rules) == 1
+        assert rules[0].from_port == 80
+        assert len(rules_again) == 1
+        assert self.describe_calls == [
+            "DescribeSecurityGroups",
+            "DescribeSecurityGroups",
+        ]
@@ -9,7 +9,13 @@ import unittest
 from moto import mock_aws
 from pytest import fail
 
-from com.maxmin.aws.ec2.dao.domain.security_group import SecurityGroupData
+from com.maxmin.aws.ec2.dao.domain.security_group import (
+    CidrRuleData,
+    IpRangeData,
+    SecurityGroupData,
+    SecurityGroupRuleData,
+    UserIdGroupPairData,
+)
 from com.maxmin.aws.ec2.dao.domain.tag import TagData
 from com.maxmin.aws.ec2.dao.security_group import SecurityGroupDao
 from com.maxmin.aws.exception import AwsDaoException
@@ -202,6 +208,78 @@ class SecurityGroupDaoTestCase(unittest.TestCase):
         except Exception:
             fail("ERROR: an AwsDaoException should have been raised!")
 
+    @mock_aws
+    def test_delete_all_rules(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURITYGROUP", "my security group", vpc_id, security_group_tags
+        ).get("GroupId")
+
+        granted_security_group_tags = []
+        granted_security_group_tags.append(
+            self.test_utils.build_tag("name", "mygrantedsecuritygroup")
+        )
+
+        granted_security_group_id = self.test_utils.create_security_group(
+            "MYGRANTEDSECURITYGROUP",
+            "my granted security group",
+            vpc_id,
+            granted_security_group_tags,
+        ).get("GroupId")
+
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 22, 22, "tcp", "0.0.0.0/0", "SSH access"
+        )
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 80, 80, "tcp", "0.0.0.0/0", "HTTP access"
+        )
+        self.test_utils.allow_access_from_security_group(
+            security_group_id,
+            5432,
+            5432,
+            "tcp",
+            granted_security_group_id,
+            "PostgreSQL access",
+        )
+
+        security_group_data = SecurityGroupData()
+        security_group_data.security_group_id = security_group_id
+
+        # run the test
+        self.security_group_dao.delete_all_rules(security_group_data)
+
+        response = self.test_utils.describe_security_group(security_group_id)
+
+        assert len(response.get("IpPermissions")) == 0
+
+    @mock_aws
+    def test_delete_all_rules_not_existing_security_group(self):
+        security_group_data = SecurityGroupData()
+        security_group_data.security_group_id = "1234"
+
+        try:
+            # run the test
+            self.security_group_dao.delete_all_rules(security_group_data)
+
+            fail("ERROR: an exception should have been thrown!")
+
+        except AwsDaoException as e:
+            assert str(e) == "Error deleting the security group rules!"
+        except Exception:
+            fail("ERROR: an AwsDaoException should have been raised!")
+
     @mock_aws
     def test_load_security_group(self):
         vpc_tags = []
@@ -356,3 +434,151 @@ class SecurityGroupDaoTestCase(unittest.TestCase):
         )
 
         assert len(security_group_datas) == 0
+
+    def create_security_groups(self) -> tuple:
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURITYGROUP",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysecuritygroup")],
+        ).get("GroupId")
+
+        granted_security_group_id = self.test_utils.create_security_group(
+            "MYGRANTEDSECURITYGROUP",
+            "my granted security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mygrantedsecuritygroup")],
+        ).get("GroupId")
+
+        return security_group_id, granted_security_group_id
+
+    @mock_aws
+    def test_load_all_rules(self):
+        (
+            security_group_id,
+            granted_security_group_id,
+        ) = self.create_security_groups()
+
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 22, 22, "tcp", "0.0.0.0/0", "SSH access"
+        )
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 22, 22, "tcp", "10.0.0.0/8", "SSH private"
+        )
+        self.test_utils.allow_access_from_security_group(
+            security_group_id,
+            5432,
+            5432,
+            "tcp",
+            granted_security_group_id,
+            "PostgreSQL access",
+        )
+
+        # run the test
+        rule_datas = self.security_group_dao.load_all_rules(security_group_id)
+
+        cidr_rule_datas = [
+            r for r in rule_datas if isinstance(r, CidrRuleData)
+        ]
+        security_group_rule_datas = [
+            r for r in rule_datas if isinstance(r, SecurityGroupRuleData)
+        ]
+
+        # a rule for each granted CIDR interval
+        assert len(cidr_rule_datas) == 2
+        assert sorted(r.ip_ranges[0].cidr_ip for r in cidr_rule_datas) == [
+            "0.0.0.0/0",
+            "10.0.0.0/8",
+        ]
+        assert all(len(r.ip_ranges) == 1 for r in cidr_rule_datas)
+        assert len(security_group_rule_datas) == 1
+        assert security_group_rule_datas[0].from_port == 5432
+        assert (
+            security_group_rule_datas[0].user_id_group_pairs[0].group_id
+            == granted_security_group_id
+        )
+
+    @mock_aws
+    def test_create_and_delete_rules(self):
+        (
+            security_group_id,
+            granted_security_group_id,
+        ) = self.create_security_groups()
+
+        rule_datas = []
+
+        for port in range(8000, 8050):
+            cidr_rule_data = CidrRuleData()
+            cidr_rule_data.from_port = port
+            cidr_rule_data.to_port = port
+            cidr_rule_data.protocol = "tcp"
+
+            ip_range_data = IpRangeData()
+            ip_range_data.cidr_ip = "0.0.0.0/0"
+            ip_range_data.description = f"port {port}"
+            cidr_rule_data.ip_ranges.append(ip_range_data)
+
+            rule_datas.append(cidr_rule_data)
+
+        security_group_rule_data = SecurityGroupRuleData()
+        security_group_rule_data.from_port = 5432
+        security_group_rule_data.to_port = 5432
+        security_group_rule_data.protocol = "tcp"
+
+        user_id_group_pair_data = UserIdGroupPairData()
+        user_id_group_pair_data.group_id = granted_security_group_id
+        user_id_group_pair_data.description = "PostgreSQL access"
+        security_group_rule_data.user_id_group_pairs.append(
+            user_id_group_pair_data
+        )
+
+        rule_datas.append(security_group_rule_data)
+
+        # run the test
+        self.security_group_dao.create_rules(security_group_id, rule_datas)
+
+        response = self.test_utils.describe_security_group(security_group_id)
+
+        assert len(response.get("IpPermissions")) == 51
+
+        # run the test
+        self.security_group_dao.delete_rules(security_group_id, rule_datas[1:])
+
+        response = self.test_utils.describe_security_group(security_group_id)
+
+        assert len(response.get("IpPermissions")) == 1
+        assert response.get("IpPermissions")[0].get("FromPort") == 8000
+        assert (
+            response.get("IpPermissions")[0]
+            .get("IpRanges")[0]
+            .get("Description")
+            == "port 8000"
+        )
+
+    @mock_aws
+    def test_create_rules_not_existing_security_group(self):
+        cidr_rule_data = CidrRuleData()
+        cidr_rule_data.from_port = 22
+        cidr_rule_data.to_port = 22
+        cidr_rule_data.protocol = "tcp"
+
+        ip_range_data = IpRangeData()
+        ip_range_data.cidr_ip = "0.0.0.0/0"
+        cidr_rule_data.ip_ranges.append(ip_range_data)
+
+        try:
+            # run the test
+            self.security_group_dao.create_rules(
+                "sg-1234567890abcdef0", [cidr_rule_data]
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsDaoException as e:
+            assert str(e) == "Error creating the security group rules!"
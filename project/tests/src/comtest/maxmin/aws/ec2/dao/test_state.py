@@ -0,0 +1,252 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.ec2.dao.domain.tag import TagData
+from com.maxmin.aws.ec2.dao.domain.vpc import VpcData
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.ec2.dao.state import StateDao
+from com.maxmin.aws.ec2.dao.vpc import VpcDao
+from com.maxmin.aws.exception import AwsDaoException
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class StateDaoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.state_dir = tempfile.TemporaryDirectory()
+        self.state_file = os.path.join(self.state_dir.name, "state.json")
+        StateDao.enable(self.state_file)
+
+    def tearDown(self):
+        StateDao.disable()
+        self.state_dir.cleanup()
+
+    def read_state_file(self) -> dict:
+        with open(self.state_file) as file:
+            return json.load(file)
+
+    def test_record_and_save(self):
+        # run the test
+        StateDao.record("eu-west-1", "vpc", "myvpc", ["vpc-2", "vpc-1"])
+        StateDao.save()
+
+        assert StateDao.get_ids("eu-west-1", "vpc") == {
+            "myvpc": ["vpc-1", "vpc-2"]
+        }
+        assert self.read_state_file() == {
+            "eu-west-1": {"vpc": {"myvpc": ["vpc-1", "vpc-2"]}}
+        }
+
+    def test_record_no_ids(self):
+        StateDao.record("eu-west-1", "vpc", "myvpc", ["vpc-1"])
+        StateDao.save()
+
+        # run the test
+        StateDao.record("eu-west-1", "vpc", "myvpc", [])
+        StateDao.save()
+
+        assert StateDao.get_ids("eu-west-1", "vpc") == {}
+        assert self.read_state_file() == {"eu-west-1": {"vpc": {}}}
+
+    def test_enable_reads_state_file(self):
+        StateDao.record("eu-west-1", "vpc", "myvpc", ["vpc-1"])
+        StateDao.save()
+
+        # run the test
+        StateDao.disable()
+        StateDao.enable(self.state_file)
+
+        assert StateDao.get_ids("eu-west-1", "vpc") == {"myvpc": ["vpc-1"]}
+
+    def test_save_merges_concurrent_runs(self):
+        StateDao.record("eu-west-1", "vpc", "myvpc", ["vpc-1"])
+
+        # another run saves its changes in the meantime
+        with open(self.state_file, "w") as file:
+            json.dump({"us-east-1": {"vpc": {"othervpc": ["vpc-9"]}}}, file)
+
+        # run the test
+        StateDao.save()
+
+        assert self.read_state_file() == {
+            "eu-west-1": {"vpc": {"myvpc": ["vpc-1"]}},
+            "us-east-1": {"vpc": {"othervpc": ["vpc-9"]}},
+        }
+
+    def test_enable_state_file_not_readable(self):
+        with open(self.state_file, "w") as file:
+            file.write("{not json")
+
+        # run the test
+        StateDao.enable(self.state_file)
+
+        assert StateDao.get_ids("eu-west-1", "vpc") == {}
+
+    def test_save_error(self):
+        StateDao.record("eu-west-1", "vpc", "myvpc", ["vpc-1"])
+        os.mkdir(f"{self.state_file}.tmp")
+
+        try:
+            # run the test
+            StateDao.save()
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsDaoException as e:
+            assert str(e) == "Error saving the state!"
+
+    def test_record_disabled(self):
+        StateDao.disable()
+
+        # run the test
+        StateDao.record("eu-west-1", "vpc", "myvpc", ["vpc-1"])
+        StateDao.save()
+
+        assert StateDao.get_ids("eu-west-1", "vpc") == {}
+        assert not os.path.exists(self.state_file)
+
+
+class InventoryStateTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.state_dir = tempfile.TemporaryDirectory()
+        self.state_file = os.path.join(self.state_dir.name, "state.json")
+        self.test_utils = TestUtils()
+        self.vpc_dao = VpcDao()
+        self.region_nm = self.vpc_dao.ec2.meta.region_name
+        self.describe_calls = []
+
+        ClientRegistry.get_client("ec2").meta.events.register(
+            "before-parameter-build.ec2.*", self.count_describe_calls
+        )
+
+    def tearDown(self):
+        InventoryDao.disable()
+        StateDao.disable()
+        ClientRegistry.clear()
+        self.state_dir.cleanup()
+
+    def count_describe_calls(self, model, params, **kwargs):
+        if model.name.startswith("Describe"):
+            self.describe_calls.append((model.name, "VpcIds" in params))
+
+    def create_vpc(self, vpc_nm: str, cidr: str = "10.0.10.0/16") -> str:
+        return self.test_utils.create_vpc(
+            cidr, [self.test_utils.build_tag("name", vpc_nm)]
+        ).get("VpcId")
+
+    def start_run(self) -> None:
+        """
+        Starts a run with the state saved by the previous one.
+        """
+        StateDao.save()
+        InventoryDao.enable(60)
+        StateDao.enable(self.state_file)
+        self.describe_calls.clear()
+
+    @mock_aws
+    def test_load_all_vpcs_from_state(self):
+        vpc_id = self.create_vpc("myvpc")
+        self.create_vpc("othervpc", "10.1.10.0/16")
+        self.start_run()
+        self.vpc_dao.load_all("myvpc")
+
+        # run the test
+        self.start_run()
+        vpcs = self.vpc_dao.load_all("myvpc")
+
+        assert len(vpcs) == 1
+        assert vpcs[0].vpc_id == vpc_id
+        assert self.describe_calls == [("DescribeVpcs", True)]
+
+    @mock_aws
+    def test_load_all_vpcs_not_in_state(self):
+        self.create_vpc("myvpc")
+        other_vpc_id = self.create_vpc("othervpc", "10.1.10.0/16")
+        self.start_run()
+        self.vpc_dao.load_all("myvpc")
+
+        # run the test
+        self.start_run()
+        vpcs = self.vpc_dao.load_all("othervpc")
+
+        assert len(vpcs) == 1
+        assert vpcs[0].vpc_id == other_vpc_id
+        assert self.describe_calls == [
+            ("DescribeVpcs", True),
+            ("DescribeVpcs", False),
+        ]
+        assert StateDao.get_ids(self.region_nm, "vpc").get("othervpc") == [
+            other_vpc_id
+        ]
+
+    @mock_aws
+    def test_load_all_vpcs_state_out_of_date(self):
+        vpc_id = self.create_vpc("myvpc")
+        self.start_run()
+        self.vpc_dao.load_all("myvpc")
+        self.start_run()
+
+        # the VPC is deleted outside the runs
+        self.test_utils.ec2.delete_vpc(VpcId=vpc_id)
+
+        # run the test
+        vpcs = self.vpc_dao.load_all("myvpc")
+
+        assert len(vpcs) == 0
+        assert self.describe_calls == [
+            ("DescribeVpcs", True),
+            ("DescribeVpcs", False),
+        ]
+        assert StateDao.get_ids(self.region_nm, "vpc") == {}
+
+    @mock_aws
+    def test_load_all_vpcs_renamed(self):
+        vpc_id = self.create_vpc("myvpc")
+        self.start_run()
+        self.vpc_dao.load_all("myvpc")
+        self.start_run()
+
+        # the VPC is renamed outside the runs
+        self.test_utils.ec2.create_tags(
+            Resources=[vpc_id], Tags=[{"Key": "name", "Value": "othervpc"}]
+        )
+
+        # run the test
+        vpcs = self.vpc_dao.load_all("myvpc")
+
+        assert len(vpcs) == 0
+        assert self.describe_calls == [
+            ("DescribeVpcs", True),
+            ("DescribeVpcs", False),
+        ]
+
+    @mock_aws
+    def test_create_vpc_scans_vpcs(self):
+        self.create_vpc("myvpc")
+        self.start_run()
+        self.vpc_dao.load_all("myvpc")
+        self.start_run()
+        self.vpc_dao.load_all("myvpc")
+
+        vpc_data = VpcData()
+        vpc_data.cidr = "10.1.10.0/16"
+        vpc_data.tags = [TagData("name", "othervpc")]
+        self.vpc_dao.create(vpc_data)
+        self.describe_calls.clear()
+
+        # run the test
+        vpcs = self.vpc_dao.load_all("othervpc")
+
+        assert len(vpcs) == 1
+        assert ("DescribeVpcs", False) in self.describe_calls
@@ -241,6 +241,37 @@ class SubnetDaoTestCase(unittest.TestCase):
         assert subnet_datas[0].get_tag_value("name") == "mysubnet2"
         assert subnet_datas[0].get_tag_value("class") == "webservices"
 
+    @mock_aws
+    def test_load_all_subnets_by_tag_name_and_vpc(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id1 = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+        vpc_id2 = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("class", "webservices"))
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id1, subnet_tags
+        )
+        subnet_id2 = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id2, subnet_tags
+        ).get("SubnetId")
+
+        # run the test
+        subnet_datas = self.subnet_dao.load_all("mysubnet", vpc_id2)
+
+        assert len(subnet_datas) == 1
+        assert subnet_datas[0].subnet_id == subnet_id2
+        assert subnet_datas[0].vpc_id == vpc_id2
+
     @mock_aws
     def test_load_all_subnets_by_tag_name_more_found(self):
         vpc_tags1 = []
@@ -5,7 +5,9 @@ Created on Mar 28, 2023
 """
 
 import unittest
+from typing import Iterator
 
+from botocore.stub import ANY, Stubber
 from moto import mock_aws
 from pytest import fail
 
@@ -180,8 +182,81 @@ class VpcDaoTestCase(unittest.TestCase):
 
         assert len(vpc_datas) == 2
 
+    @mock_aws
+    def test_load_all_vpcs_by_tag_name_other_tag_value(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "myvpc"))
+        vpc_tags.append(self.test_utils.build_tag("name", "othervpc"))
+
+        self.test_utils.create_vpc("10.0.10.0/16", vpc_tags)
+
+        # run the test
+        vpc_datas = self.vpc_dao.load_all("myvpc")
+
+        assert len(vpc_datas) == 0
+
+    @mock_aws
+    def test_load_all_vpcs_by_tag_name_and_state(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        self.test_utils.create_vpc("10.0.10.0/16", vpc_tags)
+
+        # run the test
+        available_vpc_datas = self.vpc_dao.load_all("myvpc", ["available"])
+        pending_vpc_datas = self.vpc_dao.load_all("myvpc", ["pending"])
+
+        assert len(available_vpc_datas) == 1
+        assert len(pending_vpc_datas) == 0
+
     @mock_aws
     def test_load_all_vpcs_by_tag_name_not_found(self):
         vpc_datas = self.vpc_dao.load_all("myvpc")
 
         assert len(vpc_datas) == 0
+
+    @mock_aws
+    def test_load_all_vpcs_by_tag_name_paginated(self):
+        vpc_pages = [
+            {
+                "Vpcs": [{"VpcId": "vpc-1", "Tags": []}],
+                "NextToken": "t1",
+            },
+            {"Vpcs": [{"VpcId": "vpc-2", "Tags": []}]},
+        ]
+
+        with Stubber(self.vpc_dao.ec2) as stubber:
+            stubber.add_response(
+                "describe_vpcs",
+                vpc_pages[0],
+                {"Filters": ANY, "MaxResults": ANY},
+            )
+            stubber.add_response(
+                "describe_vpcs",
+                vpc_pages[1],
+                {"Filters": ANY, "MaxResults": ANY, "NextToken": "t1"},
+            )
+
+            # run the test
+            vpc_datas = self.vpc_dao.load_all("myvpc")
+
+        # the VPCs in the second page are not lost
+        assert [vpc_data.vpc_id for vpc_data in vpc_datas] == [
+            "vpc-1",
+            "vpc-2",
+        ]
+
+    @mock_aws
+    def test_iterate_all_vpcs_by_tag_name(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        for i in range(5):
+            self.test_utils.create_vpc(f"10.0.{i}.0/24", vpc_tags)
+
+        # run the test
+        vpc_datas = self.vpc_dao.iterate_all("myvpc")
+
+        assert isinstance(vpc_datas, Iterator)
+        assert len(list(vpc_datas)) == 5
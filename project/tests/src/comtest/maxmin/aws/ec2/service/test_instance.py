@@ -4,6 +4,8 @@ Created on Mar 28, 2023
 @author: vagrant
 """
 
+import asyncio
+import socket
 import unittest
 
 from moto import mock_aws
@@ -104,6 +106,267 @@ class InstanceServiceServiceTestCase(unittest.TestCase):
             == "webservices"
         )
 
+    @mock_aws
+    def test_create_instance_async(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("class", "webservices"))
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id, subnet_tags
+        ).get("SubnetId")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("class", "webservices")
+        )
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        self.test_utils.create_security_group(
+            "MYSECURIYGROUP", "my security group", vpc_id, security_group_tags
+        )
+
+        key_pair_tags = []
+        key_pair_tags.append(self.test_utils.build_tag("class", "webservices"))
+        key_pair_tags.append(self.test_utils.build_tag("name", "mykeypair"))
+
+        self.test_utils.create_key_pair("MYKEYPAIRNM", key_pair_tags, None)
+
+        instance_tags = []
+        instance_tags.append(Tag("class", "webservices"))
+
+        # run the test
+        asyncio.run(
+            self.instance_service.create_instance_async(
+                "myinstance",
+                "10.0.10.10",
+                AMI_NAME,
+                "mysecuritygroup",
+                "mysubnet",
+                "myvpc",
+                "myuser",
+                "myuserpwd",
+                "test.maxmin.it",
+                "mykeypair",
+                instance_tags,
+                InstanceService.RUNNING,
+            )
+        )
+
+        instances = self.test_utils.describe_instances("myinstance")
+
+        assert instances[0].get("VpcId") == vpc_id
+        assert instances[0].get("SubnetId") == subnet_id
+        assert instances[0].get("State").get("Name") == "running"
+
+    @mock_aws
+    def test_create_instances(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id, subnet_tags
+        ).get("SubnetId")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        self.test_utils.create_security_group(
+            "MYSECURIYGROUP", "my security group", vpc_id, security_group_tags
+        )
+
+        key_pair_tags = []
+        key_pair_tags.append(self.test_utils.build_tag("name", "mykeypair"))
+
+        self.test_utils.create_key_pair("MYKEYPAIRNM", key_pair_tags, None)
+
+        instance_datas = []
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+        ]:
+            instance_datas.append(
+                self.instance_service.build_instance_data(
+                    instance_nm,
+                    private_ip,
+                    AMI_NAME,
+                    "mysecuritygroup",
+                    "mysubnet",
+                    "myvpc",
+                    "myuser",
+                    "myuserpwd",
+                    "test.maxmin.it",
+                    "mykeypair",
+                    [Tag("class", "webservices")],
+                )
+            )
+
+        # nothing is created until the instances are launched
+        assert len(self.test_utils.describe_instances("myinstance1")) == 0
+
+        # run the test
+        self.instance_service.create_instances(instance_datas)
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+        ]:
+            instances = self.test_utils.describe_instances(instance_nm)
+
+            assert len(instances) == 1
+            assert instances[0].get("PrivateIpAddress") == private_ip
+            assert instances[0].get("State").get("Name") == "running"
+            assert instances[0].get("SubnetId") == subnet_id
+            assert (
+                self.test_utils.get_tag_value(
+                    "class", instances[0].get("Tags")
+                )
+                == "webservices"
+            )
+
+    def test_create_instances_without_data(self):
+        try:
+            # run the test
+            self.instance_service.create_instances([])
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Instance data are mandatory!"
+
+    def test_create_instance_unknown_readiness(self):
+        try:
+            # run the test
+            self.instance_service.create_instance(
+                "myinstance",
+                "10.0.10.10",
+                AMI_NAME,
+                "mysecuritygroup",
+                "mysubnet",
+                "myvpc",
+                "myuser",
+                "myuserpwd",
+                "test.maxmin.it",
+                "mykeypair",
+                [],
+                "booted",
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Unknown readiness level booted!"
+
+    @mock_aws
+    def test_wait_instances(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a",
+            "10.0.10.0/25",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysubnet")],
+        ).get("SubnetId")
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysecuritygroup")],
+        ).get("GroupId")
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+        ]:
+            instance_tags = []
+            instance_tags.append(
+                self.test_utils.build_tag("name", instance_nm)
+            )
+
+            self.test_utils.create_instance(
+                AMI_ID,
+                security_group_id,
+                subnet_id,
+                private_ip,
+                "ENCODED CLOUD INIT DATA",
+                instance_tags,
+            )
+
+        for readiness in [
+            InstanceService.NONE,
+            InstanceService.RUNNING,
+            InstanceService.STATUS_OK,
+        ]:
+            # run the test
+            self.instance_service.wait_instances(
+                ["myinstance1", "myinstance2"], readiness
+            )
+
+        for instance_nm in ["myinstance1", "myinstance2"]:
+            instance = self.instance_service.load_instance(instance_nm)
+
+            assert instance.state == "running"
+            assert instance.public_ip is not None
+
+    @mock_aws
+    def test_wait_not_existing_instances(self):
+        try:
+            # run the test
+            self.instance_service.wait_instances(
+                ["myinstance"], InstanceService.RUNNING
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Instance myinstance not found!"
+
+    def test_wait_ssh_reachable(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+
+            # run the test
+            self.instance_service.wait_ssh_reachable(
+                "127.0.0.1", server.getsockname()[1], 1
+            )
+
+    def test_wait_ssh_not_reachable(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            port = server.getsockname()[1]
+
+        try:
+            # run the test
+            self.instance_service.wait_ssh_reachable("127.0.0.1", port, 1)
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == f"127.0.0.1:{port} not reachable!"
+
     @mock_aws
     def test_create_instance_twice(self):
         vpc_tags = []
@@ -289,6 +552,65 @@ class InstanceServiceServiceTestCase(unittest.TestCase):
         assert len(instances) == 1
         assert instances[0].get("State").get("Name") == "terminated"
 
+    @mock_aws
+    def test_terminate_instance_async(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("class", "webservices"))
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id, subnet_tags
+        ).get("SubnetId")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("class", "webservices")
+        )
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP", "my security group", vpc_id, security_group_tags
+        ).get("GroupId")
+
+        key_pair_tags = []
+        key_pair_tags.append(self.test_utils.build_tag("class", "webservices"))
+        key_pair_tags.append(self.test_utils.build_tag("name", "mykeypair"))
+
+        self.test_utils.create_key_pair("MYKEYPAIRNM", key_pair_tags, None)
+
+        instance_tags = []
+        instance_tags.append(self.test_utils.build_tag("class", "webservices"))
+        instance_tags.append(self.test_utils.build_tag("name", "myinstance"))
+
+        self.test_utils.create_instance(
+            AMI_ID,
+            security_group_id,
+            subnet_id,
+            "10.0.10.10",
+            "ENCODED CLOUD INIT DATA",
+            instance_tags,
+        )
+
+        # run the test
+        asyncio.run(
+            self.instance_service.terminate_instance_async("myinstance")
+        )
+
+        instances = self.test_utils.describe_instances("myinstance")
+
+        assert len(instances) == 1
+        assert instances[0].get("State").get("Name") == "terminated"
+
     @mock_aws
     def test_delete_not_existing_instance(self):
         self.instance_service.terminate_instance("myinstance")
@@ -296,6 +618,78 @@ class InstanceServiceServiceTestCase(unittest.TestCase):
         # no error expected
         pass
 
+    @mock_aws
+    def test_terminate_instances(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        subnet_tags = []
+        subnet_tags.append(self.test_utils.build_tag("class", "webservices"))
+        subnet_tags.append(self.test_utils.build_tag("name", "mysubnet"))
+
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a", "10.0.10.0/25", vpc_id, subnet_tags
+        ).get("SubnetId")
+
+        security_group_tags = []
+        security_group_tags.append(
+            self.test_utils.build_tag("class", "webservices")
+        )
+        security_group_tags.append(
+            self.test_utils.build_tag("name", "mysecuritygroup")
+        )
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURIYGROUP", "my security group", vpc_id, security_group_tags
+        ).get("GroupId")
+
+        for instance_nm, private_ip in [
+            ("myinstance1", "10.0.10.10"),
+            ("myinstance2", "10.0.10.11"),
+        ]:
+            instance_tags = []
+            instance_tags.append(
+                self.test_utils.build_tag("class", "webservices")
+            )
+            instance_tags.append(
+                self.test_utils.build_tag("name", instance_nm)
+            )
+
+            self.test_utils.create_instance(
+                AMI_ID,
+                security_group_id,
+                subnet_id,
+                private_ip,
+                "ENCODED CLOUD INIT DATA",
+                instance_tags,
+            )
+
+        # run the test
+        self.instance_service.terminate_instances(
+            ["myinstance1", "myinstance2", "myinstance3"]
+        )
+
+        for instance_nm in ["myinstance1", "myinstance2"]:
+            instances = self.test_utils.describe_instances(instance_nm)
+
+            assert len(instances) == 1
+            assert instances[0].get("State").get("Name") == "terminated"
+
+    @mock_aws
+    def test_terminate_instances_without_names(self):
+        try:
+            # run the test
+            self.instance_service.terminate_instances([])
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Instance names are mandatory!"
+
     @mock_aws
     def test_load_instance(self):
         vpc_tags = []
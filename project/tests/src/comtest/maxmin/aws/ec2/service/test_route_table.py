@@ -292,6 +292,54 @@ class RouteTableServiceTestCase(unittest.TestCase):
         assert len(response.get("Associations")) == 1
         assert response.get("Associations")[0].get("SubnetId") == subnet_id
 
+    @mock_aws
+    def test_delete_associated_route_table(self):
+        vpc_tags = []
+        vpc_tags.append(self.test_utils.build_tag("class", "webservices"))
+        vpc_tags.append(self.test_utils.build_tag("name", "myvpc"))
+
+        vpc_id = self.test_utils.create_vpc("10.0.10.0/16", vpc_tags).get(
+            "VpcId"
+        )
+
+        route_table_tags = []
+        route_table_tags.append(
+            self.test_utils.build_tag("class", "webservices")
+        )
+        route_table_tags.append(
+            self.test_utils.build_tag("name", "myroutetable")
+        )
+
+        route_table_id = self.test_utils.create_route_table(
+            vpc_id, route_table_tags
+        ).get("RouteTableId")
+
+        for subnet_nm, cidr in [
+            ("mysubnet1", "10.0.10.0/25"),
+            ("mysubnet2", "10.0.10.128/25"),
+        ]:
+            subnet_tags = []
+            subnet_tags.append(self.test_utils.build_tag("name", subnet_nm))
+
+            self.test_utils.create_subnet(
+                "eu-west-1a", cidr, vpc_id, subnet_tags
+            )
+
+            self.route_table_service.associate_route_table(
+                "myroutetable", subnet_nm
+            )
+
+        response = self.test_utils.describe_route_table(route_table_id)
+
+        assert len(response.get("Associations")) == 2
+
+        # run the test
+        self.route_table_service.delete_route_table("myroutetable")
+
+        response = self.test_utils.describe_route_tables("myroutetable")
+
+        assert len(response) == 0
+
     @mock_aws
     def test_load_route(self):
         vpc_tags = []
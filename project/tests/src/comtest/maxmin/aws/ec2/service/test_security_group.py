@@ -9,6 +9,11 @@ import unittest
 from moto import mock_aws
 from pytest import fail
 
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.ec2.service.domain.security_group import (
+    CidrRule,
+    SecurityGroupRule,
+)
 from com.maxmin.aws.ec2.service.domain.tag import Tag
 from com.maxmin.aws.ec2.service.security_group import SecurityGroupService
 from com.maxmin.aws.exception import AwsServiceException
@@ -18,8 +23,51 @@ from comtest.maxmin.aws.utils import TestUtils
 
 class SecurityGroupServiceTestCase(unittest.TestCase):
     def setUp(self):
+        ClientRegistry.clear()
         self.test_utils = TestUtils()
         self.security_group_service = SecurityGroupService()
+        self.ec2_calls = []
+
+        ClientRegistry.get_client("ec2").meta.events.register(
+            "before-call.ec2", self.count_ec2_calls
+        )
+
+    def tearDown(self):
+        ClientRegistry.clear()
+
+    def count_ec2_calls(self, model, **kwargs):
+        self.ec2_calls.append(model.name)
+
+    def build_cidr_rule(self, port: int, cidr: str) -> CidrRule:
+        cidr_rule = CidrRule()
+        cidr_rule.from_port = port
+        cidr_rule.to_port = port
+        cidr_rule.protocol = "tcp"
+        cidr_rule.granted_cidr = cidr
+        cidr_rule.description = f"port {port}"
+
+        return cidr_rule
+
+    def create_security_groups(self) -> tuple:
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        ).get("VpcId")
+
+        security_group_id = self.test_utils.create_security_group(
+            "MYSECURITYGROUP",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mysecuritygroup")],
+        ).get("GroupId")
+
+        granted_security_group_id = self.test_utils.create_security_group(
+            "MYGRANTEDSECURITYGROUP",
+            "my granted security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "mygrantedsecuritygroup")],
+        ).get("GroupId")
+
+        return security_group_id, granted_security_group_id
 
     @mock_aws
     def test_create_security_group(self):
@@ -260,3 +308,163 @@ class SecurityGroupServiceTestCase(unittest.TestCase):
         )
 
         assert not security_group
+
+    @mock_aws
+    def test_synchronize_rules(self):
+        (
+            security_group_id,
+            granted_security_group_id,
+        ) = self.create_security_groups()
+
+        # kept
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 8000, 8000, "tcp", "0.0.0.0/0", "port 8000"
+        )
+        # not configured, deleted
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 22, 22, "tcp", "10.0.0.0/8", "SSH access"
+        )
+        self.test_utils.allow_access_from_security_group(
+            security_group_id,
+            3306,
+            3306,
+            "tcp",
+            granted_security_group_id,
+            "MySQL access",
+        )
+
+        cidr_rules = [
+            self.build_cidr_rule(port, "0.0.0.0/0")
+            for port in range(8000, 8050)
+        ]
+
+        security_group_rule = SecurityGroupRule()
+        security_group_rule.from_port = 5432
+        security_group_rule.to_port = 5432
+        security_group_rule.protocol = "tcp"
+        security_group_rule.granted_security_group_nm = (
+            "mygrantedsecuritygroup"
+        )
+        security_group_rule.description = "PostgreSQL access"
+
+        self.ec2_calls.clear()
+
+        # run the test
+        self.security_group_service.synchronize_rules(
+            "mysecuritygroup", cidr_rules, [security_group_rule]
+        )
+
+        # the rules are changed with one request for each direction
+        assert self.ec2_calls.count("AuthorizeSecurityGroupIngress") == 1
+        assert self.ec2_calls.count("RevokeSecurityGroupIngress") == 1
+
+        response = self.test_utils.describe_security_group(security_group_id)
+
+        permissions = {}
+        for permission in response.get("IpPermissions"):
+            for ip_range in permission.get("IpRanges"):
+                permissions[
+                    (permission.get("FromPort"), ip_range.get("CidrIp"))
+                ] = ip_range.get("Description")
+            for user_id_group_pair in permission.get("UserIdGroupPairs"):
+                permissions[
+                    (permission.get("FromPort"), user_id_group_pair["GroupId"])
+                ] = user_id_group_pair.get("Description")
+
+        assert len(permissions) == 51
+        assert (22, "10.0.0.0/8") not in permissions
+        assert (3306, granted_security_group_id) not in permissions
+        assert (
+            permissions[(5432, granted_security_group_id)]
+            == "PostgreSQL access"
+        )
+        assert permissions[(8049, "0.0.0.0/0")] == "port 8049"
+
+        self.ec2_calls.clear()
+
+        # run again, nothing to change
+        self.security_group_service.synchronize_rules(
+            "mysecuritygroup", cidr_rules, [security_group_rule]
+        )
+
+        assert "AuthorizeSecurityGroupIngress" not in self.ec2_calls
+        assert "RevokeSecurityGroupIngress" not in self.ec2_calls
+
+    @mock_aws
+    def test_synchronize_rules_dry_run(self):
+        security_group_id, _ = self.create_security_groups()
+
+        # kept
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 8000, 8000, "tcp", "0.0.0.0/0", "port 8000"
+        )
+        # not configured
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 22, 22, "tcp", "10.0.0.0/8", "SSH access"
+        )
+
+        cidr_rules = [
+            self.build_cidr_rule(port, "0.0.0.0/0")
+            for port in range(8000, 8003)
+        ]
+
+        self.ec2_calls.clear()
+
+        # run the test
+        created, deleted = self.security_group_service.synchronize_rules(
+            "mysecuritygroup", cidr_rules, [], dry_run=True
+        )
+
+        assert created == 2
+        assert deleted == 1
+        assert "AuthorizeSecurityGroupIngress" not in self.ec2_calls
+        assert "RevokeSecurityGroupIngress" not in self.ec2_calls
+
+        response = self.test_utils.describe_security_group(security_group_id)
+
+        assert len(response.get("IpPermissions")) == 2
+
+    @mock_aws
+    def test_synchronize_rules_not_existing_security_group(self):
+        try:
+            # run the test
+            self.security_group_service.synchronize_rules(
+                "mysecuritygroup",
+                [self.build_cidr_rule(22, "0.0.0.0/0")],
+                [],
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Security group not found!"
+
+    @mock_aws
+    def test_synchronize_rules_not_existing_granted_security_group(self):
+        security_group_id, _ = self.create_security_groups()
+
+        security_group_rule = SecurityGroupRule()
+        security_group_rule.from_port = 5432
+        security_group_rule.to_port = 5432
+        security_group_rule.protocol = "tcp"
+        security_group_rule.granted_security_group_nm = "notexisting"
+
+        try:
+            # run the test
+            self.security_group_service.synchronize_rules(
+                "mysecuritygroup", [], [security_group_rule]
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Granted security group not found!"
+
+    def test_synchronize_rules_missing_cidr(self):
+        try:
+            # run the test
+            self.security_group_service.synchronize_rules(
+                "mysecuritygroup", [self.build_cidr_rule(22, None)], []
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Rule granted CIDR interval is mandatory!"
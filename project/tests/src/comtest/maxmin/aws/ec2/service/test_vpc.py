@@ -4,6 +4,7 @@ Created on Mar 28, 2023
 @author: vagrant
 """
 
+import asyncio
 import unittest
 
 from moto import mock_aws
@@ -46,6 +47,44 @@ class VpcServiceTestCase(unittest.TestCase):
             == "webservices"
         )
 
+    @mock_aws
+    def test_create_vpc_async(self):
+        async def create_vpcs() -> None:
+            await asyncio.gather(
+                *[
+                    self.vpc_service.create_vpc_async(
+                        f"myvpc{i}", f"10.{i}.0.0/16", []
+                    )
+                    for i in range(5)
+                ]
+            )
+
+        # run the test
+        asyncio.run(create_vpcs())
+
+        for i in range(5):
+            vpcs = self.test_utils.describe_vpcs(f"myvpc{i}")
+
+            assert len(vpcs) == 1
+            assert vpcs[0].get("State") == "available"
+            assert vpcs[0].get("CidrBlock") == f"10.{i}.0.0/16"
+
+    @mock_aws
+    def test_create_vpc_async_twice(self):
+        self.test_utils.create_vpc(
+            "10.0.10.0/16", [self.test_utils.build_tag("name", "myvpc")]
+        )
+
+        try:
+            # run the test
+            asyncio.run(
+                self.vpc_service.create_vpc_async("myvpc", "10.0.10.0/16", [])
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "VPC already created!"
+
     @mock_aws
     def test_create_vpc_twice(self):
         tags = []
@@ -8,14 +8,29 @@ import unittest
 
 from moto import mock_aws
 
+from com.maxmin.aws.base.dao.client import ClientRegistry
 from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
 from comtest.maxmin.aws.utils import TestUtils
 
 
 class HostedZoneDaoTestCase(unittest.TestCase):
     def setUp(self):
+        ClientRegistry.clear()
         self.test_utils = TestUtils()
         self.hosted_zone_dao = HostedZoneDao()
+        self.list_calls = []
+
+        ClientRegistry.get_client("route53").meta.events.register(
+            "before-call.route53.ListHostedZonesByName",
+            self.count_list_calls,
+        )
+
+    def tearDown(self):
+        HostedZoneDao.disable()
+        ClientRegistry.clear()
+
+    def count_list_calls(self, model, **kwargs):
+        self.list_calls.append(model.name)
 
     @mock_aws
     def test_load_all_hosted_zones(self):
@@ -36,3 +51,57 @@ class HostedZoneDaoTestCase(unittest.TestCase):
 
         assert hosted_zone_datas[1].hosted_zone_id == hosted_zone_id1
         assert hosted_zone_datas[1].registered_domain == "maxmin.it."
+
+    @mock_aws
+    def test_load_hosted_zone(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it").get(
+            "Id"
+        )
+        self.test_utils.create_hosted_zone("maxmin.itx.com")
+        self.test_utils.create_hosted_zone("shop.maxmin.it")
+
+        # run the test
+        hosted_zone_data = self.hosted_zone_dao.load("maxmin.it")
+
+        assert hosted_zone_data.hosted_zone_id == hosted_zone_id
+        assert hosted_zone_data.registered_domain == "maxmin.it."
+
+        # run the test
+        hosted_zone_data = self.hosted_zone_dao.load("MaxMin.it.")
+
+        assert hosted_zone_data.hosted_zone_id == hosted_zone_id
+
+        # run the test
+        hosted_zone_data = self.hosted_zone_dao.load("maxmin")
+
+        assert hosted_zone_data is None
+
+        # a single request for each lookup
+        assert len(self.list_calls) == 3
+
+    @mock_aws
+    def test_load_hosted_zone_cached(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it").get(
+            "Id"
+        )
+
+        HostedZoneDao.enable()
+
+        # run the test
+        for registered_domain in ["maxmin.it", "maxmin.it.", "maxmin.it"]:
+            hosted_zone_data = self.hosted_zone_dao.load(registered_domain)
+
+            assert hosted_zone_data.hosted_zone_id == hosted_zone_id
+
+        # the zones not found are not cached
+        assert self.hosted_zone_dao.load("maxmin.com") is None
+        assert self.hosted_zone_dao.load("maxmin.com") is None
+
+        assert len(self.list_calls) == 3
+
+        HostedZoneDao.invalidate("maxmin.it")
+
+        self.hosted_zone_dao.load("maxmin.it")
+
+        assert HostedZoneDao.is_enabled() is True
+        assert len(self.list_calls) == 4
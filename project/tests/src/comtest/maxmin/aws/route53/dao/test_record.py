@@ -4,11 +4,16 @@ Created on Mar 28, 2023
 @author: vagrant
 """
 
+import json
+import os
+import tempfile
 import unittest
 
 from moto import mock_aws
 from pytest import fail
 
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.journal import RunJournal
 from com.maxmin.aws.exception import AwsDaoException
 from com.maxmin.aws.route53.dao.domain.record import RecordData
 from com.maxmin.aws.route53.dao.record import RecordDao
@@ -73,7 +78,7 @@ class RecordDaoTestCase(unittest.TestCase):
             "Id"
         )
 
-        record_data = RecordData
+        record_data = RecordData()
         record_data.dns_nm = "test.maxmin.it"
         record_data.ip_address = "10.0.10.10"
         record_data.hosted_zone_id = hosted_zone_id
@@ -88,7 +93,7 @@ class RecordDaoTestCase(unittest.TestCase):
         assert record.get("Name") == "test.maxmin.it."
         assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.10"
 
-        record_data = RecordData
+        record_data = RecordData()
         record_data.dns_nm = "sells.maxmin.it"
         record_data.ip_address = "10.0.10.20"
         record_data.hosted_zone_id = hosted_zone_id
@@ -113,7 +118,7 @@ class RecordDaoTestCase(unittest.TestCase):
             "test.maxmin.it.", "10.0.10.10", hosted_zone_id
         )
 
-        record_data = RecordData
+        record_data = RecordData()
         record_data.dns_nm = "test.maxmin.it"
         record_data.ip_address = "10.0.10.10"
         record_data.hosted_zone_id = hosted_zone_id
@@ -138,7 +143,7 @@ class RecordDaoTestCase(unittest.TestCase):
             "test.maxmin.it", "10.0.10.30", hosted_zone_id
         )
 
-        record_data = RecordData
+        record_data = RecordData()
         record_data.dns_nm = "test.maxmin.it"
         record_data.ip_address = "10.0.10.30"
         record_data.hosted_zone_id = hosted_zone_id
@@ -156,7 +161,7 @@ class RecordDaoTestCase(unittest.TestCase):
             "sells.maxmin.it", "10.0.10.30", hosted_zone_id
         )
 
-        record_data = RecordData
+        record_data = RecordData()
         record_data.dns_nm = "test.maxmin.it"
         record_data.ip_address = "10.0.10.30"
         record_data.hosted_zone_id = hosted_zone_id
@@ -169,3 +174,237 @@ class RecordDaoTestCase(unittest.TestCase):
         )
 
         assert record
+
+    @mock_aws
+    def test_change_all_records(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+        self.test_utils.create_record(
+            "sells.maxmin.it", "10.0.10.20", hosted_zone_id
+        )
+
+        changes = []
+
+        for action, dns_nm, ip_address in [
+            (RecordDao.CREATE, "admin.maxmin.it", "10.0.10.30"),
+            (RecordDao.UPSERT, "sells.maxmin.it", "10.0.10.40"),
+            (RecordDao.DELETE, "test.maxmin.it", "10.0.10.10"),
+        ]:
+            record_data = RecordData()
+            record_data.dns_nm = dns_nm
+            record_data.ip_address = ip_address
+            record_data.hosted_zone_id = hosted_zone_id
+            changes.append((action, record_data))
+
+        # run the test
+        change_ids = self.record_dao.change_all(hosted_zone_id, changes)
+
+        assert len(change_ids) == 1
+
+        record = self.test_utils.describe_record(
+            "admin.maxmin.it", hosted_zone_id
+        )
+
+        assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.30"
+        assert record.get("TTL") == 300
+
+        record = self.test_utils.describe_record(
+            "sells.maxmin.it", hosted_zone_id
+        )
+
+        assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.40"
+        assert not self.test_utils.describe_record(
+            "test.maxmin.it", hosted_zone_id
+        )
+
+    @mock_aws
+    def test_change_all_records_chunked(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        changes = []
+
+        # an UPSERT counts as two changes, 600 don't fit in one batch
+        for i in range(600):
+            record_data = RecordData()
+            record_data.dns_nm = f"box{i}.maxmin.it"
+            record_data.ip_address = f"10.0.{i // 250}.{i % 250}"
+            record_data.hosted_zone_id = hosted_zone_id
+            changes.append((RecordDao.UPSERT, record_data))
+
+        # run the test
+        change_ids = self.record_dao.change_all(hosted_zone_id, changes)
+
+        assert len(change_ids) == 2
+
+    @mock_aws
+    def test_change_all_records_error(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+
+        record_data = RecordData()
+        record_data.dns_nm = "test.maxmin.it"
+        record_data.ip_address = "10.0.10.10"
+        record_data.hosted_zone_id = hosted_zone_id
+
+        try:
+            # run the test
+            self.record_dao.change_all(
+                hosted_zone_id, [(RecordDao.CREATE, record_data)]
+            )
+
+            fail("An exception should have been thrown!")
+
+        except AwsDaoException as e:
+            assert str(e) == "Error changing the records!"
+        except Exception:
+            fail("An AwsDaoException should have been raised!")
+
+    @mock_aws
+    def test_load_record(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+        self.test_utils.create_record(
+            "test2.maxmin.it", "10.0.10.20", hosted_zone_id
+        )
+
+        # run the test
+        record_data = self.record_dao.load(hosted_zone_id, "test.maxmin.it")
+
+        assert record_data.dns_nm == "test.maxmin.it."
+        assert record_data.ip_address == "10.0.10.10"
+        assert record_data.type == "A"
+        assert record_data.ttl == 300
+
+        # run the test
+        record_data = self.record_dao.load(hosted_zone_id, "TEST2.maxmin.it.")
+
+        assert record_data.ip_address == "10.0.10.20"
+
+    @mock_aws
+    def test_load_record_not_found(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test2.maxmin.it", "10.0.10.20", hosted_zone_id
+        )
+
+        # run the test, the next record in order is returned by Route53
+        assert self.record_dao.load(hosted_zone_id, "test.maxmin.it") is None
+        assert self.record_dao.load(hosted_zone_id, "zzz.maxmin.it") is None
+        assert (
+            self.record_dao.load(hosted_zone_id, "test2.maxmin.it", "CNAME")
+            is None
+        )
+
+    @mock_aws
+    def test_load_all_records_paginated(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        changes = []
+
+        for i in range(700):
+            record_data = RecordData()
+            record_data.dns_nm = f"box{i}.maxmin.it"
+            record_data.ip_address = f"10.0.{i // 250}.{i % 250}"
+            record_data.hosted_zone_id = hosted_zone_id
+            changes.append((RecordDao.CREATE, record_data))
+
+        self.record_dao.change_all(hosted_zone_id, changes)
+
+        # run the test
+        record_datas = self.record_dao.load_all(hosted_zone_id)
+
+        # NS, SOA and the A records
+        assert len(record_datas) == 702
+
+
+class RecordDaoJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.journal_dir = tempfile.TemporaryDirectory()
+        self.journal_file = os.path.join(self.journal_dir.name, "journal.json")
+        RunJournal.enable(self.journal_file, "run1")
+        self.test_utils = TestUtils()
+        self.record_dao = RecordDao()
+        self.route53_calls = []
+        self.sync_failing = True
+
+        ClientRegistry.get_client("route53").meta.events.register(
+            "before-call.route53.*", self.count_route53_calls
+        )
+
+    def tearDown(self):
+        RunJournal.disable()
+        ClientRegistry.clear()
+        self.journal_dir.cleanup()
+
+    def count_route53_calls(self, model, **kwargs):
+        self.route53_calls.append(model.name)
+
+        if model.name == "GetChange" and self.sync_failing:
+            raise AwsDaoException("Connection lost!")
+
+    def build_changes(self, hosted_zone_id: str) -> list:
+        record_data = RecordData()
+        record_data.dns_nm = "admin.maxmin.it"
+        record_data.ip_address = "10.0.10.30"
+        record_data.hosted_zone_id = hosted_zone_id
+
+        return [(RecordDao.CREATE, record_data)]
+
+    @mock_aws
+    def test_change_all_records_resumed(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        # the run fails while waiting for the change
+        try:
+            self.record_dao.change_all(
+                hosted_zone_id, self.build_changes(hosted_zone_id)
+            )
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsDaoException as e:
+            assert str(e) == "Error changing the records!"
+
+        RunJournal.disable()
+        RunJournal.enable(self.journal_file, "run1")
+        self.sync_failing = False
+        self.route53_calls.clear()
+
+        # run the test
+        change_ids = self.record_dao.change_all(
+            hosted_zone_id, self.build_changes(hosted_zone_id)
+        )
+
+        assert len(change_ids) == 1
+        # the record is created once, the change is waited for
+        assert self.route53_calls == ["GetChange"]
+        assert self.test_utils.describe_record(
+            "admin.maxmin.it", hosted_zone_id
+        )
+
+        with open(self.journal_file) as file:
+            assert json.load(file).get("operations") == {}
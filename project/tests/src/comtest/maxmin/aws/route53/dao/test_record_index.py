@@ -0,0 +1,144 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import unittest
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.route53.dao.domain.record import RecordData
+from com.maxmin.aws.route53.dao.record import RecordDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class RecordIndexDaoTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        RecordIndexDao.enable(60)
+        self.test_utils = TestUtils()
+        self.record_dao = RecordDao()
+        self.list_calls = []
+
+        ClientRegistry.get_client("route53").meta.events.register(
+            "before-call.route53.ListResourceRecordSets",
+            self.count_list_calls,
+        )
+
+    def tearDown(self):
+        RecordIndexDao.disable()
+        ClientRegistry.clear()
+
+    def count_list_calls(self, model, **kwargs):
+        self.list_calls.append(model.name)
+
+    @mock_aws
+    def test_load_records_from_index(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+        self.test_utils.create_record(
+            "sells.maxmin.it", "10.0.10.20", hosted_zone_id
+        )
+
+        # run the test
+        test_record = self.record_dao.load(hosted_zone_id, "test.maxmin.it")
+        sells_record = self.record_dao.load(hosted_zone_id, "Sells.maxmin.it.")
+        shop_record = self.record_dao.load(hosted_zone_id, "shop.maxmin.it")
+
+        assert test_record.dns_nm == "test.maxmin.it."
+        assert test_record.ip_address == "10.0.10.10"
+        assert test_record.ttl == 300
+        assert sells_record.ip_address == "10.0.10.20"
+        assert shop_record is None
+        assert self.list_calls == ["ListResourceRecordSets"]
+
+    @mock_aws
+    def test_load_records_from_index_paginated(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        changes = []
+
+        for i in range(700):
+            record_data = RecordData()
+            record_data.dns_nm = f"box{i}.maxmin.it"
+            record_data.ip_address = f"10.0.{i // 250}.{i % 250}"
+            record_data.hosted_zone_id = hosted_zone_id
+            changes.append((RecordDao.CREATE, record_data))
+
+        self.record_dao.change_all(hosted_zone_id, changes)
+
+        self.list_calls.clear()
+
+        # run the test
+        for i in range(700):
+            record_data = self.record_dao.load(
+                hosted_zone_id, f"box{i}.maxmin.it"
+            )
+
+            assert record_data.ip_address == f"10.0.{i // 250}.{i % 250}"
+
+        # 702 records, 300 for each page
+        assert len(self.list_calls) == 3
+
+    @mock_aws
+    def test_index_invalidated_by_changes(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        assert self.record_dao.load(hosted_zone_id, "test.maxmin.it") is None
+
+        # changed outside the daos, the index doesn't see it
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+
+        assert self.record_dao.load(hosted_zone_id, "test.maxmin.it") is None
+
+        record_data = RecordData()
+        record_data.dns_nm = "sells.maxmin.it"
+        record_data.ip_address = "10.0.10.20"
+        record_data.hosted_zone_id = hosted_zone_id
+
+        # run the test
+        self.record_dao.change_all(
+            hosted_zone_id, [(RecordDao.CREATE, record_data)]
+        )
+
+        assert (
+            self.record_dao.load(hosted_zone_id, "test.maxmin.it").ip_address
+            == "10.0.10.10"
+        )
+        assert (
+            self.record_dao.load(hosted_zone_id, "sells.maxmin.it").ip_address
+            == "10.0.10.20"
+        )
+
+    @mock_aws
+    def test_load_records_index_disabled(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it.").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+
+        RecordIndexDao.disable()
+
+        # run the test
+        self.record_dao.load(hosted_zone_id, "test.maxmin.it")
+        self.record_dao.load(hosted_zone_id, "test.maxmin.it")
+
+        assert RecordIndexDao.is_enabled() is False
+        assert len(self.list_calls) == 2
@@ -4,9 +4,16 @@ Created on Mar 28, 2023
 @author: vagrant
 """
 
+import asyncio
 import unittest
 
 from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.exception import AwsServiceException
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from com.maxmin.aws.route53.service.domain.record import RecordChange
 from com.maxmin.aws.route53.service.hosted_zone import HostedZoneService
 from comtest.maxmin.aws.utils import TestUtils
 
@@ -57,12 +64,18 @@ class HostedZoneServiceTestCase(unittest.TestCase):
             "Id"
         )
         self.test_utils.create_hosted_zone("maxmin.com")
+        self.test_utils.create_hosted_zone("maxmin.itx.com")
 
         # run the test
         hosted_zone = self.hosted_zone_service.load_hosted_zone("maxmin.ie")
 
         assert not hosted_zone
 
+        # run the test
+        hosted_zone = self.hosted_zone_service.load_hosted_zone("maxmin.itx")
+
+        assert not hosted_zone
+
         # run the test
         hosted_zone = self.hosted_zone_service.load_hosted_zone("maxmin.it")
 
@@ -102,3 +115,232 @@ class HostedZoneServiceTestCase(unittest.TestCase):
 
         assert record.dns_nm == "test.maxmin.it."
         assert record.ip_address == "10.0.10.10"
+
+    @mock_aws
+    def test_change_records(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+
+        # run the test
+        self.hosted_zone_service.change_records(
+            [
+                RecordChange(
+                    HostedZoneService.CREATE, "admin.maxmin.it", "10.0.10.20"
+                ),
+                RecordChange(
+                    HostedZoneService.UPSERT, "sells.maxmin.it", "10.0.10.30"
+                ),
+                RecordChange(HostedZoneService.DELETE, "test.maxmin.it."),
+                # already deleted
+                RecordChange(HostedZoneService.DELETE, "shop.maxmin.it"),
+            ],
+            "maxmin.it",
+        )
+
+        record = self.test_utils.describe_record(
+            "admin.maxmin.it", hosted_zone_id
+        )
+
+        assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.20"
+        assert record.get("TTL") == 300
+
+        record = self.test_utils.describe_record(
+            "sells.maxmin.it", hosted_zone_id
+        )
+
+        assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.30"
+        assert not self.test_utils.describe_record(
+            "test.maxmin.it", hosted_zone_id
+        )
+
+        # run the test
+        self.hosted_zone_service.change_records(
+            [
+                RecordChange(
+                    HostedZoneService.UPSERT, "sells.maxmin.it", "10.0.10.40"
+                ),
+            ],
+            "maxmin.it",
+        )
+
+        record = self.test_utils.describe_record(
+            "sells.maxmin.it", hosted_zone_id
+        )
+
+        assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.40"
+
+    @mock_aws
+    def test_change_records_async(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it").get(
+            "Id"
+        )
+
+        # run the test
+        asyncio.run(
+            self.hosted_zone_service.change_records_async(
+                [
+                    RecordChange(
+                        HostedZoneService.CREATE,
+                        "admin.maxmin.it",
+                        "10.0.10.20",
+                    ),
+                ],
+                "maxmin.it",
+            )
+        )
+
+        record = self.test_utils.describe_record(
+            "admin.maxmin.it", hosted_zone_id
+        )
+
+        assert record.get("ResourceRecords")[0].get("Value") == "10.0.10.20"
+
+    @mock_aws
+    def test_change_records_create_existing(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+
+        try:
+            # run the test
+            self.hosted_zone_service.change_records(
+                [
+                    RecordChange(
+                        HostedZoneService.CREATE,
+                        "admin.maxmin.it",
+                        "10.0.10.20",
+                    ),
+                    RecordChange(
+                        HostedZoneService.CREATE,
+                        "test.maxmin.it",
+                        "10.0.10.10",
+                    ),
+                ],
+                "maxmin.it",
+            )
+
+            fail("An exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Record test.maxmin.it already created!"
+
+        # nothing is changed
+        assert not self.test_utils.describe_record(
+            "admin.maxmin.it", hosted_zone_id
+        )
+
+    @mock_aws
+    def test_change_records_mixed_case(self):
+        hosted_zone_id = self.test_utils.create_hosted_zone("maxmin.it").get(
+            "Id"
+        )
+
+        self.test_utils.create_record(
+            "test.maxmin.it", "10.0.10.10", hosted_zone_id
+        )
+        self.test_utils.create_record(
+            "admin.maxmin.it", "10.0.10.20", hosted_zone_id
+        )
+
+        try:
+            # run the test
+            self.hosted_zone_service.change_records(
+                [
+                    RecordChange(
+                        HostedZoneService.CREATE,
+                        "Admin.MaxMin.it",
+                        "10.0.10.20",
+                    ),
+                ],
+                "maxmin.it",
+            )
+
+            fail("An exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Record Admin.MaxMin.it already created!"
+
+        # run the test
+        self.hosted_zone_service.change_records(
+            [RecordChange(HostedZoneService.DELETE, "Test.MaxMin.it")],
+            "maxmin.it",
+        )
+
+        assert not self.test_utils.describe_record(
+            "test.maxmin.it", hosted_zone_id
+        )
+
+    @mock_aws
+    def test_change_records_from_index(self):
+        ClientRegistry.clear()
+        RecordIndexDao.enable(60)
+        list_calls = []
+
+        ClientRegistry.get_client("route53").meta.events.register(
+            "before-call.route53.ListResourceRecordSets",
+            lambda model, **kwargs: list_calls.append(model.name),
+        )
+
+        try:
+            hosted_zone_id = self.test_utils.create_hosted_zone(
+                "maxmin.it"
+            ).get("Id")
+
+            self.test_utils.create_record(
+                "test.maxmin.it", "10.0.10.10", hosted_zone_id
+            )
+
+            # run the test
+            self.hosted_zone_service.change_records(
+                [
+                    RecordChange(
+                        HostedZoneService.CREATE,
+                        "admin.maxmin.it",
+                        "10.0.10.20",
+                    ),
+                    RecordChange(
+                        HostedZoneService.UPSERT,
+                        "sells.maxmin.it",
+                        "10.0.10.30",
+                    ),
+                    RecordChange(HostedZoneService.DELETE, "test.maxmin.it"),
+                ],
+                "maxmin.it",
+            )
+
+            # the records of the zone are listed once
+            assert list_calls == ["ListResourceRecordSets"]
+            assert not self.test_utils.describe_record(
+                "test.maxmin.it", hosted_zone_id
+            )
+        finally:
+            RecordIndexDao.disable()
+            ClientRegistry.clear()
+
+    def test_change_records_unknown_action(self):
+        try:
+            # run the test
+            self.hosted_zone_service.change_records(
+                [RecordChange("MERGE", "admin.maxmin.it", "10.0.10.20")],
+                "maxmin.it",
+            )
+
+            fail("An exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Unknown record action MERGE!"
+
+    def test_change_records_without_changes(self):
+        try:
+            # run the test
+            self.hosted_zone_service.change_records([], "maxmin.it")
+
+            fail("An exception should have been thrown!")
+        except AwsServiceException as e:
+            assert str(e) == "Record changes are mandatory!"
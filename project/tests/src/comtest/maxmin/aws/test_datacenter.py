@@ -0,0 +1,384 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import os
+import unittest
+
+from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.configuration.dao.datacenter import (
+    DatacenterConfigDao,
+    HostedZoneConfigDao,
+)
+from com.maxmin.aws.configuration.dao.domain.datacenter import (
+    HostedZoneConfig,
+    InstanceConfig,
+)
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.datacenter import (
+    FanoutGraphBuilder,
+    ShutdownGraphBuilder,
+    StartupGraphBuilder,
+)
+from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.aws.constants import AMI_NAME
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class DatacenterGraphBuilderTestCase(unittest.TestCase):
+    INSTANCE_NMS = ["dtc-box", "dtc-box2", "dtc-box3"]
+
+    def setUp(self):
+        ClientRegistry.clear()
+        self.test_utils = TestUtils()
+        self.datacenter_config_dao = DatacenterConfigDao()
+        self.hosted_zone_config_dao = HostedZoneConfigDao()
+
+    def tearDown(self):
+        for instance_nm in DatacenterGraphBuilderTestCase.INSTANCE_NMS:
+            self.test_utils.delete_private_key_file(
+                f"{ProjectDirectories.ACCESS_DIR}/{instance_nm}"
+            )
+
+        ClientRegistry.clear()
+
+    def test_build_startup_graph(self):
+        datacenter_config = self.datacenter_config_dao.load(
+            os.path.join(
+                ProjectDirectories.TEST_DIR, "config/test_datacenter.json"
+            )
+        )
+        hosted_zone_config = self.hosted_zone_config_dao.load(
+            os.path.join(
+                ProjectDirectories.TEST_DIR, "config/test_hostedzone.json"
+            )
+        )
+
+        # run the test
+        graph = StartupGraphBuilder(
+            datacenter_config, hosted_zone_config, 60, 600
+        ).build()
+
+        assert list(graph.nodes.keys()) == [
+            "vpc",
+            "internet-gateway",
+            "route-table",
+            "route",
+            "subnet:admin-subnet",
+            "security-group:admin-sgp",
+            "rules:admin-sgp",
+            "key-pair:admin-box",
+            "instances",
+            "ready:running",
+            "ready:ssh_reachable",
+            "dns",
+        ]
+        assert graph.nodes["vpc"].dependencies == []
+        assert graph.nodes["route"].dependencies == [
+            "route-table",
+            "internet-gateway",
+        ]
+        assert graph.nodes["subnet:admin-subnet"].dependencies == [
+            "vpc",
+            "route-table",
+        ]
+        # mysecuritygroup is not part of the datacenter
+        assert graph.nodes["rules:admin-sgp"].dependencies == [
+            "security-group:admin-sgp"
+        ]
+        assert graph.nodes["key-pair:admin-box"].dependencies == []
+        assert graph.nodes["instances"].dependencies == [
+            "route",
+            "key-pair:admin-box",
+            "subnet:admin-subnet",
+            "security-group:admin-sgp",
+        ]
+        # the DNS record doesn't wait for the SSH port
+        assert graph.nodes["ready:running"].dependencies == ["instances"]
+        assert graph.nodes["ready:ssh_reachable"].dependencies == ["instances"]
+        assert graph.nodes["dns"].dependencies == ["ready:running"]
+        assert graph.nodes["vpc"].timeout == 60
+        assert graph.nodes["instances"].timeout == 60
+        assert graph.nodes["ready:ssh_reachable"].timeout == 600
+
+        graph.validate()
+
+    def test_build_startup_graph_without_hosted_zone(self):
+        datacenter_config = self.datacenter_config_dao.load(
+            os.path.join(
+                ProjectDirectories.TEST_DIR, "config/test_datacenter.json"
+            )
+        )
+
+        # run the test
+        graph = StartupGraphBuilder(
+            datacenter_config, HostedZoneConfig()
+        ).build()
+
+        assert "dns" not in graph.nodes
+        # nothing needs the running level
+        assert "ready:running" not in graph.nodes
+        assert "ready:ssh_reachable" in graph.nodes
+
+    def test_build_startup_graph_unknown_readiness(self):
+        datacenter_config = self.datacenter_config_dao.load(
+            os.path.join(
+                ProjectDirectories.TEST_DIR, "config/test_datacenter.json"
+            )
+        )
+        datacenter_config.instances[0].readiness = "booted"
+
+        try:
+            # run the test
+            StartupGraphBuilder(datacenter_config, HostedZoneConfig()).build()
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Unknown readiness level booted!"
+
+    def load_datacenter_config(self):
+        """
+        Loads config/datacenter.json with a second instance, both booting
+        from an image known by moto.
+        """
+        datacenter_config = self.datacenter_config_dao.load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "datacenter.json")
+        )
+
+        template = datacenter_config.instances[0]
+        template.parent_img = AMI_NAME
+
+        instance_config = InstanceConfig()
+        instance_config.__dict__.update(template.__dict__)
+        instance_config.name = "dtc-box2"
+        instance_config.private_ip = "10.0.20.36"
+        instance_config.dns_domain = "box2.dtc.maxmin.it"
+        datacenter_config.instances.append(instance_config)
+
+        return datacenter_config
+
+    @mock_aws
+    def test_execute_startup_graph(self):
+        datacenter_config = self.load_datacenter_config()
+        hosted_zone_config = self.hosted_zone_config_dao.load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "hostedzone.json")
+        )
+
+        hosted_zone_id = self.test_utils.create_hosted_zone(
+            hosted_zone_config.registered_domain
+        ).get("Id")
+
+        graph = StartupGraphBuilder(
+            datacenter_config, hosted_zone_config
+        ).build()
+
+        # run the test
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+
+        subnet_id = self.test_utils.describe_subnets("dtc-subnet")[0].get(
+            "SubnetId"
+        )
+
+        for instance_nm, private_ip, dns_nm in [
+            ("dtc-box", "10.0.20.35", "dtc.maxmin.it"),
+            ("dtc-box2", "10.0.20.36", "box2.dtc.maxmin.it"),
+        ]:
+            instances = self.test_utils.describe_instances(instance_nm)
+
+            assert len(instances) == 1
+            assert instances[0].get("PrivateIpAddress") == private_ip
+            assert instances[0].get("SubnetId") == subnet_id
+
+            record = self.test_utils.describe_record(dns_nm, hosted_zone_id)
+
+            assert record.get("ResourceRecords")[0].get("Value") == (
+                instances[0].get("PublicIpAddress")
+            )
+
+        # run again, all the resources are already there
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+        assert len(self.test_utils.describe_instances("dtc-box")) == 1
+
+    @mock_aws
+    def test_execute_fanout_graph(self):
+        datacenter_config = self.load_datacenter_config()
+        hosted_zone_config = self.hosted_zone_config_dao.load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "hostedzone.json")
+        )
+
+        # a second datacenter with a single instance in another region
+        datacenter_config2 = self.load_datacenter_config()
+        datacenter_config2.vpc.name = "dtc-datacenter2"
+        datacenter_config2.vpc.region = "us-east-1"
+        datacenter_config2.subnets[0].az = "us-east-1a"
+        datacenter_config2.instances = datacenter_config2.instances[:1]
+        datacenter_config2.instances[0].name = "dtc-box3"
+        datacenter_config2.instances[0].dns_domain = "box3.dtc.maxmin.it"
+
+        self.test_utils.create_hosted_zone(
+            hosted_zone_config.registered_domain
+        )
+
+        fanout_builder = FanoutGraphBuilder(
+            [
+                StartupGraphBuilder(datacenter_config, hosted_zone_config),
+                StartupGraphBuilder(datacenter_config2, hosted_zone_config),
+            ]
+        )
+        graph = fanout_builder.build()
+
+        # run the test
+        result = GraphExecutor(8).execute(graph)
+
+        assert result.succeeded is True
+        assert "dtc-datacenter2/vpc" in graph.nodes
+        assert graph.nodes[
+            "dtc-datacenter2/internet-gateway"
+        ].dependencies == ["dtc-datacenter2/vpc"]
+
+        test_utils_us = TestUtils()
+        test_utils_us.ec2 = ClientRegistry.get_client("ec2", "us-east-1")
+        vpcs_us = test_utils_us.describe_vpcs("dtc-datacenter2")
+        instances_us = test_utils_us.describe_instances("dtc-box3")
+
+        assert len(vpcs_us) == 1
+        assert len(instances_us) == 1
+        assert instances_us[0].get("Placement").get("AvailabilityZone") == (
+            "us-east-1a"
+        )
+        assert self.test_utils.describe_vpcs("dtc-datacenter2") == []
+        assert len(self.test_utils.describe_instances("dtc-box")) == 1
+
+        report = fanout_builder.report(result)
+
+        assert [
+            (datacenter.get("datacenter"), datacenter.get("region"))
+            for datacenter in report
+        ] == [
+            ("dtc-datacenter", "eu-west-1"),
+            ("dtc-datacenter2", "us-east-1"),
+        ]
+        assert all(datacenter.get("succeeded") for datacenter in report)
+        assert all(datacenter.get("failed") == [] for datacenter in report)
+        assert all(
+            0 < datacenter.get("elapsed") <= result.elapsed
+            for datacenter in report
+        )
+
+    def test_build_fanout_graph_repeated_datacenter(self):
+        datacenter_config = self.load_datacenter_config()
+
+        try:
+            # run the test
+            FanoutGraphBuilder(
+                [
+                    StartupGraphBuilder(datacenter_config, HostedZoneConfig()),
+                    StartupGraphBuilder(datacenter_config, HostedZoneConfig()),
+                ]
+            ).build()
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Datacenter dtc-datacenter is repeated!"
+
+    def test_build_shutdown_graph(self):
+        datacenter_config = self.datacenter_config_dao.load(
+            os.path.join(
+                ProjectDirectories.TEST_DIR, "config/test_datacenter.json"
+            )
+        )
+        hosted_zone_config = self.hosted_zone_config_dao.load(
+            os.path.join(
+                ProjectDirectories.TEST_DIR, "config/test_hostedzone.json"
+            )
+        )
+
+        # run the test
+        graph = ShutdownGraphBuilder(
+            datacenter_config, hosted_zone_config, 60, 600
+        ).build()
+
+        assert graph.nodes["dns"].dependencies == []
+        assert graph.nodes["instances"].dependencies == ["dns"]
+        assert graph.nodes["instances"].timeout == 600
+        assert graph.nodes["key-pair:admin-box"].dependencies == []
+        assert graph.nodes["rules:admin-sgp"].dependencies == []
+        assert graph.nodes["security-group:admin-sgp"].dependencies == [
+            "instances",
+            "rules:admin-sgp",
+        ]
+        assert graph.nodes["internet-gateway"].dependencies == ["instances"]
+        assert graph.nodes["subnet:admin-subnet"].dependencies == ["instances"]
+        assert graph.nodes["route-table"].dependencies == [
+            "subnet:admin-subnet"
+        ]
+        assert graph.nodes["vpc"].dependencies == [
+            "security-group:admin-sgp",
+            "internet-gateway",
+            "route-table",
+            "subnet:admin-subnet",
+        ]
+        assert graph.nodes["vpc"].timeout == 60
+
+        graph.validate()
+
+    @mock_aws
+    def test_execute_shutdown_graph(self):
+        datacenter_config = self.load_datacenter_config()
+        hosted_zone_config = self.hosted_zone_config_dao.load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "hostedzone.json")
+        )
+
+        hosted_zone_id = self.test_utils.create_hosted_zone(
+            hosted_zone_config.registered_domain
+        ).get("Id")
+
+        result = GraphExecutor(4).execute(
+            StartupGraphBuilder(datacenter_config, hosted_zone_config).build()
+        )
+
+        assert result.succeeded is True
+
+        graph = ShutdownGraphBuilder(
+            datacenter_config, hosted_zone_config
+        ).build()
+
+        # run the test
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+        assert set(result.timings.keys()) == set(graph.nodes.keys())
+
+        for instance_nm, dns_nm in [
+            ("dtc-box", "dtc.maxmin.it"),
+            ("dtc-box2", "box2.dtc.maxmin.it"),
+        ]:
+            instances = self.test_utils.describe_instances(instance_nm)
+
+            assert len(instances) == 1
+            assert instances[0].get("State").get("Name") == "terminated"
+            assert (
+                self.test_utils.describe_record(dns_nm, hosted_zone_id) is None
+            )
+
+        assert len(self.test_utils.describe_security_groups("dtc-sgp")) == 0
+        assert len(self.test_utils.describe_subnets("dtc-subnet")) == 0
+        assert (
+            len(self.test_utils.describe_route_tables("dtc-routetable")) == 0
+        )
+        assert len(self.test_utils.describe_vpcs("dtc-datacenter")) == 0
+
+        # run again, all the resources are already gone
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
@@ -0,0 +1,178 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import os
+import tempfile
+import unittest
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.configuration.dao.datacenter import DatacenterConfigDao
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.golden import GoldenImageBaker, ProvisionDigest
+from comtest.maxmin.aws.constants import AMI_ID, AMI_NAME
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class ProvisionDigestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.provision_dir = tempfile.TemporaryDirectory()
+
+        for file_path, content in (
+            ("ansible.cfg", "[defaults]"),
+            ("playbooks/nginx.yml", "- hosts: all"),
+            ("playbooks/variables/provision.yml", "version: 1"),
+        ):
+            self.write_file(file_path, content)
+
+    def tearDown(self):
+        self.provision_dir.cleanup()
+
+    def write_file(self, file_path: str, content: str) -> None:
+        file_path = os.path.join(self.provision_dir.name, file_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, "w") as file:
+            file.write(content)
+
+    def test_compute_variables_changed(self):
+        digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        self.write_file("playbooks/variables/provision.yml", "version: 2")
+
+        # run the test
+        changed_digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        assert changed_digest != digest
+
+    def test_compute_playbook_added(self):
+        digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        self.write_file("playbooks/java.yml", "- hosts: all")
+
+        # run the test
+        changed_digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        assert changed_digest != digest
+
+    def test_compute_logs_excluded(self):
+        digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        self.write_file("logs/ansible.log", "PLAY RECAP")
+
+        # run the test
+        changed_digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        assert changed_digest == digest
+
+    def test_compute_static_inventory_excluded(self):
+        digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        self.write_file("inventory/datacenter.json", '{"all": {}}')
+
+        # run the test
+        changed_digest = ProvisionDigest.compute(self.provision_dir.name)
+
+        assert changed_digest == digest
+
+
+class GoldenImageBakerTestCase(unittest.TestCase):
+    DIGEST = "0123456789abcdef0123456789abcdef"
+
+    def setUp(self):
+        ClientRegistry.clear()
+        self.test_utils = TestUtils()
+        self.datacenter_config = DatacenterConfigDao().load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "datacenter.json")
+        )
+        self.datacenter_config.instances[0].parent_img = AMI_NAME
+        self.baker = GoldenImageBaker(
+            self.datacenter_config, GoldenImageBakerTestCase.DIGEST
+        )
+
+    def tearDown(self):
+        ClientRegistry.clear()
+
+    def create_instance(self) -> None:
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.0.0/16",
+            [self.test_utils.build_tag("name", "dtc-datacenter")],
+        ).get("VpcId")
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a",
+            "10.0.20.0/24",
+            vpc_id,
+            [self.test_utils.build_tag("name", "dtc-subnet")],
+        ).get("SubnetId")
+        security_group_id = self.test_utils.create_security_group(
+            "dtc-sgp",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "dtc-sgp")],
+        ).get("GroupId")
+
+        self.test_utils.create_instance(
+            AMI_ID,
+            security_group_id,
+            subnet_id,
+            "10.0.20.35",
+            "ENCODED CLOUD INIT DATA",
+            [self.test_utils.build_tag("name", "dtc-box")],
+        )
+
+    @mock_aws
+    def test_bake(self):
+        self.create_instance()
+
+        # run the test
+        image_nms = self.baker.bake()
+
+        assert image_nms == ["dtc-box-golden-0123456789ab"]
+
+        images = self.test_utils.describe_images("dtc-box-golden-0123456789ab")
+        tags = {tag.get("Key"): tag.get("Value") for tag in images[0]["Tags"]}
+
+        assert images[0].get("Name") == "dtc-box-golden-0123456789ab"
+        assert tags.get("provision") == GoldenImageBakerTestCase.DIGEST
+        assert tags.get("parent") == AMI_NAME
+
+    @mock_aws
+    def test_bake_already_baked(self):
+        self.create_instance()
+        self.baker.bake()
+
+        # run the test
+        image_nms = self.baker.bake()
+
+        assert image_nms == []
+
+    @mock_aws
+    def test_apply(self):
+        self.create_instance()
+        self.baker.bake()
+
+        # run the test
+        instance_nms = self.baker.apply()
+
+        assert instance_nms == ["dtc-box"]
+        assert (
+            self.datacenter_config.instances[0].parent_img
+            == "dtc-box-golden-0123456789ab"
+        )
+
+    @mock_aws
+    def test_apply_provisioning_changed(self):
+        self.create_instance()
+        self.baker.bake()
+
+        # run the test
+        instance_nms = GoldenImageBaker(
+            self.datacenter_config, "fedcba9876543210"
+        ).apply()
+
+        assert instance_nms == []
+        assert self.datacenter_config.instances[0].parent_img == AMI_NAME
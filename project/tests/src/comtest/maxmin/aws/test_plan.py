@@ -0,0 +1,201 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import os
+import unittest
+
+from moto import mock_aws
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.configuration.dao.datacenter import (
+    DatacenterConfigDao,
+    HostedZoneConfigDao,
+)
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.datacenter import StartupGraphBuilder
+from com.maxmin.aws.ec2.dao.inventory import InventoryDao
+from com.maxmin.aws.plan import Plan, ShutdownPlanner, StartupPlanner
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZoneDao
+from com.maxmin.aws.route53.dao.record_index import RecordIndexDao
+from comtest.maxmin.aws.constants import AMI_NAME
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class PlannerTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        InventoryDao.enable(60)
+        RecordIndexDao.enable(60)
+        HostedZoneDao.enable()
+        self.test_utils = TestUtils()
+        self.datacenter_config = DatacenterConfigDao().load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "datacenter.json")
+        )
+        self.datacenter_config.instances[0].parent_img = AMI_NAME
+        self.hosted_zone_config = HostedZoneConfigDao().load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "hostedzone.json")
+        )
+        self.ec2_calls = []
+
+        ClientRegistry.get_client("ec2").meta.events.register(
+            "before-call.ec2.*", self.count_ec2_calls
+        )
+
+    def tearDown(self):
+        self.test_utils.delete_private_key_file(
+            f"{ProjectDirectories.ACCESS_DIR}/dtc-box"
+        )
+        InventoryDao.disable()
+        RecordIndexDao.disable()
+        HostedZoneDao.disable()
+        ClientRegistry.clear()
+
+    def count_ec2_calls(self, model, **kwargs):
+        self.ec2_calls.append(model.name)
+
+    def start_datacenter(self) -> None:
+        result = GraphExecutor(4).execute(
+            StartupGraphBuilder(
+                self.datacenter_config, self.hosted_zone_config
+            ).build()
+        )
+
+        assert result.succeeded is True
+
+        # the plan runs with a new inventory
+        InventoryDao.invalidate()
+        RecordIndexDao.invalidate()
+        self.ec2_calls.clear()
+
+    def get_changes(self, plan: Plan) -> list:
+        return [
+            (action.action, action.resource_type, action.resource_nm)
+            for action in plan.actions
+            if action.action != Plan.KEEP
+        ]
+
+    @mock_aws
+    def test_startup_plan(self):
+        self.test_utils.create_hosted_zone(
+            self.hosted_zone_config.registered_domain
+        )
+
+        # run the test
+        plan = StartupPlanner(
+            self.datacenter_config, self.hosted_zone_config
+        ).plan()
+
+        assert self.get_changes(plan) == [
+            ("create", "vpc", "dtc-datacenter"),
+            ("create", "internet-gateway", "dtc-gateway"),
+            ("create", "route-table", "dtc-routetable"),
+            ("create", "route", "dtc-routetable"),
+            ("create", "subnet", "dtc-subnet"),
+            ("create", "security-group", "dtc-sgp"),
+            ("create", "rules", "dtc-sgp"),
+            ("create", "key-pair", "dtc-box"),
+            ("create", "instance", "dtc-box"),
+            ("create", "record", "dtc.maxmin.it"),
+        ]
+        assert plan.count(Plan.CREATE) == 10
+        assert plan.requests == 12
+        # VPC, Internet gateway, subnet, security group, instance readiness
+        assert plan.waits == 6
+        # the account is read with a scan for each type, never changed
+        assert all(call.startswith("Describe") for call in self.ec2_calls)
+        assert len(self.ec2_calls) == len(set(self.ec2_calls))
+        assert not self.test_utils.describe_vpcs("dtc-datacenter")
+
+    @mock_aws
+    def test_startup_plan_no_changes(self):
+        self.test_utils.create_hosted_zone(
+            self.hosted_zone_config.registered_domain
+        )
+        self.start_datacenter()
+
+        # run the test
+        plan = StartupPlanner(
+            self.datacenter_config, self.hosted_zone_config
+        ).plan()
+
+        assert plan.changed is False
+        assert plan.requests == 0
+        assert plan.count(Plan.KEEP) == 10
+
+    @mock_aws
+    def test_startup_plan_rules_modified(self):
+        self.start_datacenter()
+
+        security_group_id = self.test_utils.describe_security_groups(
+            "dtc-sgp"
+        )[0].get("GroupId")
+        self.test_utils.allow_access_from_cidr(
+            security_group_id, 3306, 3306, "tcp", "0.0.0.0/0", "MySQL access"
+        )
+
+        # run the test
+        plan = StartupPlanner(
+            self.datacenter_config, self.hosted_zone_config
+        ).plan()
+
+        assert self.get_changes(plan) == [("modify", "rules", "dtc-sgp")]
+        assert plan.actions[6].detail == "+0 -1 rules"
+        assert plan.requests == 1
+
+    @mock_aws
+    def test_shutdown_plan(self):
+        self.test_utils.create_hosted_zone(
+            self.hosted_zone_config.registered_domain
+        )
+        self.start_datacenter()
+
+        # run the test
+        plan = ShutdownPlanner(
+            self.datacenter_config, self.hosted_zone_config
+        ).plan()
+
+        assert self.get_changes(plan) == [
+            ("delete", "record", "dtc.maxmin.it"),
+            ("delete", "instance", "dtc-box"),
+            ("delete", "key-pair", "dtc-box"),
+            ("delete", "rules", "dtc-sgp"),
+            ("delete", "security-group", "dtc-sgp"),
+            ("delete", "internet-gateway", "dtc-gateway"),
+            ("delete", "subnet", "dtc-subnet"),
+            ("delete", "route-table", "dtc-routetable"),
+            ("delete", "vpc", "dtc-datacenter"),
+        ]
+        assert plan.requests == 11
+        assert plan.waits == 1
+        assert all(call.startswith("Describe") for call in self.ec2_calls)
+        assert len(self.test_utils.describe_vpcs("dtc-datacenter")) == 1
+
+    @mock_aws
+    def test_shutdown_plan_no_datacenter(self):
+        # run the test
+        plan = ShutdownPlanner(
+            self.datacenter_config, self.hosted_zone_config
+        ).plan()
+
+        assert plan.changed is False
+        assert plan.requests == 0
+
+    def test_format(self):
+        plan = Plan()
+        plan.add(Plan.CREATE, "vpc", "myvpc", 1, 1)
+        plan.add(Plan.MODIFY, "rules", "mysgp", 1, detail="+1 -0 rules")
+        plan.add(Plan.KEEP, "subnet", "mysubnet")
+
+        # run the test
+        lines = plan.format()
+
+        assert lines == [
+            "+ create  vpc               myvpc",
+            "~ modify  rules             mysgp (+1 -0 rules)",
+            "Plan: 1 to create, 1 to modify, 0 to delete, 1 unchanged, "
+            "about 2 requests and 1 waiters.",
+        ]
@@ -0,0 +1,207 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import os
+import stat
+import tempfile
+import unittest
+
+from pytest import fail
+
+from com.maxmin.aws.base.graph import GraphExecutor
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.playbook import PlaybookGraphBuilder
+
+
+class PlaybookGraphBuilderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.provision_dir = tempfile.TemporaryDirectory()
+        self.bin_dir = tempfile.TemporaryDirectory()
+        self.calls_file = os.path.join(self.bin_dir.name, "calls.txt")
+
+        os.mkdir(os.path.join(self.provision_dir.name, "logs"))
+
+        self.write_command("ansible-inventory", 0)
+        self.write_command("ansible-playbook", 0)
+
+    def tearDown(self):
+        self.provision_dir.cleanup()
+        self.bin_dir.cleanup()
+
+    def write_command(self, command: str, exit_code: int) -> None:
+        """
+        Writes a fake Ansible command that records its arguments.
+        """
+        command_file = os.path.join(self.bin_dir.name, command)
+
+        with open(command_file, "w") as file:
+            file.write(
+                "#!/bin/sh\n"
+                f'echo "{command} $@" >> {self.calls_file}\n'
+                f'echo "PLAY RECAP $@"\n'
+                f"exit {exit_code}\n"
+            )
+
+        os.chmod(command_file, os.stat(command_file).st_mode | stat.S_IEXEC)
+
+    def read_calls(self) -> list:
+        with open(self.calls_file) as file:
+            return file.read().splitlines()
+
+    def test_build(self):
+        # run the test
+        graph = PlaybookGraphBuilder(self.provision_dir.name).build()
+
+        assert graph.nodes["upgrade"].dependencies == ["inventory"]
+        assert graph.nodes["downloads"].dependencies == ["inventory"]
+        assert graph.nodes["openssl"].dependencies == ["upgrade", "downloads"]
+        assert graph.nodes["tomcat"].dependencies == ["java"]
+        assert graph.dependents("python") == [
+            "java",
+            "postgresql",
+            "nginx",
+            "docker",
+            "mariadb",
+        ]
+
+    def test_execute(self):
+        graph = PlaybookGraphBuilder(
+            self.provision_dir.name, self.bin_dir.name
+        ).build()
+
+        # run the test
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+
+        calls = self.read_calls()
+
+        assert len(calls) == 12
+        assert calls[0] == "ansible-inventory --list --flush-cache"
+        assert sorted(calls[1:3]) == [
+            "ansible-playbook playbooks/downloads.yml",
+            "ansible-playbook playbooks/upgrade.yml",
+        ]
+        assert calls[3:5] == [
+            "ansible-playbook playbooks/openssl.yml",
+            "ansible-playbook playbooks/python.yml",
+        ]
+        assert calls.index("ansible-playbook playbooks/tomcat.yml") > (
+            calls.index("ansible-playbook playbooks/java.yml")
+        )
+
+        with open(
+            os.path.join(self.provision_dir.name, "logs", "nginx.log")
+        ) as file:
+            assert file.read() == "PLAY RECAP playbooks/nginx.yml\n"
+
+    def test_run_playbook_failed(self):
+        self.write_command("ansible-playbook", 2)
+        builder = PlaybookGraphBuilder(
+            self.provision_dir.name, self.bin_dir.name
+        )
+
+        try:
+            # run the test
+            builder.run_playbook("nginx")
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsException as e:
+            log_file = os.path.join(
+                self.provision_dir.name, "logs", "nginx.log"
+            )
+
+            assert str(e) == f"nginx failed, see {log_file}!"
+
+    def test_run_playbook_command_not_found(self):
+        builder = PlaybookGraphBuilder(
+            self.provision_dir.name, os.path.join(self.bin_dir.name, "none")
+        )
+
+        try:
+            # run the test
+            builder.run_playbook("nginx")
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Error running nginx!"
+
+    def test_execute_stack_failed(self):
+        self.write_command("ansible-playbook", 0)
+        builder = PlaybookGraphBuilder(
+            self.provision_dir.name, self.bin_dir.name
+        )
+        run_playbook = builder.run_playbook
+
+        def failing_run_playbook(playbook: str) -> None:
+            if playbook == "java":
+                raise AwsException("java failed!")
+
+            run_playbook(playbook)
+
+        builder.run_playbook = failing_run_playbook
+
+        # run the test
+        result = GraphExecutor(4, GraphExecutor.CONTINUE_ON_ERROR).execute(
+            builder.build()
+        )
+
+        # the other stacks are provisioned
+        assert result.failed_nodes == ["java"]
+        assert result.states["tomcat"] == GraphExecutor.SKIPPED
+        assert result.states["nginx"] == GraphExecutor.SUCCEEDED
+        assert result.states["phpmyadmin"] == GraphExecutor.SUCCEEDED
+
+    def test_build_static(self):
+        inventory_file = os.path.join(self.provision_dir.name, "hosts.json")
+
+        with open(inventory_file, "w") as file:
+            file.write("{}")
+
+        # run the test
+        graph = PlaybookGraphBuilder(
+            self.provision_dir.name, inventory_file=inventory_file
+        ).build()
+
+        assert "inventory" not in graph.nodes
+        assert graph.nodes["upgrade"].dependencies == []
+        assert graph.nodes["downloads"].dependencies == []
+
+    def test_execute_static(self):
+        inventory_file = os.path.join(self.provision_dir.name, "hosts.json")
+
+        with open(inventory_file, "w") as file:
+            file.write("{}")
+
+        graph = PlaybookGraphBuilder(
+            self.provision_dir.name,
+            self.bin_dir.name,
+            inventory_file=inventory_file,
+        ).build()
+
+        # run the test
+        result = GraphExecutor(4).execute(graph)
+
+        assert result.succeeded is True
+
+        calls = self.read_calls()
+
+        # no inventory refresh, the playbooks read the static inventory
+        assert len(calls) == 11
+        assert sorted(calls[:2]) == [
+            f"ansible-playbook playbooks/downloads.yml -i {inventory_file}",
+            f"ansible-playbook playbooks/upgrade.yml -i {inventory_file}",
+        ]
+
+    def test_build_static_not_written(self):
+        # run the test
+        graph = PlaybookGraphBuilder(
+            self.provision_dir.name,
+            inventory_file=os.path.join(self.provision_dir.name, "none.json"),
+        ).build()
+
+        # the dynamic inventory
+        assert graph.nodes["upgrade"].dependencies == ["inventory"]
@@ -0,0 +1,137 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from moto import mock_aws
+from pytest import fail
+
+from com.maxmin.aws.base.dao.client import ClientRegistry
+from com.maxmin.aws.configuration.dao.datacenter import DatacenterConfigDao
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.static_inventory import StaticInventory
+from comtest.maxmin.aws.constants import AMI_ID
+from comtest.maxmin.aws.utils import TestUtils
+
+
+class StaticInventoryTestCase(unittest.TestCase):
+    def setUp(self):
+        ClientRegistry.clear()
+        self.test_utils = TestUtils()
+        self.inventory_dir = tempfile.TemporaryDirectory()
+        self.inventory_file = os.path.join(
+            self.inventory_dir.name, "datacenter.json"
+        )
+        self.datacenter_config = DatacenterConfigDao().load(
+            os.path.join(ProjectDirectories.CONFIG_DIR, "datacenter.json")
+        )
+
+    def tearDown(self):
+        ClientRegistry.clear()
+        self.inventory_dir.cleanup()
+
+    def create_instance(self) -> str:
+        vpc_id = self.test_utils.create_vpc(
+            "10.0.0.0/16",
+            [self.test_utils.build_tag("name", "dtc-datacenter")],
+        ).get("VpcId")
+        subnet_id = self.test_utils.create_subnet(
+            "eu-west-1a",
+            "10.0.20.0/24",
+            vpc_id,
+            [self.test_utils.build_tag("name", "dtc-subnet")],
+        ).get("SubnetId")
+        security_group_id = self.test_utils.create_security_group(
+            "dtc-sgp",
+            "my security group",
+            vpc_id,
+            [self.test_utils.build_tag("name", "dtc-sgp")],
+        ).get("GroupId")
+
+        return self.test_utils.create_instance(
+            AMI_ID,
+            security_group_id,
+            subnet_id,
+            "10.0.20.35",
+            "ENCODED CLOUD INIT DATA",
+            [
+                self.test_utils.build_tag("name", "dtc-box"),
+                self.test_utils.build_tag("database", "postgresql"),
+                self.test_utils.build_tag("webserver", "nginx"),
+                self.test_utils.build_tag("owner", "maxmin"),
+            ],
+        ).get("InstanceId")
+
+    @mock_aws
+    def test_build(self):
+        instance_id = self.create_instance()
+
+        # run the test
+        inventory = StaticInventory(self.datacenter_config).build()
+
+        host = inventory["all"]["hosts"]["dtc-box"]
+
+        assert host.get("ansible_host")
+        assert host.get("ansible_user") == "dtcadmin"
+        assert host.get("ansible_ssh_private_key_file") == os.path.join(
+            ProjectDirectories.ACCESS_DIR, "dtc-box"
+        )
+        assert host.get("instance_id") == instance_id
+        assert host.get("private_ip_address") == "10.0.20.35"
+        assert host.get("tags").get("owner") == "maxmin"
+
+        # the groups of the aws_ec2 dynamic inventory
+        assert inventory["all"]["children"] == {
+            "name_dtc_box": {"hosts": {"dtc-box": None}},
+            "database_postgresql": {"hosts": {"dtc-box": None}},
+            "webserver_nginx": {"hosts": {"dtc-box": None}},
+        }
+
+    @mock_aws
+    def test_build_instance_not_running(self):
+        try:
+            # run the test
+            StaticInventory(self.datacenter_config).build()
+
+            fail("ERROR: an exception should have been thrown!")
+        except AwsException as e:
+            assert str(e) == "Instance dtc-box not running!"
+
+    @mock_aws
+    def test_write(self):
+        self.create_instance()
+
+        # run the test
+        StaticInventory(self.datacenter_config).write(self.inventory_file)
+
+        with open(self.inventory_file) as file:
+            inventory = json.load(file)
+
+        assert list(inventory["all"]["hosts"]) == ["dtc-box"]
+        assert not os.path.exists(f"{self.inventory_file}.tmp")
+
+    @mock_aws
+    def test_discard(self):
+        self.create_instance()
+        StaticInventory(self.datacenter_config).write(self.inventory_file)
+
+        # run the test
+        StaticInventory.discard(self.inventory_file)
+
+        assert not os.path.exists(self.inventory_file)
+
+        # already removed
+        StaticInventory.discard(self.inventory_file)
+
+    def test_build_group_nm(self):
+        # run the test
+        group_nm = StaticInventory.build_group_nm("name", "dtc-box.1")
+
+        assert group_nm == "name_dtc_box_1"